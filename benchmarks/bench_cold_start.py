@@ -0,0 +1,144 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Measures how quickly a freshly started worker can show each page.
+#
+#   python benchmarks/bench_cold_start.py [rounds]
+#
+# Every measurement runs in a new Python process, like a worker that an
+# autoscaler has just started. For each page it reports the median of:
+#
+#   import  importing the page's module and everything it pulls in, after
+#           streamlit itself has been imported
+#   render  the page's first run in streamlit's AppTest, with the loading
+#           spinner delay (ISLAMIC_HUB_LOADING_DELAY) set to 0
+#
+# and for islamic_resources.py, the script `streamlit run` starts with:
+#
+#   script  its first run with no page drawn: the imports, page config,
+#           styles and sidebar every session pays for
+#   home    its first run as a visitor sees it, drawing the Home page
+#
+# The time to import streamlit is shown for reference. Pages that fetch
+# data wait for the network, or for it to fail, so run this with the APIs
+# either reachable or not, consistently. Exits non-zero if any page takes
+# longer than IMPORT_BUDGET to import or RENDER_BUDGET to render, or the
+# script's first run takes longer than SCRIPT_BUDGET.
+
+ROUNDS = 3
+IMPORT_BUDGET = 0.3
+RENDER_BUDGET = 1.0
+SCRIPT_BUDGET = 0.5
+
+RENDER_SCRIPT = """
+from islamic_hub import pages
+pages.render({page!r})
+"""
+
+
+# Runs in the child process: imports, renders one page and prints the timings
+def measure(page):
+    sys.path.insert(0, ROOT)
+    start = time.perf_counter()
+    import streamlit
+    from streamlit.testing.v1 import AppTest
+    streamlit_import = time.perf_counter() - start
+
+    import importlib
+    start = time.perf_counter()
+    from islamic_hub import pages
+    importlib.import_module(f"islamic_hub.pages.{pages.PAGES[page]}")
+    page_import = time.perf_counter() - start
+
+    app = AppTest.from_string(RENDER_SCRIPT.format(page=page), default_timeout=120)
+    start = time.perf_counter()
+    app.run()
+    render = time.perf_counter() - start
+
+    heavy = [name for name in ("numpy", "pandas", "pytz", "requests") if name in sys.modules]
+    print(json.dumps({
+        "streamlit": streamlit_import,
+        "import": page_import,
+        "render": render,
+        "exceptions": len(app.exception),
+        "heavy": heavy,
+    }))
+
+
+# Runs in the child process: runs islamic_resources.py once, drawing the
+# Home page or, with draw false, no page at all
+def measure_script(draw):
+    sys.path.insert(0, ROOT)
+    start = time.perf_counter()
+    import streamlit
+    from streamlit.testing.v1 import AppTest
+    streamlit_import = time.perf_counter() - start
+
+    if not draw:
+        from islamic_hub import pages
+        pages.render = lambda page: None
+    app = AppTest.from_file(os.path.join(ROOT, "islamic_resources.py"), default_timeout=120)
+    start = time.perf_counter()
+    app.run()
+    run = time.perf_counter() - start
+
+    heavy = [name for name in ("numpy", "pandas", "pytz", "requests") if name in sys.modules]
+    print(json.dumps({"streamlit": streamlit_import, "run": run, "exceptions": len(app.exception), "heavy": heavy}))
+
+
+def run_child(*args):
+    env = dict(os.environ, ISLAMIC_HUB_LOADING_DELAY="0", ISLAMIC_HUB_HTTP_RETRIES="0")
+    output = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), *args],
+        env=env, cwd=ROOT, check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main(rounds=ROUNDS):
+    sys.path.insert(0, ROOT)
+    from islamic_hub.pages import PAGES
+
+    failed = False
+    streamlit_times = []
+    print(f"{'page':<24} {'import':>9} {'render':>9}  modules loaded")
+    for page in PAGES:
+        results = [run_child("--page", page) for _ in range(rounds)]
+        streamlit_times.extend(result["streamlit"] for result in results)
+        page_import = statistics.median(result["import"] for result in results)
+        render = statistics.median(result["render"] for result in results)
+        over = page_import > IMPORT_BUDGET or render > RENDER_BUDGET
+        errors = sum(result["exceptions"] for result in results)
+        failed = failed or over or errors
+        print(f"{page[2:]:<24} {page_import * 1000:6.0f} ms {render * 1000:6.0f} ms  "
+              f"{', '.join(results[-1]['heavy']) or '-'}"
+              f"{'  OVER BUDGET' if over else ''}{f'  {errors} exceptions' if errors else ''}")
+
+    script_results = [run_child("--script", "none") for _ in range(rounds)]
+    home_results = [run_child("--script", "home") for _ in range(rounds)]
+    script = statistics.median(result["run"] for result in script_results)
+    home = statistics.median(result["run"] for result in home_results)
+    errors = sum(result["exceptions"] for result in script_results + home_results)
+    failed = failed or script > SCRIPT_BUDGET or errors
+    print(f"{'main script':<24} {script * 1000:6.0f} ms {home * 1000:6.0f} ms  "
+          f"{', '.join(script_results[-1]['heavy']) or '-'} (with Home: {', '.join(home_results[-1]['heavy']) or '-'})"
+          f"{'  OVER BUDGET' if script > SCRIPT_BUDGET else ''}{f'  {errors} exceptions' if errors else ''}")
+    print(f"streamlit import {statistics.median(streamlit_times) * 1000:.0f} ms; "
+          f"budgets: import {IMPORT_BUDGET * 1000:.0f} ms, render {RENDER_BUDGET * 1000:.0f} ms, "
+          f"script {SCRIPT_BUDGET * 1000:.0f} ms")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--page"]:
+        measure(sys.argv[2])
+    elif sys.argv[1:2] == ["--script"]:
+        measure_script(sys.argv[2] == "home")
+    else:
+        sys.exit(main(*[int(arg) for arg in sys.argv[1:2]]))
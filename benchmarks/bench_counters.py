@@ -0,0 +1,69 @@
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from islamic_hub.counters import CounterStore, MemoryBackend, SQLiteBackend
+
+# Measures how many counter reports per second the store absorbs.
+#
+#   python benchmarks/bench_counters.py [threads] [reports per thread]
+#
+# Threads stand in for sessions tapping at once. Each thread counts for
+# its own 100 users, reporting a user's new total after every tap, while
+# the background flusher writes batches to a fresh SQLite database every
+# FLUSH_INTERVAL seconds. Afterwards the stored totals are checked
+# against the taps. Exits non-zero if the SQLite store absorbs fewer than
+# MIN_RATE reports per second.
+
+MIN_RATE = 50000
+FLUSH_INTERVAL = 0.5
+DAY = "2025-03-01"
+
+
+def run(backend, threads, per_thread):
+    store = CounterStore(backend, flush_interval=FLUSH_INTERVAL)
+
+    def tap(worker):
+        counts = [0] * 100
+        for n in range(per_thread):
+            counts[n % 100] += 1
+            store.record("durood", f"user-{worker}-{n % 100}", DAY, counts[n % 100])
+
+    workers = [threading.Thread(target=tap, args=(i,)) for i in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    store.flush()
+    final_flush = time.perf_counter() - start
+
+    total = threads * per_thread
+    assert store.day_total("durood", DAY) == total
+    assert store.user_total("durood", "user-0-0", DAY) == per_thread // 100 + (per_thread % 100 > 0)
+    return total / elapsed, final_flush, store.stats()
+
+
+def main(threads=8, per_thread=50000):
+    with tempfile.TemporaryDirectory() as directory:
+        results = [
+            ("memory", run(MemoryBackend(), threads, per_thread)),
+            ("sqlite", run(SQLiteBackend(os.path.join(directory, "counters.sqlite3")), threads, per_thread)),
+        ]
+
+    print(f"{threads} threads x {per_thread:,} reports, {threads * 100} users")
+    for name, (rate, final_flush, stats) in results:
+        print(f"  {name:<7} {rate:12,.0f} reports/s  {stats['flushes']:3d} flushes  "
+              f"{stats['rows_written']:6,d} rows written  final flush {final_flush * 1000:6.1f} ms")
+    return 0 if results[-1][1][0] >= MIN_RATE else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(*[int(arg) for arg in sys.argv[1:3]]))
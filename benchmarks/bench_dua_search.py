@@ -0,0 +1,71 @@
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from islamic_hub.datasets.duas import DUAS
+from islamic_hub.record_search import RecordIndex
+from islamic_hub.textnorm import normalize
+
+# Times the Duas search on a collection the size of Hisn al-Muslim.
+#
+#   python benchmarks/bench_dua_search.py [duas] [rounds]
+#
+# The collection is the bundled duas repeated under new ids and titles
+# until it has the requested size (default 600). Reports the time to
+# build the index, and for each query the median time of a ranked
+# search for one page of results, against a scan that normalises and
+# checks every dua's fields on each keystroke. Exits non-zero if any
+# indexed search takes longer than QUERY_BUDGET.
+
+SIZE = 600
+ROUNDS = 50
+QUERY_BUDGET = 0.005
+FIELDS = {"title": 3, "translation": 1, "urdu": 1, "arabic": 1, "transliteration": 1}
+QUERIES = ["rain", "travel", "mosque enter", "prot", "اللہ", "الله", "ربنا", "allahumma"]
+
+
+def collection(size):
+    duas = []
+    for n in range(size):
+        dua = dict(DUAS[n % len(DUAS)])
+        dua["id"] = n + 1
+        dua["title"] = f"{dua['title']} ({n // len(DUAS) + 1})"
+        duas.append(dua)
+    return duas
+
+
+def median_time(rounds, func):
+    times = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def main(size=SIZE, rounds=ROUNDS):
+    duas = collection(size)
+    start = time.perf_counter()
+    index = RecordIndex(duas, FIELDS, unique=("title",), facets=("category",))
+    build = time.perf_counter() - start
+    print(f"{size} duas: index built in {build * 1000:.1f} ms")
+
+    slowest = 0
+    print(f"  {'query':<16} {'matches':>8} {'indexed':>10} {'scan':>10}")
+    for query in QUERIES:
+        term = normalize(query)
+        indexed = median_time(rounds, lambda: index.search(query, limit=10))
+        scan = median_time(rounds, lambda: [
+            dua for dua in duas if any(term in normalize(dua[field]) for field in FIELDS)
+        ])
+        slowest = max(slowest, indexed)
+        print(f"  {query:<16} {index.search(query, limit=0)[0]:8d} {indexed * 1000:7.3f} ms {scan * 1000:7.3f} ms")
+    print(f"slowest indexed search {slowest * 1000:.3f} ms; budget {QUERY_BUDGET * 1000:.0f} ms")
+    return 1 if slowest > QUERY_BUDGET else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(*[int(arg) for arg in sys.argv[1:3]]))
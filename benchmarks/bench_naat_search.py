@@ -0,0 +1,93 @@
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from islamic_hub.datasets.naats import NAATS
+from islamic_hub.pages.naats import SEARCH_FIELDS
+from islamic_hub.record_search import RecordIndex
+from islamic_hub.textnorm import phonetic_key
+
+# Times the Naats search and checks that Roman Urdu and Urdu script find
+# each other.
+#
+#   python benchmarks/bench_naat_search.py [naats] [rounds]
+#
+# The collection is the bundled naats repeated under new ids until it has
+# the requested size (default 3000). Reports the time to build the
+# phonetic index, and for each query the number of matches, the median
+# time of one page of results and the first title. Then times the
+# language and reciter facets. Exits non-zero if any search takes longer
+# than QUERY_BUDGET, or a query in EXPECTED does not find its naat first.
+
+SIZE = 3000
+ROUNDS = 50
+QUERY_BUDGET = 0.005
+
+# Queries, with the title they should find first (or None)
+EXPECTED = [
+    ("main banda e aasi", "Main Banda-e-Aasi Hun"),
+    ("میں بندہ عاصی", "Main Banda-e-Aasi Hun"),
+    ("tujhe salam", "Mere Hussain Tujhey Salam"),
+    ("تجھے سلام", "Mere Hussain Tujhey Salam"),
+    ("sohne muhammad", "Uchiya Uchiya Shana"),
+    ("سوہنے محمد", "Uchiya Uchiya Shana"),
+    ("owais", None),
+    ("mere maula", None),
+    ("allah", None),
+]
+
+
+def collection(size):
+    naats = []
+    for n in range(size):
+        naat = dict(NAATS[n % len(NAATS)])
+        naat["id"] = n + 1
+        naats.append(naat)
+    return naats
+
+
+def median_time(rounds, func):
+    times = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def main(size=SIZE, rounds=ROUNDS):
+    naats = collection(size)
+    start = time.perf_counter()
+    index = RecordIndex(naats, SEARCH_FIELDS, facets=("language", "reciter"), word_key=phonetic_key, prefix_length=2,
+                       min_key_length=2)
+    build = time.perf_counter() - start
+    print(f"{size} naats: index built in {build * 1000:.1f} ms")
+
+    slowest = 0
+    missed = 0
+    print(f"  {'query':<20} {'matches':>8} {'time':>10}  first")
+    for query, expected in EXPECTED:
+        total, results = index.search(query, limit=5)
+        took = median_time(rounds, lambda: index.search(query, limit=5))
+        slowest = max(slowest, took)
+        first = results[0]["title"] if results else "-"
+        if expected is not None and first != expected:
+            missed += 1
+            first += f"  (expected {expected})"
+        print(f"  {query:<20} {total:8d} {took * 1000:7.3f} ms  {first}")
+
+    for name, value in (("language", "Punjabi"), ("reciter", "Owais Raza Qadri")):
+        took = median_time(rounds, lambda: index.facet(name, value))
+        filtered = median_time(rounds, lambda: index.search("allah", limit=5, filters={name: value}))
+        slowest = max(slowest, filtered)
+        print(f"  {name}={value}: {len(index.facet(name, value))} naats in {took * 1e6:.2f} us, "
+              f"'allah' within them in {filtered * 1000:.3f} ms")
+    print(f"slowest search {slowest * 1000:.3f} ms; budget {QUERY_BUDGET * 1000:.0f} ms; {missed} missed")
+    return 1 if slowest > QUERY_BUDGET or missed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(*[int(arg) for arg in sys.argv[1:3]]))
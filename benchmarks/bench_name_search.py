@@ -0,0 +1,80 @@
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from islamic_hub.datasets import asma_al_husna, names_of_muhammad
+from islamic_hub.names import ASMA_AL_HUSNA, NAMES_OF_MUHAMMAD, SEARCH_FIELDS
+from islamic_hub.trigram_search import TrigramIndex
+
+# Times the typo-tolerant name searches.
+#
+#   python benchmarks/bench_name_search.py [rounds]
+#
+# Builds the trigram index of the bundled Asma Al-Husna and of the names
+# of the Prophet ﷺ, then reports for each query the top match and the
+# median search time. Exits non-zero if any search takes longer than
+# QUERY_BUDGET, or a spelling variant in EXPECTED does not find its name.
+
+ROUNDS = 200
+QUERY_BUDGET = 0.002
+
+# Queries, with the transliteration they should find first (or None)
+EXPECTED = {
+    ASMA_AL_HUSNA: [
+        ("Rahman", "Ar-Rahman"),
+        ("Rehman", "Ar-Rahman"),
+        ("Ar-Rahmaan", "Ar-Rahman"),
+        ("arrahman", "Ar-Rahman"),
+        ("رحمن", "Ar-Rahman"),
+        ("raheem", "Ar-Raheem"),
+        ("mercyful", "Ar-Raheem"),
+        ("mumin", "Al-Mu'min"),
+        ("merc", None),
+        ("the", None),
+    ],
+    NAMES_OF_MUHAMMAD: [
+        ("Mohammed", "Muhammad"),
+        ("mustapha", "Al-Mustafa"),
+        ("rasool", "Ar-Rasul"),
+        ("light", None),
+        ("mercy", None),
+    ],
+}
+
+
+def median_time(rounds, func):
+    times = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def main(rounds=ROUNDS):
+    slowest = 0
+    missed = 0
+    for names, records in ((ASMA_AL_HUSNA, asma_al_husna.NAMES), (NAMES_OF_MUHAMMAD, names_of_muhammad.NAMES)):
+        start = time.perf_counter()
+        index = TrigramIndex(records, SEARCH_FIELDS[names])
+        build = time.perf_counter() - start
+        print(f"{names}: {len(index)} names, index built in {build * 1000:.1f} ms")
+        print(f"  {'query':<14} {'matches':>8} {'time':>10}  first")
+        for query, expected in EXPECTED[names]:
+            results = index.search(query)
+            took = median_time(rounds, lambda: index.search(query))
+            slowest = max(slowest, took)
+            first = results[0]["transliteration"] if results else "-"
+            if expected is not None and first != expected:
+                missed += 1
+                first += f"  (expected {expected})"
+            print(f"  {query:<14} {len(results):8d} {took * 1000:7.3f} ms  {first}")
+    print(f"slowest search {slowest * 1000:.3f} ms; budget {QUERY_BUDGET * 1000:.0f} ms; {missed} missed")
+    return 1 if slowest > QUERY_BUDGET or missed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(*[int(arg) for arg in sys.argv[1:2]]))
@@ -0,0 +1,80 @@
+import os
+import sqlite3
+import sys
+import time
+import unicodedata
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from islamic_hub import settings, textnorm
+from islamic_hub.datasets.duas import DUAS
+from islamic_hub.pages.duas import SEARCH_FIELDS
+
+# Times text normalisation over the whole Quran.
+#
+#   python benchmarks/bench_normalize.py [corpus path] [rounds]
+#
+# Normalises every ayah of every edition in the offline corpus with
+# textnorm.normalize(), and for comparison with the straightforward
+# version: NFKD, then a Python loop dropping combining marks, then lower().
+# Reports the best of `rounds` passes. Then times a dua search with the
+# records' normalised fields filled in, against normalising every record
+# on each search. Exits non-zero if normalize() handles fewer than
+# MIN_RATE characters per second on any edition.
+
+ROUNDS = 5
+MIN_RATE = 5000000
+
+
+def naive_normalize(text):
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).lower()
+
+
+def best_of(rounds, func, items):
+    best = None
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for item in items:
+            func(item)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main(corpus_path=None, rounds=ROUNDS):
+    corpus_path = corpus_path or settings.CORPUS_PATH
+    if not os.path.exists(corpus_path):
+        print(f"No offline corpus at {corpus_path}, run `python -m islamic_resources sync` first")
+        return 2
+    conn = sqlite3.connect(corpus_path)
+    editions = [row[0] for row in conn.execute("SELECT identifier FROM editions ORDER BY identifier")]
+
+    slowest = None
+    print(f"{'edition':<16} {'chars':>10} {'normalize':>11} {'naive':>11} {'speedup':>8}  rate")
+    for edition in editions:
+        texts = [row[0] for row in conn.execute("SELECT text FROM texts WHERE edition = ?", (edition,))]
+        chars = sum(len(text) for text in texts)
+        fast = best_of(rounds, textnorm.normalize, texts)
+        naive = best_of(rounds, naive_normalize, texts)
+        rate = chars / fast
+        slowest = rate if slowest is None else min(slowest, rate)
+        print(f"{edition:<16} {chars:10,d} {fast * 1000:8.1f} ms {naive * 1000:8.1f} ms {naive / fast:7.1f}x  "
+              f"{rate / 1e6:.1f}M chars/s")
+    conn.close()
+
+    queries = ["morning", "protection", "رب", "allahumma"]
+    cold = best_of(rounds, lambda query: [
+        dua for dua in DUAS
+        if any(query in textnorm.normalize(dua[field]) for field in SEARCH_FIELDS)
+    ], queries)
+    textnorm.add_search_text(DUAS, SEARCH_FIELDS)
+    warm = best_of(rounds, lambda query: textnorm.search_records(DUAS, query, SEARCH_FIELDS), queries)
+    print(f"dua search, {len(queries)} queries over {len(DUAS)} duas: "
+          f"{warm * 1000:.3f} ms with normalised fields, {cold * 1000:.3f} ms normalising per search")
+
+    return 1 if slowest is not None and slowest < MIN_RATE else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(*[convert(arg) for convert, arg in zip((str, int), sys.argv[1:3])]))
@@ -0,0 +1,61 @@
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from islamic_hub.prayer_table import compute_times_grid, date_range, prayer_times_table, utc_offsets_grid
+
+# Times a year of prayer timetables for 1000 locations.
+#
+#   python benchmarks/bench_prayer_table.py [locations]
+#
+# Reports the raw (dates x locations) grid and the full columnar table,
+# with offsets estimated from the longitude and with real time zones.
+# Exits non-zero if the full table takes longer than BUDGET seconds.
+
+BUDGET = 0.5
+ZONES = [
+    ("Asia/Karachi", 30, 70), ("Asia/Riyadh", 24, 45), ("Africa/Cairo", 30, 31), ("Asia/Jakarta", -6, 107),
+    ("Europe/London", 52, 0), ("America/New_York", 41, -74), ("Asia/Dhaka", 24, 90), ("Europe/Istanbul", 41, 29),
+    ("Asia/Tehran", 36, 51), ("Africa/Lagos", 7, 4), ("Asia/Kuala_Lumpur", 3, 102), ("Europe/Oslo", 60, 11),
+    ("America/Los_Angeles", 34, -118), ("Australia/Sydney", -34, 151), ("Asia/Kolkata", 22, 79),
+]
+
+
+def best_of(fn, repeat=5):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main(n_locations=1000):
+    rng = np.random.default_rng(0)
+    picks = rng.integers(0, len(ZONES), n_locations)
+    timezones = [ZONES[i][0] for i in picks]
+    latitudes = np.array([ZONES[i][1] for i in picks]) + rng.uniform(-3, 3, n_locations)
+    longitudes = np.array([ZONES[i][2] for i in picks]) + rng.uniform(-3, 3, n_locations)
+    days = date_range("2025-01-01", "2025-12-31")
+    cells = len(days) * n_locations
+
+    offsets = np.round(longitudes / 15)
+    results = [
+        ("grid, longitude offsets", best_of(lambda: compute_times_grid(days, latitudes, longitudes, offsets))),
+        ("time zone offsets", best_of(lambda: utc_offsets_grid(days, timezones))),
+        ("table, longitude offsets", best_of(lambda: prayer_times_table(days, latitudes, longitudes))),
+        ("table, time zones", best_of(lambda: prayer_times_table(days, latitudes, longitudes, timezones))),
+    ]
+
+    print(f"{len(days)} days x {n_locations} locations = {cells:,} cells")
+    for name, seconds in results:
+        print(f"  {name:<26} {seconds * 1000:8.1f} ms  ({seconds / cells * 1e9:6.1f} ns/cell)")
+    return 0 if results[-1][1] < BUDGET else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000))
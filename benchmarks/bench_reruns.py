@@ -0,0 +1,176 @@
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+
+# Times widget interactions against a running app, as a browser sees them.
+#
+#   python benchmarks/bench_reruns.py [script] [rounds]
+#
+# Starts `streamlit run` on a free port and talks to it over its websocket
+# the way the frontend does. Every rerun carries the current value of every
+# widget. A widget drawn inside a fragment sends its fragment's id, so that
+# only the fragment reruns. For each interaction, reports the median time
+# from sending the change to the end of the run, and how many elements the
+# server sent back. Run it against an older checkout of islamic_resources.py
+# to compare. Exits non-zero if any run raised an exception.
+#
+# The app's data comes from the network, so pages whose API is unreachable
+# draw their fallback content. Interactions whose widget is not drawn are
+# reported as skipped.
+
+ROUNDS = 5
+STARTUP_TIMEOUT = 60
+RUN_TIMEOUT = 120
+SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "islamic_resources.py")
+
+# (page, widget label, values to switch between). A value of True clicks a
+# button, None switches between the widget's first two options.
+INTERACTIONS = [
+    ("📚 Juz Browser", "Read Juz 30", [True]),
+    ("📚 Juz Browser", "View Mode", ["All Verses", "By Surah"]),
+    ("🎧 Listen to Quran", "Select Reciter", None),
+    ("🕋 Prayer Times", "View", ["Monthly Timetable", "Today"]),
+    ("🕋 Prayer Times", "Calculation Method", ["Islamic Society of North America", "Muslim World League"]),
+    ("🤲 Duas Collection", "Search by keyword", ["morning", "protection"]),
+    ("📋 Asma Al-Husna", "Select View", ["List View", "Grid View"]),
+    ("📒 Names of Muhammad ﷺ", "Select View", ["List View", "Grid View"]),
+]
+
+try:
+    from websockets.sync.client import connect
+    from streamlit.proto.BackMsg_pb2 import BackMsg
+    from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+    from streamlit.proto.WidgetStates_pb2 import WidgetState
+except ImportError:
+    print("This benchmark needs streamlit and websockets (pip install websockets)")
+    sys.exit(2)
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(script):
+    port = _free_port()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", script, "--server.headless", "true",
+         "--server.port", str(port), "--browser.gatherUsageStats", "false"],
+        cwd=os.path.dirname(os.path.abspath(script)),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    deadline = time.time() + STARTUP_TIMEOUT
+    while time.time() < deadline:
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1)
+            return server, port
+        except Exception:
+            time.sleep(0.2)
+    server.kill()
+    raise RuntimeError("streamlit did not start")
+
+
+class Session:
+    def __init__(self, ws):
+        self.ws = ws
+        # label -> (widget id, fragment id, options)
+        self.widgets = {}
+        self.states = {}
+        self.exceptions = 0
+
+    def set(self, label, value):
+        widget_id, fragment_id, options = self.widgets[label]
+        state = WidgetState(id=widget_id)
+        if value is True:
+            state.trigger_value = True
+        else:
+            state.string_value = value
+            self.states[widget_id] = state
+        return state, fragment_id
+
+    # Sends one rerun and waits for it to finish. Returns the seconds it
+    # took and the number of elements drawn.
+    def rerun(self, trigger=None, fragment_id=""):
+        msg = BackMsg()
+        client_state = msg.rerun_script
+        client_state.fragment_id = fragment_id
+        for state in self.states.values():
+            client_state.widget_states.widgets.add().CopyFrom(state)
+        if trigger is not None:
+            client_state.widget_states.widgets.add().CopyFrom(trigger)
+
+        start = time.perf_counter()
+        self.ws.send(msg.SerializeToString())
+        elements = 0
+        while True:
+            forward = ForwardMsg.FromString(self.ws.recv(timeout=RUN_TIMEOUT))
+            kind = forward.WhichOneof("type")
+            if kind == "delta":
+                elements += 1
+                self._record(forward.delta)
+            elif kind == "script_finished" and forward.script_finished != ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                return time.perf_counter() - start, elements
+
+    def _record(self, delta):
+        if delta.WhichOneof("type") != "new_element":
+            return
+        kind = delta.new_element.WhichOneof("type")
+        if kind == "exception":
+            self.exceptions += 1
+            return
+        element = getattr(delta.new_element, kind)
+        if hasattr(element, "id") and hasattr(element, "label") and element.id:
+            options = list(getattr(element, "options", []))
+            self.widgets[element.label] = (element.id, delta.fragment_id, options)
+
+
+def measure(session, page, label, values, rounds):
+    session.set("Go to", page)
+    session.rerun()
+    if label not in session.widgets:
+        return None
+    if values is None:
+        values = session.widgets[label][2][1::-1]
+    times = []
+    elements = []
+    scoped = False
+    for n in range(rounds * len(values)):
+        state, fragment_id = session.set(label, values[n % len(values)])
+        scoped = scoped or bool(fragment_id)
+        seconds, drawn = session.rerun(state if values[0] is True else None, fragment_id)
+        times.append(seconds)
+        elements.append(drawn)
+    return statistics.median(times), statistics.median(elements), scoped
+
+
+def main(script=SCRIPT, rounds=ROUNDS):
+    server, port = start_server(script)
+    try:
+        with connect(f"ws://127.0.0.1:{port}/_stcore/stream", subprotocols=["streamlit"],
+                     max_size=None, open_timeout=RUN_TIMEOUT) as ws:
+            session = Session(ws)
+            seconds, elements = session.rerun()
+            print(f"{os.path.relpath(script)}: first run {seconds * 1000:7.0f} ms, {elements} elements")
+            for page, label, values in INTERACTIONS:
+                result = measure(session, page, label, values, rounds)
+                name = f"{page[2:]}: {label}"
+                if result is None:
+                    print(f"  {name:<40} skipped, not drawn")
+                    continue
+                seconds, elements, scoped = result
+                print(f"  {name:<40} {seconds * 1000:7.0f} ms  {elements:5.0f} elements  "
+                      f"{'fragment' if scoped else 'full'} rerun")
+    finally:
+        server.terminate()
+        server.wait()
+    return 1 if session.exceptions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(*[convert(arg) for convert, arg in zip((str, int), sys.argv[1:3])]))
@@ -0,0 +1,82 @@
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from islamic_hub import settings
+from islamic_hub.quran_search import QuranIndex, build_index
+
+# Measures the Quran search index: how long it takes to build from the
+# offline corpus, to open, and to answer queries.
+#
+#   python benchmarks/bench_search.py [corpus path] [rounds]
+#
+# The index is built into a temporary file, so the app's own index is left
+# alone. Each query runs once on a freshly opened index (cold) and then
+# `rounds` more times (warm), where the scores of common words are already
+# memoised but the query itself is ranked again; a repeated query, as when
+# paging through results, is answered from the index's ranked cache.
+# Queries in a language whose edition is not installed just find nothing.
+# Exits non-zero if any cold query takes longer than QUERY_BUDGET.
+
+ROUNDS = 20
+QUERY_BUDGET = 0.05
+
+QUERIES = [
+    "الله",
+    "الرحمن الرحيم",
+    "بِسْمِ ٱللَّهِ ٱلرَّحْمَٰنِ",
+    '"بسم الله الرحمن الرحيم"',
+    "الذين امنوا",
+    "الكتاب",
+    "رب*",
+    "mercy",
+    "the",
+    "believe righteous",
+    '"straight path"',
+    '"those who believe"',
+    "merc*",
+    "forgiv* merciful",
+    "اللہ",
+    "رحم*",
+]
+
+
+def main(corpus_path=None, rounds=ROUNDS):
+    corpus_path = corpus_path or settings.CORPUS_PATH
+    with tempfile.TemporaryDirectory() as directory:
+        index_path = os.path.join(directory, "quran_search.idx")
+        start = time.perf_counter()
+        words = build_index(corpus_path, index_path)
+        build = time.perf_counter() - start
+
+        start = time.perf_counter()
+        index = QuranIndex(index_path)
+        opened = time.perf_counter() - start
+
+        with index:
+            print(f"{', '.join(index.editions)}: {words:,} words, {os.path.getsize(index_path) / 1024 / 1024:.1f} MB")
+            print(f"  build {build:6.2f} s   open {opened * 1000:6.2f} ms")
+            print(f"  {'query':<32} {'matches':>8} {'cold':>9} {'warm':>9}")
+            slowest = 0
+            for query in QUERIES:
+                start = time.perf_counter()
+                total, _ = index.search(query)
+                cold = time.perf_counter() - start
+                times = []
+                for _ in range(rounds):
+                    index._ranked.cache_clear()
+                    start = time.perf_counter()
+                    index.search(query)
+                    times.append(time.perf_counter() - start)
+                slowest = max(slowest, cold)
+                print(f"  {query:<32} {total:8,d} {cold * 1000:6.2f} ms {statistics.median(times) * 1000:6.2f} ms")
+    print(f"slowest cold query {slowest * 1000:.2f} ms; budget {QUERY_BUDGET * 1000:.0f} ms")
+    return 1 if slowest > QUERY_BUDGET else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(*[convert(arg) for convert, arg in zip((str, int), sys.argv[1:3])]))
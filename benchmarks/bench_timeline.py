@@ -0,0 +1,117 @@
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from islamic_hub import timeline
+
+# Compares the SVG prayer timeline with the Plotly figure it replaced.
+#
+#   python benchmarks/bench_timeline.py
+#
+# For each renderer, reports the server time per render and the bytes sent
+# to the browser for one chart. The SVG is timed both cold (chart cache
+# cleared) and warm (only the marker redrawn). The Plotly path is timed
+# only if plotly is installed. It builds the figure exactly as the Prayer
+# Times page used to and serializes it the way st.plotly_chart does. Its
+# payload excludes plotly.js itself, which the browser also had to load.
+# Exits non-zero if a warm SVG render takes longer than BUDGET seconds.
+
+BUDGET = 0.0005
+ROWS = [
+    ("Fajr", "04:52", 4 + 52 / 60),
+    ("Sunrise", "06:15", 6 + 15 / 60),
+    ("Dhuhr", "11:50", 11 + 50 / 60),
+    ("Asr", "15:04", 15 + 4 / 60),
+    ("Maghrib", "17:25", 17 + 25 / 60),
+    ("Isha", "18:43", 18 + 43 / 60),
+]
+CURRENT_HOUR = 14.5
+
+
+def per_call(fn, number=200, repeat=5):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        timings.append((time.perf_counter() - start) / number)
+    return min(timings)
+
+
+def svg_cold():
+    timeline._chart.cache_clear()
+    return timeline.render(ROWS, CURRENT_HOUR)
+
+
+def svg_warm():
+    return timeline.render(ROWS, CURRENT_HOUR)
+
+
+def plotly_figure():
+    import pandas as pd
+    import plotly.express as px
+
+    prayer_df = pd.DataFrame({
+        'Prayer': [name for name, _, _ in ROWS],
+        'Time': [label for _, label, _ in ROWS],
+        'Hour': [hour for _, _, hour in ROWS],
+        'Color': ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd', '#8c564b']
+    })
+    fig = px.timeline(
+        prayer_df,
+        x_start="Hour",
+        x_end=[h + 1 for h in prayer_df['Hour']],
+        y="Prayer",
+        color="Prayer",
+        labels={"Hour": "Time of Day"},
+        color_discrete_sequence=prayer_df['Color'],
+        title="Daily Prayer Timeline"
+    )
+    fig.update_layout(
+        xaxis=dict(
+            title="Time of Day",
+            tickvals=list(range(0, 26, 2)),
+            ticktext=[f"{h % 24:02d}:00" for h in range(0, 26, 2)],
+            range=[4, 22]
+        ),
+        yaxis=dict(title=""),
+        height=250
+    )
+    fig.add_shape(
+        type="line", x0=CURRENT_HOUR, y0=-0.5, x1=CURRENT_HOUR, y1=len(ROWS) - 0.5,
+        line=dict(color="red", width=2, dash="dash")
+    )
+    fig.add_annotation(x=CURRENT_HOUR, y=len(ROWS) - 0.5, text="Current Time", showarrow=True, arrowhead=1, ax=0, ay=-30)
+    return fig.to_json()
+
+
+def plotly_js_size():
+    import plotly
+    path = os.path.join(os.path.dirname(plotly.__file__), "package_data", "plotly.min.js")
+    return os.path.getsize(path) if os.path.exists(path) else None
+
+
+def main():
+    results = [
+        ("svg, cached chart", per_call(svg_warm, 2000), len(svg_warm().encode("utf-8"))),
+        ("svg, cold", per_call(svg_cold), len(svg_cold().encode("utf-8"))),
+    ]
+    try:
+        size = len(plotly_figure().encode("utf-8"))
+        results.append(("plotly figure", per_call(plotly_figure, 20), size))
+        js_size = plotly_js_size()
+    except ImportError:
+        js_size = None
+        print("plotly is not installed; skipping the Plotly comparison")
+
+    for name, seconds, size in results:
+        print(f"  {name:<18} {seconds * 1e6:10.1f} us/render  {size / 1024:8.1f} KiB")
+    if js_size:
+        print(f"  {'plotly.js bundle':<18} {'':>20}  {js_size / 1024:8.1f} KiB")
+    return 0 if results[0][1] < BUDGET else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
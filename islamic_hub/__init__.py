@@ -0,0 +1,4 @@
+# Helper package for the Islamic Resources Hub Streamlit app.
+# islamic_resources.py sets up the app and its sidebar; the pages live in
+# islamic_hub.pages, their bundled collections in islamic_hub.datasets
+# and the data access code they share in the rest of this package.
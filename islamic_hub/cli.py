@@ -0,0 +1,52 @@
+import argparse
+
+from islamic_hub import settings
+
+# Command line entry point, run as:
+#   python -m islamic_resources sync --editions quran-uthmani,ur.jalandhry,en.asad
+#   python -m islamic_resources index
+
+
+def _editions(value):
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m islamic_resources")
+    commands = parser.add_subparsers(dest="command")
+    commands.required = True
+
+    sync = commands.add_parser("sync", help="Download full Quran editions into the offline corpus")
+    sync.add_argument("--editions", type=_editions, default=settings.CORPUS_EDITIONS,
+                      help="Comma separated edition identifiers (default: %(default)s)")
+    sync.add_argument("--workers", type=int, default=4, help="Parallel downloads (default: %(default)s)")
+    sync.add_argument("--api-url", default=settings.QURAN_API_URL, help="Quran API base URL (default: %(default)s)")
+    sync.add_argument("--corpus", default=settings.CORPUS_PATH, help="Corpus database path (default: %(default)s)")
+    sync.add_argument("--force", action="store_true", help="Download editions that are already installed")
+    sync.add_argument("--index", default=settings.SEARCH_INDEX_PATH, help="Search index path (default: %(default)s)")
+
+    index = commands.add_parser("index", help="Rebuild the Quran search index from the offline corpus")
+    index.add_argument("--corpus", default=settings.CORPUS_PATH, help="Corpus database path (default: %(default)s)")
+    index.add_argument("--index", default=settings.SEARCH_INDEX_PATH, help="Search index path (default: %(default)s)")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.command == "sync":
+        from islamic_hub.sync import sync
+        failed = sync(args.editions, corpus_path=args.corpus, api_url=args.api_url,
+                      workers=args.workers, force=args.force, index_path=args.index)
+        return 1 if failed else 0
+    if args.command == "index":
+        import time
+        from islamic_hub.quran_search import build_index
+        started = time.perf_counter()
+        try:
+            words = build_index(args.corpus, args.index)
+        except ValueError as e:
+            print(e)
+            return 1
+        print(f"Indexed {words} words for search in {time.perf_counter() - started:.1f}s")
+        return 0
+    return 2
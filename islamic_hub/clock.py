@@ -0,0 +1,98 @@
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+
+# Wall-clock time at the user's location rather than the server's.
+#
+# Everything here works with aware datetimes. A location carries an IANA
+# zone name; when it has none, a fixed offset is estimated from the
+# longitude, the same estimate the prayer time engine uses. Zone objects
+# are built once per name, so converting a time on every render is only
+# a table lookup.
+
+# Timings that belong to the evening of the day. When one of them falls
+# before Dhuhr it has wrapped past local midnight (Isha and the night
+# portions at high latitudes).
+EVENING_TIMINGS = ("Asr", "Sunset", "Maghrib", "Isha", "Midnight", "Firstthird", "Lastthird")
+
+
+# pytz is only imported once a zone is needed, so pages that show no
+# times do not load it
+@lru_cache(maxsize=1024)
+def get_zone(name):
+    import pytz
+    try:
+        return pytz.timezone(name)
+    except pytz.UnknownTimeZoneError:
+        return None
+
+
+@lru_cache(maxsize=None)
+def _fixed_zone(hours):
+    import pytz
+    return pytz.FixedOffset(hours * 60)
+
+
+# Zone for a location: its IANA zone if known, else the offset of the
+# nearest whole hour of longitude
+def zone_for(timezone=None, longitude=0):
+    zone = get_zone(timezone) if timezone else None
+    return zone or _fixed_zone(round(longitude / 15))
+
+
+def now(zone):
+    return datetime.now(timezone.utc).astimezone(zone)
+
+
+def today(zone):
+    return now(zone).date()
+
+
+# UTC offset in hours at local noon of a day, which is what the prayer
+# time calculations use for the whole day
+def utc_offset(zone, day):
+    return zone.utcoffset(datetime(day.year, day.month, day.day, 12)).total_seconds() / 3600
+
+
+# Aware datetime for fractional local hours on a day, such as the values
+# computed by the prayer time engine. Rounded to the nearest minute, like
+# the "HH:MM" timings shown elsewhere.
+def at_hours(zone, day, hours, offset=None):
+    if offset is None:
+        offset = utc_offset(zone, day)
+    midnight = datetime(day.year, day.month, day.day, tzinfo=timezone.utc)
+    return (midnight + timedelta(minutes=round((hours - offset) * 60))).astimezone(zone)
+
+
+# [(name, aware datetime)] in chronological order for a day's timings
+# given as fractional local hours. Timings that could not be computed
+# (NaN) are left out.
+def schedule(zone, day, timings, names):
+    offset = utc_offset(zone, day)
+    midday = timings.get("Dhuhr", 12)
+    events = []
+    for name in names:
+        hours = timings[name]
+        if hours != hours:
+            continue
+        if name in EVENING_TIMINGS and hours < midday:
+            hours += 24
+        events.append((name, at_hours(zone, day, hours, offset)))
+    events.sort(key=lambda event: event[1])
+    return events
+
+
+# The first (name, datetime) of a schedule that is still ahead, or None
+def next_event(events, moment):
+    for name, when in events:
+        if when > moment:
+            return name, when
+    return None
+
+
+# "2 h 05 min" / "12 min", counting a started minute as a whole one
+def format_duration(delta):
+    minutes = max(0, -int(-delta.total_seconds() // 60))
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours} h {minutes:02d} min"
+    return f"{minutes} min"
@@ -0,0 +1,289 @@
+import json
+import os
+import sqlite3
+import threading
+from functools import lru_cache
+
+from islamic_hub import settings
+
+# Offline store for the full text of the Quran.
+#
+# Each installed edition holds all 6236 ayahs. Surah, juz, manzil, page,
+# ruku and hizb metadata is stored once and shared by every edition. The
+# juz(), surah() and ayah() readers return the same JSON shapes as the
+# alquran.cloud endpoints they replace, so the pages do not need to know
+# where the data came from.
+
+TOTAL_AYAHS = 6236
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS surahs (
+    number INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    english_name TEXT NOT NULL,
+    english_name_translation TEXT NOT NULL,
+    revelation_type TEXT NOT NULL,
+    number_of_ayahs INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS ayahs (
+    number INTEGER PRIMARY KEY,
+    surah INTEGER NOT NULL REFERENCES surahs(number),
+    number_in_surah INTEGER NOT NULL,
+    juz INTEGER NOT NULL,
+    manzil INTEGER NOT NULL,
+    page INTEGER NOT NULL,
+    ruku INTEGER NOT NULL,
+    hizb_quarter INTEGER NOT NULL,
+    sajda TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ayahs_surah ON ayahs(surah, number_in_surah);
+CREATE INDEX IF NOT EXISTS ayahs_juz ON ayahs(juz);
+CREATE INDEX IF NOT EXISTS ayahs_page ON ayahs(page);
+CREATE INDEX IF NOT EXISTS ayahs_hizb ON ayahs(hizb_quarter);
+CREATE TABLE IF NOT EXISTS editions (
+    identifier TEXT PRIMARY KEY,
+    info TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS checksums (
+    edition TEXT PRIMARY KEY,
+    sha256 TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS texts (
+    edition TEXT NOT NULL,
+    number INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    PRIMARY KEY (edition, number)
+) WITHOUT ROWID;
+"""
+
+# Each corpus memoises this many juz, surah, page, hizb and ayah reads
+READ_CACHE_SIZE = 4096
+
+AYAH_COLUMNS = "a.number, t.text, a.number_in_surah, a.juz, a.manzil, a.page, a.ruku, a.hizb_quarter, a.sajda, a.surah"
+
+
+class QuranCorpus:
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        self._surahs = None
+        self._editions = None
+        self._mtime = None
+        # Per corpus rather than on the class, so the reads of one corpus
+        # are neither served by another nor keep it alive
+        self._read = lru_cache(maxsize=READ_CACHE_SIZE)(self._load)
+
+    # One connection per thread, Streamlit runs every session in its own thread
+    def _connection(self, create=False):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            return conn
+        if not create and not os.path.exists(self.path):
+            return None
+        if create:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        conn = sqlite3.connect(self.path)
+        conn.executescript(SCHEMA)
+        self._local.conn = conn
+        return conn
+
+    def _clear_caches(self):
+        self._surahs = None
+        self._editions = None
+        self._read.cache_clear()
+
+    # Drop memoised reads when another process (e.g. the sync command) has
+    # written to the database since we last looked
+    def _refresh(self):
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except OSError:
+            mtime = None
+        if mtime != self._mtime:
+            self._mtime = mtime
+            self._clear_caches()
+
+    def installed_editions(self):
+        self._refresh()
+        if self._editions is None:
+            conn = self._connection()
+            if conn is None:
+                return {}
+            rows = conn.execute("SELECT identifier, info FROM editions").fetchall()
+            self._editions = {identifier: json.loads(info) for identifier, info in rows}
+        return self._editions
+
+    def has_edition(self, edition):
+        return edition in self.installed_editions()
+
+    def edition_checksum(self, edition):
+        conn = self._connection()
+        if conn is None:
+            return None
+        row = conn.execute("SELECT sha256 FROM checksums WHERE edition = ?", (edition,)).fetchone()
+        return row[0] if row else None
+
+    # Store a full edition as returned by /v1/quran/{edition}
+    def install_edition(self, data, checksum=None):
+        edition = data["edition"]
+        identifier = edition["identifier"]
+        surahs = data["surahs"]
+        ayah_count = sum(len(surah["ayahs"]) for surah in surahs)
+        if len(surahs) != 114 or ayah_count != TOTAL_AYAHS:
+            raise ValueError(f"Edition {identifier} is incomplete: {len(surahs)} surahs, {ayah_count} ayahs")
+
+        surah_rows = []
+        ayah_rows = []
+        text_rows = []
+        for surah in surahs:
+            surah_rows.append((
+                surah["number"], surah["name"], surah["englishName"],
+                surah["englishNameTranslation"], surah["revelationType"], len(surah["ayahs"])
+            ))
+            for ayah in surah["ayahs"]:
+                ayah_rows.append((
+                    ayah["number"], surah["number"], ayah["numberInSurah"], ayah["juz"],
+                    ayah["manzil"], ayah["page"], ayah["ruku"], ayah["hizbQuarter"],
+                    json.dumps(ayah.get("sajda", False))
+                ))
+                text_rows.append((identifier, ayah["number"], ayah["text"]))
+
+        with self._write_lock:
+            conn = self._connection(create=True)
+            with conn:
+                conn.executemany("INSERT OR IGNORE INTO surahs VALUES (?, ?, ?, ?, ?, ?)", surah_rows)
+                conn.executemany("INSERT OR IGNORE INTO ayahs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", ayah_rows)
+                conn.execute("DELETE FROM texts WHERE edition = ?", (identifier,))
+                conn.executemany("INSERT INTO texts VALUES (?, ?, ?)", text_rows)
+                conn.execute("INSERT OR REPLACE INTO editions VALUES (?, ?)", (identifier, json.dumps(edition)))
+                if checksum:
+                    conn.execute("INSERT OR REPLACE INTO checksums VALUES (?, ?)", (identifier, checksum))
+            self._clear_caches()
+        return identifier
+
+    def surahs(self):
+        self._refresh()
+        if self._surahs is None:
+            conn = self._connection()
+            if conn is None:
+                return []
+            self._surahs = [
+                {
+                    "number": row[0],
+                    "name": row[1],
+                    "englishName": row[2],
+                    "englishNameTranslation": row[3],
+                    "revelationType": row[4],
+                    "numberOfAyahs": row[5]
+                }
+                for row in conn.execute("SELECT * FROM surahs ORDER BY number")
+            ]
+        return self._surahs
+
+    def _ayah(self, row, with_surah=True):
+        ayah = {
+            "number": row[0],
+            "text": row[1],
+            "numberInSurah": row[2],
+            "juz": row[3],
+            "manzil": row[4],
+            "page": row[5],
+            "ruku": row[6],
+            "hizbQuarter": row[7],
+            "sajda": json.loads(row[8])
+        }
+        if with_surah:
+            ayah["surah"] = self.surahs()[row[9] - 1]
+        return ayah
+
+    # Memoised in self._read so repeat renders skip SQLite entirely. Callers
+    # must treat the returned dicts as read-only.
+    def _load(self, kind, number, edition):
+        if not self.has_edition(edition):
+            return None
+        conn = self._connection()
+        edition_info = self.installed_editions()[edition]
+
+        if kind == "ayah":
+            row = conn.execute(
+                f"SELECT {AYAH_COLUMNS} FROM ayahs a JOIN texts t ON t.number = a.number AND t.edition = ? "
+                "WHERE a.number = ?", (edition, number)
+            ).fetchone()
+            if row is None:
+                return None
+            ayah = self._ayah(row)
+            ayah["edition"] = edition_info
+            return ayah
+
+        column = {"juz": "juz", "surah": "surah", "page": "page", "hizb": "hizb_quarter"}[kind]
+        rows = conn.execute(
+            f"SELECT {AYAH_COLUMNS} FROM ayahs a JOIN texts t ON t.number = a.number AND t.edition = ? "
+            f"WHERE a.{column} = ? ORDER BY a.number", (edition, number)
+        ).fetchall()
+        if not rows:
+            return None
+
+        if kind == "surah":
+            surah = dict(self.surahs()[number - 1])
+            surah["ayahs"] = [self._ayah(row, with_surah=False) for row in rows]
+            surah["edition"] = edition_info
+            return surah
+
+        ayahs = [self._ayah(row) for row in rows]
+        surahs_in_range = {}
+        for ayah in ayahs:
+            surahs_in_range.setdefault(str(ayah["surah"]["number"]), ayah["surah"])
+        return {
+            "number": number,
+            "ayahs": ayahs,
+            "surahs": surahs_in_range,
+            "edition": edition_info
+        }
+
+    def juz(self, juz_number, edition):
+        self._refresh()
+        return self._read("juz", int(juz_number), edition)
+
+    def surah(self, surah_number, edition):
+        self._refresh()
+        return self._read("surah", int(surah_number), edition)
+
+    def page(self, page_number, edition):
+        self._refresh()
+        return self._read("page", int(page_number), edition)
+
+    def hizb_quarter(self, hizb_number, edition):
+        self._refresh()
+        return self._read("hizb", int(hizb_number), edition)
+
+    # Accepts the global ayah number (1-6236) or a "surah:ayah" reference
+    def ayah(self, reference, edition):
+        self._refresh()
+        if isinstance(reference, str) and ":" in reference:
+            surah_number, number_in_surah = (int(part) for part in reference.split(":", 1))
+            conn = self._connection()
+            if conn is None:
+                return None
+            row = conn.execute(
+                "SELECT number FROM ayahs WHERE surah = ? AND number_in_surah = ?",
+                (surah_number, number_in_surah)
+            ).fetchone()
+            if row is None:
+                return None
+            reference = row[0]
+        return self._read("ayah", int(reference), edition)
+
+
+_corpus = None
+_corpus_lock = threading.Lock()
+
+
+def get_corpus():
+    global _corpus
+    if _corpus is None:
+        with _corpus_lock:
+            if _corpus is None:
+                _corpus = QuranCorpus(settings.CORPUS_PATH)
+    return _corpus
+
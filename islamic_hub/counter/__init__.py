@@ -0,0 +1,47 @@
+import os
+
+import streamlit.components.v1 as components
+
+# Tasbeeh counter whose taps are counted in the browser.
+#
+# The counter is a static Streamlit component (frontend/index.html, no
+# build step). A tap only updates the page. The running total is sent
+# back in batches, and each batch is the component's new value, so the
+# app reruns once per batch rather than once per tap. The browser also
+# keeps the day's count in localStorage, so a reload carries on from where
+# the user left off.
+
+FRONTEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "frontend")
+
+# Send a batch after this many taps, or after this long without a tap
+SYNC_EVERY = 33
+SYNC_DELAY = 2.0
+
+_component = components.declare_component("tasbeeh_counter", path=FRONTEND_DIR)
+
+
+# Draws the counter and returns the latest batch the browser has sent, or
+# None before the first one. A batch is {"count": the day's total,
+# "batch": sequence number, "day": "YYYY-MM-DD" in the browser's time zone,
+# "user": anonymous id kept by the browser, "reset": whether the user reset
+# the counter}. The browser sends one as soon as the counter loads.
+#
+# count is the server's total: the counter starts from it, and catches up
+# to it on later runs if it is ahead of the browser. name keeps separate
+# counters apart in the browser's storage. on_change runs before the rerun
+# a batch causes, with the batch in st.session_state[key].
+def tasbeeh_counter(name, count=0, goal=100, steps=(1, 10), description="", key=None, on_change=None):
+    return _component(
+        name=name,
+        count=count,
+        goal=goal,
+        # A tuple, not a list: Streamlit checks list arguments for
+        # dataframes, which imports pandas
+        steps=tuple(steps),
+        description=description,
+        syncEvery=SYNC_EVERY,
+        syncDelay=int(SYNC_DELAY * 1000),
+        key=key,
+        on_change=on_change,
+        default=None
+    )
@@ -0,0 +1,363 @@
+import atexit
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+
+from islamic_hub import settings
+
+log = logging.getLogger(__name__)
+
+# Persistent dhikr counters: each user's daily total and the community
+# total for the day.
+#
+# Clients count on their own and report the user's total for the day.
+# Reports are coalesced in memory and written in one batch every
+# flush_interval seconds, so a burst of taps, or thousands of users
+# tapping at once, turns into a single transaction per interval. A user's
+# own total includes what is still pending, so they see it immediately;
+# the community total is what has been written.
+#
+# A report is an absolute total, not a change, and the stored total only
+# moves up: each report is applied as max(stored, reported), unless the
+# user reset their counter. A device that is behind, or the same report
+# reaching two workers, cannot undo or double what was counted. The
+# community total grows by however much a user's total goes up, counting
+# from zero after a reset, and is worked out by the backend in the same
+# transaction. A reset does not take recitations away from it.
+#
+# Backends apply a batch atomically, so several worker processes can
+# share one store:
+#
+#   SQLiteBackend  a database in WAL mode on the local disk (default)
+#   RedisBackend   a Redis server, for workers spread over several hosts
+#   MemoryBackend  process memory only, for development and benchmarks
+#
+# Days are "YYYY-MM-DD" strings in the user's own calendar, as reported
+# by their browser.
+#
+# A report above MAX_COUNT is dropped. If a backend still cannot store a
+# user's reports, only that user's reports are dropped and logged; the
+# rest of the batch is written.
+
+# Far above any day's recitations, and far enough below SQLite's 64-bit
+# integers, and the 2**53 Redis scripts count exactly to, that the
+# community total cannot overflow either
+MAX_COUNT = 10 ** 9
+
+# What a backend raises for a report it cannot store, rather than for
+# being unavailable
+DATA_ERRORS = (OverflowError, ValueError, TypeError)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS user_totals (
+    counter TEXT NOT NULL,
+    user TEXT NOT NULL,
+    day TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (counter, user, day)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS day_totals (
+    counter TEXT NOT NULL,
+    day TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (counter, day)
+) WITHOUT ROWID;
+"""
+
+
+# A user's new total from their stored total and a report, and how much
+# it adds to the community total
+def _updated(stored, count, reset):
+    if reset:
+        return count, count
+    return max(stored, count), max(0, count - stored)
+
+
+# Pending reports for one user and day are a list of (count, reset),
+# applied in order. Reports between resets are combined into one, but a
+# reset starts a new entry, so what was counted before it still reaches
+# the community total.
+def _merge(reports, later):
+    for count, reset in later:
+        if reset or not reports:
+            reports = reports + [(count, reset)]
+        else:
+            reports = reports[:-1] + [(max(reports[-1][0], count), reports[-1][1])]
+    return reports
+
+
+# A user's total after their pending reports
+def _replay(stored, reports):
+    for count, reset in reports:
+        stored, _ = _updated(stored, count, reset)
+    return stored
+
+
+class SQLiteBackend:
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+
+    # One connection per thread, Streamlit runs every session in its own thread
+    def _connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=10)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(SCHEMA)
+            self._local.conn = conn
+        return conn
+
+    # reports maps (counter, user, day) to a list of (count, reset), see
+    # _merge(). Returns the keys whose reports could not be stored.
+    def apply(self, reports):
+        try:
+            self._apply(reports)
+            return []
+        except DATA_ERRORS:
+            pass
+        # The batch was rolled back; write it again one user at a time to
+        # find the reports the database cannot store
+        rejected = []
+        for key, pending in reports.items():
+            try:
+                self._apply({key: pending})
+            except DATA_ERRORS:
+                rejected.append(key)
+        return rejected
+
+    def _apply(self, reports):
+        conn = self._connection()
+        with conn:
+            # Take the write lock before reading the stored totals, so no
+            # other process changes them in between
+            conn.execute("BEGIN IMMEDIATE")
+            # Insert-then-update rather than an upsert, which needs SQLite 3.24
+            conn.executemany("INSERT OR IGNORE INTO user_totals VALUES (?, ?, ?, 0)", list(reports))
+            conn.executemany(
+                "INSERT OR IGNORE INTO day_totals VALUES (?, ?, 0)",
+                list(dict.fromkeys((counter, day) for counter, _, day in reports))
+            )
+            # The first report of every user, then the second of those
+            # that have one, and so on. Only a reset makes a second.
+            for step in range(max(len(pending) for pending in reports.values())):
+                rows = [key + pending[step] for key, pending in reports.items() if step < len(pending)]
+                conn.executemany(
+                    "UPDATE day_totals SET count = count + CASE WHEN ? THEN ? ELSE MAX(0, ? - (SELECT count"
+                    " FROM user_totals WHERE counter = ? AND user = ? AND day = ?)) END WHERE counter = ? AND day = ?",
+                    [(int(reset), count, count, counter, user, day, counter, day)
+                     for counter, user, day, count, reset in rows]
+                )
+                conn.executemany(
+                    "UPDATE user_totals SET count = CASE WHEN ? THEN ? ELSE MAX(count, ?) END"
+                    " WHERE counter = ? AND user = ? AND day = ?",
+                    [(int(reset), count, count, counter, user, day) for counter, user, day, count, reset in rows]
+                )
+
+    def user_total(self, counter, user, day):
+        row = self._connection().execute(
+            "SELECT count FROM user_totals WHERE counter = ? AND user = ? AND day = ?", (counter, user, day)
+        ).fetchone()
+        return row[0] if row else 0
+
+    def day_total(self, counter, day):
+        row = self._connection().execute(
+            "SELECT count FROM day_totals WHERE counter = ? AND day = ?", (counter, day)
+        ).fetchone()
+        return row[0] if row else 0
+
+
+class RedisBackend:
+    # Totals expire this long after their last change
+    EXPIRE_SECONDS = 400 * 24 * 60 * 60
+
+    # KEYS: the day's user totals and community total. ARGV: user, count,
+    # reset (1 or 0), expiry, largest count. Runs atomically on the server,
+    # and refuses a count it cannot store before changing anything.
+    RECORD_SCRIPT = """
+local count = tonumber(ARGV[2])
+if not count or count < 0 or count > tonumber(ARGV[5]) or count ~= math.floor(count) then
+    return redis.error_reply("invalid count " .. ARGV[2])
+end
+local stored = tonumber(redis.call("HGET", KEYS[1], ARGV[1]) or "0")
+local added = count
+if ARGV[3] ~= "1" then
+    added = math.max(0, count - stored)
+    count = math.max(stored, count)
+end
+redis.call("HSET", KEYS[1], ARGV[1], count)
+redis.call("INCRBY", KEYS[2], added)
+redis.call("EXPIRE", KEYS[1], ARGV[4])
+redis.call("EXPIRE", KEYS[2], ARGV[4])
+"""
+
+    def __init__(self, url):
+        try:
+            import redis
+        except ImportError:
+            raise ImportError("The redis counter backend needs the redis package (pip install redis)")
+        self._redis = redis.Redis.from_url(url)
+        self._record = self._redis.register_script(self.RECORD_SCRIPT)
+        self._error = redis.ResponseError
+
+    @staticmethod
+    def _user_key(counter, day):
+        return f"islamic-hub:counter:{counter}:{day}:users"
+
+    @staticmethod
+    def _day_key(counter, day):
+        return f"islamic-hub:counter:{counter}:{day}:total"
+
+    # A transaction does not stop at a failed command, so a refused report
+    # leaves the others written
+    def apply(self, reports):
+        pipe = self._redis.pipeline(transaction=True)
+        keys = []
+        for (counter, user, day), pending in reports.items():
+            for count, reset in pending:
+                self._record(
+                    keys=[self._user_key(counter, day), self._day_key(counter, day)],
+                    args=[user, count, int(reset), self.EXPIRE_SECONDS, MAX_COUNT],
+                    client=pipe
+                )
+                keys.append((counter, user, day))
+        results = pipe.execute(raise_on_error=False)
+        return list(dict.fromkeys(key for key, result in zip(keys, results) if isinstance(result, self._error)))
+
+    def user_total(self, counter, user, day):
+        return int(self._redis.hget(self._user_key(counter, day), user) or 0)
+
+    def day_total(self, counter, day):
+        return int(self._redis.get(self._day_key(counter, day)) or 0)
+
+
+class MemoryBackend:
+    def __init__(self):
+        self._users = defaultdict(int)
+        self._days = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def apply(self, reports):
+        with self._lock:
+            for (counter, user, day), pending in reports.items():
+                for count, reset in pending:
+                    total, added = _updated(self._users[(counter, user, day)], count, reset)
+                    self._users[(counter, user, day)] = total
+                    self._days[(counter, day)] += added
+        return []
+
+    def user_total(self, counter, user, day):
+        return self._users.get((counter, user, day), 0)
+
+    def day_total(self, counter, day):
+        return self._days.get((counter, day), 0)
+
+
+class CounterStore:
+    def __init__(self, backend, flush_interval=2.0):
+        self.backend = backend
+        self.flush_interval = flush_interval
+        # (counter, user, day) -> reports not yet written, see _merge()
+        self._reports = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._flusher = None
+        self._stats = {"reports": 0, "flushes": 0, "rows_written": 0, "errors": 0, "dropped": 0}
+
+    def _start_flusher(self):
+        if self._flusher is None:
+            self._flusher = threading.Thread(target=self._flush_loop, name="counter-flush", daemon=True)
+            self._flusher.start()
+
+    def _flush_loop(self):
+        while True:
+            time.sleep(self.flush_interval)
+            self.flush()
+
+    # Records a user's total for a day, as reported by a client that counts
+    # on its own. The stored total only goes down when reset is true.
+    def record(self, counter, user, day, count, reset=False):
+        key = (counter, user, day)
+        if int(count) > MAX_COUNT:
+            log.warning("Dropped a %s report of %s for %s on %s, over the maximum", counter, count, user, day)
+            with self._lock:
+                self._stats["dropped"] += 1
+            return
+        with self._lock:
+            self._reports[key] = _merge(self._reports.get(key, []), [(max(int(count), 0), bool(reset))])
+            self._stats["reports"] += 1
+            self._start_flusher()
+
+    # Writes all pending reports in one batch. On failure they are put
+    # back, under any that arrived since, and retried with the next flush.
+    # Reports the backend refuses are dropped, or they would fail every
+    # flush after.
+    def flush(self):
+        with self._flush_lock:
+            with self._lock:
+                reports, self._reports = self._reports, {}
+            if not reports:
+                return 0
+            try:
+                rejected = self.backend.apply(reports)
+            except Exception:
+                with self._lock:
+                    for key, pending in reports.items():
+                        self._reports[key] = _merge(pending, self._reports.get(key, []))
+                    self._stats["errors"] += 1
+                return 0
+            for key in rejected:
+                log.warning("Dropped %s reports for %s on %s the counter store refused: %s", key[0], key[1], key[2],
+                            reports[key])
+            written = len(reports) - len(rejected)
+            with self._lock:
+                self._stats["flushes"] += 1
+                self._stats["rows_written"] += written
+                self._stats["dropped"] += len(rejected)
+            return written
+
+    # Reads hold the flush lock, so a batch is never counted both as
+    # pending and as written, or as neither
+    def user_total(self, counter, user, day):
+        with self._flush_lock:
+            stored = self.backend.user_total(counter, user, day)
+            with self._lock:
+                pending = self._reports.get((counter, user, day), [])
+            return _replay(stored, pending)
+
+    def day_total(self, counter, day):
+        return self.backend.day_total(counter, day)
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            stats["pending"] = len(self._reports)
+        return stats
+
+
+def _backend():
+    if settings.COUNTER_BACKEND == "redis":
+        return RedisBackend(settings.COUNTER_REDIS_URL)
+    if settings.COUNTER_BACKEND == "memory":
+        return MemoryBackend()
+    return SQLiteBackend(settings.COUNTER_PATH)
+
+
+_store = None
+_lock = threading.Lock()
+
+
+def get_store():
+    global _store
+    if _store is None:
+        with _lock:
+            if _store is None:
+                _store = CounterStore(_backend(), flush_interval=settings.COUNTER_FLUSH_INTERVAL)
+                # Write what is still pending when the server shuts down
+                atexit.register(_store.flush)
+    return _store
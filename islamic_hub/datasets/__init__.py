@@ -0,0 +1,2 @@
+# Collections that ship with the app, one module each, imported only by
+# the pages that show them.
@@ -0,0 +1,103 @@
+# The 99 names of Allah, shown when the names cannot be downloaded
+
+NAMES = [
+    {"number": 1, "name": "الرحمن", "transliteration": "Ar-Rahman", "en": {"meaning": "The Most Compassionate"}},
+    {"number": 2, "name": "الرحيم", "transliteration": "Ar-Raheem", "en": {"meaning": "The Most Merciful"}},
+    {"number": 3, "name": "الملك", "transliteration": "Al-Malik", "en": {"meaning": "The King, The Sovereign"}},
+    {"number": 4, "name": "القدوس", "transliteration": "Al-Quddus", "en": {"meaning": "The Holy One"}},
+    {"number": 5, "name": "السلام", "transliteration": "As-Salam", "en": {"meaning": "The Source of Peace"}},
+    {"number": 6, "name": "المؤمن", "transliteration": "Al-Mu'min", "en": {"meaning": "The Guarantor of Faith"}},
+    {"number": 7, "name": "المهيمن", "transliteration": "Al-Muhaymin", "en": {"meaning": "The Guardian"}},
+    {"number": 8, "name": "العزيز", "transliteration": "Al-Aziz", "en": {"meaning": "The Mighty"}},
+    {"number": 9, "name": "الجبار", "transliteration": "Al-Jabbar", "en": {"meaning": "The Compeller"}},
+    {"number": 10, "name": "المتكبر", "transliteration": "Al-Mutakabbir", "en": {"meaning": "The Greatest"}},
+    {"number": 11, "name": "الخالق", "transliteration": "Al-Khaliq", "en": {"meaning": "The Creator"}},
+    {"number": 12, "name": "البارئ", "transliteration": "Al-Bari'", "en": {"meaning": "The Maker"}},
+    {"number": 13, "name": "المصور", "transliteration": "Al-Musawwir", "en": {"meaning": "The Fashioner"}},
+    {"number": 14, "name": "الغفار", "transliteration": "Al-Ghaffar", "en": {"meaning": "The Ever-Forgiving"}},
+    {"number": 15, "name": "القهار", "transliteration": "Al-Qahhar", "en": {"meaning": "The Subduer"}},
+    {"number": 16, "name": "الوهاب", "transliteration": "Al-Wahhab", "en": {"meaning": "The Bestower"}},
+    {"number": 17, "name": "الرزاق", "transliteration": "Ar-Razzaq", "en": {"meaning": "The Provider"}},
+    {"number": 18, "name": "الفتاح", "transliteration": "Al-Fattah", "en": {"meaning": "The Opener"}},
+    {"number": 19, "name": "العليم", "transliteration": "Al-Alim", "en": {"meaning": "The All-Knowing"}},
+    {"number": 20, "name": "القابض", "transliteration": "Al-Qabid", "en": {"meaning": "The Withholder"}},
+    {"number": 21, "name": "الباسط", "transliteration": "Al-Basit", "en": {"meaning": "The Extender"}},
+    {"number": 22, "name": "الخافض", "transliteration": "Al-Khafid", "en": {"meaning": "The Abaser"}},
+    {"number": 23, "name": "الرافع", "transliteration": "Ar-Rafi", "en": {"meaning": "The Exalter"}},
+    {"number": 24, "name": "المعز", "transliteration": "Al-Mu'izz", "en": {"meaning": "The Bestower of Honors"}},
+    {"number": 25, "name": "المذل", "transliteration": "Al-Mudhill", "en": {"meaning": "The Humiliator"}},
+    {"number": 26, "name": "السميع", "transliteration": "As-Sami", "en": {"meaning": "The All-Hearing"}},
+    {"number": 27, "name": "البصير", "transliteration": "Al-Basir", "en": {"meaning": "The All-Seeing"}},
+    {"number": 28, "name": "الحكم", "transliteration": "Al-Hakam", "en": {"meaning": "The Judge"}},
+    {"number": 29, "name": "العدل", "transliteration": "Al-Adl", "en": {"meaning": "The Just"}},
+    {"number": 30, "name": "اللطيف", "transliteration": "Al-Latif", "en": {"meaning": "The Subtle One"}},
+    {"number": 31, "name": "الخبير", "transliteration": "Al-Khabir", "en": {"meaning": "The All-Aware"}},
+    {"number": 32, "name": "الحليم", "transliteration": "Al-Halim", "en": {"meaning": "The Forbearing"}},
+    {"number": 33, "name": "العظيم", "transliteration": "Al-Azim", "en": {"meaning": "The Magnificent"}},
+    {"number": 34, "name": "الغفور", "transliteration": "Al-Ghafur", "en": {"meaning": "The Forgiving"}},
+    {"number": 35, "name": "الشكور", "transliteration": "Ash-Shakur", "en": {"meaning": "The Appreciative"}},
+    {"number": 36, "name": "العلي", "transliteration": "Al-Ali", "en": {"meaning": "The Most High"}},
+    {"number": 37, "name": "الكبير", "transliteration": "Al-Kabir", "en": {"meaning": "The Greatest"}},
+    {"number": 38, "name": "الحفيظ", "transliteration": "Al-Hafiz", "en": {"meaning": "The Preserver"}},
+    {"number": 39, "name": "المقيت", "transliteration": "Al-Muqit", "en": {"meaning": "The Sustainer"}},
+    {"number": 40, "name": "الحسيب", "transliteration": "Al-Hasib", "en": {"meaning": "The Reckoner"}},
+    {"number": 41, "name": "الجليل", "transliteration": "Al-Jalil", "en": {"meaning": "The Majestic"}},
+    {"number": 42, "name": "الكريم", "transliteration": "Al-Karim", "en": {"meaning": "The Generous"}},
+    {"number": 43, "name": "الرقيب", "transliteration": "Ar-Raqib", "en": {"meaning": "The Watchful"}},
+    {"number": 44, "name": "المجيب", "transliteration": "Al-Mujib", "en": {"meaning": "The Responsive"}},
+    {"number": 45, "name": "الواسع", "transliteration": "Al-Wasi", "en": {"meaning": "The All-Encompassing"}},
+    {"number": 46, "name": "الحكيم", "transliteration": "Al-Hakim", "en": {"meaning": "The Wise"}},
+    {"number": 47, "name": "الودود", "transliteration": "Al-Wadud", "en": {"meaning": "The Loving"}},
+    {"number": 48, "name": "المجيد", "transliteration": "Al-Majid", "en": {"meaning": "The Glorious"}},
+    {"number": 49, "name": "الباعث", "transliteration": "Al-Ba'ith", "en": {"meaning": "The Resurrector"}},
+    {"number": 50, "name": "الشهيد", "transliteration": "Ash-Shahid", "en": {"meaning": "The Witness"}},
+    {"number": 51, "name": "الحق", "transliteration": "Al-Haqq", "en": {"meaning": "The Truth"}},
+    {"number": 52, "name": "الوكيل", "transliteration": "Al-Wakil", "en": {"meaning": "The Trustee"}},
+    {"number": 53, "name": "القوي", "transliteration": "Al-Qawiyy", "en": {"meaning": "The Strong"}},
+    {"number": 54, "name": "المتين", "transliteration": "Al-Matin", "en": {"meaning": "The Firm"}},
+    {"number": 55, "name": "الولي", "transliteration": "Al-Waliyy", "en": {"meaning": "The Protecting Friend"}},
+    {"number": 56, "name": "الحميد", "transliteration": "Al-Hamid", "en": {"meaning": "The Praiseworthy"}},
+    {"number": 57, "name": "المحصي", "transliteration": "Al-Muhsi", "en": {"meaning": "The Enumerator"}},
+    {"number": 58, "name": "المبدئ", "transliteration": "Al-Mubdi", "en": {"meaning": "The Originator"}},
+    {"number": 59, "name": "المعيد", "transliteration": "Al-Mu'id", "en": {"meaning": "The Restorer"}},
+    {"number": 60, "name": "المحيي", "transliteration": "Al-Muhyi", "en": {"meaning": "The Giver of Life"}},
+    {"number": 61, "name": "المميت", "transliteration": "Al-Mumit", "en": {"meaning": "The Taker of Life"}},
+    {"number": 62, "name": "الحي", "transliteration": "Al-Hayy", "en": {"meaning": "The Ever-Living"}},
+    {"number": 63, "name": "القيوم", "transliteration": "Al-Qayyum", "en": {"meaning": "The Self-Subsisting"}},
+    {"number": 64, "name": "الواجد", "transliteration": "Al-Wajid", "en": {"meaning": "The Finder"}},
+    {"number": 65, "name": "الماجد", "transliteration": "Al-Majid", "en": {"meaning": "The Noble"}},
+    {"number": 66, "name": "الواحد", "transliteration": "Al-Wahid", "en": {"meaning": "The One"}},
+    {"number": 67, "name": "الأحد", "transliteration": "Al-Ahad", "en": {"meaning": "The Unique"}},
+    {"number": 68, "name": "الصمد", "transliteration": "As-Samad", "en": {"meaning": "The Eternal"}},
+    {"number": 69, "name": "القادر", "transliteration": "Al-Qadir", "en": {"meaning": "The Capable"}},
+    {"number": 70, "name": "المقتدر", "transliteration": "Al-Muqtadir", "en": {"meaning": "The Powerful"}},
+    {"number": 71, "name": "المقدم", "transliteration": "Al-Muqaddim", "en": {"meaning": "The Expediter"}},
+    {"number": 72, "name": "المؤخر", "transliteration": "Al-Mu'akhkhir", "en": {"meaning": "The Delayer"}},
+    {"number": 73, "name": "الأول", "transliteration": "Al-Awwal", "en": {"meaning": "The First"}},
+    {"number": 74, "name": "الآخر", "transliteration": "Al-Akhir", "en": {"meaning": "The Last"}},
+    {"number": 75, "name": "الظاهر", "transliteration": "Az-Zahir", "en": {"meaning": "The Manifest"}},
+    {"number": 76, "name": "الباطن", "transliteration": "Al-Batin", "en": {"meaning": "The Hidden"}},
+    {"number": 77, "name": "الوالي", "transliteration": "Al-Wali", "en": {"meaning": "The Governor"}},
+    {"number": 78, "name": "المتعالي", "transliteration": "Al-Muta'ali", "en": {"meaning": "The Most Exalted"}},
+    {"number": 79, "name": "البر", "transliteration": "Al-Barr", "en": {"meaning": "The Source of Goodness"}},
+    {"number": 80, "name": "التواب", "transliteration": "At-Tawwab", "en": {"meaning": "The Acceptor of Repentance"}},
+    {"number": 81, "name": "المنتقم", "transliteration": "Al-Muntaqim", "en": {"meaning": "The Avenger"}},
+    {"number": 82, "name": "العفو", "transliteration": "Al-'Afuww", "en": {"meaning": "The Pardoner"}},
+    {"number": 83, "name": "الرؤوف", "transliteration": "Ar-Ra'uf", "en": {"meaning": "The Kind"}},
+    {"number": 84, "name": "مالك الملك", "transliteration": "Malik Al-Mulk", "en": {"meaning": "The Owner of Sovereignty"}},
+    {"number": 85, "name": "ذو الجلال والإكرام", "transliteration": "Dhul-Jalali wal-Ikram", "en": {"meaning": "The Lord of Majesty and Honor"}},
+    {"number": 86, "name": "المقسط", "transliteration": "Al-Muqsit", "en": {"meaning": "The Equitable"}},
+    {"number": 87, "name": "الجامع", "transliteration": "Al-Jami", "en": {"meaning": "The Gatherer"}},
+    {"number": 88, "name": "الغني", "transliteration": "Al-Ghani", "en": {"meaning": "The Self-Sufficient"}},
+    {"number": 89, "name": "المغني", "transliteration": "Al-Mughni", "en": {"meaning": "The Enricher"}},
+    {"number": 90, "name": "المانع", "transliteration": "Al-Mani'", "en": {"meaning": "The Preventer"}},
+    {"number": 91, "name": "الضار", "transliteration": "Ad-Darr", "en": {"meaning": "The Distresser"}},
+    {"number": 92, "name": "النافع", "transliteration": "An-Nafi'", "en": {"meaning": "The Benefiter"}},
+    {"number": 93, "name": "النور", "transliteration": "An-Nur", "en": {"meaning": "The Light"}},
+    {"number": 94, "name": "الهادي", "transliteration": "Al-Hadi", "en": {"meaning": "The Guide"}},
+    {"number": 95, "name": "البديع", "transliteration": "Al-Badi'", "en": {"meaning": "The Originator"}},
+    {"number": 96, "name": "الباقي", "transliteration": "Al-Baqi", "en": {"meaning": "The Everlasting"}},
+    {"number": 97, "name": "الوارث", "transliteration": "Al-Warith", "en": {"meaning": "The Inheritor"}},
+    {"number": 98, "name": "الرشيد", "transliteration": "Ar-Rashid", "en": {"meaning": "The Guide to the Right Path"}},
+    {"number": 99, "name": "الصبور", "transliteration": "As-Sabur", "en": {"meaning": "The Patient"}}
+]
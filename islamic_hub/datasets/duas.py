@@ -0,0 +1,155 @@
+# Daily duas with their category, Arabic text, transliteration, English
+# and Urdu translations and their source
+
+DUAS = [
+    {
+        "id": 1,
+        "title": "Dua for Beginning a Meal",
+        "category": "Daily Activities",
+        "arabic": "بِسْمِ اللهِ",
+        "transliteration": "Bismillah",
+        "translation": "In the name of Allah",
+        "urdu": "اللہ کے نام سے",
+        "reference": "Abu Dawud"
+    },
+    {
+        "id": 2,
+        "title": "Dua After Completing a Meal",
+        "category": "Daily Activities",
+        "arabic": "الْحَمْدُ لِلَّهِ الَّذِي أَطْعَمَنِي هَذَا وَرَزَقَنِيهِ مِنْ غَيْرِ حَوْلٍ مِنِّي وَلَا قُوَّةٍ",
+        "transliteration": "Alhamdu lillahil-ladhi at'amani hadha, wa razaqanihi min ghayri hawlin minni wa la quwwatin",
+        "translation": "Praise is to Allah Who has fed me this and provided it for me without any might or power on my part",
+        "urdu": "تمام تعریفیں اللہ کے لیے ہیں جس نے مجھے یہ کھلایا اور بغیر میری طاقت اور قوت کے مجھے یہ رزق دیا",
+        "reference": "Abu Dawud, Tirmidhi"
+    },
+    {
+        "id": 3,
+        "title": "Dua Before Entering the Bathroom",
+        "category": "Daily Activities",
+        "arabic": "اللَّهُمَّ إِنِّي أَعُوذُ بِكَ مِنَ الْخُبُثِ وَالْخَبَائِثِ",
+        "transliteration": "Allahumma inni a'udhu bika minal-khubthi wal-khaba'ith",
+        "translation": "O Allah, I seek refuge in You from the male and female unclean spirits",
+        "urdu": "اے اللہ میں تیری پناہ چاہتا ہوں خبیث (شیطان) اور خبیثہ (شیطانی) سے",
+        "reference": "Bukhari, Muslim"
+    },
+    {
+        "id": 4,
+        "title": "Dua When Leaving the Bathroom",
+        "category": "Daily Activities",
+        "arabic": "غُفْرَانَكَ",
+        "transliteration": "Ghufranaka",
+        "translation": "I ask You (Allah) for forgiveness",
+        "urdu": "میں آپ سے معافی مانگتا ہوں",
+        "reference": "Abu Dawud, Tirmidhi, Ibn Majah"
+    },
+    {
+        "id": 5,
+        "title": "Dua When Waking Up",
+        "category": "Morning & Evening",
+        "arabic": "الْحَمْدُ لِلَّهِ الَّذِي أَحْيَانَا بَعْدَ مَا أَمَاتَنَا وَإِلَيْهِ النُّشُورُ",
+        "transliteration": "Alhamdu lillahil-ladhi ahyana ba'da ma amatana, wa ilayhin-nushur",
+        "translation": "Praise is to Allah Who gives us life after He has caused us to die and to Him is the return",
+        "urdu": "تمام تعریف اللہ کے لیے ہے جس نے ہمیں زندگی دی اسکے بعد کہ ہمیں موت دی تھی اور اسی کی طرف پلٹنا ہے",
+        "reference": "Bukhari"
+    },
+    {
+        "id": 6,
+        "title": "Dua Before Sleeping",
+        "category": "Morning & Evening",
+        "arabic": "بِاسْمِكَ اللَّهُمَّ أَمُوتُ وَأَحْيَا",
+        "transliteration": "Bismika Allahumma amutu wa ahya",
+        "translation": "In Your name, O Allah, I die and I live",
+        "urdu": "اے اللہ، تیرے نام سے میں مرتا ہوں اور جیتا ہوں",
+        "reference": "Bukhari"
+    },
+    {
+        "id": 7,
+        "title": "Dua for Protection",
+        "category": "Morning & Evening",
+        "arabic": "بِسْمِ اللَّهِ الَّذِي لَا يَضُرُّ مَعَ اسْمِهِ شَيْءٌ فِي الْأَرْضِ وَلَا فِي السَّمَاءِ وَهُوَ السَّمِيعُ الْعَلِيمُ",
+        "transliteration": "Bismillahil-ladhi la yadurru ma'as-mihi shay'un fil-ardi wa la fis-sama'i, wa huwas-Sami'ul-'Alim",
+        "translation": "In the name of Allah, with Whose name nothing can harm on earth or in the heaven, and He is the All-Hearing, the All-Knowing",
+        "urdu": "اللہ کے نام سے جس کے نام کے ساتھ زمین اور آسمان میں کوئی چیز نقصان نہیں پہنچا سکتی اور وہ سننے والا، جاننے والا ہے",
+        "reference": "Abu Dawud, Tirmidhi"
+    },
+    {
+        "id": 8,
+        "title": "Dua for Anxiety and Sorrow",
+        "category": "Emotional Well-being",
+        "arabic": "اللَّهُمَّ إِنِّي عَبْدُكَ، ابْنُ عَبْدِكَ، ابْنُ أَمَتِكَ، نَاصِيَتِي بِيَدِكَ، مَاضٍ فِيَّ حُكْمُكَ، عَدْلٌ فِيَّ قَضَاؤُكَ، أَسْأَلُكَ بِكُلِّ اسْمٍ هُوَ لَكَ، سَمَّيْتَ بِهِ نَفْسَكَ، أَوْ أَنْزَلْتَهُ فِي كِتَابِكَ، أَوْ عَلَّمْتَهُ أَحَداً مِنْ خَلْقِكَ، أَوِ اسْتَأْثَرْتَ بِهِ فِي عِلْمِ الْغَيْبِ عِنْدَكَ، أَنْ تَجْعَلَ الْقُرْآنَ رَبِيعَ قَلْبِي، وَنُورَ صَدْرِي، وَجَلَاءَ حُزْنِي، وَذَهَابَ هَمِّي",
+        "transliteration": "Allahumma inni 'abduka, ibnu 'abdika, ibnu amatika, nasiyati biyadika, madin fiyya hukmuka, 'adlun fiyya qada'uka, as'aluka bikulli ismin huwa laka, sammayta bihi nafsaka, aw anzaltahu fi kitabika, aw 'allamtahu ahadan min khalqika, aw ista'tharta bihi fi 'ilmil-ghaybi 'indaka, an taj'alal-Qur'ana rabi'a qalbi, wa nura sadri, wa jala'a huzni, wa dhahaba hammi",
+        "translation": "O Allah, I am Your slave, the son of Your slave, the son of Your female slave. My forelock is in Your Hand. Your judgment over me is assured, and Your decreeing concerning me is just. I ask You by every name which is Yours, by which You named Yourself, or which You revealed in Your Book, or which You taught to any of Your creation, or which You have preserved in the knowledge of the unseen with You, that You make the Quran the spring of my heart, and the light of my chest, and the removal of my sadness, and the departure of my anxiety",
+        "urdu": "اے اللہ! میں تیرا بندہ ہوں، تیرے بندے کا بیٹا، تیری بندی کا بیٹا۔ میری پیشانی تیرے ہاتھ میں ہے۔ میرے بارے میں تیرا فیصلہ جاری ہے، میرے بارے میں تیرا فیصلہ عدل ہے۔ میں تجھ سے تیرے ہر اس نام کے واسطے سے سوال کرتا ہوں جو تیرا ہے، جس سے تو نے اپنے آپ کو پکارا، یا جسے تو نے اپنی کتاب میں نازل کیا، یا جسے تو نے اپنی مخلوق میں سے کسی کو سکھایا، یا جسے تو نے اپنے پاس غیب کے علم میں رکھا ہے، کہ تو قرآن کو میرے دل کی بہار، میرے سینے کا نور، میرے غم کو دور کرنے والا اور میری پریشانی کو ختم کرنے والا بنا دے",
+        "reference": "Ahmad"
+    },
+    {
+        "id": 9,
+        "title": "Dua for Entering the Mosque",
+        "category": "Worship",
+        "arabic": "اللَّهُمَّ افْتَحْ لِي أَبْوَابَ رَحْمَتِكَ",
+        "transliteration": "Allahumma iftah li abwaba rahmatika",
+        "translation": "O Allah, open for me the gates of Your mercy",
+        "urdu": "اے اللہ میرے لیے اپنی رحمت کے دروازے کھول دے",
+        "reference": "Muslim"
+    },
+    {
+        "id": 10,
+        "title": "Dua for Leaving the Mosque",
+        "category": "Worship",
+        "arabic": "اللَّهُمَّ إِنِّي أَسْأَلُكَ مِنْ فَضْلِكَ",
+        "transliteration": "Allahumma inni as'aluka min fadlika",
+        "translation": "O Allah, I ask You for Your bounty",
+        "urdu": "اے اللہ میں تجھ سے تیرا فضل مانگتا ہوں",
+        "reference": "Muslim"
+    },
+    {
+        "id": 11,
+        "title": "Dua for Seeking Knowledge",
+        "category": "Worship",
+        "arabic": "اللَّهُمَّ إِنِّي أَسْأَلُكَ عِلْمًا نَافِعًا، وَرِزْقًا طَيِّبًا، وَعَمَلًا مُتَقَبَّلًا",
+        "transliteration": "Allahumma inni as'aluka 'ilman nafi'an, wa rizqan tayyiban, wa 'amalan mutaqabbalan",
+        "translation": "O Allah, I ask You for knowledge that is beneficial, provision that is good, and deeds that are acceptable",
+        "urdu": "اے اللہ! میں تجھ سے فائدہ مند علم، پاکیزہ رزق اور قبول عمل کا سوال کرتا ہوں",
+        "reference": "Ibn Majah"
+    },
+    {
+        "id": 12,
+        "title": "Dua for Parents",
+        "category": "Family & Travel",
+        "arabic": "رَبِّ ارْحَمْهُمَا كَمَا رَبَّيَانِي صَغِيرًا",
+        "transliteration": "Rabbi irhamhuma kama rabbayani sagheera",
+        "translation": "My Lord, have mercy upon them as they brought me up [when I was] small",
+        "urdu": "اے میرے رب! ان پر رحم فرما جیسا کہ انہوں نے مجھے بچپن میں پالا",
+        "reference": "Quran 17:24"
+    },
+    {
+        "id": 13,
+        "title": "Dua for Traveling",
+        "category": "Family & Travel",
+        "arabic": "سُبْحَانَ الَّذِي سَخَّرَ لَنَا هَذَا وَمَا كُنَّا لَهُ مُقْرِنِينَ وَإِنَّا إِلَى رَبِّنَا لَمُنْقَلِبُونَ",
+        "transliteration": "Subhanal-ladhi sakhkhara lana hadha wa ma kunna lahu muqrinin, wa inna ila Rabbina lamunqalibun",
+        "translation": "Glorified is He Who has subjected this to us, and we could never have it (by our efforts). And verily, to Our Lord we indeed are to return!",
+        "urdu": "پاک ہے وہ جس نے ہمارے لیے اس (سواری) کو مسخر کیا حالانکہ ہم اس کے قابو میں لانے والے نہ تھے اور یقیناً ہم اپنے رب کی طرف پلٹنے والے ہیں",
+        "reference": "Quran 43:13-14"
+    },
+    {
+        "id": 14,
+        "title": "Dua for Returning from Travel",
+        "category": "Family & Travel",
+        "arabic": "آيِبُونَ، تَائِبُونَ، عَابِدُونَ، لِرَبِّنَا حَامِدُونَ",
+        "transliteration": "Ayibuna, ta'ibuna, 'abiduna, li-Rabbina hamidun",
+        "translation": "We return, repent, worship and praise our Lord",
+        "urdu": "ہم واپس آنے والے، توبہ کرنے والے، عبادت کرنے والے اور اپنے رب کی حمد کرنے والے ہیں",
+        "reference": "Muslim"
+    },
+    {
+        "id": 15,
+        "title": "Dua for Rain",
+        "category": "Emotional Well-being",
+        "arabic": "اللَّهُمَّ أَغِثْنَا، اللَّهُمَّ أَغِثْنَا، اللَّهُمَّ أَغِثْنَا",
+        "transliteration": "Allahumma aghithna, Allahumma aghithna, Allahumma aghithna",
+        "translation": "O Allah, send us rain. O Allah, send us rain. O Allah, send us rain",
+        "urdu": "اے اللہ ہم پر بارش برسا، اے اللہ ہم پر بارش برسا، اے اللہ ہم پر بارش برسا",
+        "reference": "Bukhari"
+    }
+]
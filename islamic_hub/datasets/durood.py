@@ -0,0 +1,68 @@
+# Durood Shareef with Arabic text, transliteration, translations and
+# virtues
+
+DUROOD = [
+    {
+        "id": 1,
+        "title": "Durood Ibrahim",
+       "arabic": "اللَّهُمَّ صَلِّ عَلَى مُحَمَّدٍ وَعَلَى آلِ مُحَمَّدٍ كَمَا صَلَّيْتَ عَلَى إِبْرَاهِيمَ وَعَلَى آلِ إِبْرَاهِيمَ إِنَّكَ حَمِيدٌ مَجِيدٌ اللَّهُمَّ بَارِكْ عَلَى مُحَمَّدٍ وَعَلَى آلِ مُحَمَّدٍ كَمَا بَارَكْتَ عَلَى إِبْرَاهِيمَ وَعَلَى آلِ إِبْرَاهِيمَ إِنَّكَ حَمِيدٌ مَجِيدٌ",
+        "transliteration": "Allahumma salli 'ala Muhammadin wa 'ala aali Muhammadin kama sallayta 'ala Ibrahima wa 'ala aali Ibrahima innaka Hamidum Majid. Allahumma barik 'ala Muhammadin wa 'ala aali Muhammadin kama barakta 'ala Ibrahima wa 'ala aali Ibrahima innaka Hamidum Majid",
+        "translation": "O Allah, send prayers upon Muhammad and the followers of Muhammad, just as You sent prayers upon Ibrahim and upon the followers of Ibrahim. Verily, You are full of praise and majesty. O Allah, send blessings upon Muhammad and upon the family of Muhammad, just as You sent blessings upon Ibrahim and upon the family of Ibrahim. Verily, You are full of praise and majesty.",
+        "urdu": "اے اللہ! درود بھیج محمد پر اور آل محمد پر جیسے تو نے درود بھیجا ابراہیم پر اور آل ابراہیم پر۔ بیشک تو تعریف والا بزرگی والا ہے۔ اے اللہ! برکت نازل فرما محمد پر اور آل محمد پر جیسے تو نے برکت نازل فرمائی ابراہیم پر اور آل ابراہیم پر۔ بیشک تو تعریف والا بزرگی والا ہے۔",
+        "virtues": "This is the Durood that Muslims recite in their prayers (Salah). It is reported in numerous hadith that the Prophet Muhammad ﷺ taught this Durood to his companions when they asked how to send blessings upon him."
+    },
+    {
+        "id": 2,
+        "title": "Durood-e-Taj",
+        "arabic": "اللَّهُمَّ صَلِّ عَلَى سَيِّدِنَا مُحَمَّدٍ صَاحِبِ التَّاجِ وَالْمِعْرَاجِ وَالْبُرَاقِ وَالْعَلَمِ صَاحِبِ الْقَضِيبِ وَالنَّاقَةِ وَالْحَرَمِ صَاحِبِ الْحِلِّ وَالْحَرَمِ وَزَمْزَمَ وَالْعَلَمِ دَافِعِ الْبَلَاءِ وَالْوَبَاءِ وَالْقَحْطِ وَالْمَرَضِ وَالْأَلَمِ",
+        "transliteration": "Allahumma salli 'ala sayyidina Muhammadin sahibit taji wal mi'raji wal buraqi wal 'alam, sahibil qadeebi wan naqati wal haram, sahibil hilli wal haram wa zamzam wal 'alam, dafi'il bala'i wal waba'i wal qahti wal maradi wal alam",
+        "translation": "O Allah, send Your blessings upon our Master Muhammad, the possessor of the crown and the ascension and the buraq and the standard, the repeller of affliction and disease and drought and illness and pain.",
+        "urdu": "اے اللہ! رحمت نازل فرما ہمارے سردار محمد پر، تاج اور معراج اور براق اور نشان والے، قضیب اور ناقہ اور حرم والے، حل اور حرم اور زمزم اور نشان والے، بلا اور وبا اور قحط اور مرض اور درد کو دفع کرنے والے پر۔",
+        "virtues": "This Durood mentions many attributes and blessings of Prophet Muhammad ﷺ. It is highly regarded in the Sufi tradition and is said to bring relief from afflictions and difficulties."
+    },
+    {
+        "id": 3,
+        "title": "Durood-e-Tunajjina",
+        "arabic": "اللَّهُمَّ صَلِّ عَلَى سَيِّدِنَا مُحَمَّدٍ صَلَاةً تُنْجِينَا بِهَا مِنْ جَمِيعِ الْأَهْوَالِ وَالْآفَاتِ وَتَقْضِي لَنَا بِهَا جَمِيعَ الْحَاجَاتِ وَتُطَهِّرُنَا بِهَا مِنْ جَمِيعِ السَّيِّئَاتِ وَتَرْفَعُنَا بِهَا عِنْدَكَ أَعْلَى الدَّرَجَاتِ وَتُبَلِّغُنَا بِهَا أَقْصَى الْغَايَاتِ مِنْ جَمِيعِ الْخَيْرَاتِ فِي الْحَيَاةِ وَبَعْدَ الْمَمَاتِ",
+        "transliteration": "Allahumma salli 'ala sayyidina Muhammadin salatan tunjina biha min jami'il ahwali wal afat, wa taqdi lana biha jami'al hajat, wa tutahhiruna biha min jami'is sayyi'at, wa tarfa'una biha 'indaka a'lad darajat, wa tuballighuna biha aqsal ghayat min jami'il khayrat fil hayati wa ba'dal mamat",
+        "translation": "O Allah, bestow Your blessings upon our Master Muhammad, a blessing by which You deliver us from all anxieties and calamities, and satisfy all our needs, and cleanse us by it from all sins, and raise us by it to the highest degrees, and cause us to reach by it the furthest goals of all good in this life and after death.",
+        "urdu": "اے اللہ! ہمارے سردار محمد پر ایسا درود بھیج جس کے ذریعے ہمیں تمام ہولناکیوں اور آفتوں سے نجات ملے اور ہماری تمام حاجتیں پوری ہوں اور ہمیں تمام گناہوں سے پاک کرے اور ہمیں تیرے ہاں اعلیٰ درجات تک پہنچائے اور ہمیں زندگی میں اور موت کے بعد تمام خیرات کی انتہا تک پہنچا دے۔",
+        "virtues": "This Durood is known for seeking protection from calamities and fulfillment of needs. Many scholars mention that reciting this Durood regularly brings relief from difficulties and helps in attaining one's goals."
+    },
+    {
+        "id": 4,
+        "title": "Durood-e-Shafi",
+        "arabic": "اَللّٰهُمَّ صَلِّ عَلٰى سَيِّدِنَا مُحَمَّدٍ طِبِّ الْقُلُوْبِ وَ دَوَآئِهَا وَ عَافِيَةِ الْاَبْدَانِ وَ شِفَآئِهَا وَ نُوْرِ الْاَبْصَارِ وَ ضِيَآئِهَا وَ عَلٰى اٰلِهٖ وَ صَحْبِهٖ وَ سَلِّمْ",
+        "transliteration": "Allahumma salli 'ala sayyidina Muhammadin tibbil qulubi wa dawa'iha, wa 'afiyatil abdani wa shifa'iha, wa nuril absari wa diya'iha, wa 'ala alihi wa sahbihi wa sallim",
+        "translation": "O Allah, bestow Your blessings upon our master Muhammad, the medicine for hearts and their cure, the good health of bodies and their healing, the light of eyes and their illumination, and upon his family and companions, and grant them peace.",
+        "urdu": "اے اللہ! ہمارے سردار محمد پر درود بھیج، جو دلوں کی دوا اور شفا ہیں، جسموں کی عافیت اور شفا ہیں، آنکھوں کا نور اور روشنی ہیں، اور ان کی آل اور صحابہ پر، اور انہیں سلامتی عطا فرما۔",
+        "virtues": "This Durood is especially beneficial for seeking cure from illnesses and diseases. Many people recite it for physical and spiritual healing."
+    },
+    {
+        "id": 5,
+        "title": "Durood-e-Nariya",
+        "arabic": "اللَّهُمَّ صَلِّ صَلاَةً كَامِلَةً وَسَلِّمْ سَلاَمًا تَامًّا عَلَى سَيِّدِنَا مُحَمَّدٍ الَّذِي تَنْحَلُّ بِهِ الْعُقَدُ وَتَنْفَرِجُ بِهِ الْكُرَبُ وَتُقْضَى بِهِ الْحَوَائِجُ وَتُنَالُ بِهِ الرَّغَائِبُ وَحُسْنُ الْخَوَاتِمِ وَيُسْتَسْقَى الْغَمَامُ بِوَجْهِهِ الْكَرِيمِ وَعَلَى آلِهِ وَصَحْبِهِ فِي كُلِّ لَمْحَةٍ وَنَفَسٍ بِعَدَدِ كُلِّ مَعْلُومٍ لَكَ",
+        "transliteration": "Allahumma salli salatan kamilatan wa sallim salaman tamman 'ala sayyidina Muhammadin alladhi tanhallu bihil 'uqadu wa tanfariju bihil kurabu wa tuqda bihil hawa'iju wa tunalu bihir ragha'ibu wa husnul khawatimi wa yustasqal ghamamu bi wajhihil karimi wa 'ala alihi wa sahbihi fi kulli lamhatin wa nafasin bi 'adadi kulli ma'lumin laka",
+        "translation": "O Allah, convey complete blessings and perfect peace upon our Master Muhammad, by whom the knots are untied, by whom the difficulties are relieved, by whom the needs are fulfilled, by whom the desires are obtained, and (by whom) there are good endings, and by whose noble face the clouds are asked for rain, and upon his family and companions in every glance and breath, as many times as all that is known to You.",
+        "urdu": "اے اللہ، ہمارے سردار محمد پر مکمل درود اور پورا سلام بھیج، جن کے وسیلے سے گرہیں کھلتی ہیں، مشکلات دور ہوتی ہیں، حاجتیں پوری ہوتی ہیں، خواہشیں حاصل ہوتی ہیں، اور حسن خاتمہ ہوتا ہے، اور جن کے کریم چہرے کے واسطے سے بادلوں سے بارش طلب کی جاتی ہے، اور ان کی آل اور صحابہ پر ہر لمحے اور سانس میں، اس تعداد میں جو تمہارے علم میں ہے۔",
+        "virtues": "This Durood is particularly powerful for solving difficult problems and fulfilling important needs. Many have experienced its blessings in times of hardship."
+    },
+    {
+        "id": 6,
+        "title": "Durood-e-Qadri",
+        "arabic": "اَللّٰهُمَّ صَلِّ عَلٰى حَبِيْبِكَ سَيِّدِنَا مُحَمَّدِنِ الْمُصْطَفٰى وَ عَلٰى اٰلِهٖ وَ اَصْحَابِهٖ وَ بَارِكْ وَ سَلِّمْ عَدَدَ مَا فِيْ عِلْمِ اللّٰهِ صَلَاةً دَائِمَةً بِدَوَامِ مُلْكِ اللّٰهِ",
+        "transliteration": "Allahumma salli 'ala habibika sayyidina Muhammadini-l-Mustafa wa 'ala alihi wa ashabihi wa barik wa sallim 'adada ma fi 'ilmillahi salatan da'imatan bi dawami mulkillah",
+        "translation": "O Allah, send blessings upon Your beloved, our Master Muhammad, the Chosen One, and upon his family and companions, and bestow blessings and peace (upon them) as many as the knowledge of Allah, with blessings lasting as long as the kingdom of Allah.",
+        "urdu": "اے اللہ، اپنے محبوب، ہمارے سردار محمد مصطفی، اور ان کی آل اور اصحاب پر درود بھیج، اور برکت اور سلامتی نازل فرما، اس تعداد میں جو اللہ کے علم میں ہے، ایسا درود جو اللہ کی بادشاہی کی دوام کے ساتھ دائم رہے۔",
+        "virtues": "This Durood is associated with Shaykh Abdul Qadir Jilani and is recited by many in the Qadri Sufi order. It is said to bring great spiritual elevation."
+    },
+    {
+        "id": 7,
+        "title": "Salawat-e-Fatih",
+        "arabic": "اللَّهُمَّ صَلِّ عَلَى سَيِّدِنَا مُحَمَّدٍ الْفَاتِحِ لِمَا أُغْلِقَ وَالْخَاتِمِ لِمَا سَبَقَ نَاصِرِ الْحَقِّ بِالْحَقِّ وَالْهَادِي إِلَى صِرَاطِكَ الْمُسْتَقِيمِ وَعَلَى آلِهِ حَقَّ قَدْرِهِ وَمِقْدَارِهِ الْعَظِيمِ",
+        "transliteration": "Allahumma salli 'ala sayyidina Muhammadin-il-fatihi lima ughliqa wal-khatimi lima sabaqa nasir-il-haqqi bil-haqqi wal-hadi ila siratik-al-mustaqim wa 'ala alihi haqqa qadrihi wa miqdarihi-il-'azim",
+        "translation": "O Allah, send blessings upon our Master Muhammad, the opener of what was closed, and the seal of what had preceded, the helper of the Truth by the Truth, the guide to Your straight path, and upon his family, according to his great rank and grandeur.",
+        "urdu": "اے اللہ! ہمارے سردار محمد پر درود بھیج، جو بند کی ہوئی چیزوں کو کھولنے والے، پچھلی چیزوں پر مہر لگانے والے، حق کے ساتھ حق کی مدد کرنے والے، تیرے سیدھے راستے کی طرف راہنمائی کرنے والے، اور ان کی آل پر، ان کے عظیم مرتبے اور مقدار کے مطابق۔",
+        "virtues": "This Durood is widely recited in the Tijaniyya Sufi order. Shaykh Ahmad Tijani said that this Durood has immense spiritual benefits and rewards."
+    }
+]
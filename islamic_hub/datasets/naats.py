@@ -0,0 +1,265 @@
+# Naats with their reciter, language and a SoundCloud link
+
+NAATS = [
+    {
+        "id": 1,
+        "title": "Main Banda-e-Aasi Hun",
+        "reciter": "Khalid Husnain Khalid",
+        "language": "Urdu",
+        "duration": "6:13",
+        "audio_url": "https://soundcloud.com/best-naats-collection/main-banda-e-aasi-hun-by-khalid-husnain-khalid",
+        "lyrics_excerpt": "میں بندہ عاصی ہوں میرے مولا\nمیں بندہ عاصی ہوں میرے مولا"
+    },
+    {
+        "id": 2,
+        "title": "Uchiya Uchiya Shana",
+        "reciter": "Owais Raza Qadri",
+        "language": "Urdu",
+        "duration": "7:25",
+        "audio_url": "https://soundcloud.com/best-naats-collection/uchiya-uchiya-shana-mere-sohne-myhammad-owais-raza-qadri",
+        "lyrics_excerpt": "اچیاں اچیاں شاناں میرے سوہنے محمد دیاں\nتے میٹھیاں میٹھیاں گلاں میرے سوہنے محمد دیاں"
+    },
+    {
+        "id": 3,
+        "title": "Allah Ho Allah",
+        "reciter": "Umair Zubair Qadri",
+        "language": "Urdu",
+        "duration": "6:45",
+        "audio_url": "https://soundcloud.com/best-naats-collection/umair-zubair-qadri-hamd-allah-ho-allah",
+        "lyrics_excerpt": "اللہ ہو اللہ ہو اللہ ہو اللہ\nاللہ ہو میرے مولا"
+    },
+    {
+        "id": 4,
+        "title": "Wah Kia Baat Aala Hazrat Ki",
+        "reciter": "Muhammad Zain Ul Abedeen",
+        "language": "Urdu",
+        "duration": "5:38",
+        "audio_url": "https://soundcloud.com/muhammed-zain-ul-abedeen/wah-kia-baat-aala-hazrat-ki",
+       "lyrics_excerpt": "واہ کیا بات اعلٰی حضرت کی\nواہ کیا بات اعلٰی حضرت کی"
+    },
+    {
+        "id": 5,
+        "title": "Bari Dear Ho Gai",
+        "reciter": "Tasleem Sabri",
+        "language": "Urdu",
+        "duration": "8:20",
+        "audio_url": "https://soundcloud.com/best-naats-collection/urdu-duabari-dear-ho-gaitasleem-sabri",
+        "lyrics_excerpt": "بڑی دیر ہو گئی، عاصی کھڑا ہے در پہ\nبڑی دیر ہو گئی، عاصی کھڑا ہے در پہ"
+    },
+    {
+        "id": 6,
+        "title": "Mere Hussain Tujhey Salam",
+        "reciter": "Various",
+        "language": "Urdu",
+        "duration": "7:15",
+        "audio_url": "https://soundcloud.com/best-naats-collection/mere-hussain-tujhey-salam",
+        "lyrics_excerpt": "میرے حسین تجھے سلام\nمیرے حسین تجھے سلام"
+    },
+    {
+        "id": 7,
+        "title": "Meri Darkan Main Ya Nabi",
+        "reciter": "Various",
+        "language": "Urdu",
+        "duration": "6:30",
+        "audio_url": "https://soundcloud.com/best-naats-collection/meri-darkan-main-ya-nabi",
+        "lyrics_excerpt": "میری دھڑکن میں یا نبی\nمیرے دل میں صدا تیری"
+    },
+    {
+        "id": 8,
+        "title": "Mujhe Rang De",
+        "reciter": "Various",
+        "language": "Urdu",
+        "duration": "5:50",
+        "audio_url": "https://soundcloud.com/best-naats-collection/mujhe-rang-de",
+        "lyrics_excerpt": "مجھے رنگ دے، مجھے رنگ دے\nمدینے کے رنگ میں رنگ دے"
+    },
+    {
+        "id": 9,
+        "title": "Haq Char Yar",
+        "reciter": "Hafiz Tahir Qadri",
+        "language": "Urdu",
+        "duration": "7:40",
+        "audio_url": "https://soundcloud.com/best-naats-collection/haq-char-yar-by-hafiz-tahir",
+        "lyrics_excerpt": "حق چار یار خدا کے ولی\nحق چار یار خدا کے ولی"
+    },
+    {
+        "id": 10,
+        "title": "Aao Namaz Hum Ko Bulati",
+        "reciter": "Abdul Rauf Rufi",
+        "language": "Urdu",
+        "duration": "6:35",
+        "audio_url": "https://soundcloud.com/best-naats-collection/aao-namaz-hum-ko-bulati-abdul",
+        "lyrics_excerpt": "آؤ نماز ہم کو بُلاتی\nآؤ نماز ہم کو بُلاتی"
+    },
+    {
+        "id": 11,
+        "title": "Ao Ghee Ke Diya Lao",
+        "reciter": "Sehar Azam",
+        "language": "Urdu",
+        "duration": "5:45",
+        "audio_url": "https://soundcloud.com/best-naats-collection/ao-ghee-ke-diya-lao-sehar-azam",
+        "lyrics_excerpt": "آؤ گھی کے دیا لاؤ\nکوئی دیا لاؤ"
+    },
+    {
+        "id": 12,
+        "title": "Aap Ko Jo Maan Gaya",
+        "reciter": "Rehan Qadri",
+        "language": "Urdu",
+        "duration": "7:10",
+        "audio_url": "https://soundcloud.com/best-naats-collection/aap-ko-jo-maan-gaya-by-rehan",
+        "lyrics_excerpt": "آپ کو جو مان گیا\nاس نے سب کچھ پا لیا"
+    },
+    {
+        "id": 13,
+        "title": "Owaision Mein Baith Jaa",
+        "reciter": "Various",
+        "language": "Urdu",
+        "duration": "6:28",
+        "audio_url": "https://soundcloud.com/best-naats-collection/owaision-mein-baith-jaa-by",
+        "lyrics_excerpt": "اویسیوں میں بیٹھ جا\nاویسیوں میں بیٹھ جا"
+    },
+    {
+        "id": 14,
+        "title": "Bachpan Meray Nabi (S.A.W.A.W)",
+        "reciter": "Various",
+        "language": "Urdu",
+        "duration": "5:55",
+        "audio_url": "https://soundcloud.com/best-naats-collection/bachpan-meray-nabi-s-a-w-a-w",
+        "lyrics_excerpt": "بچپن میرے نبی کا\nبڑا پیارا تھا"
+    },
+    {
+        "id": 15,
+        "title": "Aasion Ko Dar Tumhara",
+        "reciter": "Various",
+        "language": "Urdu",
+        "duration": "6:50",
+        "audio_url": "https://soundcloud.com/best-naats-collection/aasion-ko-dar-tumhara",
+        "lyrics_excerpt": "عاصیوں کو در تمہارا\nعاصیوں کو در تمہارا"
+    },
+    {
+        "id": 16,
+        "title": "Hamd - Sagheer Ahmed Naqshbandi",
+        "reciter": "Sagheer Ahmed Naqshbandi",
+        "language": "Urdu",
+        "duration": "7:25",
+        "audio_url": "https://soundcloud.com/best-naats-collection/sagheer-ahmed-naqshbandi-hamd",
+        "lyrics_excerpt": "اے میرے مالک و مولا\nتیرا شکر ہے تیرا شکر"
+    },
+    {
+        "id": 17,
+        "title": "Har Lehza Hai Momin",
+        "reciter": "Various",
+        "language": "Urdu",
+        "duration": "5:40",
+        "audio_url": "https://soundcloud.com/best-naats-collection/har-lehza-hai-momin",
+        "lyrics_excerpt": "ہر لحظہ ہے مومن تیری نظر کا طلبگار\nہر لحظہ ہے مومن تیری نظر کا طلبگار"
+    },
+    {
+        "id": 18,
+        "title": "Ya Shafi Al Wara Salam",
+        "reciter": "Various",
+        "language": "Arabic",
+        "duration": "6:15",
+        "audio_url": "https://soundcloud.com/best-naats-collection/ya-shafi-al-wara-salam-arabic",
+        "lyrics_excerpt": "یا شافع الورا سلام\nیا شافع الورا سلام"
+    },
+    {
+        "id": 19,
+        "title": "Allah Hoo Allah Hoo",
+        "reciter": "Various",
+        "language": "Urdu/Arabic",
+        "duration": "8:05",
+        "audio_url": "https://soundcloud.com/best-naats-collection/allah-hoo-allah-hoo-dil-pawey",
+        "lyrics_excerpt": "اللہ ہو اللہ ہو\nاللہ ہو اللہ ہو"
+    },
+    {
+        "id": 20,
+        "title": "Aaiyan Thandiyan Hawanwan",
+        "reciter": "Various",
+        "language": "Punjabi",
+        "duration": "6:30",
+        "audio_url": "https://soundcloud.com/best-naats-collection/aaiyan-thandiyan-hawanwan-made",
+        "lyrics_excerpt": "آئیاں ٹھنڈیاں ہواواں\nمدینے دی چلیاں"
+    },
+    {
+        "id": 21,
+        "title": "Ae Rasool-e-Ameen",
+        "reciter": "Syed Fasihuddin Soharwardi",
+        "language": "Urdu",
+        "duration": "7:15",
+        "audio_url": "https://soundcloud.com/best-naats-collection/ae-rasool-e-ameen-by-syed",
+        "lyrics_excerpt": "اے رسول امین\nتم پہ کروڑوں درود"
+    },
+    {
+        "id": 22,
+        "title": "Album 2010",
+        "reciter": "Various",
+        "language": "Urdu",
+        "duration": "6:45",
+        "audio_url": "https://soundcloud.com/best-naats-collection/album-2010",
+        "lyrics_excerpt": "محمد کا دم قدم ہے\nہر رنج و غم میں مرہم ہے"
+    },
+    {
+        "id": 23,
+        "title": "Mera Koi Nahi Hai Tere Siva",
+        "reciter": "Various",
+        "language": "Urdu",
+        "duration": "5:50",
+        "audio_url": "https://soundcloud.com/best-naats-collection/mera-koi-nahi-hai-tere-siva",
+        "lyrics_excerpt": "میرا کوئی نہیں ہے تیرے سوا\nمیرا کوئی نہیں ہے تیرے سوا"
+    },
+    {
+        "id": 24,
+        "title": "Har Haal Main Allah Hai",
+        "reciter": "Various",
+        "language": "Urdu",
+        "duration": "7:20",
+        "audio_url": "https://soundcloud.com/best-naats-collection/har-haal-main-allah-hai-allah",
+        "lyrics_excerpt": "ہر حال میں اللہ ہے\nاللہ ہر حال میں"
+    },
+    {
+        "id": 25,
+        "title": "Tu Raheem Wi Ae Tu Kareem",
+        "reciter": "Various",
+        "language": "Punjabi",
+        "duration": "6:10",
+        "audio_url": "https://soundcloud.com/best-naats-collection/tu-raheem-wi-ae-tu-kareem",
+        "lyrics_excerpt": "تو رحیم وی اے تو کریم وی اے\nتو رحیم وی اے تو کریم وی اے"
+    },
+    {
+        "id": 26,
+        "title": "Darood Sharif",
+        "reciter": "Sami Yousuf",
+        "language": "Arabic",
+        "duration": "4:35",
+        "audio_url": "https://soundcloud.com/muneeb-farazz/darood-sharif-by-sami-yousuf",
+        "lyrics_excerpt": "اللهم صل على محمد وعلى آل محمد كما صليت على إبراهيم وعلى آل إبراهيم"
+    },
+    {
+        "id": 27,
+        "title": "Amia Hi Amia",
+        "reciter": "Various",
+        "language": "Urdu",
+        "duration": "5:20",
+        "audio_url": "https://soundcloud.com/muneeb-farazz/amia-hi-amia",
+        "lyrics_excerpt": "آمیا ہی آمیا\nآمیا ہی آمیا"
+    },
+    {
+        "id": 28,
+        "title": "Background Nasheed",
+        "reciter": "Various",
+        "language": "Arabic",
+        "duration": "3:45",
+        "audio_url": "https://soundcloud.com/islamiaudiolibrary/background-nasheed-no-19",
+        "lyrics_excerpt": "سبحان الله، الحمد لله، الله أكبر"
+    },
+    {
+        "id": 29,
+        "title": "Main Banda E Aasi Hoon",
+        "reciter": "Muhammad Ali Imran",
+        "language": "Urdu",
+        "duration": "6:25",
+        "audio_url": "https://soundcloud.com/muhammad-ali-imran-451515811/main_banda_e_aasi_hoon",
+        "lyrics_excerpt": "میں بندہ عاصی ہوں میرے مولا\nمیں بندہ عاصی ہوں میرے مولا"
+    }
+]
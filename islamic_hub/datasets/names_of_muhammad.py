@@ -0,0 +1,504 @@
+# Names and titles of the Prophet Muhammad ﷺ with their meaning, where
+# they come from and what they signify
+
+NAMES = [
+    {"number": 1, "name": "محمد", "transliteration": "Muhammad", "meaning": "The Praised One", 
+     "description": "The most common name of the Prophet, mentioned in the Quran. It indicates that he is praised by Allah and all of creation.",
+     "reference": "Mentioned in the Quran in Surah Al-Imran (3:144), Surah Al-Ahzab (33:40), Surah Muhammad (47:2), and Surah Al-Fath (48:29).",
+     "significance": "This name prophesied his mission of bringing a message that would cause him to be praised throughout history."},
+    
+    {"number": 2, "name": "أحمد", "transliteration": "Ahmad", "meaning": "The Most Praised One", 
+     "description": "A more intensive form of 'Muhammad', indicating he is the most praised of Allah's creation.",
+     "reference": "Mentioned in the Quran in Surah As-Saff (61:6) where Jesus (peace be upon him) foretold his coming.",
+     "significance": "This name connects Prophet Muhammad to previous prophetic traditions and shows the continuity of divine revelation."},
+    
+    {"number": 3, "name": "حامد", "transliteration": "Hamid", "meaning": "The Praiser", 
+     "description": "One who praises Allah abundantly, indicating his constant remembrance and gratitude to Allah.",
+     "reference": "Derived from his character as described in various hadith collections.",
+     "significance": "Highlights his role as one who taught humanity how to praise and thank Allah properly."},
+    
+    {"number": 4, "name": "محمود", "transliteration": "Mahmud", "meaning": "The Praised", 
+     "description": "The one who is praised by others, indicating the respect and honor given to him.",
+     "reference": "Related to the 'Maqam Mahmud' (Praised Station) mentioned in Surah Al-Isra (17:79).",
+     "significance": "Refers to his special station of praise on the Day of Judgment when he will intercede for humanity."},
+    
+    {"number": 5, "name": "المصطفى", "transliteration": "Al-Mustafa", "meaning": "The Chosen One", 
+     "description": "Selected by Allah above all creation for the final prophethood.",
+     "reference": "Based on Quranic verses such as Surah Al-Hajj (22:75): 'Allah chooses Messengers from angels and from men.'",
+     "significance": "Emphasizes his special selection by Allah for the final and universal message."},
+    
+    {"number": 6, "name": "المختار", "transliteration": "Al-Mukhtar", "meaning": "The Selected One", 
+     "description": "Chosen by Allah for the final prophethood from among all humanity.",
+     "reference": "Derived from hadith literature describing his selection for prophethood.",
+     "significance": "Emphasizes that his prophethood was by divine selection rather than personal ambition."},
+    
+    {"number": 7, "name": "النبي", "transliteration": "An-Nabi", "meaning": "The Prophet", 
+     "description": "The one who receives divine revelation and guidance.",
+     "reference": "Used frequently in the Quran to refer to him, such as in Surah Al-Ahzab (33:56).",
+     "significance": "Identifies his core role as a recipient and transmitter of divine revelation."},
+    
+    {"number": 8, "name": "الرسول", "transliteration": "Ar-Rasul", "meaning": "The Messenger", 
+     "description": "The one who conveys divine message to humanity.",
+     "reference": "Used frequently in the Quran, such as in Surah Al-Baqarah (2:143).",
+     "significance": "Emphasizes his role in delivering Allah's message to humanity."},
+    
+    {"number": 9, "name": "الأمين", "transliteration": "Al-Amin", "meaning": "The Trustworthy", 
+     "description": "Known for his honesty and trustworthiness even before prophethood.",
+     "reference": "He was known by this title among the Meccans even before his prophethood.",
+     "significance": "Highlights his impeccable character and integrity that was recognized even by his opponents."},
+    
+    {"number": 10, "name": "الصادق", "transliteration": "As-Sadiq", "meaning": "The Truthful", 
+     "description": "Always spoke the truth in all circumstances.",
+     "reference": "Based on the Quranic description in Surah Maryam (19:41) and his known character.",
+     "significance": "Emphasizes his unwavering commitment to truth in all situations."},
+    
+    {"number": 11, "name": "المصدوق", "transliteration": "Al-Masduq", "meaning": "The Verified Truthful", 
+     "description": "Whose truthfulness is verified by Allah.",
+     "reference": "Derived from hadith literature and his proven truthfulness in all prophecies.",
+     "significance": "Highlights that his truthfulness was divinely attested and proven through fulfilled prophecies."},
+    
+    {"number": 12, "name": "حبيب الله", "transliteration": "Habibullah", "meaning": "The Beloved of Allah", 
+     "description": "Loved by Allah above all creation.",
+     "reference": "Based on various hadith that indicate his special status with Allah.",
+     "significance": "Emphasizes the unique love relationship between Allah and His final Messenger."},
+    
+    {"number": 13, "name": "خليل الله", "transliteration": "Khalilullah", "meaning": "The Friend of Allah", 
+     "description": "Having a special friendship with Allah.",
+     "reference": "In hadith literature, Prophet Muhammad mentioned that Allah took him as a Khalil (close friend).",
+     "significance": "Indicates his intimate relationship with Allah, similar to Prophet Ibrahim's status."},
+    
+    {"number": 14, "name": "صفي الله", "transliteration": "Safiyullah", "meaning": "The Chosen of Allah", 
+     "description": "Purified and selected by Allah.",
+     "reference": "Derived from hadith literature describing his special selection.",
+     "significance": "Highlights his purified state and special selection for the final message."},
+    
+    {"number": 15, "name": "نجي الله", "transliteration": "Najiyullah", "meaning": "The Confidant of Allah", 
+     "description": "One who has private communication with Allah.",
+     "reference": "Based on events like the Night Journey (Isra and Mi'raj) where he communicated directly with Allah.",
+     "significance": "Emphasizes his direct communication with Allah during the Night Journey and other occasions."},
+    
+    {"number": 16, "name": "الشفيع", "transliteration": "Ash-Shafi'", "meaning": "The Intercessor", 
+     "description": "Will intercede for believers on the Day of Judgment.",
+     "reference": "Based on numerous hadith about his intercession on the Day of Judgment.",
+     "significance": "Highlights his special role in interceding for humanity on the Day of Judgment."},
+    
+    {"number": 17, "name": "المشفع", "transliteration": "Al-Mushaffa'", "meaning": "The One Whose Intercession is Accepted", 
+     "description": "Whose intercession Allah has promised to accept.",
+     "reference": "Based on hadith about the acceptance of his intercession.",
+     "significance": "Emphasizes that not only will he intercede, but his intercession will be accepted by Allah."},
+    
+    {"number": 18, "name": "الشاهد", "transliteration": "Ash-Shahid", "meaning": "The Witness", 
+     "description": "Will bear witness for his community on the Day of Judgment.",
+     "reference": "Mentioned in the Quran in Surah Al-Baqarah (2:143) and others.",
+     "significance": "Highlights his role as a witness over his community on the Day of Judgment."},
+    
+    {"number": 19, "name": "البشير", "transliteration": "Al-Bashir", "meaning": "The Bearer of Good News", 
+     "description": "Brings the good news of Allah's mercy and Paradise.",
+     "reference": "Mentioned in the Quran in Surah Al-Ahzab (33:45).",
+     "significance": "Emphasizes the positive aspect of his message - bringing good news to believers."},
+    
+    {"number": 20, "name": "النذير", "transliteration": "An-Nadhir", "meaning": "The Warner", 
+     "description": "Warns against disbelief and sin.",
+     "reference": "Mentioned in the Quran in Surah Al-Ahzab (33:45).",
+     "significance": "Highlights his role in warning humanity against the consequences of rejecting faith."},
+    
+    {"number": 21, "name": "الداعي", "transliteration": "Ad-Da'i", "meaning": "The Caller", 
+     "description": "Calls people to the worship of Allah.",
+     "reference": "Based on the Quranic verse in Surah Al-Ahzab (33:46).",
+     "significance": "Emphasizes his role in inviting people to Islam and the worship of Allah alone."},
+    
+    {"number": 22, "name": "السراج المنير", "transliteration": "As-Siraj al-Munir", "meaning": "The Luminous Lamp", 
+     "description": "Illuminates the path for humanity.",
+     "reference": "Mentioned in the Quran in Surah Al-Ahzab (33:46).",
+     "significance": "Highlights his role in bringing light and guidance to dispel the darkness of ignorance."},
+    
+    {"number": 23, "name": "المذكر", "transliteration": "Al-Mudhakkir", "meaning": "The Reminder", 
+     "description": "Reminds people of their purpose of creation.",
+     "reference": "Based on the Quranic emphasis on his role as a reminder in Surah Al-Ghashiyah (88:21).",
+     "significance": "Emphasizes his role in reminding people of their purpose and accountability."},
+    
+    {"number": 24, "name": "البرهان", "transliteration": "Al-Burhan", "meaning": "The Proof", 
+     "description": "His life and message are proof of Allah's existence.",
+     "reference": "Based on the Quranic verse in Surah An-Nisa (4:174) referring to the clear proof.",
+     "significance": "Highlights that his life, character, and message serve as evidence for the truth of Islam."},
+    
+    {"number": 25, "name": "النور", "transliteration": "An-Nur", "meaning": "The Light", 
+     "description": "Brings spiritual light to darkness.",
+     "reference": "Based on the Quranic verse in Surah Al-Ma'idah (5:15) referring to light from Allah.",
+     "significance": "Emphasizes his role in bringing spiritual illumination to humanity."},
+    
+    {"number": 26, "name": "طه", "transliteration": "Ta Ha", "meaning": "Ta Ha", 
+     "description": "A name mentioned in the Quran, interpreted by some as a name of the Prophet.",
+     "reference": "Opening letters of Surah Ta-Ha (20).",
+     "significance": "These special letters are among the mysteries of the Quran and are considered by some as a name of the Prophet."},
+    
+    {"number": 27, "name": "يس", "transliteration": "Ya Sin", "meaning": "Ya Sin", 
+     "description": "A name mentioned in the Quran, interpreted by some as a name of the Prophet.",
+     "reference": "Opening letters of Surah Ya-Sin (36).",
+     "significance": "Some scholars interpret these letters as referring to or addressing the Prophet."},
+    
+    {"number": 28, "name": "المزمل", "transliteration": "Al-Muzzammil", "meaning": "The Enshrouded One", 
+     "description": "The one wrapped in garments, referring to how he was when receiving revelation.",
+     "reference": "Title of and mentioned in Surah Al-Muzzammil (73:1).",
+     "significance": "Refers to his state when he received early revelations, wrapped in a cloak."},
+    
+    {"number": 29, "name": "المدثر", "transliteration": "Al-Muddaththir", "meaning": "The Cloaked One", 
+     "description": "The one covered with a cloak, another reference to his state during revelation.",
+     "reference": "Title of and mentioned in Surah Al-Muddaththir (74:1).",
+     "significance": "Refers to his humble and awe-struck state when receiving divine revelation."},
+    
+    {"number": 30, "name": "عبد الله", "transliteration": "Abdullah", "meaning": "Servant of Allah", 
+     "description": "Emphasizes his primary role as a servant of Allah.",
+     "reference": "Mentioned in the Quran in Surah Al-Jinn (72:19) and other places.",
+     "significance": "Highlights his fundamental identity as a devoted servant of Allah, before being a prophet or messenger."},
+    
+    {"number": 31, "name": "حبيب الرحمن", "transliteration": "Habib ar-Rahman", "meaning": "The Beloved of the Most Merciful", 
+     "description": "Beloved by Allah, the Most Merciful.",
+     "reference": "Based on various hadith indicating his special status with Allah.",
+     "significance": "Emphasizes the loving relationship between him and Allah, the Most Merciful."},
+    
+    {"number": 32, "name": "سيد ولد آدم", "transliteration": "Sayyid Walad Adam", "meaning": "Master of the Children of Adam", 
+     "description": "The leader of all humanity.",
+     "reference": "Based on a hadith: 'I will be the leader of the children of Adam on the Day of Resurrection.'",
+     "significance": "Highlights his status as the greatest human being to ever live."},
+    
+    {"number": 33, "name": "سيد المرسلين", "transliteration": "Sayyid al-Mursalin", "meaning": "Master of the Messengers", 
+     "description": "The leader of all prophets and messengers.",
+     "reference": "Based on hadith literature describing his leadership of all prophets.",
+     "significance": "Emphasizes his status as the final and greatest messenger in the chain of prophethood."},
+    
+    {"number": 34, "name": "إمام المتقين", "transliteration": "Imam al-Muttaqin", "meaning": "Leader of the Pious", 
+     "description": "The exemplar for all those who fear Allah.",
+     "reference": "Based on his role described in various hadith.",
+     "significance": "Highlights his role as the perfect example for the God-conscious to follow."},
+    
+    {"number": 35, "name": "خاتم النبيين", "transliteration": "Khatam an-Nabiyyin", "meaning": "Seal of the Prophets", 
+     "description": "The final prophet, after whom there is no prophet.",
+     "reference": "Explicitly mentioned in the Quran in Surah Al-Ahzab (33:40).",
+     "significance": "Confirms the finality of his prophethood and the completion of divine revelation through him."},
+    
+    {"number": 36, "name": "رسول الرحمة", "transliteration": "Rasul ar-Rahmah", "meaning": "Messenger of Mercy", 
+     "description": "Brings Allah's mercy to all creation.",
+     "reference": "Based on the Quranic verse in Surah Al-Anbiya (21:107): 'We have not sent you except as a mercy to the worlds.'",
+     "significance": "Emphasizes the merciful nature of his message and mission to all creation."},
+    
+    {"number": 37, "name": "الهادي", "transliteration": "Al-Hadi", "meaning": "The Guide", 
+     "description": "Guides humanity to the straight path.",
+     "reference": "Based on Quranic verses that describe his guiding role, such as Surah Ash-Shura (42:52).",
+     "significance": "Highlights his role in guiding humanity out of darkness into light."},
+    
+    {"number": 38, "name": "المهدي", "transliteration": "Al-Mahdi", "meaning": "The Guided One", 
+     "description": "Perfectly guided by Allah.",
+     "reference": "Based on his description in hadith literature.",
+     "significance": "Emphasizes that he was divinely guided in all aspects of his life and mission."},
+    
+    {"number": 39, "name": "رحمة للعالمين", "transliteration": "Rahmatul lil 'Alamin", "meaning": "Mercy to the Worlds", 
+     "description": "His message is a mercy for all creation.",
+     "reference": "Directly quoted from the Quran in Surah Al-Anbiya (21:107).",
+     "significance": "Highlights the universal scope of his mercy-based mission for all worlds and all times."},
+    
+    {"number": 40, "name": "القاسم", "transliteration": "Al-Qasim", "meaning": "The Distributor", 
+     "description": "One who distributes fairly.",
+     "reference": "This was also the name of his son who passed away in childhood.",
+     "significance": "Reflects his just distribution of both material goods and spiritual knowledge."},
+    
+    {"number": 41, "name": "شفيع المذنبين", "transliteration": "Shafi' al-Mudhnibin", "meaning": "Intercessor for Sinners", 
+     "description": "Will intercede for sinners on the Day of Judgment.",
+     "reference": "Based on numerous hadith about his intercession.",
+     "significance": "Emphasizes his compassionate role in interceding for sinful believers on Judgment Day."},
+    
+    {"number": 42, "name": "شفيع الأمة", "transliteration": "Shafi' al-Ummah", "meaning": "Intercessor for the Nation", 
+     "description": "Will intercede for his community.",
+     "reference": "Based on hadith describing his intercession specifically for his ummah (community).",
+     "significance": "Highlights his special concern and care for his followers even in the afterlife."},
+    
+    {"number": 43, "name": "صاحب الشفاعة", "transliteration": "Sahib ash-Shafa'ah", "meaning": "Master of Intercession", 
+     "description": "Will be granted the right of intercession.",
+     "reference": "Based on the hadith of 'Maqam Mahmud' (the Praised Station) from which he will intercede.",
+     "significance": "Emphasizes his unique and exalted position as the primary intercessor on Judgment Day."},
+    
+    {"number": 44, "name": "صاحب المقام المحمود", "transliteration": "Sahib al-Maqam al-Mahmud", "meaning": "Master of the Praised Station", 
+     "description": "Will be given a special station on the Day of Judgment.",
+     "reference": "Based on the Quranic verse in Surah Al-Isra (17:79) and supporting hadith.",
+     "significance": "Refers to the special position of honor he will be granted on the Day of Resurrection."},
+    
+    {"number": 45, "name": "صاحب اللواء", "transliteration": "Sahib al-Liwa'", "meaning": "Bearer of the Banner", 
+     "description": "Will carry the banner of praise on the Day of Judgment.",
+     "reference": "Based on hadith describing him carrying the Banner of Praise (Liwa al-Hamd).",
+     "significance": "Symbolizes his leadership of all humanity on the Day of Resurrection."},
+    
+    {"number": 46, "name": "صاحب الوسيلة", "transliteration": "Sahib al-Wasilah", "meaning": "Master of the Means", 
+     "description": "Will be granted al-Wasilah, the highest rank in Paradise.",
+     "reference": "Based on hadith instructing Muslims to pray that he be granted al-Wasilah.",
+     "significance": "Refers to the highest station in Paradise which he alone will attain."},
+    
+    {"number": 47, "name": "صاحب التاج", "transliteration": "Sahib at-Taj", "meaning": "Bearer of the Crown", 
+     "description": "Will be honored with a special crown.",
+     "reference": "Based on descriptions in hadith literature.",
+     "significance": "Symbolizes his royal dignity and honor in the sight of Allah."},
+    
+    {"number": 48, "name": "صاحب البراق", "transliteration": "Sahib al-Buraq", "meaning": "Master of Buraq", 
+     "description": "Was carried by Buraq during the Night Journey.",
+     "reference": "Based on the narrations of Isra and Mi'raj (the Night Journey).",
+     "significance": "Highlights the special heavenly mount provided for his miraculous journey."},
+    
+    {"number": 49, "name": "صاحب الحوض", "transliteration": "Sahib al-Hawd", "meaning": "Master of the Pool", 
+     "description": "Will have a pool from which his followers will drink.",
+     "reference": "Based on numerous hadith describing Al-Kawthar, his pool in the hereafter.",
+     "significance": "Refers to his blessed pool (Al-Kawthar) that will quench the thirst of believers on Judgment Day."},
+    
+    {"number": 50, "name": "المحمود", "transliteration": "Al-Mahmud", "meaning": "The Praised One", 
+     "description": "Praised by Allah and His creation.",
+     "reference": "Related to the 'Maqam Mahmud' mentioned in Surah Al-Isra (17:79).",
+     "significance": "Reflects the universal praise he receives from all creation and from Allah Himself."},
+    
+    {"number": 51, "name": "الماحي", "transliteration": "Al-Mahi", "meaning": "The Eraser", 
+     "description": "Through whom Allah erases disbelief.",
+     "reference": "Based on hadith where he named himself as such.",
+     "significance": "Refers to his role in erasing disbelief through his message."},
+    
+    {"number": 52, "name": "الحاشر", "transliteration": "Al-Hashir", "meaning": "The Gatherer", 
+     "description": "People will be gathered at his feet on the Day of Judgment.",
+     "reference": "Based on hadith where he named himself as such.",
+     "significance": "Indicates that humanity will be gathered following him on the Day of Resurrection."},
+    
+    {"number": 53, "name": "العاقب", "transliteration": "Al-'Aqib", "meaning": "The Successor", 
+     "description": "The one who comes after all other prophets.",
+     "reference": "Based on hadith where he named himself as such.",
+     "significance": "Confirms his position as the final prophet after whom there is no other."},
+    
+    {"number": 54, "name": "المقفى", "transliteration": "Al-Muqaffa", "meaning": "The Last in Succession", 
+     "description": "The one who follows all previous prophets.",
+     "reference": "Based on hadith describing his position in the prophetic lineage.",
+     "significance": "Emphasizes his role as the culmination of the prophetic tradition."},
+    
+    {"number": 55, "name": "نبي التوبة", "transliteration": "Nabi at-Tawbah", "meaning": "Prophet of Repentance", 
+     "description": "One through whom Allah accepts repentance.",
+     "reference": "Based on hadith literature describing his role in facilitating repentance.",
+     "significance": "Highlights how his message emphasizes Allah's mercy and acceptance of repentance."},
+    
+    {"number": 56, "name": "نبي الملحمة", "transliteration": "Nabi al-Malhamah", "meaning": "Prophet of Battle", 
+     "description": "The one who was sent with the sword for the defense of truth.",
+     "reference": "Based on hadith describing his mission's aspects of striving against falsehood.",
+     "significance": "Refers to his role in establishing justice through struggle when necessary."},
+    
+    {"number": 57, "name": "نبي الرحمة", "transliteration": "Nabi ar-Rahmah", "meaning": "Prophet of Mercy", 
+     "description": "The one who was sent as a mercy.",
+     "reference": "Based on the Quranic verse in Surah Al-Anbiya (21:107).",
+     "significance": "Emphasizes that the fundamental nature of his mission was mercy, not harshness."},
+    
+    {"number": 58, "name": "الضحوك", "transliteration": "Ad-Dahuk", "meaning": "The Smiler", 
+     "description": "Known for his pleasant demeanor and smile.",
+     "reference": "Based on descriptions in hadith of his cheerful disposition.",
+     "significance": "Highlights his approachable, positive, and joyful character."},
+    
+    {"number": 59, "name": "القتال", "transliteration": "Al-Qattal", "meaning": "The Fighter", 
+     "description": "Who fought for the cause of Allah.",
+     "reference": "Based on his leadership in defensive battles for the Muslim community.",
+     "significance": "Refers to his courage in defending the truth and the believers."},
+    
+    {"number": 60, "name": "المتوكل", "transliteration": "Al-Mutawakkil", "meaning": "The Reliant on Allah", 
+     "description": "Who completely relied on Allah.",
+     "reference": "Mentioned in hadith and reflected in the Quranic emphasis on trust in Allah.",
+     "significance": "Exemplifies his complete trust in Allah in all circumstances."},
+    
+    {"number": 61, "name": "الفاتح", "transliteration": "Al-Fatih", "meaning": "The Opener", 
+     "description": "Through whom Allah opened hearts and lands.",
+     "reference": "Based on his role in opening hearts to faith and freeing lands from oppression.",
+     "significance": "Refers to his role in opening closed hearts to truth and justice."},
+    
+    {"number": 62, "name": "الخاتم", "transliteration": "Al-Khatim", "meaning": "The Final One", 
+     "description": "The last prophet sent by Allah.",
+     "reference": "Based on the Quranic verse in Surah Al-Ahzab (33:40).",
+     "significance": "Confirms the finality of his prophethood and the completion of divine revelation."},
+    
+    {"number": 63, "name": "المصلي", "transliteration": "Al-Musalli", "meaning": "The Prayer Performer", 
+     "description": "Who performed prayers perfectly.",
+     "reference": "Based on his exemplary prayer described in hadith: 'Pray as you have seen me pray.'",
+     "significance": "Highlights his role as the perfect exemplar in worship."},
+    
+    {"number": 64, "name": "المتوسل", "transliteration": "Al-Mutawassil", "meaning": "The Intermediary", 
+     "description": "The means through which believers seek Allah's favor.",
+     "reference": "Based on his intercessory role described in various hadith.",
+     "significance": "Refers to his unique position as an intermediary between Allah and creation."},
+    
+    {"number": 65, "name": "الشاكر", "transliteration": "Ash-Shakir", "meaning": "The Grateful", 
+     "description": "Always grateful to Allah in all circumstances.",
+     "reference": "Based on descriptions in hadith of his immense gratitude to Allah.",
+     "significance": "Exemplifies perfect gratitude to Allah despite hardships."},
+    
+    {"number": 66, "name": "المذكور", "transliteration": "Al-Madhkur", "meaning": "The Mentioned One", 
+     "description": "Whose name is mentioned alongside Allah's in the testimony of faith.",
+     "reference": "Based on the Shahadah (testimony of faith) which mentions his name.",
+     "significance": "Highlights the honor of his name being paired with Allah's in the declaration of faith."},
+    
+    {"number": 67, "name": "المظفر", "transliteration": "Al-Muzaffar", "meaning": "The Victorious", 
+     "description": "Given victory by Allah over enemies.",
+     "reference": "Based on the Quranic promise of victory in Surah Al-Mujadilah (58:21).",
+     "significance": "Reflects Allah's promise that his message would ultimately prevail."},
+    
+    {"number": 68, "name": "المبشر", "transliteration": "Al-Mubashshir", "meaning": "The Bringer of Glad Tidings", 
+     "description": "Who brought good news to believers.",
+     "reference": "Mentioned in the Quran in Surah Al-Ahzab (33:45).",
+     "significance": "Emphasizes the positive aspect of his message of hope and divine reward."},
+    
+    {"number": 69, "name": "المنذر", "transliteration": "Al-Mundhir", "meaning": "The Warner", 
+     "description": "Who warned humanity against disbelief.",
+     "reference": "Mentioned in the Quran in Surah Al-Ahzab (33:45).",
+     "significance": "Highlights his responsibility to warn about the consequences of rejecting faith."},
+    
+    {"number": 70, "name": "طيب", "transliteration": "Tayyib", "meaning": "The Pure", 
+     "description": "Pure in character and lineage.",
+     "reference": "Based on descriptions in hadith literature.",
+     "significance": "Reflects the purity of his character, speech, actions, and lineage."},
+    
+    {"number": 71, "name": "طاهر", "transliteration": "Tahir", "meaning": "The Clean", 
+     "description": "Pure from all impurities.",
+     "reference": "Based on Quranic references to purification in Surah Al-Ahzab (33:33).",
+     "significance": "Indicates his physical and spiritual cleanliness and purity."},
+    
+    {"number": 72, "name": "حبيب", "transliteration": "Habib", "meaning": "The Beloved", 
+     "description": "Beloved by Allah and believers.",
+     "reference": "Based on various hadith describing the love Muslims should have for him.",
+     "significance": "Emphasizes the deep love relationship between him and his followers."},
+    
+    {"number": 73, "name": "سيد ولد آدم", "transliteration": "Sayyid Walad Adam", "meaning": "Master of Adam's Children", 
+     "description": "The leader of all humanity.",
+     "reference": "Based on hadith: 'I will be the leader of the children of Adam on the Day of Resurrection.'",
+     "significance": "Confirms his status as the greatest human being ever created."},
+    
+    {"number": 74, "name": "سيد الناس", "transliteration": "Sayyid an-Nas", "meaning": "Master of People", 
+     "description": "The leader of all people.",
+     "reference": "Based on hadith literature describing his leadership.",
+     "significance": "Highlights his position as the foremost leader of humanity."},
+    
+    {"number": 75, "name": "حبيب الحق", "transliteration": "Habib al-Haqq", "meaning": "Beloved of the Truth", 
+     "description": "Loved by Allah, the Truth.",
+     "reference": "Based on spiritual literature describing his relationship with Allah.",
+     "significance": "Emphasizes his special status as beloved by Allah (Al-Haqq)."},
+    
+    {"number": 76, "name": "شهيد", "transliteration": "Shahid", "meaning": "Witness", 
+     "description": "Who will bear witness over the nations.",
+     "reference": "Based on the Quranic verse in Surah Al-Baqarah (2:143).",
+     "significance": "Refers to his role as a witness over his community on the Day of Judgment."},
+    
+    {"number": 77, "name": "مشهود", "transliteration": "Mashhud", "meaning": "Witnessed", 
+     "description": "Whose prophethood is witnessed and confirmed.",
+     "reference": "Based on the abundant evidence and testimonies to his prophethood.",
+     "significance": "Indicates how his prophethood is supported by clear signs and evidences."},
+    
+    {"number": 78, "name": "مشهود له", "transliteration": "Mashhud Lahu", "meaning": "One Testified For", 
+     "description": "For whom Allah and the believers testify.",
+     "reference": "Based on divine and human testimonies to his truthfulness.",
+     "significance": "Emphasizes how Allah Himself testifies to his truthfulness and mission."},
+    
+    {"number": 79, "name": "بشير", "transliteration": "Bashir", "meaning": "Announcer of Good News", 
+     "description": "Who brought good news of Paradise.",
+     "reference": "Mentioned in the Quran in Surah Al-Ahzab (33:45).",
+     "significance": "Highlights his role in bringing glad tidings to the believers."},
+    
+    {"number": 80, "name": "مبشر", "transliteration": "Mubashshir", "meaning": "Giver of Glad Tidings", 
+     "description": "Who gave glad tidings of Allah's mercy.",
+     "reference": "Mentioned in the Quran in Surah Al-Ahzab (33:45).",
+     "significance": "Emphasizes his role in bringing good news of divine mercy and rewards."},
+    
+    {"number": 81, "name": "نذير", "transliteration": "Nadhir", "meaning": "Warner", 
+     "description": "Who warned against Allah's punishment.",
+     "reference": "Mentioned in the Quran in Surah Al-Ahzab (33:45).",
+     "significance": "Highlights his responsibility to warn humanity about divine punishment for wrongdoing."},
+    
+    {"number": 82, "name": "منذر", "transliteration": "Mundhir", "meaning": "Admonisher", 
+     "description": "Who admonished against evil.",
+     "reference": "Based on the Quranic references to his warning role.",
+     "significance": "Refers to his role in admonishing against sinful behavior."},
+    
+    {"number": 83, "name": "داعي إلى الله", "transliteration": "Da'i ila Allah", "meaning": "Caller to Allah", 
+     "description": "Who invited people to worship Allah.",
+     "reference": "Based on the Quranic verse in Surah Al-Ahzab (33:46).",
+     "significance": "Emphasizes his primary mission of calling people to monotheism and worship of Allah."},
+    
+    {"number": 84, "name": "سراج منير", "transliteration": "Siraj Munir", "meaning": "Illuminating Lamp", 
+     "description": "Who illuminated the path of guidance.",
+     "reference": "Mentioned in the Quran in Surah Al-Ahzab (33:46).",
+     "significance": "Highlights his role in bringing light and guidance to humanity."},
+    
+    {"number": 85, "name": "ناصر", "transliteration": "Nasir", "meaning": "Helper", 
+     "description": "Helper of the truth and justice.",
+     "reference": "Based on his role described in hadith literature.",
+     "significance": "Refers to his support and defense of truth, justice, and the oppressed."},
+    
+    {"number": 86, "name": "منصور", "transliteration": "Mansur", "meaning": "Victorious", 
+     "description": "Made victorious by Allah.",
+     "reference": "Based on Allah's promise of victory in the Quran.",
+     "significance": "Emphasizes that Allah granted him victory despite overwhelming opposition."},
+    
+    {"number": 87, "name": "مؤدب", "transliteration": "Mu'addib", "meaning": "Teacher of Good Manners", 
+     "description": "Who taught etiquette and good manners.",
+     "reference": "Based on hadith: 'My Lord has taught me good manners and perfected my manners.'",
+     "significance": "Highlights his role in teaching moral and ethical behavior to humanity."},
+    
+    {"number": 88, "name": "معلم", "transliteration": "Mu'allim", "meaning": "Teacher", 
+     "description": "Teacher of wisdom and knowledge.",
+     "reference": "Based on the Quranic verse in Surah Al-Jumu'ah (62:2).",
+     "significance": "Emphasizes his primary role as an educator and teacher of humanity."},
+    
+    {"number": 89, "name": "هادي", "transliteration": "Hadi", "meaning": "Guide", 
+     "description": "Guide to the straight path.",
+     "reference": "Based on his guiding role described throughout the Quran.",
+     "significance": "Refers to his role in guiding humanity to the path of righteousness."},
+    
+    {"number": 90, "name": "مهدي", "transliteration": "Mahdi", "meaning": "Guided One", 
+     "description": "Perfectly guided by Allah.",
+     "reference": "Based on the Quranic emphasis on his guidance in Surah An-Najm (53:2-3).",
+     "significance": "Emphasizes that he himself was divinely guided before guiding others."},
+    
+    {"number": 91, "name": "مبين", "transliteration": "Mubin", "meaning": "Clear Explainer", 
+     "description": "Who explained the message clearly.",
+     "reference": "Based on numerous Quranic verses describing the clarity of his message.",
+     "significance": "Highlights his ability to explain complex spiritual truths in clear, understandable terms."},
+    
+    {"number": 92, "name": "مطهر", "transliteration": "Mutahhir", "meaning": "Purifier", 
+     "description": "Who purified souls from shirk and sin.",
+     "reference": "Based on the Quranic verse in Surah Al-Jumu'ah (62:2).",
+     "significance": "Refers to his role in purifying souls from spiritual impurities."},
+    
+    {"number": 93, "name": "مزكي", "transliteration": "Muzakki", "meaning": "Sanctifier", 
+     "description": "Who sanctified souls and purified them.",
+     "reference": "Mentioned in the Quran in Surah Al-Baqarah (2:129) and Surah Al-Jumu'ah (62:2).",
+     "significance": "Emphasizes his role in spiritual purification and growth of his followers."},
+    
+    {"number": 94, "name": "مفتاح", "transliteration": "Miftah", "meaning": "Key", 
+     "description": "Key to goodness and guidance.",
+     "reference": "Based on hadith literature describing his role.",
+     "significance": "Symbolizes how his teachings unlock the doors to divine knowledge and blessings."},
+    
+    {"number": 95, "name": "مفتاح الجنة", "transliteration": "Miftah al-Jannah", "meaning": "Key to Paradise", 
+     "description": "Following him leads to Paradise.",
+     "reference": "Based on hadith literature describing obedience to him as a path to Paradise.",
+     "significance": "Emphasizes how following his example and teachings leads to salvation."},
+    
+    {"number": 96, "name": "مفتاح الرحمة", "transliteration": "Miftah ar-Rahmah", "meaning": "Key to Mercy", 
+     "description": "Through whom Allah's mercy is attained.",
+     "reference": "Based on the Quranic verse in Surah Al-Anbiya (21:107).",
+     "significance": "Highlights how his message unlocks divine mercy for humanity."},
+    
+    {"number": 97, "name": "علم الهدى", "transliteration": "Alam al-Huda", "meaning": "Banner of Guidance", 
+     "description": "The sign and symbol of guidance.",
+     "reference": "Based on descriptions in spiritual literature.",
+     "significance": "Presents him as a clear standard and symbol of divine guidance."},
+    
+    {"number": 98, "name": "علم اليقين", "transliteration": "Alam al-Yaqin", "meaning": "Banner of Certainty", 
+     "description": "The sign and symbol of certainty in faith.",
+     "reference": "Based on the certainty of his message and prophecies.",
+     "significance": "Emphasizes how his life and teachings bring certainty to those in doubt."},
+    
+    {"number": 99, "name": "علم الإيمان", "transliteration": "Alam al-Iman", "meaning": "Banner of Faith", 
+     "description": "The sign and symbol of true faith.",
+     "reference": "Based on his exemplary faith described in hadith literature.",
+     "significance": "Presents him as the perfect embodiment and standard of faith."},
+    
+    {"number": 100, "name": "علم الإسلام", "transliteration": "Alam al-Islam", "meaning": "Banner of Islam", 
+     "description": "The sign and symbol of Islam.",
+     "reference": "Based on his position as the primary representative of Islam.",
+     "significance": "Identifies him as the foremost representative and embodiment of the Islamic faith."}
+]
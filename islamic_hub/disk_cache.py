@@ -0,0 +1,165 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+
+from islamic_hub.response_cache import CachedResponse, compile_rules, ttl_for
+
+# Persistent HTTP cache shared by every worker process on the machine.
+#
+# It sits between the in-memory response cache and the network. Bodies are
+# stored zlib-compressed in a SQLite database in WAL mode, so readers in
+# other processes are never blocked by a writer. Fresh rows (same TTL rules
+# as the memory cache) are answered straight from disk. Expired rows are
+# revalidated with If-None-Match / If-Modified-Since, and a 304 only
+# refreshes their expiry and stored_at, the time the body was last
+# confirmed upstream. If the upstream cannot be reached, the last copy
+# on disk is served instead of failing.
+#
+# The database is kept under max_bytes of compressed bodies by evicting the
+# least recently used rows. Rows that have not been read for max_idle
+# seconds are dropped as well.
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    url TEXT PRIMARY KEY,
+    status INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    stored_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_last_access ON responses(last_access);
+"""
+
+# Only headers that matter to callers or to revalidation are kept
+KEPT_HEADERS = ("content-type", "etag", "last-modified", "cache-control")
+
+# Reads only bump last_access when it is older than this, so hot rows do
+# not turn every read into a write
+ACCESS_GRANULARITY = 60 * 60
+
+
+class DiskCache:
+    def __init__(self, path, fetch, max_bytes=256 * 1024 * 1024, max_idle=30 * 24 * 60 * 60, rules=None):
+        self.path = path
+        self.fetch = fetch
+        self.max_bytes = max_bytes
+        self.max_idle = max_idle
+        self.rules = compile_rules(rules)
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        self._stats = {"hits": 0, "revalidated": 0, "misses": 0, "stale_on_error": 0, "evictions": 0}
+
+    def _connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=10)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(SCHEMA)
+            self._local.conn = conn
+        return conn
+
+    def _count(self, name):
+        with self._write_lock:
+            self._stats[name] += 1
+
+    def _response(self, url, row):
+        status, headers, body = row[0], json.loads(row[1]), zlib.decompress(row[2])
+        return CachedResponse(url, status, body, headers, fetched_at=row[7])
+
+    def _save(self, url, response, now):
+        headers = {name: value for name, value in response.headers.items() if name.lower() in KEPT_HEADERS}
+        body = zlib.compress(response.content, 6)
+        ttl, _ = ttl_for(url, self.rules)
+        with self._write_lock:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (url, response.status_code, json.dumps(headers), body, len(body),
+                     response.headers.get("ETag"), response.headers.get("Last-Modified"),
+                     now, now + ttl, now)
+                )
+            self._evict(conn, now)
+
+    def _evict(self, conn, now):
+        with conn:
+            removed = conn.execute("DELETE FROM responses WHERE last_access < ?", (now - self.max_idle,)).rowcount
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+            if total > self.max_bytes:
+                # Oldest reads first until we are back under the budget
+                for url, size in conn.execute("SELECT url, size FROM responses ORDER BY last_access").fetchall():
+                    if total <= self.max_bytes:
+                        break
+                    conn.execute("DELETE FROM responses WHERE url = ?", (url,))
+                    total -= size
+                    removed += 1
+        if removed:
+            self._stats["evictions"] += removed
+
+    def get(self, url, timeout=10):
+        now = time.time()
+        conn = self._connection()
+        row = conn.execute(
+            "SELECT status, headers, body, etag, last_modified, expires_at, last_access, stored_at FROM responses WHERE url = ?",
+            (url,)
+        ).fetchone()
+
+        if row is not None and now < row[5]:
+            self._count("hits")
+            if now - row[6] > ACCESS_GRANULARITY:
+                with self._write_lock, conn:
+                    conn.execute("UPDATE responses SET last_access = ? WHERE url = ?", (now, url))
+            return self._response(url, row)
+
+        headers = {}
+        if row is not None:
+            if row[3]:
+                headers["If-None-Match"] = row[3]
+            if row[4]:
+                headers["If-Modified-Since"] = row[4]
+
+        try:
+            response = self.fetch(url, timeout=timeout, headers=headers) if headers else self.fetch(url, timeout=timeout)
+        except Exception:
+            if row is None:
+                raise
+            self._count("stale_on_error")
+            return self._response(url, row)
+
+        if response.status_code == 304 and row is not None:
+            self._count("revalidated")
+            ttl, _ = ttl_for(url, self.rules)
+            with self._write_lock, conn:
+                conn.execute(
+                    "UPDATE responses SET stored_at = ?, expires_at = ?, last_access = ? WHERE url = ?",
+                    (now, now + ttl, now, url)
+                )
+            return self._response(url, row[:7] + (now,))
+
+        if response.status_code == 200:
+            self._count("misses")
+            self._save(url, response, now)
+        elif row is not None and response.status_code >= 500:
+            self._count("stale_on_error")
+            return self._response(url, row)
+        return response
+
+    def stats(self):
+        conn = self._connection()
+        entries, size = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+        with self._write_lock:
+            stats = dict(self._stats)
+        stats["entries"] = entries
+        stats["bytes"] = size
+        stats["max_bytes"] = self.max_bytes
+        return stats
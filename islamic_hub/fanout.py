@@ -0,0 +1,18 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from islamic_hub import settings
+
+# Shared thread pool for fetching several independent resources at once,
+# e.g. one juz in a translation and in Arabic. The pool lives for the whole
+# process; Streamlit reruns the page script but not this module.
+
+_pool = ThreadPoolExecutor(max_workers=settings.FANOUT_WORKERS, thread_name_prefix="fanout")
+
+
+# Like map(fn, items) but runs the calls concurrently. Results keep the
+# order of items, and the first exception raised is re-raised.
+def map_concurrently(fn, items):
+    items = list(items)
+    if len(items) <= 1:
+        return [fn(item) for item in items]
+    return list(_pool.map(fn, items))
@@ -0,0 +1,159 @@
+import gzip
+import os
+import re
+import threading
+import unicodedata
+from bisect import bisect_left, bisect_right
+
+import numpy as np
+
+# Offline world city gazetteer.
+#
+# islamic_hub/data/cities.tsv.gz lists the 34,000 cities with a population
+# of 15,000 or more, with coordinates and IANA time zones (built by
+# scripts/build_gazetteer.py from GeoNames data, CC BY 4.0,
+# https://www.geonames.org). Large cities also carry their common Latin
+# alternate names, so "Mecca" and "Makkah" both find the same place.
+#
+# Names are folded (case, accents and punctuation removed) and kept in one
+# sorted list. A prefix lookup is two binary searches that give the slice
+# of matching names, and the most populous matches in that slice are
+# returned first.
+
+DATA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "cities.tsv.gz")
+
+_NON_WORD = re.compile(r"[^0-9a-z]+")
+
+
+# "São Paulo" -> "sao paulo", "Ar-Riyad" -> "ar riyad"
+def fold(text):
+    text = unicodedata.normalize("NFKD", text.casefold())
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    return _NON_WORD.sub(" ", text).strip()
+
+
+class Gazetteer:
+    def __init__(self, path=DATA_PATH):
+        import pytz
+        self.country_names = dict(pytz.country_names)
+
+        names, countries, timezones = [], [], []
+        latitudes, longitudes, populations = [], [], []
+        # (folded name, city index, is the city's own name)
+        entries = []
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            for index, line in enumerate(f):
+                name, country, latitude, longitude, timezone, population, aliases = line.rstrip("\n").split("\t")
+                names.append(name)
+                countries.append(country)
+                timezones.append(timezone)
+                latitudes.append(float(latitude))
+                longitudes.append(float(longitude))
+                populations.append(int(population))
+                primary = fold(name)
+                if primary:
+                    entries.append((primary, index, True))
+                for alias in aliases.split("|") if aliases else ():
+                    key = fold(alias)
+                    if key and key != primary:
+                        entries.append((key, index, False))
+
+        self.names = names
+        self.countries = countries
+        self.timezones = timezones
+        self.latitudes = np.array(latitudes)
+        self.longitudes = np.array(longitudes)
+        self.populations = np.array(populations, dtype=np.int64)
+        self._country_codes = np.array(countries)
+        self._folded_countries = {code: fold(name) for code, name in self.country_names.items()}
+
+        entries.sort()
+        self._keys = [key for key, _, _ in entries]
+        self._cities = np.array([index for _, index, _ in entries], dtype=np.int32)
+        self._primary = np.array([primary for _, _, primary in entries], dtype=bool)
+
+    def __len__(self):
+        return len(self.names)
+
+    def city(self, index):
+        country = self.countries[index]
+        return {
+            'city': self.names[index],
+            'country': country,
+            'country_name': self.country_names.get(country, country),
+            'latitude': float(self.latitudes[index]),
+            'longitude': float(self.longitudes[index]),
+            'timezone': self.timezones[index],
+            'population': int(self.populations[index])
+        }
+
+    def _country_codes_matching(self, query):
+        query = fold(query)
+        if not query:
+            return None
+        return [
+            code for code, name in self._folded_countries.items()
+            if code.lower() == query or name.startswith(query)
+        ]
+
+    def _top(self, cities, limit):
+        if len(cities) > limit:
+            cities = cities[np.argpartition(-self.populations[cities], limit)[:limit]]
+        return cities[np.argsort(-self.populations[cities], kind="stable")].tolist()
+
+    # Cities whose name starts with the query, most populous first. Exact
+    # names come before longer ones, and a city's own name before its
+    # alternate names. "Hyderabad, PK" or "Hyderabad, Pakistan" narrows
+    # the results to one country.
+    def search(self, query, limit=10):
+        query, _, country = query.partition(",")
+        prefix = fold(query)
+        if not prefix:
+            return []
+        codes = self._country_codes_matching(country)
+
+        lo = bisect_left(self._keys, prefix)
+        exact_end = bisect_right(self._keys, prefix, lo)
+        hi = bisect_left(self._keys, prefix + "\x7f", exact_end)
+
+        results = []
+        seen = set()
+        for start, end in ((lo, exact_end), (exact_end, hi)):
+            cities = self._cities[start:end]
+            primary = self._primary[start:end]
+            if codes is not None:
+                wanted = np.isin(self._country_codes[cities], codes)
+                cities, primary = cities[wanted], primary[wanted]
+            # A city has one primary key, but may have several aliases
+            # sharing the prefix
+            for group in (cities[primary], np.unique(cities[~primary])):
+                for index in self._top(group, limit):
+                    if index not in seen:
+                        seen.add(index)
+                        results.append(self.city(index))
+                        if len(results) == limit:
+                            return results
+        return results
+
+
+# "Lahore, Pakistan"
+def label(city):
+    return f"{city['city']}, {city['country_name']}"
+
+
+_gazetteer = None
+_lock = threading.Lock()
+
+
+# The bundled gazetteer, or None when its data file is missing or cannot
+# be read, so the pages can say so instead of failing
+def get_gazetteer():
+    global _gazetteer
+    if _gazetteer is None:
+        with _lock:
+            if _gazetteer is None:
+                try:
+                    _gazetteer = Gazetteer()
+                except (OSError, ValueError) as e:
+                    return None
+    return _gazetteer
@@ -0,0 +1,80 @@
+import math
+import threading
+
+# Offline location lookups.
+#
+# pytz ships the tz database's zone.tab, which gives every IANA time zone
+# its country and the coordinates of its principal city. When no network
+# location is available, the browser's time zone is therefore enough to
+# place the user in the right city or region, which is close enough for
+# prayer times until they pick their exact city.
+
+_zones = None
+_lock = threading.Lock()
+
+
+# "+3348+07301" or "+334805+0730105" -> (33.8, 73.0167)
+def _parse_coordinates(text):
+    split = max(text.rfind("+"), text.rfind("-"))
+    values = []
+    for part in (text[:split], text[split:]):
+        sign = -1 if part[0] == "-" else 1
+        digits = part[1:]
+        # Degrees take 2 digits for latitude and 3 for longitude
+        width = 2 if len(values) == 0 else 3
+        degrees = int(digits[:width])
+        minutes = int(digits[width:width + 2])
+        seconds = int(digits[width + 2:width + 4] or 0)
+        values.append(sign * (degrees + minutes / 60 + seconds / 3600))
+    return values[0], values[1]
+
+
+# {zone name: (country code, latitude, longitude)} from pytz's zone.tab
+def zone_locations():
+    global _zones
+    if _zones is None:
+        with _lock:
+            if _zones is None:
+                import pytz
+                zones = {}
+                with pytz.open_resource("zone.tab") as f:
+                    for line in f.read().decode("utf-8").splitlines():
+                        if not line or line.startswith("#"):
+                            continue
+                        fields = line.split("\t")
+                        latitude, longitude = _parse_coordinates(fields[1])
+                        zones[fields[2]] = (fields[0], round(latitude, 4), round(longitude, 4))
+                _zones = zones
+    return _zones
+
+
+# A location dict (city, country, latitude, longitude, timezone) for an
+# IANA time zone name, or None if the zone has no entry
+def location_for_timezone(timezone):
+    entry = zone_locations().get(timezone) if timezone else None
+    if entry is None:
+        return None
+    country, latitude, longitude = entry
+    return {
+        'city': timezone.rsplit("/", 1)[-1].replace("_", " "),
+        'country': country,
+        'latitude': latitude,
+        'longitude': longitude,
+        'timezone': timezone
+    }
+
+
+# IANA zone name for coordinates: the zone whose principal city is
+# nearest, preferring zones of the given country
+def nearest_timezone(latitude, longitude, country=None):
+    zones = zone_locations()
+    candidates = [name for name, entry in zones.items() if entry[0] == country] or list(zones)
+    cos_latitude = math.cos(math.radians(latitude))
+
+    def distance(name):
+        _, zone_latitude, zone_longitude = zones[name]
+        # Longitude difference wrapped to [-180, 180)
+        dlng = (zone_longitude - longitude + 180) % 360 - 180
+        return (zone_latitude - latitude) ** 2 + (dlng * cos_latitude) ** 2
+
+    return min(candidates, key=distance)
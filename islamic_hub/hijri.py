@@ -0,0 +1,185 @@
+import sys
+from datetime import date
+
+import numpy as np
+
+from islamic_hub.ummalqura import FIRST_YEAR, LAST_YEAR, MONTH_STARTS
+
+# Hijri dates without a network call.
+#
+# Two variants are supported:
+#
+# UMM_AL_QURA, the official calendar of Saudi Arabia and the default. It
+# is a lookup table: month starts for 1343-1500 AH (1924-2077), plus an
+# index from every day in that span to its month, so a conversion either
+# way is a couple of array reads. Dates outside the table fall back to the
+# tabular calendar.
+#
+# TABULAR, the arithmetic Islamic calendar: 30-year cycles in which years
+# 2, 5, 7, 10, 13, 16, 18, 21, 24, 26 and 29 have 355 days, counted from
+# the civil epoch of 16 July 622 (Julian calendar, 19 July in the
+# proleptic Gregorian calendar Python uses).
+#
+# Both can differ from a locally announced calendar by a day or two, since
+# that depends on the moon sighting.
+#
+# from_gregorian and to_gregorian have *_array counterparts that take
+# NumPy arrays (dates as datetime64[D]) for bulk timetables.
+
+UMM_AL_QURA = "umm-al-qura"
+TABULAR = "tabular"
+VARIANTS = (UMM_AL_QURA, TABULAR)
+
+MONTHS = [
+    "Muharram", "Safar", "Rabi al-Awwal", "Rabi al-Thani", "Jumada al-Ula", "Jumada al-Akhirah",
+    "Rajab", "Shaban", "Ramadan", "Shawwal", "Dhu al-Qadah", "Dhu al-Hijjah",
+]
+MUHARRAM = 1
+RAMADAN = 9
+SHAWWAL = 10
+DHU_AL_HIJJAH = 12
+
+# Monday first, like date.weekday()
+WEEKDAYS = ["Al Athnayn", "Al Thalaata", "Al Arba'a", "Al Khamees", "Al Juma'a", "Al Sabt", "Al Ahad"]
+
+# date.toordinal() of 1 Muharram 1 AH in the tabular calendar
+EPOCH = 227015
+
+# date.toordinal() of 1970-01-01, for converting datetime64[D] values
+UNIX_EPOCH = 719163
+
+# Umm al-Qura month starts as date ordinals, and the month index of every
+# day they cover
+_MONTH_STARTS = np.array(MONTH_STARTS, dtype=np.int64) + 678575
+_FIRST_DAY = int(_MONTH_STARTS[0])
+_END_DAY = int(_MONTH_STARTS[-1])
+_DAY_MONTHS = np.repeat(np.arange(len(_MONTH_STARTS) - 1, dtype=np.int16), np.diff(_MONTH_STARTS))
+# Plain Python copies for single dates, which would otherwise pay NumPy's
+# per-call overhead
+_MONTH_STARTS_LIST = _MONTH_STARTS.tolist()
+_DAY_MONTHS_BYTES = _DAY_MONTHS.tobytes()
+
+
+# Tabular calendar. Written with plain arithmetic so the same code serves
+# Python ints and NumPy arrays.
+def _tabular_ordinal(year, month, day):
+    return (EPOCH - 1 + (year - 1) * 354 + (3 + 11 * year) // 30
+            + 29 * (month - 1) + month // 2 + day)
+
+
+def _tabular_from_ordinal(ordinal):
+    year = (30 * (ordinal - EPOCH) + 10646) // 10631
+    month = np.minimum(12, (11 * (ordinal - _tabular_ordinal(year, 1, 1)) + 330) // 325)
+    return year, month, ordinal - _tabular_ordinal(year, month, 1) + 1
+
+
+def _in_table(year):
+    return (year >= FIRST_YEAR) & (year <= LAST_YEAR)
+
+
+def _check(variant):
+    if variant not in VARIANTS:
+        raise ValueError(f"Unknown hijri calendar variant {variant!r}")
+
+
+def _from_ordinals(ordinals, variant):
+    _check(variant)
+    year, month, day = _tabular_from_ordinal(ordinals)
+    if variant == UMM_AL_QURA:
+        inside = (ordinals >= _FIRST_DAY) & (ordinals < _END_DAY)
+        index = _DAY_MONTHS[np.clip(ordinals - _FIRST_DAY, 0, len(_DAY_MONTHS) - 1)].astype(np.int64)
+        year = np.where(inside, FIRST_YEAR + index // 12, year)
+        month = np.where(inside, index % 12 + 1, month)
+        day = np.where(inside, ordinals - _MONTH_STARTS[index] + 1, day)
+    return year, month, day
+
+
+def _to_ordinals(year, month, day, variant):
+    _check(variant)
+    ordinals = _tabular_ordinal(year, month, day)
+    if variant == UMM_AL_QURA:
+        inside = _in_table(year)
+        index = np.clip((year - FIRST_YEAR) * 12 + month - 1, 0, len(_MONTH_STARTS) - 2)
+        ordinals = np.where(inside, _MONTH_STARTS[index] + day - 1, ordinals)
+    return ordinals
+
+
+# Hijri (year, month, day) for a Gregorian date
+def from_gregorian(day, variant=UMM_AL_QURA):
+    _check(variant)
+    ordinal = day.toordinal()
+    if variant == UMM_AL_QURA and _FIRST_DAY <= ordinal < _END_DAY:
+        offset = 2 * (ordinal - _FIRST_DAY)
+        index = int.from_bytes(_DAY_MONTHS_BYTES[offset:offset + 2], sys.byteorder)
+        return FIRST_YEAR + index // 12, index % 12 + 1, ordinal - _MONTH_STARTS_LIST[index] + 1
+    year, month, day_of_month = _tabular_from_ordinal(ordinal)
+    return int(year), int(month), int(day_of_month)
+
+
+# Gregorian date for a Hijri (year, month, day)
+def to_gregorian(year, month, day, variant=UMM_AL_QURA):
+    _check(variant)
+    if variant == UMM_AL_QURA and FIRST_YEAR <= year <= LAST_YEAR:
+        return date.fromordinal(_MONTH_STARTS_LIST[(year - FIRST_YEAR) * 12 + month - 1] + day - 1)
+    return date.fromordinal(_tabular_ordinal(year, month, day))
+
+
+# Arrays of Hijri years, months and days for an array of Gregorian dates
+def from_gregorian_array(days, variant=UMM_AL_QURA):
+    ordinals = np.asarray(days, dtype="datetime64[D]").astype(np.int64) + UNIX_EPOCH
+    return _from_ordinals(ordinals, variant)
+
+
+# datetime64[D] array of Gregorian dates for arrays of Hijri dates
+def to_gregorian_array(years, months, days, variant=UMM_AL_QURA):
+    ordinals = _to_ordinals(
+        np.asarray(years, dtype=np.int64), np.asarray(months, dtype=np.int64), np.asarray(days, dtype=np.int64),
+        variant
+    )
+    return (ordinals - UNIX_EPOCH).astype("datetime64[D]")
+
+
+# First and last Gregorian day of a Hijri month
+def month_range(year, month, variant=UMM_AL_QURA):
+    first = to_gregorian(year, month, 1, variant)
+    following = to_gregorian(year + 1, 1, 1, variant) if month == 12 else to_gregorian(year, month + 1, 1, variant)
+    return first, date.fromordinal(following.toordinal() - 1)
+
+
+# Hijri year of the next (or current) Ramadan on or after a date
+def next_ramadan_year(day, variant=UMM_AL_QURA):
+    year, month, _ = from_gregorian(day, variant)
+    return year if month <= RAMADAN else year + 1
+
+
+# (name, first day, last day) of the main observances in a Hijri year
+def observances(year, variant=UMM_AL_QURA):
+    def day(month, day_of_month):
+        return to_gregorian(year, month, day_of_month, variant)
+
+    ramadan_first, ramadan_last = month_range(year, RAMADAN, variant)
+    return [
+        ("Islamic New Year", day(MUHARRAM, 1), day(MUHARRAM, 1)),
+        ("Ashura", day(MUHARRAM, 10), day(MUHARRAM, 10)),
+        ("Ramadan", ramadan_first, ramadan_last),
+        ("Eid al-Fitr", day(SHAWWAL, 1), day(SHAWWAL, 3)),
+        ("Day of Arafah", day(DHU_AL_HIJJAH, 9), day(DHU_AL_HIJJAH, 9)),
+        ("Eid al-Adha", day(DHU_AL_HIJJAH, 10), day(DHU_AL_HIJJAH, 13)),
+    ]
+
+
+# "DD-MM-YYYY", the format aladhan uses for hijri dates
+def format_date(year, month, day):
+    return f"{day:02d}-{month:02d}-{year}"
+
+
+# Hijri block shaped like aladhan's data["date"]["hijri"]
+def date_block(day, variant=UMM_AL_QURA):
+    year, month, day_of_month = from_gregorian(day, variant)
+    return {
+        "date": format_date(year, month, day_of_month),
+        "day": f"{day_of_month:02d}",
+        "weekday": {"en": WEEKDAYS[day.weekday()]},
+        "month": {"number": month, "en": MONTHS[month - 1]},
+        "year": str(year),
+    }
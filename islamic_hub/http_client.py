@@ -0,0 +1,119 @@
+import random
+import threading
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from islamic_hub import settings
+from islamic_hub.disk_cache import DiskCache
+from islamic_hub.response_cache import ResponseCache
+
+# Process-wide HTTP client shared by every fetcher.
+#
+# A single requests.Session keeps connections to each upstream host alive,
+# so repeat calls skip the TCP and TLS handshakes. Failed GETs are retried
+# a bounded number of times with jittered exponential backoff, and a
+# semaphore per host caps how many requests all sessions together can have
+# in flight against one API.
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+USER_AGENT = "islamic-resources-hub/0.1 (+https://github.com/Riaz-Hussain-Saifi/Python-Quran-App)"
+
+
+# urllib3's backoff is deterministic, so concurrent sessions that fail
+# together would retry together. Spread them out with full jitter.
+class JitteredRetry(Retry):
+    def get_backoff_time(self):
+        backoff = super().get_backoff_time()
+        return random.uniform(0, backoff) if backoff > 0 else 0
+
+
+class HttpClient:
+    def __init__(self, pool_size=None, per_host_limit=None, retries=None, backoff_factor=0.5):
+        pool_size = pool_size or settings.HTTP_POOL_SIZE
+        self.per_host_limit = per_host_limit or settings.HTTP_PER_HOST_LIMIT
+        retries = settings.HTTP_RETRIES if retries is None else retries
+
+        retry = JitteredRetry(
+            total=retries,
+            connect=retries,
+            read=retries,
+            status=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUSES,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({
+            "User-Agent": USER_AGENT,
+            "Accept-Encoding": "gzip, deflate",
+            "Connection": "keep-alive"
+        })
+        self._host_limits = {}
+        self._lock = threading.Lock()
+
+    def _host_limit(self, url):
+        host = urlsplit(url).netloc
+        with self._lock:
+            limit = self._host_limits.get(host)
+            if limit is None:
+                limit = self._host_limits[host] = threading.BoundedSemaphore(self.per_host_limit)
+        return limit
+
+    def get(self, url, timeout=10, **kwargs):
+        with self._host_limit(url):
+            return self.session.get(url, timeout=timeout, **kwargs)
+
+    def close(self):
+        self.session.close()
+
+
+_client = None
+_cache = None
+_disk_cache = None
+_lock = threading.Lock()
+
+
+def get_client():
+    global _client
+    if _client is None:
+        with _lock:
+            if _client is None:
+                _client = HttpClient()
+    return _client
+
+
+# Memory cache -> disk cache (when enabled) -> pooled client
+def get_cache():
+    global _cache, _disk_cache
+    if _cache is None:
+        client = get_client()
+        with _lock:
+            if _cache is None:
+                fetch = client.get
+                if settings.DISK_CACHE_ENABLED:
+                    _disk_cache = DiskCache(settings.DISK_CACHE_PATH, client.get, max_bytes=settings.DISK_CACHE_MAX_BYTES)
+                    fetch = _disk_cache.get
+                _cache = ResponseCache(fetch, max_bytes=settings.CACHE_MAX_BYTES)
+    return _cache
+
+
+# Plain GETs are answered from the response cache. Requests with extra
+# options (headers, streaming, ...) always go to the network.
+def get(url, timeout=10, **kwargs):
+    if kwargs:
+        return get_client().get(url, timeout=timeout, **kwargs)
+    return get_cache().get(url, timeout=timeout)
+
+
+def cache_stats():
+    stats = get_cache().stats()
+    if _disk_cache is not None:
+        stats["disk"] = _disk_cache.stats()
+    return stats
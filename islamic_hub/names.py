@@ -0,0 +1,43 @@
+import threading
+
+from islamic_hub.trigram_search import TrigramIndex
+
+# The 99 names of Allah and the names of the Prophet ﷺ, with one search
+# index for each, shared by their pages. Each dataset is imported only
+# when its own index is first built, so a page loads only its own.
+
+ASMA_AL_HUSNA = "asma_al_husna"
+NAMES_OF_MUHAMMAD = "names_of_muhammad"
+
+# Fields the name searches look in, with their weights
+SEARCH_FIELDS = {
+    ASMA_AL_HUSNA: {"transliteration": 3, "name": 3, "en.meaning": 2},
+    NAMES_OF_MUHAMMAD: {"transliteration": 3, "name": 3, "meaning": 2, "description": 1},
+}
+
+# The 99 names come with the app, so the page and its search index never
+# wait on the network, and every process indexes the same list
+def get_asma_al_husna():
+    from islamic_hub.datasets import asma_al_husna
+    return asma_al_husna.NAMES
+
+def get_names_of_muhammad():
+    from islamic_hub.datasets import names_of_muhammad
+    return names_of_muhammad.NAMES
+
+_NAME_LISTS = {
+    ASMA_AL_HUSNA: get_asma_al_husna,
+    NAMES_OF_MUHAMMAD: get_names_of_muhammad,
+}
+
+_name_indexes = {}
+_name_indexes_lock = threading.Lock()
+
+# The search index of ASMA_AL_HUSNA or NAMES_OF_MUHAMMAD, built the first
+# time it is needed and kept for the life of the process
+def get_name_index(names):
+    if names not in _name_indexes:
+        with _name_indexes_lock:
+            if names not in _name_indexes:
+                _name_indexes[names] = TrigramIndex(_NAME_LISTS[names](), SEARCH_FIELDS[names])
+    return _name_indexes[names]
@@ -0,0 +1,25 @@
+import importlib
+
+# The app's pages, one module each.
+#
+# The router imports a page's module the first time the page is opened,
+# so a run only loads the code and data of the page being viewed. Each
+# module has a render() function that draws its page.
+
+# Sidebar label -> module
+PAGES = {
+    "🏠 Home": "home",
+    "📚 Juz Browser": "juz_browser",
+    "🎧 Listen to Quran": "listen_to_quran",
+    "🔍 Search Quran": "search_quran",
+    "🕋 Prayer Times": "prayer_times",
+    "🤲 Duas Collection": "duas",
+    "📿 Durood Shareef": "durood_shareef",
+    "🎵 Naats Collection": "naats",
+    "📋 Asma Al-Husna": "asma_al_husna",
+    "📒 Names of Muhammad ﷺ": "names_of_muhammad",
+}
+
+
+def render(page):
+    importlib.import_module(f"{__name__}.{PAGES[page]}").render()
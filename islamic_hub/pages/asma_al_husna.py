@@ -0,0 +1,142 @@
+import streamlit as st
+
+from islamic_hub.names import ASMA_AL_HUSNA, get_name_index
+from islamic_hub.pages.common import fragment, loading_animation
+
+# The 99 names in the chosen view
+@fragment
+def asma_al_husna_view(index):
+    names = index.records
+    
+    # Display view options with animation effects
+    view_option = st.radio("Select View", ["Grid View", "List View", "Details View"], horizontal=True)
+    
+    if view_option == "Grid View":
+        # Display in a grid with animations
+        cols_per_row = 3
+        rows = (len(names) + cols_per_row - 1) // cols_per_row
+        
+        for i in range(rows):
+            row_cols = st.columns(cols_per_row)
+            for j in range(cols_per_row):
+                idx = i * cols_per_row + j
+                if idx < len(names):
+                    name = names[idx]
+                    with row_cols[j]:
+                        st.markdown(f"""
+                        <div class="name-card" style="animation: fadeIn {0.5 + (idx * 0.02)}s ease-in-out;">
+                            <div class="name-number">{name['number']}</div>
+                            <h3 style="margin: 0; color: #046307; text-align: center; padding-left: 30px;">{name['name']}</h3>
+                            <p style="margin: 5px 0 0 0; font-size: 0.9rem; text-align: center;">{name['transliteration']}</p>
+                            <p style="margin: 5px 0 0 0; font-size: 0.8rem; text-align: center;">{name['en']['meaning']}</p>
+                        </div>
+                        """, unsafe_allow_html=True)
+    
+    elif view_option == "List View":
+        # Add a search functionality
+        search_term = st.text_input("Search by name or meaning", placeholder="e.g. Merciful, Rehman, الرحمن")
+        
+        if search_term:
+            filtered_names = index.search(search_term)
+            
+            if filtered_names:
+                st.success(f"Found {len(filtered_names)} names matching '{search_term}'")
+                for name in filtered_names:
+                    st.markdown(f"""
+                    <div class="name-card" style="animation: fadeIn 0.8s ease-in-out;">
+                        <div style="display: flex; justify-content: space-between; align-items: center;">
+                            <div class="name-number">{name['number']}</div>
+                            <h3 style="margin: 0; color: #046307;">{name['name']}</h3>
+                        </div>
+                        <p style="margin: 5px 0 0 0;"><strong>Transliteration:</strong> {name['transliteration']}</p>
+                        <p style="margin: 5px 0 0 0;"><strong>Meaning:</strong> {name['en']['meaning']}</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+            else:
+                st.warning(f"No names found matching '{search_term}'")
+        else:
+            # Display all names in a list with animations
+            for i, name in enumerate(names):
+                st.markdown(f"""
+                <div class="name-card" style="animation: fadeIn {0.5 + (i * 0.02)}s ease-in-out;">
+                    <div style="display: flex; justify-content: space-between; align-items: center;">
+                        <div class="name-number">{name['number']}</div>
+                        <h3 style="margin: 0; color: #046307;">{name['name']}</h3>
+                    </div>
+                    <p style="margin: 5px 0 0 0;"><strong>Transliteration:</strong> {name['transliteration']}</p>
+                    <p style="margin: 5px 0 0 0;"><strong>Meaning:</strong> {name['en']['meaning']}</p>
+                </div>
+                """, unsafe_allow_html=True)
+    
+    else:  # Details View
+        # Group names into categories
+        categories = {
+            "Divine Essence": [1, 2, 3, 4, 5],
+            "Divine Power": [6, 7, 8, 9, 10, 69, 70],
+            "Divine Mercy": [45, 46, 47, 48, 49, 50],
+            "Divine Knowledge": [11, 12, 13, 14, 27, 28, 29],
+            "Divine Majesty": [37, 38, 39, 40, 41, 42],
+            "Divine Providence": [15, 16, 17, 18, 19, 20],
+            "Divine Justice": [30, 31, 32, 33, 34]
+        }
+        
+        # Create tabs for categories
+        category_tabs = st.tabs(list(categories.keys()))
+        
+        for i, (category, name_numbers) in enumerate(categories.items()):
+            with category_tabs[i]:
+                for number in name_numbers:
+                    name = index.get(number)
+                    if name:
+                        with st.expander(f"{number}. {name['transliteration']} ({name['en']['meaning']})"):
+                            st.markdown(f"""
+                            <div style="text-align: center; margin-bottom: 15px;">
+                                <h2 style="color: #046307; font-size: 2.5rem;">{name['name']}</h2>
+                                <p style="font-size: 1.2rem;">{name['transliteration']}</p>
+                            </div>
+                            
+                            <p><strong>Meaning:</strong> {name['en']['meaning']}</p>
+                            
+                            <div class="info-box">
+                                <p><strong>Significance:</strong> The name {name['transliteration']} emphasizes Allah's attribute of being {name['en']['meaning']}.</p>
+                                <p><strong>In the Quran:</strong> This name or its derivatives appear in several verses.</p>
+                            </div>
+                            
+                            <p><strong>Benefits of Recitation:</strong> Remembering this name helps believers connect with this divine attribute and seek Allah's blessings through it.</p>
+                            """, unsafe_allow_html=True)
+
+# The 99 names of Allah
+def render():
+    st.markdown("<h2 class='section-header'>Asma Al-Husna - The 99 Names of Allah</h2>", unsafe_allow_html=True)
+    
+    st.markdown("""
+    <div class="info-box">
+        <p>The Prophet Muhammad ﷺ said: "Allah has ninety-nine names, one hundred minus one. Whoever enumerates them will enter Paradise." (Bukhari)</p>
+        <p>The Asma al-Husna (The Most Beautiful Names) refer to the 99 names of Allah mentioned in Islamic tradition.</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Get Asma Al-Husna
+    loading_animation()
+    index = get_name_index(ASMA_AL_HUSNA)
+    
+    asma_al_husna_view(index)
+    
+     # Display information about Asma Al-Husna
+    with st.expander("About Asma Al-Husna"):
+        st.markdown("""
+        <div class="info-box">
+            <h4 style="margin-top:0">The 99 Names of Allah</h4>
+            
+            <p>These names describe Allah's attributes and characteristics. Muslims are encouraged to call upon Allah using these names, especially in times of need and during supplication.</p>
+            
+            <p><strong>Significance:</strong></p>
+            
+            <ul>
+                <li>Each name represents a unique attribute of Allah</li>
+                <li>Remembering and reflecting on these names brings believers closer to understanding Allah's nature</li>
+                <li>Calling upon Allah by His beautiful names is recommended in the Quran: "And to Allah belong the best names, so invoke Him by them" (Quran 7:180)</li>
+                <li>Memorizing and understanding these names is considered a means of increasing one's faith and knowledge</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
@@ -0,0 +1,49 @@
+import time
+
+import streamlit as st
+
+from islamic_hub import settings
+
+# Helpers shared by several pages: fragments, the loading spinner,
+# pagination and the live naats stream.
+
+# Reruns triggered by widgets inside a fragment only re-execute that
+# function. st.fragment needs Streamlit 1.37 (1.33 as experimental_fragment);
+# on older versions the function just runs as part of the whole script.
+# The interactive parts of each page are fragments, so the data fetched
+# before them and the rest of the page are not loaded or drawn again.
+fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None) or (lambda func: func)
+
+# Define a loading animation function
+def loading_animation():
+    with st.spinner("Loading..."):
+        time.sleep(settings.LOADING_DELAY)
+
+# Draws a page picker when there are more than page_size items and
+# returns the offset of the first item on the chosen page. key keeps
+# several pickers on one page apart.
+def paginate(total, page_size, key):
+    pages = (total + page_size - 1) // page_size
+    if pages <= 1:
+        return 0
+    page = st.number_input(f"Page (of {pages})", min_value=1, max_value=pages, value=1, key=key)
+    return (page - 1) * page_size
+
+# Function to add YouTube live naats iframe
+def add_youtube_live():
+    st.markdown("<h3>Live Naats Streaming</h3>", unsafe_allow_html=True)
+    st.markdown("""
+    <div class="card">
+        <div style="position: relative; padding-bottom: 56.25%; height: 0; overflow: hidden;">
+            <iframe 
+                style="position: absolute; top: 0; left: 0; width: 100%; height: 100%;" 
+                src="https://www.youtube.com/embed/8NUOU1UG5Zg?si=elnVqN-zxqKGPYfX'    
+                title="YouTube video player" 
+                frameborder="0" 
+                allow="accelerometer; autoplay; clipboard-write; encrypted-media; gyroscope; picture-in-picture; web-share" 
+                referrerpolicy="strict-origin-when-cross-origin" 
+                allowfullscreen>
+            </iframe>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
@@ -0,0 +1,126 @@
+import threading
+
+import streamlit as st
+
+from islamic_hub.datasets.duas import DUAS
+from islamic_hub.pages.common import fragment, loading_animation, paginate
+from islamic_hub.record_search import RecordIndex
+
+# Fields the search looks in, and how much a word in each counts. Arabic
+# and Urdu are matched without harakat, and Urdu letter forms match their
+# Arabic counterparts.
+SEARCH_FIELDS = {"title": 3, "category": 1, "translation": 1, "urdu": 1, "arabic": 1, "transliteration": 1}
+
+# Category tabs, in this order
+CATEGORIES = ["Daily Activities", "Morning & Evening", "Worship", "Family & Travel", "Emotional Well-being"]
+
+# Duas shown per page, in the search results and in each category
+PAGE_SIZE = 10
+
+_dua_index = None
+_dua_index_lock = threading.Lock()
+
+# The duas indexed by id, title, category and word, built once per process
+def get_dua_index():
+    global _dua_index
+    if _dua_index is None:
+        with _dua_index_lock:
+            if _dua_index is None:
+                _dua_index = RecordIndex(DUAS, SEARCH_FIELDS, unique=("title",), facets=("category",))
+    return _dua_index
+
+# One dua in an expander
+def show_dua(dua):
+    with st.expander(dua["title"]):
+        st.markdown(f"""
+        <div class="arabic-text">{dua['arabic']}</div>
+        <div class="urdu-text">{dua['urdu']}</div>
+        <p><strong>Transliteration:</strong> {dua['transliteration']}</p>
+        <p><strong>Translation:</strong> {dua['translation']}</p>
+        <p><strong>Reference:</strong> {dua['reference']}</p>
+        """, unsafe_allow_html=True)
+
+# The category tabs, a page of duas each
+@fragment
+def dua_categories(index):
+    # Create a tab for each category with animations
+    dua_tabs = st.tabs(CATEGORIES)
+    
+    for tab, category in zip(dua_tabs, CATEGORIES):
+        with tab:
+            duas = index.facet("category", category)
+            offset = paginate(len(duas), PAGE_SIZE, key=f"dua_page_{category}")
+            for dua in duas[offset:offset + PAGE_SIZE]:
+                show_dua(dua)
+
+# Ranked keyword search over the duas
+@fragment
+def dua_search(index):
+    # Allow users to search for duas
+    st.markdown("<h3>Search Duas</h3>", unsafe_allow_html=True)
+    search_term = st.text_input("Search by keyword", placeholder="e.g. morning, meal, protection, رب")
+    
+    if search_term:
+        # One ranked search gives the count and every page of results
+        total, search_results = index.search(search_term, limit=None)
+        
+        if total:
+            st.success(f"Found {total} duas matching '{search_term}'")
+            offset = paginate(total, PAGE_SIZE, key="dua_search_page")
+            for dua in search_results[offset:offset + PAGE_SIZE]:
+                show_dua(dua)
+        else:
+            st.warning(f"No duas found matching '{search_term}'")
+            # Suggest some popular duas
+            st.markdown("""
+            <div class="info-box">
+                <h4>Popular Duas</h4>
+                <p>Try searching for these common duas:</p>
+                <ul>
+                    <li>Protection</li>
+                    <li>Meal</li>
+                    <li>Morning</li>
+                    <li>Anxiety</li>
+                </ul>
+            </div>
+            """, unsafe_allow_html=True)
+
+# The duas by category, with a keyword search
+def render():
+    st.markdown("<h2 class='section-header'>Duas Collection</h2>", unsafe_allow_html=True)
+    
+    st.markdown("""
+    <div class="info-box">
+        <p>A collection of daily supplications (duas) with Arabic text, transliteration, and translation in both English and Urdu.</p>
+        <p>Dua is the act of supplication or calling out to Allah. It is an expression of submission and humility to God. The Prophet Muhammad ﷺ said, "Dua is worship." (Tirmidhi)</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Get duas
+    loading_animation()
+    index = get_dua_index()
+    
+    dua_categories(index)
+    
+    dua_search(index)
+    
+    with st.expander("About Duas"):
+     st.markdown('<div class="info-box">', unsafe_allow_html=True)
+    
+     st.write("The duas presented here are from authentic sources including the Quran and Hadith. They cover various aspects of daily life and are recommended for regular practice.")
+    
+     st.write("When making dua, it is recommended to:")
+    
+     st.markdown("""
+     <ul>
+        <li>Begin with praising Allah</li>
+        <li>Send blessings upon the Prophet Muhammad ﷺ</li>
+        <li>Raise your hands with palms facing upward</li>
+        <li>Be sincere and focused</li>
+        <li>End by sending blessings upon the Prophet Muhammad ﷺ again</li>
+     </ul>
+    """, unsafe_allow_html=True)
+    
+     st.write("The Prophet Muhammad ﷺ said: \"Nothing is more honorable to Allah the Most High than dua.\" (Sahih al-Jami)")
+    
+    st.markdown('</div>', unsafe_allow_html=True)
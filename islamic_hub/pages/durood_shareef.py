@@ -0,0 +1,171 @@
+import re
+
+import streamlit as st
+
+from islamic_hub import clock, counters
+from islamic_hub.counter import tasbeeh_counter
+from islamic_hub.datasets.durood import DUROOD
+from islamic_hub.pages.common import fragment, loading_animation
+from islamic_hub.textnorm import search_records
+
+DUROOD_COUNTER = "durood"
+
+# Fields the Durood search looks in
+SEARCH_FIELDS = ("title", "arabic", "urdu", "transliteration", "translation")
+
+# More taps than anyone can make in a day. A batch claiming more did not
+# come from the counter and is ignored.
+MAX_DAILY_COUNT = 1_000_000
+
+# Who a counter batch belongs to: the signed-in account when the app uses
+# st.login, so the total follows the user across devices, otherwise the
+# anonymous id kept by their browser
+def get_counter_user(batch):
+    try:
+        if st.user.is_logged_in:
+            return "account:" + st.user.email
+    except Exception as e:
+        pass
+    return "browser:" + str(batch.get("user") or "anonymous")[:64]
+
+# The count a batch reports, or None if it is not a whole number of taps
+# the counter could have sent. The batch comes from the browser, so any
+# value can arrive here.
+def parse_count(value):
+    if isinstance(value, bool):
+        return None
+    try:
+        count = int(value)
+    except (TypeError, ValueError, OverflowError) as e:
+        return None
+    if count > MAX_DAILY_COUNT:
+        return None
+    return max(count, 0)
+
+# Stores the batch the Durood counter has just sent. Runs as the
+# counter's on_change callback, before the counter is drawn again.
+def save_durood_batch():
+    batch = st.session_state.get("durood_counter")
+    if not batch:
+        return
+    day = str(batch.get("day", ""))
+    if not re.match(r"^\d{4}-\d{2}-\d{2}$", day):
+        day = clock.today(clock.zone_for("UTC")).strftime("%Y-%m-%d")
+    user = get_counter_user(batch)
+    store = counters.get_store()
+    count = parse_count(batch.get("count", 0))
+    # Counts only go down through the Reset button, so a device that is
+    # behind cannot undo what was counted elsewhere
+    reset = bool(batch.get("reset"))
+    if count is not None and (reset or count > store.user_total(DUROOD_COUNTER, user, day)):
+        store.record(DUROOD_COUNTER, user, day, count, reset=reset)
+    st.session_state.durood_day = day
+    st.session_state.durood_count = store.user_total(DUROOD_COUNTER, user, day)
+
+# Daily Durood counter. Taps are counted in the browser and arrive in
+# batches; as a fragment, a batch reruns only this function rather than
+# the whole page.
+@fragment
+def durood_counter():
+    if 'durood_count' not in st.session_state:
+        st.session_state.durood_count = 0
+    tasbeeh_counter(
+        DUROOD_COUNTER,
+        st.session_state.durood_count,
+        goal=100,
+        steps=(1, 10),
+        description="Many scholars recommend reciting Durood Shareef at least 100 times daily.",
+        key="durood_counter",
+        on_change=save_durood_batch
+    )
+    if 'durood_day' in st.session_state:
+        total = counters.get_store().day_total(DUROOD_COUNTER, st.session_state.durood_day)
+        st.caption(f"Durood recited by everyone today: {total:,}")
+
+# The Durood collection, narrowed down by the search box
+@fragment
+def durood_collection(duroods):
+    search_term = st.text_input("Search Durood", placeholder="e.g. Ibrahim, Taj, blessings")
+    if search_term:
+        duroods = search_records(duroods, search_term, SEARCH_FIELDS)
+        if not duroods:
+            st.warning(f"No durood found matching '{search_term}'")
+
+    # Display each durood in an expander with animations
+    for durood in duroods:
+        with st.expander(durood["title"]):
+            st.markdown(f"""
+            <div class="arabic-text">{durood['arabic']}</div>
+            <div class="urdu-text">{durood['urdu']}</div>
+            <p><strong>Transliteration:</strong> {durood['transliteration']}</p>
+            <p><strong>Translation:</strong> {durood['translation']}</p>
+            <p><strong>Virtues:</strong> {durood['virtues']}</p>
+            """, unsafe_allow_html=True)
+
+# The Durood collection and the daily counter
+def render():
+    st.markdown("<h2 class='section-header'>Durood Shareef Collection</h2>", unsafe_allow_html=True)
+    
+    st.markdown("""
+    <div class="info-box">
+        <p>Durood Shareef refers to the invocation of blessings upon the Prophet Muhammad ﷺ. The Prophet ﷺ said, "Whoever sends blessings upon me once, Allah will send blessings upon him tenfold." (Muslim)</p>
+        <p>Reciting Durood is one of the most virtuous acts and brings numerous blessings in this world and the hereafter.</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Get durood collection
+    loading_animation()
+    duroods = DUROOD
+    durood_collection(duroods)
+    
+    # Durood counter with beautiful animation
+    st.markdown("<h3>Daily Durood Counter</h3>", unsafe_allow_html=True)
+    
+    # Display current count and progress
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        durood_counter()
+    
+    with col2:
+        st.markdown("""
+        <div class="card" style="animation: fadeIn 1s ease-in-out;">
+            <h4 style="margin-top:0">Best Times to Recite</h4>
+            <ul>
+                <li>Friday is especially virtuous for sending Durood</li>
+                <li>After the Adhan (call to prayer)</li>
+                <li>During the final sitting in prayer</li>
+                <li>Before making dua (supplication)</li>
+                <li>In gatherings, to bring blessings</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # Display information about benefits of reciting Durood
+    with st.expander("Benefits of Reciting Durood Shareef"):
+        st.markdown("""
+        <div class="info-box">
+            <h4 style="margin-top:0">Virtues of Sending Blessings upon the Prophet Muhammad ﷺ</h4>
+            
+            <p>The Prophet Muhammad ﷺ said:</p>
+            
+            <ul>
+                <li>"The closest of people to me on the Day of Resurrection will be those who send the most blessings upon me." (Tirmidhi)</li>
+                <li>"Whoever sends blessings upon me once, Allah will send blessings upon him tenfold." (Muslim)</li>
+                <li>"The miser is the one in whose presence I am mentioned and he does not send blessings upon me." (Tirmidhi)</li>
+                <li>"Do not make your houses graves, and do not make my grave a place of celebration. Send blessings upon me, for your blessings reach me wherever you are." (Abu Dawud)</li>
+            </ul>
+            
+            <p><strong>Benefits of reciting Durood Shareef:</strong></p>
+            
+            <ol>
+                <li>Allah sends ten blessings upon the one who sends one blessing upon the Prophet ﷺ</li>
+                <li>It is a means of having one's sins forgiven</li>
+                <li>It is a means of having one's needs fulfilled</li>
+                <li>It brings one closer to the Prophet ﷺ on the Day of Judgment</li>
+                <li>It is a means of gaining the Prophet's ﷺ intercession</li>
+                <li>It is a means of having one's supplications accepted</li>
+                <li>It brings blessings and peace to one's life</li>
+            </ol>
+        </div>
+        """, unsafe_allow_html=True)
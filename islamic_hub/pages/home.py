@@ -0,0 +1,251 @@
+import random
+
+import streamlit as st
+
+from islamic_hub import clock
+from islamic_hub.datasets.duas import DUAS
+from islamic_hub.datasets.naats import NAATS
+from islamic_hub.pages.common import add_youtube_live, loading_animation
+from islamic_hub.pages.prayer_times import get_prayer_schedule, get_prayer_times, get_session_location
+from islamic_hub.quran import get_ayah_editions
+
+# Overview with today's prayer times, a dua, a naat and an ayah
+def render():
+    st.markdown("""
+<div class="hero-section">
+    <h1 class="hero-title">Explore Islamic Resources</h1>
+    <p class="hero-subtitle">Your comprehensive platform for Quran, Prayer Times, Naats, Duas, and more</p>
+    <div>
+        <a href="#" onclick="document.querySelectorAll('[data-testid=\'stSidebar\'] [role=\'radio\']')[1].click(); return false;" class="hero-button">Browse Quran</a>
+        <a href="#" onclick="document.querySelectorAll('[data-testid=\'stSidebar\'] [role=\'radio\']')[7].click(); return false;" class="hero-button">Listen to Naats</a>
+    </div>
+</div>
+""", unsafe_allow_html=True)
+    
+    # Dashboard layout
+    st.markdown("<h2 class='section-header'>Welcome to Islamic Resources Hub</h2>", unsafe_allow_html=True)
+    
+    # Create three columns for the dashboard
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown("""
+        <div class="card">
+            <h3 style="color: #046307;">📚 Quran</h3>
+            <p>Access the Holy Quran in multiple languages and translations.</p>
+            <ul>
+                <li>Browse by Juz (Para)</li>
+                <li>Multiple translations including Urdu</li>
+                <li>Listen to beautiful recitations</li>
+                <li>Read complete surahs and juz</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown("""
+        <div class="card">
+            <h3 style="color: #046307;">🕋 Prayer Times</h3>
+            <p>Get accurate prayer times for your location with multiple calculation methods.</p>
+            <ul>
+                <li>Automatic location detection</li>
+                <li>Multiple calculation methods</li>
+                <li>Daily prayer schedule</li>
+                <li>Visual prayer timeline</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("""
+        <div class="card">
+            <h3 style="color: #046307;">🎵 Naats Collection</h3>
+            <p>Listen to beautiful Naats in praise of Prophet Muhammad ﷺ.</p>
+            <ul>
+                <li>Various renowned reciters</li>
+                <li>Different languages</li>
+                <li>High-quality audio</li>
+                <li>Lyrics in Urdu and English</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown("""
+        <div class="card">
+            <h3 style="color: #046307;">📿 Durood Shareef</h3>
+            <p>Collection of Durood Shareef with Arabic text, transliteration, and translation.</p>
+            <ul>
+                <li>Multiple Durood variants</li>
+                <li>Virtues and benefits</li>
+                <li>Urdu translation</li>
+                <li>Daily counter for tracking recitations</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown("""
+        <div class="card">
+            <h3 style="color: #046307;">🤲 Duas Collection</h3>
+            <p>Comprehensive collection of daily duas with translations and references.</p>
+            <ul>
+                <li>Categorized duas</li>
+                <li>Arabic with Urdu translation</li>
+                <li>Source references</li>
+                <li>Searchable database</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown("""
+        <div class="card">
+            <h3 style="color: #046307;">📋 Divine Names</h3>
+            <p>The 99 Names of Allah and Names of Prophet Muhammad ﷺ.</p>
+            <ul>
+                <li>Complete numbered lists</li>
+                <li>Arabic text with meanings</li>
+                <li>Detailed explanations</li>
+                <li>Multiple view options</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # Current date and prayer time info
+    st.markdown("<h2 class='section-header'>Today's Overview</h2>", unsafe_allow_html=True)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Current date and prayer times based on user's location
+        loading_animation()
+        user_location = get_session_location()
+        prayer_data = get_prayer_times(
+            user_location['city'],
+            user_location['country'],
+            latitude=user_location['latitude'],
+            longitude=user_location['longitude'],
+            timezone=user_location.get('timezone')
+        )
+        
+        schedule = get_prayer_schedule(user_location)
+        if schedule and schedule['next']:
+            next_name, next_time = schedule['next']
+            next_prayer = "<p><strong>Next:</strong> {} at {} (in {})</p>".format(
+                next_name, next_time.strftime('%H:%M'), clock.format_duration(next_time - schedule['now'])
+            )
+        else:
+            next_prayer = ""
+        
+        if prayer_data:
+            st.markdown("""
+            <div class="info-box">
+                <h3 style="margin-top:0">Prayer Times for {}</h3>
+                <p>{} &middot; {} {} {}</p>
+                {}
+                <p><strong>Fajr:</strong> <span class="prayer-time">{}</span></p>
+                <p><strong>Sunrise:</strong> <span class="prayer-time">{}</span></p>
+                <p><strong>Dhuhr:</strong> <span class="prayer-time">{}</span></p>
+                <p><strong>Asr:</strong> <span class="prayer-time">{}</span></p>
+                <p><strong>Maghrib:</strong> <span class="prayer-time">{}</span></p>
+                <p><strong>Isha:</strong> <span class="prayer-time">{}</span></p>
+            </div>
+            """.format(
+                user_location['city'],
+                prayer_data['date']['gregorian']['date'],
+                int(prayer_data['date']['hijri']['day']),
+                prayer_data['date']['hijri']['month']['en'],
+                prayer_data['date']['hijri']['year'],
+                next_prayer,
+                prayer_data['timings']['Fajr'],
+                prayer_data['timings']['Sunrise'],
+                prayer_data['timings']['Dhuhr'],
+                prayer_data['timings']['Asr'],
+                prayer_data['timings']['Maghrib'],
+                prayer_data['timings']['Isha']
+            ), unsafe_allow_html=True)
+    
+    with col2:
+        # Quick Dua of the day - randomly pick one
+        duas = DUAS
+        dua_of_the_day = random.choice(duas)
+        
+        st.markdown(f"""
+        <div class="info-box">
+            <h3 style="margin-top:0">Dua of the Day</h3>
+            <h4>{dua_of_the_day['title']}</h4>
+            <div class="arabic-text">{dua_of_the_day['arabic']}</div>
+            <div class="urdu-text">{dua_of_the_day['urdu']}</div>
+            <p><strong>Transliteration:</strong> {dua_of_the_day['transliteration']}</p>
+            <p><strong>Translation:</strong> {dua_of_the_day['translation']}</p>
+            <p><strong>Reference:</strong> {dua_of_the_day['reference']}</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    # Featured Naat
+    st.markdown("<h2 class='section-header'>Featured Naat</h2>", unsafe_allow_html=True)
+    
+    # Get a random naat from the collection
+    naats = NAATS
+    featured_naat = random.choice(naats)
+    
+    st.markdown(f"""
+    <div class="naat-card">
+        <h3 class="naat-title">{featured_naat['title']}</h3>
+        <p class="naat-reciter">Recited by: {featured_naat['reciter']} | Language: {featured_naat['language']} | Duration: {featured_naat['duration']}</p>
+        <div class="urdu-text" style="background-color: #f5f5f5; margin-bottom: 15px;">{featured_naat['lyrics_excerpt']}</div>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Embed SoundCloud player for the featured naat
+    st.components.v1.iframe(
+        src=f"https://w.soundcloud.com/player/?url={featured_naat['audio_url']}&color=%23046307&auto_play=false&hide_related=true&show_comments=false&show_user=true&show_reposts=false&show_teaser=false",
+        height=120,
+        scrolling=False
+    )
+    
+    # Add live YouTube naats
+    add_youtube_live()
+    
+    # Featured Ayah
+    st.markdown("<h2 class='section-header'>Verse of the Day</h2>", unsafe_allow_html=True)
+    
+    # Generate a random ayah number
+    random_ayah_num = random.randint(1, 6236)
+    
+    # Get the ayah in Arabic and English
+    try:
+        loading_animation()
+        ayah_editions = get_ayah_editions(random_ayah_num, ["quran-uthmani", "en.asad", "ur.jalandhry"])
+        ayah_arabic = ayah_editions["quran-uthmani"]
+        ayah_english = ayah_editions["en.asad"]
+        ayah_urdu = ayah_editions["ur.jalandhry"]
+        
+        if ayah_arabic and ayah_english and ayah_urdu:
+            st.markdown(f"""
+            <div class="card">
+                <h4>Surah {ayah_arabic['surah']['englishName']} ({ayah_arabic['surah']['number']}), Verse {ayah_arabic['numberInSurah']}</h4>
+                <div class="arabic-text">{ayah_arabic['text']}</div>
+                <div class="urdu-text">{ayah_urdu['text']}</div>
+                <div class="translation-text">{ayah_english['text']}</div>
+            </div>
+            """, unsafe_allow_html=True)
+        else:
+            # Fallback to a well-known verse if API fails
+            st.markdown("""
+            <div class="card">
+                <h4>Surah Al-Fatiha (1), Verse 1-7</h4>
+                <div class="arabic-text">بِسْمِ اللَّهِ الرَّحْمَٰنِ الرَّحِيمِ ﴿١﴾ الْحَمْدُ لِلَّهِ رَبِّ الْعَالَمِينَ ﴿٢﴾ الرَّحْمَٰنِ الرَّحِيمِ ﴿٣﴾ مَالِكِ يَوْمِ الدِّينِ ﴿٤﴾ إِيَّاكَ نَعْبُدُ وَإِيَّاكَ نَسْتَعِينُ ﴿٥﴾ اهْدِنَا الصِّرَاطَ الْمُسْتَقِيمَ ﴿٦﴾ صِرَاطَ الَّذِينَ أَنْعَمْتَ عَلَيْهِمْ غَيْرِ الْمَغْضُوبِ عَلَيْهِمْ وَلَا الضَّالِّينَ ﴿٧﴾</div>
+                <div class="urdu-text">اللہ کے نام سے جو بڑا مہربان نہایت رحم والا ہے ﴿١﴾ تمام تعریفیں اللہ کے لیے ہیں جو تمام جہانوں کا پالنے والا ہے ﴿٢﴾ بڑا مہربان نہایت رحم والا ﴿٣﴾ انصاف کے دن کا مالک ﴿٤﴾ ہم صرف تیری ہی عبادت کرتے ہیں اور صرف تجھی سے مدد مانگتے ہیں ﴿٥﴾ ہمیں سیدھے راستے کی ہدایت دے ﴿٦﴾ ان لوگوں کے راستے کی جن پر تو نے انعام کیا، نہ ان کی جن پر غضب ہوا اور نہ گمراہوں کی ﴿٧﴾</div>
+                <div class="translation-text">In the name of Allah, the Entirely Merciful, the Especially Merciful. All praise is due to Allah, Lord of the worlds - The Entirely Merciful, the Especially Merciful, Sovereign of the Day of Recompense. It is You we worship and You we ask for help. Guide us to the straight path - The path of those upon whom You have bestowed favor, not of those who have evoked [Your] anger or of those who are astray.</div>
+            </div>
+            """, unsafe_allow_html=True)
+    except Exception as e:
+        st.error(f"Error fetching verse of the day: {e}")
+        # Fallback to a well-known verse
+        st.markdown("""
+        <div class="card">
+            <h4>Surah Al-Fatiha (1), Verse 1-7</h4>
+            <div class="arabic-text">بِسْمِ اللَّهِ الرَّحْمَٰنِ الرَّحِيمِ ﴿١﴾ الْحَمْدُ لِلَّهِ رَبِّ الْعَالَمِينَ ﴿٢﴾ الرَّحْمَٰنِ الرَّحِيمِ ﴿٣﴾ مَالِكِ يَوْمِ الدِّينِ ﴿٤﴾ إِيَّاكَ نَعْبُدُ وَإِيَّاكَ نَسْتَعِينُ ﴿٥﴾ اهْدِنَا الصِّرَاطَ الْمُسْتَقِيمَ ﴿٦﴾ صِرَاطَ الَّذِينَ أَنْعَمْتَ عَلَيْهِمْ غَيْرِ الْمَغْضُوبِ عَلَيْهِمْ وَلَا الضَّالِّينَ ﴿٧﴾</div>
+            <div class="urdu-text">اللہ کے نام سے جو بڑا مہربان نہایت رحم والا ہے ﴿١﴾ تمام تعریفیں اللہ کے لیے ہیں جو تمام جہانوں کا پالنے والا ہے ﴿٢﴾ بڑا مہربان نہایت رحم والا ﴿٣﴾ انصاف کے دن کا مالک ﴿٤﴾ ہم صرف تیری ہی عبادت کرتے ہیں اور صرف تجھی سے مدد مانگتے ہیں ﴿٥﴾ ہمیں سیدھے راستے کی ہدایت دے ﴿٦﴾ ان لوگوں کے راستے کی جن پر تو نے انعام کیا، نہ ان کی جن پر غضب ہوا اور نہ گمراہوں کی ﴿٧﴾</div>
+            <div class="translation-text">In the name of Allah, the Entirely Merciful, the Especially Merciful. All praise is due to Allah, Lord of the worlds - The Entirely Merciful, the Especially Merciful, Sovereign of the Day of Recompense. It is You we worship and You we ask for help. Guide us to the straight path - The path of those upon whom You have bestowed favor, not of those who have evoked [Your] anger or of those who are astray.</div>
+        </div>
+        """, unsafe_allow_html=True)
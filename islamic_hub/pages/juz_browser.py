@@ -0,0 +1,212 @@
+import streamlit as st
+
+from islamic_hub.pages.common import fragment, loading_animation
+from islamic_hub.quran import get_juz_editions, get_quran_editions
+
+# Juz selection grid and the selected Juz with its translation and
+# audio pickers
+@fragment
+def juz_browser():
+    # Create a grid for Juz selection with beautiful cards and animations
+    st.markdown("<h3>Select a Juz to Read</h3>", unsafe_allow_html=True)
+    
+    # Create columns for the grid with animation effect
+    cols = 5
+    rows = 6
+    
+    for i in range(rows):
+        row_cols = st.columns(cols)
+        for j in range(cols):
+            juz_number = i * cols + j + 1
+            if juz_number <= 30:
+                with row_cols[j]:
+                    st.markdown(f"""
+                    <div class="name-card" style="text-align: center; cursor: pointer; min-height: 80px; display: flex; flex-direction: column; justify-content: center; align-items: center;">
+                        <h3 style="margin: 0; color: #046307;">Juz {juz_number}</h3>
+                        <p style="margin: 5px 0 0 0; font-size: 0.8rem;">Para {juz_number}</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+                    if st.button(f"Read Juz {juz_number}", key=f"juz_{juz_number}", use_container_width=True):
+                        st.session_state.selected_juz = juz_number
+    
+    # Display selected juz
+    if 'selected_juz' in st.session_state:
+        st.markdown("<hr>", unsafe_allow_html=True)
+        
+        # Get editions for display
+        loading_animation()
+        editions = get_quran_editions()
+        text_editions = [edition for edition in editions if edition.get("format") == "text"]
+        audio_editions = [edition for edition in editions if edition.get("format") == "audio"]
+        
+        # Create options for dropdown
+        edition_options = []
+        for edition in text_editions:
+            edition_options.append({
+                "label": f"{edition.get('name')} ({edition.get('language')})",
+                "value": edition.get('identifier')
+            })
+        
+        audio_options = []
+        for edition in audio_editions:
+            audio_options.append({
+                "label": f"{edition.get('name')} ({edition.get('language')})",
+                "value": edition.get('identifier')
+            })
+        
+        col1, col2, col3 = st.columns([2, 1, 1])
+        
+        with col1:
+            st.markdown(f"<h3>Selected Juz: {st.session_state.selected_juz}</h3>", unsafe_allow_html=True)
+        
+        with col2:
+            # Default to Urdu translation if available
+            default_index = 0
+            for i, opt in enumerate(edition_options):
+                if "ur." in opt["value"]:
+                    default_index = i
+                    break
+            
+            selected_edition = st.selectbox(
+                "Select Translation",
+                options=[opt["value"] for opt in edition_options],
+                format_func=lambda x: next((opt["label"] for opt in edition_options if opt["value"] == x), x),
+                index=default_index
+            )
+        
+        with col3:
+            if audio_options:
+                selected_audio = st.selectbox(
+                    "Select Audio Recitation",
+                    options=[opt["value"] for opt in audio_options],
+                    format_func=lambda x: next((opt["label"] for opt in audio_options if opt["value"] == x), x),
+                    index=0
+                )
+            else:
+                selected_audio = None
+                st.info("Audio recitations not available")
+        
+        # Get the juz content
+        loading_animation()
+        juz_editions = get_juz_editions(st.session_state.selected_juz, [selected_edition, "quran-uthmani"])
+        juz_data = juz_editions[selected_edition]
+        arabic_juz = juz_editions["quran-uthmani"]
+        
+        if juz_data and arabic_juz:
+            # Display juz information
+            st.markdown(f"""
+            <div class="info-box">
+                <h3 style="margin-top:0">Juz {st.session_state.selected_juz} (Para {st.session_state.selected_juz})</h3>
+                <p><strong>Number of Verses:</strong> {len(juz_data.get('ayahs', []))}</p>
+                <p><strong>Surahs Included:</strong> {", ".join(set([f"{ayah['surah']['englishName']} ({ayah['surah']['number']})" for ayah in juz_data.get('ayahs', [])]))}</p>
+            </div>
+            """, unsafe_allow_html=True)
+            
+            juz_text(juz_data, arabic_juz, selected_audio)
+        else:
+            st.error("Error loading Juz data. Please try a different Juz or edition.")
+
+# Verses of the selected Juz, by Surah or all together. Switching the
+# view mode only redraws the verses.
+@fragment
+def juz_text(juz_data, arabic_juz, selected_audio):
+    # View mode selection with nice toggle animation
+    view_mode = st.radio("View Mode", ["By Surah", "All Verses"], horizontal=True)
+
+    if view_mode == "By Surah":
+        # Group ayahs by surah
+        surahs_in_juz = {}
+        for ayah in juz_data.get('ayahs', []):
+            surah_num = ayah['surah']['number']
+            if surah_num not in surahs_in_juz:
+                surahs_in_juz[surah_num] = {
+                    'name': ayah['surah']['englishName'],
+                    'translation': ayah['surah']['englishNameTranslation'],
+                    'ayahs': []
+                }
+            surahs_in_juz[surah_num]['ayahs'].append(ayah)
+
+        # Display each surah in an expander with animations
+        for surah_num in sorted(surahs_in_juz.keys()):
+            with st.expander(f"Surah {surah_num}: {surahs_in_juz[surah_num]['name']} ({surahs_in_juz[surah_num]['translation']})"):
+                # Get Arabic ayahs for this surah
+                arabic_ayahs = [ayah for ayah in arabic_juz.get('ayahs', []) if ayah['surah']['number'] == surah_num]
+
+                # Display Bismillah if not Surah 9
+                if surah_num != 9:
+                    st.markdown('<div class="arabic-text">بِسْمِ اللَّهِ الرَّحْمَٰنِ الرَّحِيمِ</div>', unsafe_allow_html=True)
+
+                # Create tabs for different view options
+                tab1, tab2 = st.tabs(["Verse by Verse", "Complete Text"])
+
+                with tab1:
+                    # Display verses with Arabic and translation
+                    for ayah, ar_ayah in zip(surahs_in_juz[surah_num]['ayahs'], arabic_ayahs):
+                        st.markdown(f"""
+                        <div class="card" style="animation: fadeIn 0.5s ease-in-out;">
+                            <div class="arabic-text">{ar_ayah['text']} ﴿{ayah['numberInSurah']}﴾</div>
+                            <div class="translation-text">{ayah['text']} ({ayah['numberInSurah']})</div>
+                        </div>
+                        """, unsafe_allow_html=True)
+
+                with tab2:
+                    # Display all Arabic text together
+                    st.markdown('<div class="arabic-text">', unsafe_allow_html=True)
+                    for ar_ayah in arabic_ayahs:
+                        st.markdown(f"{ar_ayah['text']} ﴿{ar_ayah['numberInSurah']}﴾ ", unsafe_allow_html=True)
+                    st.markdown('</div>', unsafe_allow_html=True)
+
+                    # Display all translation text together
+                    st.markdown('<div class="translation-text">', unsafe_allow_html=True)
+                    for ayah in surahs_in_juz[surah_num]['ayahs']:
+                        st.markdown(f"{ayah['text']} ({ayah['numberInSurah']}) ", unsafe_allow_html=True)
+                    st.markdown('</div>', unsafe_allow_html=True)
+
+                # Audio for surah sections in juz
+                if selected_audio:
+                    try:
+                        # Get the surah number and extract first ayah of this surah in this juz
+                        surah_number = surah_num
+                        st.markdown("<h4>Listen to this Surah section:</h4>", unsafe_allow_html=True)
+                        st.audio(f"https://cdn.islamic.network/quran/audio/128/{selected_audio}/{surah_number}.mp3", format="audio/mp3")
+                    except:
+                        st.error("Audio not available for this section")
+    else:
+        # Display all verses sequentially
+        current_surah = None
+
+        for ayah, ar_ayah in zip(juz_data.get('ayahs', []), arabic_juz.get('ayahs', [])):
+            # Display surah header when surah changes
+            if current_surah != ayah['surah']['number']:
+                current_surah = ayah['surah']['number']
+                st.markdown(f"""
+                <h4 style="margin-top: 20px; color: #046307; animation: fadeIn 0.8s ease-in-out;">Surah {current_surah}: {ayah['surah']['englishName']} ({ayah['surah']['englishNameTranslation']})</h4>
+                """, unsafe_allow_html=True)
+
+                # Display Bismillah if not Surah 9
+                if current_surah != 9:
+                    st.markdown('<div class="arabic-text">بِسْمِ اللَّهِ الرَّحْمَٰنِ الرَّحِيمِ</div>', unsafe_allow_html=True)
+
+            st.markdown(f"""
+            <div class="card" style="animation: fadeIn 0.5s ease-in-out;">
+                <div class="arabic-text">{ar_ayah['text']} ﴿{ayah['numberInSurah']}﴾</div>
+                <div class="translation-text">{ayah['text']} ({ayah['numberInSurah']})</div>
+            </div>
+            """, unsafe_allow_html=True)
+
+        # Audio for entire juz
+        if selected_audio:
+            st.warning("Full Juz audio is not available in single audio. Please use 'By Surah' view for audio recitation.")
+
+# The Quran by Juz, with a translation and audio recitation
+def render():
+    st.markdown("<h2 class='section-header'>Juz Browser</h2>", unsafe_allow_html=True)
+    
+    st.markdown("""
+    <div class="info-box">
+        <p>The Holy Quran is divided into 30 Juz (parts) of approximately equal length. This makes it easier to read the Quran over the course of a month, particularly during Ramadan.</p>
+        <p>Each Juz contains portions of different Surahs, and the division helps in systematic reading and memorization of the Quran.</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    juz_browser()
@@ -0,0 +1,152 @@
+import streamlit as st
+
+from islamic_hub.pages.common import fragment, loading_animation
+from islamic_hub.quran import get_quran_audio_list, get_quran_surahs, get_surah_editions
+
+# Picks a recommended surah in the Listen to Quran player
+def select_listen_surah(surah_num):
+    st.session_state.listen_surah = surah_num
+
+# Surah and reciter pickers, the audio player and the recommended Surahs
+@fragment
+def quran_player(surahs, reciters):
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Select Surah
+        surah_options = []
+        for surah in surahs:
+            surah_options.append({
+                "label": f"{surah.get('number')}. {surah.get('englishName')} ({surah.get('englishNameTranslation')})",
+                "value": surah.get('number')
+            })
+        
+        selected_surah = st.selectbox(
+            "Select Surah",
+            options=[opt["value"] for opt in surah_options],
+            format_func=lambda x: next((opt["label"] for opt in surah_options if opt["value"] == x), x),
+            key="listen_surah"
+        )
+    
+    with col2:
+        # Select Reciter
+        reciter_options = []
+        for reciter in reciters:
+            reciter_options.append({
+                "label": f"{reciter.get('name')} ({reciter.get('language')})",
+                "value": reciter.get('id')
+            })
+        
+        selected_reciter = st.selectbox(
+            "Select Reciter",
+            options=[opt["value"] for opt in reciter_options],
+            format_func=lambda x: next((opt["label"] for opt in reciter_options if opt["value"] == x), x),
+            index=0
+        )
+    
+    # Get audio URL
+    audio_url = f"https://cdn.islamic.network/quran/audio-surah/128/{selected_reciter}/{selected_surah}.mp3"
+    
+    # Display surah info
+    if selected_surah:
+        surah_info = next((s for s in surahs if s["number"] == selected_surah), None)
+        if surah_info:
+            st.markdown(f"""
+            <div class="card" style="margin-top: 20px;">
+                <h3 style="color: #046307;">{surah_info['englishName']} ({surah_info['englishNameTranslation']})</h3>
+                <p><strong>Number of Verses:</strong> {surah_info['numberOfAyahs']}</p>
+                <p><strong>Revelation Type:</strong> {surah_info['revelationType']}</p>
+                <p>Now playing Surah {surah_info['number']} - {surah_info['englishName']} recited by {next((r['name'] for r in reciters if r['id'] == selected_reciter), 'Unknown Reciter')}</p>
+            </div>
+            """, unsafe_allow_html=True)
+    
+    # Audio player with enhanced styling
+    st.markdown("""
+    <h3 style="margin-top: 20px;">Audio Player</h3>
+    <div style="background-color: #f0f8ff; padding: 20px; border-radius: 10px; box-shadow: 0 4px 8px rgba(0,0,0,0.1); margin: 10px 0 20px 0;">
+    """, unsafe_allow_html=True)
+    
+    # Audio player
+    st.audio(audio_url, format="audio/mp3")
+    
+    st.markdown("</div>", unsafe_allow_html=True)
+    
+    # Display Bismillah and first few verses
+    loading_animation()
+    surah_editions = get_surah_editions(selected_surah, ["quran-uthmani", "en.asad"])
+    arabic_surah = surah_editions["quran-uthmani"]
+    translation_surah = surah_editions["en.asad"]
+    
+    if arabic_surah and translation_surah:
+        # Display Bismillah if not Surah 9
+        if selected_surah != 9:
+            st.markdown('<div class="arabic-text">بِسْمِ اللَّهِ الرَّحْمَٰنِ الرَّحِيمِ</div>', unsafe_allow_html=True)
+        
+        # Display first 5 verses or all if less than 5
+        num_verses = min(5, len(arabic_surah['ayahs']))
+        
+        st.markdown("<h3>First Few Verses:</h3>", unsafe_allow_html=True)
+        
+        for i in range(num_verses):
+            ar_ayah = arabic_surah['ayahs'][i]
+            tr_ayah = translation_surah['ayahs'][i]
+            
+            st.markdown(f"""
+            <div class="card" style="animation: fadeIn 0.5s ease-in-out;">
+                <div class="arabic-text">{ar_ayah['text']} ﴿{ar_ayah['numberInSurah']}﴾</div>
+                <div class="translation-text">{tr_ayah['text']} ({tr_ayah['numberInSurah']})</div>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        # Link to read full surah
+        if st.button("Read Full Surah in Juz Browser", use_container_width=True):
+            # Find which juz contains this surah
+            juz_number = arabic_surah['ayahs'][0]['juz']
+            st.session_state.selected_juz = juz_number
+            st.session_state.page = "📚 Juz Browser"
+            st.rerun()
+    else:
+        st.error("Error loading Surah text.")
+    
+    # Recommendations
+    st.markdown("<h3>Recommended Surahs for Recitation:</h3>", unsafe_allow_html=True)
+    
+    # Create a row of recommended surahs
+    recommended = [1, 36, 55, 56, 67, 78, 112, 113, 114]  # Common surahs for recitation
+    cols = st.columns(len(recommended))
+    
+    for i, col in enumerate(cols):
+        surah_num = recommended[i]
+        surah_info = next((s for s in surahs if s["number"] == surah_num), None)
+        
+        if surah_info:
+            with col:
+                st.markdown(f"""
+                <div class="name-card" style="text-align: center; min-height: 100px; cursor: pointer;">
+                    <h4 style="margin: 0; color: #046307;">{surah_info['englishName']}</h4>
+                    <p style="font-size: 0.8rem; margin: 5px 0;">Surah {surah_info['number']}</p>
+                    <p style="font-size: 0.7rem;">{surah_info['englishNameTranslation']}</p>
+                </div>
+                """, unsafe_allow_html=True)
+                
+                # Selects this surah above; the click reruns only the player
+                st.button(f"Listen", key=f"rec_{surah_num}", use_container_width=True,
+                          on_click=select_listen_surah, args=(surah_num,))
+
+# Surah recitations by the reciter of the user's choice
+def render():
+    st.markdown("<h2 class='section-header'>Listen to Quran</h2>", unsafe_allow_html=True)
+    
+    st.markdown("""
+    <div class="info-box">
+        <p>Listen to beautiful recitations of the Holy Quran by renowned reciters. Select a Surah and reciter to begin listening.</p>
+        <p>The audio is streamed directly from Islamic Network's CDN and is available in high quality.</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Get list of Surahs and reciters
+    loading_animation()
+    surahs = get_quran_surahs()
+    reciters = get_quran_audio_list()
+    
+    quran_player(surahs, reciters)
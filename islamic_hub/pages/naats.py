@@ -0,0 +1,172 @@
+import random
+import threading
+
+import streamlit as st
+
+from islamic_hub.datasets.naats import NAATS
+from islamic_hub.pages.common import add_youtube_live, fragment, loading_animation, paginate
+from islamic_hub.record_search import RecordIndex
+from islamic_hub.textnorm import phonetic_key
+
+# Fields the search looks in, and how much a word in each counts. Words
+# are matched by their phonetic key, so Roman Urdu finds Urdu script and
+# the other way round: "main banda e aasi" finds میں بندہ عاصی ہوں.
+SEARCH_FIELDS = {"title": 3, "lyrics_excerpt": 2, "reciter": 1}
+
+# Naats shown per page of search results
+PAGE_SIZE = 5
+
+ALL = "All"
+
+_naat_index = None
+_naat_index_lock = threading.Lock()
+
+# The naats indexed by id, language, reciter and phonetic key, built once
+# per process
+def get_naat_index():
+    global _naat_index
+    if _naat_index is None:
+        with _naat_index_lock:
+            if _naat_index is None:
+                _naat_index = RecordIndex(NAATS, SEARCH_FIELDS, facets=("language", "reciter"),
+                                          word_key=phonetic_key, prefix_length=2,
+                                          min_key_length=2)
+    return _naat_index
+
+# One naat with its SoundCloud player
+def show_naat(naat):
+    st.markdown(f"""
+    <div class="naat-card" style="animation: fadeIn 0.8s ease-in-out;">
+        <h3 class="naat-title">{naat['title']}</h3>
+        <p class="naat-reciter">Duration: {naat['duration']}</p>
+        <div class="urdu-text" style="background-color: #f5f5f5; margin-bottom: 15px;">{naat['lyrics_excerpt']}</div>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Embed SoundCloud player
+    st.components.v1.iframe(
+        src=f"https://w.soundcloud.com/player/?url={naat['audio_url']}&color=%23046307&auto_play=false&hide_related=true&show_comments=false&show_user=true&show_reposts=false&show_teaser=false",
+        height=120,
+        scrolling=False
+    )
+
+# Search by title, lyrics or reciter in Roman Urdu or Urdu script,
+# narrowed to one language and reciter
+@fragment
+def naat_search(index):
+    st.markdown("<h3>Search Naats</h3>", unsafe_allow_html=True)
+    search_term = st.text_input("Search by title, lyrics or reciter", placeholder="e.g. main banda e aasi, میرے مولا, Owais Raza")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        language = st.selectbox("Language", [ALL] + list(index.facet_counts("language")))
+    with col2:
+        reciters = index.facet_counts("reciter") if language == ALL else {
+            naat["reciter"]: None for naat in index.facet("language", language)
+        }
+        reciter = st.selectbox("Reciter", [ALL] + sorted(reciters))
+    filters = {name: value for name, value in (("language", language), ("reciter", reciter)) if value != ALL}
+    
+    if search_term:
+        # One ranked search gives the count and every page of results
+        total, search_results = index.search(search_term, limit=None, filters=filters)
+        
+        if total:
+            st.success(f"Found {total} naats matching '{search_term}'")
+            offset = paginate(total, PAGE_SIZE, key="naat_search_page")
+            for naat in search_results[offset:offset + PAGE_SIZE]:
+                st.markdown(f"<p class='naat-reciter'>{naat['reciter']} · {naat['language']}</p>", unsafe_allow_html=True)
+                show_naat(naat)
+        else:
+            st.warning(f"No naats found matching '{search_term}'")
+    elif filters:
+        # Browse the chosen language and reciter
+        naats = index.facet("reciter", reciter) if reciter != ALL else index.facet("language", language)
+        if reciter != ALL and language != ALL:
+            naats = [naat for naat in naats if naat["language"] == language]
+        offset = paginate(len(naats), PAGE_SIZE, key="naat_browse_page")
+        for naat in naats[offset:offset + PAGE_SIZE]:
+            show_naat(naat)
+
+# Naats by language and reciter, with a search, live streams and a few
+# featured ones
+def render():
+    st.markdown("<h2 class='section-header'>Naats Collection</h2>", unsafe_allow_html=True)
+    
+    st.markdown("""
+    <div class="info-box">
+        <p>Naat is a devotional poetry in praise of Prophet Muhammad ﷺ. This collection features beautiful naats by renowned reciters from around the world.</p>
+        <p>Listening to and reciting naats is a way of expressing love and devotion to the Prophet Muhammad ﷺ.</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Add Live YouTube Naats
+    add_youtube_live()
+    
+    # Get naats
+    loading_animation()
+    index = get_naat_index()
+    naats = index.records
+    
+    naat_search(index)
+    
+    # Create tabs for languages
+    languages = list(index.facet_counts("language"))
+    language_tabs = st.tabs(languages)
+    
+    for i, language in enumerate(languages):
+        language_naats = index.facet("language", language)
+        with language_tabs[i]:
+            # Group by reciter
+            naats_by_reciter = {}
+            for naat in language_naats:
+                if naat['reciter'] not in naats_by_reciter:
+                    naats_by_reciter[naat['reciter']] = []
+                naats_by_reciter[naat['reciter']].append(naat)
+            
+            # Display naats grouped by reciter
+            for reciter, reciter_naats in naats_by_reciter.items():
+                st.markdown(f"<h3>{reciter}</h3>", unsafe_allow_html=True)
+                
+                for naat in reciter_naats:
+                    show_naat(naat)
+    
+    # Featured naats section
+    st.markdown("<h3>Featured Naats</h3>", unsafe_allow_html=True)
+    
+    # Select 3 random naats to feature
+    featured_naats = random.sample(naats, min(3, len(naats)))
+    
+    # Create columns for featured naats
+    cols = st.columns(len(featured_naats))
+    
+    for i, (col, naat) in enumerate(zip(cols, featured_naats)):
+        with col:
+            st.markdown(f"""
+            <div class="naat-card" style="animation: fadeIn {0.8 + i*0.2}s ease-in-out;">
+                <h3 class="naat-title">{naat['title']}</h3>
+                <p class="naat-reciter">{naat['reciter']}</p>
+                <p>Duration: {naat['duration']}</p>
+            </div>
+            """, unsafe_allow_html=True)
+            
+            # Embed SoundCloud player
+            st.components.v1.iframe(
+                src=f"https://w.soundcloud.com/player/?url={naat['audio_url']}&color=%23046307&auto_play=false&hide_related=true&show_comments=false&show_user=true&show_reposts=false&show_teaser=false",
+                height=120,
+                scrolling=False
+            )
+    
+    # Information about Naats
+    with st.expander("About Naats"):
+        st.markdown("""
+        <div class="info-box">
+            <p>Naat (نعت) is a poetry that specifically praises the Prophet Muhammad ﷺ. The practice of writing and reciting naat has been a long-standing tradition in Islamic culture.</p>
+            
+            <p>Naats are composed and recited in many languages including Arabic, Urdu, Persian, Punjabi, Sindhi, and others. They express love, devotion, and respect for the Prophet Muhammad ﷺ.</p>
+            
+            <p>The tradition of naat goes back to the time of the Prophet Muhammad ﷺ when his companions would compose and recite poetry in his praise. The Prophet ﷺ appreciated such poetry when it was within the bounds of propriety.</p>
+            
+            <p>Famous naat reciters include Junaid Jamshed, Sami Yusuf, Owais Raza Qadri, and many others who have contributed to this beautiful art form.</p>
+        </div>
+        """, unsafe_allow_html=True)
@@ -0,0 +1,148 @@
+import streamlit as st
+
+from islamic_hub.names import NAMES_OF_MUHAMMAD, get_name_index
+from islamic_hub.pages.common import fragment, loading_animation
+
+# The names of the Prophet ﷺ in the chosen view
+@fragment
+def names_of_muhammad_view(index):
+    names = index.records
+    
+    # Display view options with animation effects
+    view_option = st.radio("Select View", ["Grid View", "List View", "Detailed View"], horizontal=True)
+    
+    if view_option == "Grid View":
+        # Display in a grid with animations
+        cols_per_row = 3
+        rows = (len(names) + cols_per_row - 1) // cols_per_row
+        
+        for i in range(rows):
+            row_cols = st.columns(cols_per_row)
+            for j in range(cols_per_row):
+                idx = i * cols_per_row + j
+                if idx < len(names):
+                    name = names[idx]
+                    with row_cols[j]:
+                        st.markdown(f"""
+                        <div class="name-card" style="animation: fadeIn {0.5 + (idx * 0.02)}s ease-in-out;">
+                            <div class="name-number">{name['number']}</div>
+                            <h3 style="margin: 0; color: #046307; text-align: center; padding-left: 30px;">{name['name']}</h3>
+                            <p style="margin: 5px 0 0 0; font-size: 0.9rem; text-align: center;">{name['transliteration']}</p>
+                            <p style="margin: 5px 0 0 0; font-size: 0.8rem; text-align: center;">{name['meaning']}</p>
+                        </div>
+                        """, unsafe_allow_html=True)
+    
+    elif view_option == "List View":
+        # Add a search functionality
+        search_term = st.text_input("Search by name or meaning", placeholder="e.g. Mercy, Light, Guide")
+        
+        if search_term:
+            filtered_names = index.search(search_term)
+            
+            if filtered_names:
+                st.success(f"Found {len(filtered_names)} names matching '{search_term}'")
+                for name in filtered_names:
+                    st.markdown(f"""
+                    <div class="name-card" style="animation: fadeIn 0.8s ease-in-out;">
+                        <div style="display: flex; justify-content: space-between; align-items: center;">
+                            <div class="name-number">{name['number']}</div>
+                            <h3 style="margin: 0; color: #046307;">{name['name']}</h3>
+                        </div>
+                        <p style="margin: 5px 0 0 0;"><strong>Transliteration:</strong> {name['transliteration']}</p>
+                        <p style="margin: 5px 0 0 0;"><strong>Meaning:</strong> {name['meaning']}</p>
+                        <p style="margin: 5px 0 0 0;"><strong>Description:</strong> {name['description']}</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+            else:
+                st.warning(f"No names found matching '{search_term}'")
+        else:
+            # Display all names in a list with animations
+            for i, name in enumerate(names):
+                st.markdown(f"""
+                <div class="name-card" style="animation: fadeIn {0.5 + (i * 0.02)}s ease-in-out;">
+                    <div style="display: flex; justify-content: space-between; align-items: center;">
+                        <div class="name-number">{name['number']}</div>
+                        <h3 style="margin: 0; color: #046307;">{name['name']}</h3>
+                    </div>
+                    <p style="margin: 5px 0 0 0;"><strong>Transliteration:</strong> {name['transliteration']}</p>
+                    <p style="margin: 5px 0 0 0;"><strong>Meaning:</strong> {name['meaning']}</p>
+                    <p style="margin: 5px 0 0 0;"><strong>Description:</strong> {name['description']}</p>
+                </div>
+                """, unsafe_allow_html=True)
+    
+    else:  # Detailed View
+        # Group names into categories
+        categories = {
+            "Names in the Quran": [1, 2, 26, 27, 28, 29],
+            "Prophetic Titles": [5, 6, 7, 8, 12, 13, 35, 36, 37],
+            "Character Attributes": [9, 10, 11, 20, 21, 22],
+            "Intercessor Roles": [16, 18, 19, 41, 42, 43, 48],
+            "Divine Connection": [30, 31, 32, 33, 34, 39]
+        }
+        
+        # Create tabs for categories
+        category_tabs = st.tabs(list(categories.keys()))
+        
+        for i, (category, name_numbers) in enumerate(categories.items()):
+            with category_tabs[i]:
+                for number in name_numbers:
+                    name = index.get(number)
+                    if name:
+                        with st.expander(f"{number}. {name['transliteration']} ({name['meaning']})"):
+                            st.markdown(f"""
+                            <div class="name-detail-card">
+                                <div class="name-arabic">{name['name']}</div>
+                                <div class="name-transliteration">{name['transliteration']}</div>
+                                <div class="name-meaning">{name['meaning']}</div>
+                                
+                                <div class="name-description">
+                                    <strong>Description:</strong> {name['description']}
+                                </div>
+                                
+                                <div class="name-reference">
+                                    <strong>Reference:</strong> {name.get('reference', 'The reference for this name is not available.')}
+                                </div>
+                                
+                                <div class="name-benefit">
+                                    <strong>Significance:</strong> {name.get('significance', 'The significance of this name is not specified.')}
+                                </div>
+                            </div>
+                            """, unsafe_allow_html=True)
+
+# The names of the Prophet Muhammad ﷺ
+def render():
+    st.markdown("<h2 class='section-header'>Beautiful Names of Prophet Muhammad ﷺ</h2>", unsafe_allow_html=True)
+    
+    st.markdown("""
+    <div class="info-box">
+        <p>Prophet Muhammad ﷺ has many beautiful names and titles mentioned in the Quran, Hadith, and Islamic tradition. Each name reflects an aspect of his noble character and mission.</p>
+        <p>Learning and understanding these names helps us to appreciate the comprehensive nature of the Prophet's ﷺ personality and mission.</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Get Names of Muhammad
+    loading_animation()
+    index = get_name_index(NAMES_OF_MUHAMMAD)
+    
+    names_of_muhammad_view(index)
+    
+    # Display information about Names of Muhammad
+    with st.expander("About the Names of Prophet Muhammad ﷺ"):
+        st.markdown("""
+        <div class="info-box">
+            <h4 style="margin-top:0">The Beautiful Names of Prophet Muhammad ﷺ</h4>
+            
+            <p>Prophet Muhammad ﷺ is known by many beautiful names and titles that describe his character, mission, and status. Some of these names are mentioned in the Quran, while others appear in authentic hadith or Islamic tradition.</p>
+            
+            <p>The most common name "Muhammad" means "The Praised One," indicating his praiseworthy character and the high esteem in which he is held. Another common name "Ahmad" means "The Most Praised One," and is mentioned in the Quran in Surah As-Saff (61:6).</p>
+            
+            <p><strong>Significance:</strong></p>
+            
+            <ul>
+                <li>Each name represents a different aspect of the Prophet's ﷺ character and mission</li>
+                <li>Learning these names helps Muslims to understand and appreciate the comprehensive nature of his prophethood</li>
+                <li>Many of these names are used in sending salutations (Durood) upon the Prophet ﷺ</li>
+                <li>Some names emphasize his role as a mercy to the worlds, while others highlight his status as the final prophet</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
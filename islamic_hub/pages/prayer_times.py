@@ -0,0 +1,423 @@
+import time
+from datetime import datetime, timedelta
+
+import streamlit as st
+
+from islamic_hub import clock, gazetteer, geo, hijri, http_client, settings, timeline, timetable
+from islamic_hub import prayer_times as prayer_engine
+from islamic_hub.pages.common import fragment, loading_animation
+
+# The user's location and the prayer times there. The Home page shows
+# today's times with these helpers too.
+
+# Function to get user's location
+def get_user_location():
+    try:
+        response = http_client.get('https://ipinfo.io/json', timeout=5)
+        if response.status_code == 200:
+            data = response.json()
+            # Split coordinates string into latitude and longitude
+            coords = data.get('loc', '0,0').split(',')
+            latitude, longitude = float(coords[0]), float(coords[1])
+            location = {
+                'city': data.get('city', 'Unknown'),
+                'country': data.get('country', 'Unknown'),
+                'latitude': latitude,
+                'longitude': longitude,
+                # Every location carries a time zone, so times can be shown
+                # in the user's local time rather than the server's
+                'timezone': data.get('timezone') or geo.nearest_timezone(latitude, longitude, data.get('country')),
+                'source': 'ip'
+            }
+            return location
+        else:
+            return get_offline_location()
+    except Exception as e:
+        return get_offline_location()
+
+# Best guess without the network: the principal city of the browser's
+# time zone, or Islamabad if the browser did not report one
+def get_offline_location():
+    try:
+        timezone = st.context.timezone
+    except Exception as e:
+        timezone = None
+    location = geo.location_for_timezone(timezone)
+    if location:
+        location['source'] = 'timezone'
+        return location
+    return {
+        'city': 'Islamabad',
+        'country': 'PK',
+        'latitude': 33.6844,
+        'longitude': 73.0479,
+        'timezone': 'Asia/Karachi',
+        'source': 'default'
+    }
+
+# The location is resolved lazily, once per session, by the pages that
+# need it. An offline guess is kept for a shorter time so the lookup is
+# retried once the network is back.
+def get_session_location():
+    cached = st.session_state.get('user_location')
+    now = time.time()
+    if cached and now < cached['expires_at']:
+        return cached['location']
+    location = get_user_location()
+    ttl = settings.LOCATION_TTL if location['source'] == 'ip' else settings.LOCATION_RETRY_TTL
+    st.session_state['user_location'] = {'location': location, 'expires_at': now + ttl}
+    return location
+# Prayer times are computed locally when the coordinates are known, so
+# the page does not depend on api.aladhan.com. A city typed in by name is
+# still looked up through the API.
+def get_prayer_times(city, country, method=3, latitude=None, longitude=None, timezone=None,
+                     school=0, latitude_adjustment=3):
+    if latitude is not None and longitude is not None:
+        return get_local_prayer_times(latitude, longitude, timezone, method, school, latitude_adjustment)
+    try:
+        date = clock.today(clock.zone_for(timezone)).strftime("%d-%m-%Y")
+        url = (f"https://api.aladhan.com/v1/timingsByCity/{date}?city={city}&country={country}&method={method}"
+               f"&school={school}&latitudeAdjustmentMethod={latitude_adjustment}")
+        response = http_client.get(url, timeout=10)
+        if response.status_code == 200:
+            return response.json()["data"]
+        else:
+            # Return reliable fallback data
+            return get_fallback_prayer_times(timezone)
+    except Exception as e:
+        # Return reliable fallback data
+        return get_fallback_prayer_times(timezone)
+
+def get_local_prayer_times(latitude, longitude, timezone=None, method=3, school=0, latitude_adjustment=3):
+    try:
+        today = clock.today(clock.zone_for(timezone, longitude))
+        data = prayer_engine.prayer_times(latitude, longitude, today, timezone, method, school, latitude_adjustment)
+    except Exception as e:
+        return get_fallback_prayer_times(timezone, longitude)
+    data["date"] = {
+        "gregorian": {
+            "date": today.strftime("%d-%m-%Y"),
+            "weekday": {"en": today.strftime("%A")}
+        },
+        "hijri": hijri.date_block(today)
+    }
+    return data
+
+def get_fallback_prayer_times(timezone=None, longitude=0):
+    # Current time-based fallback prayer times
+    current_time = clock.now(clock.zone_for(timezone, longitude))
+    return {
+        "timings": {
+            "Fajr": "05:30",
+            "Sunrise": "06:45",
+            "Dhuhr": "12:15",
+            "Asr": "15:30",
+            "Maghrib": "18:00",
+            "Isha": "19:30",
+            "Imsak": "05:20",
+            "Midnight": "00:15",
+            "Firstthird": "22:00",
+            "Lastthird": "02:30"
+        },
+        "date": {
+            "gregorian": {
+                "date": current_time.strftime("%d-%m-%Y"),
+                "weekday": {"en": current_time.strftime("%A")}
+            },
+            "hijri": hijri.date_block(current_time.date())
+        }
+    }
+
+# The current time at a location, today's timings there as aware
+# datetimes and the next prayer, which after Isha is tomorrow's Fajr.
+# Yesterday's times are looked at too: at high latitudes its Isha can
+# fall after midnight.
+def get_prayer_schedule(location, method=3, school=0, latitude_adjustment=3):
+    try:
+        timezone = location.get('timezone')
+        now = clock.now(clock.zone_for(timezone, location['longitude']))
+        days = []
+        for offset in (-1, 0, 1):
+            days.append(prayer_engine.prayer_schedule(
+                location['latitude'], location['longitude'], now.date() + timedelta(days=offset), timezone,
+                method, school, latitude_adjustment, names=timetable.TABLE_TIMINGS
+            ))
+        prayers = [event for events in days for event in events if event[0] in prayer_engine.DAILY_PRAYERS]
+        return {'now': now, 'events': days[1], 'next': clock.next_event(prayers, now)}
+    except Exception as e:
+        return None
+# Location, calculation settings and the times for the chosen view
+@fragment
+def prayer_times_panel():
+    # Option to use current location
+    use_current_location = st.checkbox("Use my current location", value=True)
+    
+    if use_current_location:
+        location = get_session_location()
+        city = location['city']
+        country = location['country']
+        if location['source'] == 'ip':
+            st.info(f"Using detected location: {city}, {country}")
+        elif location['source'] == 'timezone':
+            st.info(f"Using approximate location: {city}, {country}. Your location could not be detected, "
+                    "so this is based on your time zone.")
+        else:
+            st.info(f"Using default location: {city}, {country}. Your location could not be detected; "
+                    "untick the box to enter your city.")
+    else:
+        # Cities are looked up in the bundled gazetteer, which gives their
+        # coordinates and time zone without a network call
+        query = st.text_input(
+            "City",
+            "Islamabad",
+            help="Type the start of a city name. Add a country to narrow it down, e.g. \"Hyderabad, Pakistan\"."
+        )
+        cities = gazetteer.get_gazetteer()
+        matches = cities.search(query) if query and cities is not None else []
+        if cities is None:
+            location = None
+            city = country = None
+            st.warning("The city list is missing from this installation, so cities cannot be looked up. "
+                       "Tick \"Use my current location\" instead.")
+        elif matches:
+            location = st.selectbox("Matching cities", matches, format_func=gazetteer.label)
+            city = location['city']
+            country = location['country']
+        else:
+            location = None
+            city = country = None
+            if query:
+                st.warning(f"No city found matching '{query}'. Check the spelling or try a nearby larger city.")
+    
+    method = st.selectbox(
+        "Calculation Method",
+        options=[
+            (0, "Shia Ithna-Ashari"),
+            (1, "University of Islamic Sciences, Karachi"),
+            (2, "Islamic Society of North America"),
+            (3, "Muslim World League"),
+            (4, "Umm Al-Qura University, Makkah"),
+            (5, "Egyptian General Authority of Survey"),
+            (7, "Institute of Geophysics, University of Tehran"),
+            (8, "Gulf Region"),
+            (9, "Kuwait")
+        ],
+        format_func=lambda x: x[1],
+        index=3
+    )[0]
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        school = st.selectbox(
+            "Asr Calculation",
+            options=[(0, "Standard (Shafi, Maliki, Hanbali)"), (1, "Hanafi")],
+            format_func=lambda x: x[1]
+        )[0]
+    
+    with col2:
+        latitude_adjustment = st.selectbox(
+            "High Latitude Rule",
+            options=list(prayer_engine.HIGH_LATITUDE_RULES.items()),
+            format_func=lambda x: x[1],
+            index=3
+        )[0]
+    
+    view = st.radio("View", ["Today", "Monthly Timetable", "Ramadan Timetable"], horizontal=True)
+    
+    if view != "Today":
+        if location:
+            timezone = location.get('timezone')
+            today = clock.today(clock.zone_for(timezone, location['longitude']))
+            
+            if view == "Monthly Timetable":
+                col1, col2 = st.columns(2)
+                with col1:
+                    year = st.number_input("Year", min_value=1900, max_value=2100, value=today.year)
+                with col2:
+                    month = st.selectbox(
+                        "Month",
+                        options=list(range(1, 13)),
+                        format_func=lambda m: datetime(2000, m, 1).strftime("%B"),
+                        index=today.month - 1
+                    )
+                
+                table = timetable.month_table(
+                    location['latitude'], location['longitude'], timezone,
+                    int(year), month, method, school, latitude_adjustment
+                )
+                st.markdown(f"<h3>{datetime(2000, month, 1).strftime('%B')} {int(year)} - {city}</h3>", unsafe_allow_html=True)
+                st.dataframe(table, hide_index=True, use_container_width=True)
+                
+                # The year's calendar is only built when asked for, and kept
+                # for the session until the city or settings change
+                calendar_key = (city, location['latitude'], location['longitude'], timezone,
+                                int(year), method, school, latitude_adjustment)
+                prepared = st.session_state.get("prayer_calendar")
+                if prepared is None or prepared[0] != calendar_key:
+                    if st.button(f"Prepare {int(year)} Prayer Calendar (.ics)", use_container_width=True):
+                        prepared = (calendar_key, timetable.calendar_bytes(
+                            location['latitude'], location['longitude'], timezone,
+                            int(year), method, school, latitude_adjustment,
+                            name=f"Prayer Times - {city}"
+                        ))
+                        st.session_state["prayer_calendar"] = prepared
+                if prepared is not None and prepared[0] == calendar_key:
+                    st.download_button(
+                        f"Download {int(year)} Prayer Calendar (.ics)",
+                        data=prepared[1],
+                        file_name=f"prayer-times-{city.lower().replace(' ', '-')}-{int(year)}.ics",
+                        mime="text/calendar",
+                        use_container_width=True
+                    )
+            else:
+                hijri_year = hijri.next_ramadan_year(today)
+                first, last = hijri.month_range(hijri_year, hijri.RAMADAN)
+                table = timetable.ramadan_table(
+                    location['latitude'], location['longitude'], timezone,
+                    hijri_year, method, school, latitude_adjustment
+                )
+                st.markdown(f"<h3>Ramadan {hijri_year} - {city}</h3>", unsafe_allow_html=True)
+                eid_first = next(start for name, start, end in hijri.observances(hijri_year) if name == "Eid al-Fitr")
+                st.info(f"Expected from {first.strftime('%d %B %Y')} to {last.strftime('%d %B %Y')}, "
+                        f"with Eid al-Fitr on {eid_first.strftime('%d %B %Y')}. "
+                        "The start and end depend on the moon sighting and may differ by a day.")
+                st.dataframe(table, hide_index=True, use_container_width=True)
+    
+    elif st.button("Get Prayer Times", use_container_width=True, type="primary"):
+        if location:
+            loading_animation()
+            prayer_data = get_prayer_times(
+                city, country, method,
+                latitude=location['latitude'],
+                longitude=location['longitude'],
+                timezone=location.get('timezone'),
+                school=school,
+                latitude_adjustment=latitude_adjustment
+            )
+            
+            if prayer_data:
+                # Display current date information
+                st.markdown(f"""
+                <div class="info-box" style="animation: fadeIn 0.8s ease-in-out;">
+                    <h3 style="margin-top:0">Date Information</h3>
+                    <p><strong>Gregorian:</strong> {prayer_data['date']['gregorian']['date']}</p>
+                    <p><strong>Hijri:</strong> {prayer_data['date']['hijri']['date']}</p>
+                    <p><strong>Day:</strong> {prayer_data['date']['gregorian']['weekday']['en']} / {prayer_data['date']['hijri']['weekday']['en']}</p>
+                </div>
+                """, unsafe_allow_html=True)
+                
+                # Display prayer times
+                st.markdown("<h3>Prayer Times</h3>", unsafe_allow_html=True)
+                
+                # Create a visual timeline of prayer times
+                timings = prayer_data['timings']
+                
+                # Today's timings as aware datetimes in the city's own time
+                # zone, so the current time marker and the next prayer are
+                # right wherever the server runs
+                schedule = get_prayer_schedule(location, method, school, latitude_adjustment)
+                
+                if schedule and schedule['next']:
+                    next_name, next_time = schedule['next']
+                    st.markdown(f"""
+                    <div class="info-box" style="animation: fadeIn 0.8s ease-in-out;">
+                        <p><strong>Local time in {city}:</strong> {schedule['now'].strftime('%H:%M')} ({schedule['now'].tzname()})</p>
+                        <p><strong>Next prayer:</strong> {next_name} at <span class="prayer-time">{next_time.strftime('%H:%M')}</span>
+                        (in {clock.format_duration(next_time - schedule['now'])})</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+                
+                # Hours since local midnight for the timeline. A timing after
+                # midnight is drawn past 24:00 rather than at the start of the day.
+                prayer_times = {}
+                if schedule:
+                    today = schedule['now'].date()
+                    for prayer, when in schedule['events']:
+                        hour = when.hour + when.minute/60 + 24 * (when.date() - today).days
+                        prayer_times[prayer] = (when.strftime('%H:%M'), hour)
+                else:
+                    for prayer in timetable.TABLE_TIMINGS:
+                        try:
+                            time_str = timings[prayer].split()[0]
+                            hours, minutes = time_str.split(':')
+                            prayer_times[prayer] = (time_str, int(hours) + int(minutes)/60)
+                        except Exception as e:
+                            continue
+                
+                # Current time at the city
+                now = schedule['now'] if schedule else clock.now(clock.zone_for(location.get('timezone'), location['longitude']))
+                current_hour = now.hour + now.minute/60
+                
+                # The chart is cached per day's timings; only the current
+                # time marker is drawn on each run
+                st.markdown(
+                    timeline.render([(prayer, label, hour) for prayer, (label, hour) in prayer_times.items()], current_hour),
+                    unsafe_allow_html=True
+                )
+                
+                # Display prayer times in a card layout with animations
+                col1, col2 = st.columns(2)
+                
+                with col1:
+                    st.markdown("""
+                    <div class="card" style="animation: fadeIn 0.8s ease-in-out;">
+                        <h4 style="margin-top:0">Morning Prayers</h4>
+                        <p><strong>Fajr:</strong> <span class="prayer-time">{}</span></p>
+                        <p><strong>Sunrise:</strong> <span class="prayer-time">{}</span></p>
+                        <p><strong>Dhuhr:</strong> <span class="prayer-time">{}</span></p>
+                    </div>
+                    """.format(timings['Fajr'], timings['Sunrise'], timings['Dhuhr']), unsafe_allow_html=True)
+                
+                with col2:
+                    st.markdown("""
+                    <div class="card" style="animation: fadeIn 1s ease-in-out;">
+                        <h4 style="margin-top:0">Evening Prayers</h4>
+                        <p><strong>Asr:</strong> <span class="prayer-time">{}</span></p>
+                        <p><strong>Maghrib:</strong> <span class="prayer-time">{}</span></p>
+                        <p><strong>Isha:</strong> <span class="prayer-time">{}</span></p>
+                    </div>
+                    """.format(timings['Asr'], timings['Maghrib'], timings['Isha']), unsafe_allow_html=True)
+                
+                # Additional timings
+                with st.expander("Additional Timings"):
+                    st.markdown("""
+                    <p><strong>Imsak:</strong> {}</p>
+                    <p><strong>Midnight:</strong> {}</p>
+                    <p><strong>Firstthird:</strong> {}</p>
+                    <p><strong>Lastthird:</strong> {}</p>
+                    """.format(timings['Imsak'], timings['Midnight'], timings['Firstthird'], timings['Lastthird']), unsafe_allow_html=True)
+                
+                # Additional information
+                with st.expander("Prayer Calculation Method Information"):
+                    st.markdown("""
+                    <p>The prayer times are calculated based on the selected method:</p>
+                    <ul>
+                        <li><strong>Method 0:</strong> Shia Ithna-Ashari</li>
+                        <li><strong>Method 1:</strong> University of Islamic Sciences, Karachi</li>
+                        <li><strong>Method 2:</strong> Islamic Society of North America</li>
+                        <li><strong>Method 3:</strong> Muslim World League</li>
+                        <li><strong>Method 4:</strong> Umm Al-Qura University, Makkah</li>
+                        <li><strong>Method 5:</strong> Egyptian General Authority of Survey</li>
+                        <li><strong>Method 7:</strong> Institute of Geophysics, University of Tehran</li>
+                        <li><strong>Method 8:</strong> Gulf Region</li>
+                        <li><strong>Method 9:</strong> Kuwait</li>
+                    </ul>
+                    """, unsafe_allow_html=True)
+            else:
+                st.error("Error calculating prayer times. Please try again.")
+        else:
+            st.error("Please choose a city.")
+
+# Today's prayer times and monthly and Ramadan timetables for a location
+def render():
+    st.markdown("<h2 class='section-header'>Prayer Times</h2>", unsafe_allow_html=True)
+    
+    st.markdown("""
+    <div class="info-box">
+        <p>Get accurate prayer times for your location. The prayer times are calculated based on your location and the selected calculation method.</p>
+        <p>Prayer times may vary based on geographical location and calculation methodology. Always verify with your local mosque if in doubt.</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    prayer_times_panel()
@@ -0,0 +1,80 @@
+import time
+
+import streamlit as st
+
+from islamic_hub.corpus import get_corpus
+from islamic_hub.pages.common import fragment
+from islamic_hub.quran_search import get_index
+
+RESULTS_PER_PAGE = 20
+
+# Search box, edition filter and the ranked ayahs
+@fragment
+def quran_search(index, editions):
+    search_term = st.text_input("Search the Quran", placeholder='e.g. mercy, "straight path", الرحمن, merc*')
+
+    edition_names = {identifier: info.get("englishName", identifier) for identifier, info in editions.items()}
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        selected_editions = st.multiselect(
+            "Search in",
+            list(edition_names),
+            format_func=lambda identifier: edition_names[identifier],
+            placeholder="All installed editions"
+        )
+
+    if not search_term:
+        return
+
+    # The index keeps the ranked matches of recent queries, so counting
+    # them and reading a page of them rank the query once
+    started = time.perf_counter()
+    total, _ = index.search(search_term, editions=selected_editions or None, limit=0)
+    if not total:
+        st.warning(f"No ayahs found matching '{search_term}'")
+        return
+
+    result_pages = (total + RESULTS_PER_PAGE - 1) // RESULTS_PER_PAGE
+    with col2:
+        result_page = st.number_input("Page", min_value=1, max_value=result_pages, value=1)
+    _, hits = index.search(search_term, editions=selected_editions or None,
+                           limit=RESULTS_PER_PAGE, offset=(result_page - 1) * RESULTS_PER_PAGE)
+    elapsed = time.perf_counter() - started
+    st.success(f"Found {total} matches for '{search_term}' in {elapsed * 1000:.1f} ms")
+
+    corpus = get_corpus()
+    surahs = corpus.surahs()
+    for hit in hits:
+        ayah = corpus.ayah(hit["number"], hit["edition"])
+        if not ayah:
+            continue
+        surah = surahs[hit["surah"] - 1]
+        language = editions[hit["edition"]].get("language")
+        text_class = {"ar": "arabic-text", "ur": "urdu-text"}.get(language, "translation-text")
+        st.markdown(f"""
+        <div class="card">
+            <h4 style="margin-top:0">{surah['englishName']} ({surah['name']}) {hit['surah']}:{hit['numberInSurah']}</h4>
+            <div class="{text_class}">{ayah['text']}</div>
+            <p style="margin-bottom:0"><small>{edition_names[hit['edition']]} · Juz {ayah['juz']} · Page {ayah['page']}</small></p>
+        </div>
+        """, unsafe_allow_html=True)
+
+# Full-text search over the Arabic text and every installed translation
+def render():
+    st.markdown("<h2 class='section-header'>Search the Quran</h2>", unsafe_allow_html=True)
+
+    st.markdown("""
+    <div class="info-box">
+        <p>Search the Arabic text and the installed translations. Harakat and letter forms are ignored in Arabic, so <em>الرحمن</em> finds <em>ٱلرَّحْمَٰنِ</em>.</p>
+        <p>Put words in quotes to find them side by side ("straight path"), and end a word with * to match every word starting with it (merc*).</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # The index is built from the offline corpus by the sync command
+    index = get_index()
+    editions = get_corpus().installed_editions()
+    if index is None or not editions:
+        st.info("Quran search needs the offline corpus. Run `python -m islamic_resources sync` to download it and build the search index.")
+        return
+
+    quran_search(index, {identifier: editions[identifier] for identifier in index.editions if identifier in editions})
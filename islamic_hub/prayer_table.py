@@ -0,0 +1,251 @@
+from datetime import datetime
+
+import numpy as np
+
+from islamic_hub import clock
+from islamic_hub.prayer_times import (
+    ANGLE_BASED, IMSAK_MINUTES, METHODS, MIDDLE_OF_THE_NIGHT, NO_ADJUSTMENT, ONE_SEVENTH, SHAFI, TIMING_NAMES
+)
+
+# Bulk prayer times for many dates at many locations.
+#
+# The same calculation as islamic_hub.prayer_times, written over NumPy
+# arrays: every intermediate is a (dates x locations) grid, so a year of
+# timetables for a thousand mosques is a few dozen array operations
+# instead of hundreds of thousands of Python calls.
+
+
+def _sin(d):
+    return np.sin(np.radians(d))
+
+
+def _cos(d):
+    return np.cos(np.radians(d))
+
+
+def _tan(d):
+    return np.tan(np.radians(d))
+
+
+# Cheaper than np.mod, which also has to handle the sign of the divisor
+def _fix_hour(h):
+    return h - 24 * np.floor(h / 24)
+
+
+def _time_diff(t1, t2):
+    return _fix_hour(t2 - t1)
+
+
+def julian_days(days):
+    days = np.asarray(days, dtype="datetime64[D]")
+    # Julian day of 1970-01-01 at 00:00 UTC
+    return days.astype(np.int64) + 2440587.5
+
+
+# Declination (as its sine) and equation of time for an array of julian
+# days
+def sun_position(jd):
+    d = jd - 2451545.0
+    g = np.radians(357.529 + 0.98560028 * d)
+    q = 280.459 + 0.98564736 * d
+    l = np.radians(q) + np.radians(1.915) * np.sin(g) + np.radians(0.020) * np.sin(2 * g)
+    e = np.radians(23.439 - 0.00000036 * d)
+    sin_l = np.sin(l)
+    ra = np.degrees(np.arctan2(np.cos(e) * sin_l, np.cos(l)))
+    equation = np.mod(q - ra + 180, 360) / 15 - 12
+    return np.sin(e) * sin_l, equation
+
+
+# The sun's position changes smoothly, so it is computed once an hour over
+# the span of the grid and interpolated for each cell. Linear
+# interpolation at that step is off by about a microdegree, far below the
+# minute the times are rounded to, and saves evaluating the trigonometry
+# separately for every date and location.
+SAMPLE_STEP = 1 / 24
+
+
+class _Grid:
+    def __init__(self, jd, latitude):
+        self.jd = jd
+        self.latitude = latitude
+        self.sin_latitude = _sin(latitude)
+        self.cos_latitude = _cos(latitude)
+        # Wide enough for the first guesses, which are at most a day later
+        self.start = np.floor(jd.min()) - 1
+        samples = self.start + np.arange(int((jd.max() + 2 - self.start) / SAMPLE_STEP) + 3) * SAMPLE_STEP
+        self.samples = [(values[:-1], np.diff(values)) for values in sun_position(samples)]
+        self._positions = {}
+
+    # Several prayers share the same first guess for their time
+    def position(self, time):
+        if time not in self._positions:
+            x = (self.jd + time - self.start) / SAMPLE_STEP
+            i = x.astype(np.intp)
+            w = x - i
+            self._positions[time] = tuple(
+                np.take(values, i) + w * np.take(slopes, i) for values, slopes in self.samples
+            )
+        return self._positions[time]
+
+    def mid_day(self, time):
+        _, equation = self.position(time)
+        return 12 - equation
+
+    # NaN wherever the sun never reaches the angle
+    def sun_angle_time(self, angle, time, ccw=False):
+        sin_declination, equation = self.position(time)
+        noon = 12 - equation
+        cos_declination = np.sqrt(1 - sin_declination * sin_declination)
+        cos_t = (-_sin(angle) - sin_declination * self.sin_latitude) / (cos_declination * self.cos_latitude)
+        cos_t[np.abs(cos_t) > 1] = np.nan
+        t = np.degrees(np.arccos(cos_t)) / 15
+        return noon - t if ccw else noon + t
+
+    def asr_time(self, factor, time):
+        sin_declination, _ = self.position(time)
+        declination = np.degrees(np.arcsin(sin_declination))
+        angle = -np.degrees(np.arctan(1 / (factor + _tan(np.abs(self.latitude - declination)))))
+        return self.sun_angle_time(angle, time)
+
+
+def _adjust_high_latitude(time, base, angle, night, rule, ccw=False):
+    if rule == MIDDLE_OF_THE_NIGHT:
+        portion = night / 2
+    elif rule == ONE_SEVENTH:
+        portion = night / 7
+    else:
+        portion = angle / 60 * night
+    diff = _time_diff(time, base) if ccw else _time_diff(base, time)
+    adjusted = base - portion if ccw else base + portion
+    return np.where(np.isnan(time) | (diff > portion), adjusted, time)
+
+
+# Prayer times as fractional local hours. days has shape (D,), the
+# location arrays shape (L,), utc_offsets shape (L,) or (D, L). Returns a
+# dict of (D, L) arrays keyed like TIMING_NAMES; NaN marks a time that
+# does not occur.
+def compute_times_grid(days, latitudes, longitudes, utc_offsets, method=3, school=SHAFI,
+                       latitude_adjustment=ANGLE_BASED, elevation=0):
+    params = METHODS[method]
+    latitudes = np.asarray(latitudes, dtype=float)[None, :]
+    longitudes = np.asarray(longitudes, dtype=float)[None, :]
+    utc_offsets = np.asarray(utc_offsets, dtype=float)
+    elevation = np.asarray(elevation, dtype=float)
+    jd = julian_days(days)[:, None] - longitudes / (15 * 24)
+    sun = _Grid(jd, latitudes)
+    rise_set_angle = 0.833 + 0.0347 * np.sqrt(np.maximum(elevation, 0))
+
+    with np.errstate(invalid="ignore"):
+        fajr = sun.sun_angle_time(params["fajr"], 5 / 24, ccw=True)
+        sunrise = sun.sun_angle_time(rise_set_angle, 6 / 24, ccw=True)
+        dhuhr = sun.mid_day(12 / 24)
+        asr = sun.asr_time(1 + school, 13 / 24)
+        sunset = sun.sun_angle_time(rise_set_angle, 18 / 24)
+        maghrib = sun.sun_angle_time(params["maghrib"], 18 / 24) if "maghrib" in params else sunset
+        isha = sun.sun_angle_time(params["isha"], 18 / 24) if "isha" in params else np.full_like(sunset, np.nan)
+
+        shift = utc_offsets - longitudes / 15
+        fajr, sunrise, dhuhr, asr, sunset, maghrib, isha = (
+            t + shift for t in (fajr, sunrise, dhuhr, asr, sunset, maghrib, isha)
+        )
+
+        if latitude_adjustment != NO_ADJUSTMENT:
+            night = _time_diff(sunset, sunrise)
+            fajr = _adjust_high_latitude(fajr, sunrise, params["fajr"], night, latitude_adjustment, ccw=True)
+            if "isha" in params:
+                isha = _adjust_high_latitude(isha, sunset, params["isha"], night, latitude_adjustment)
+            if "maghrib" in params:
+                maghrib = _adjust_high_latitude(maghrib, sunset, params["maghrib"], night, latitude_adjustment)
+
+        if "isha_minutes" in params:
+            isha = maghrib + params["isha_minutes"] / 60
+        imsak = fajr - IMSAK_MINUTES / 60
+
+        if params.get("midnight") == "Jafari":
+            midnight = sunset + _time_diff(sunset, fajr) / 2
+        else:
+            midnight = sunset + _time_diff(sunset, sunrise) / 2
+        night = _time_diff(sunset, fajr)
+
+        times = {
+            "Fajr": fajr,
+            "Sunrise": sunrise,
+            "Dhuhr": dhuhr,
+            "Asr": asr,
+            "Sunset": sunset,
+            "Maghrib": maghrib,
+            "Isha": isha,
+            "Imsak": imsak,
+            "Midnight": midnight,
+            "Firstthird": sunset + night / 3,
+            "Lastthird": sunset + 2 * night / 3,
+        }
+        return {name: _fix_hour(np.broadcast_to(values, jd.shape)) for name, values in times.items()}
+
+
+# UTC offsets in hours, shape (D, L), for pytz zone names. Offsets are
+# looked up once per distinct zone by binary search over the zone's
+# transition table rather than one utcoffset() call per cell.
+def utc_offsets_grid(days, timezones):
+    days = np.asarray(days, dtype="datetime64[D]")
+    # Noon UTC on each day, as naive datetimes to match pytz's table
+    instants = days.astype("datetime64[s]") + np.timedelta64(12 * 3600, "s")
+    offsets = np.empty((len(days), len(timezones)))
+    columns = {}
+    for index, name in enumerate(timezones):
+        if name not in columns:
+            zone = clock.zone_for(name)
+            transitions = getattr(zone, "_utc_transition_times", None)
+            if not transitions:
+                offset = zone.utcoffset(datetime(2000, 1, 1)).total_seconds() / 3600
+                columns[name] = np.full(len(days), offset)
+            else:
+                starts = np.array(transitions, dtype="datetime64[s]")
+                hours = np.array([info[0].total_seconds() / 3600 for info in zone._transition_info])
+                positions = np.searchsorted(starts, instants, side="right") - 1
+                columns[name] = hours[np.maximum(positions, 0)]
+        offsets[:, index] = columns[name]
+    return offsets
+
+
+def date_range(start, end):
+    return np.arange(np.datetime64(start, "D"), np.datetime64(end, "D") + np.timedelta64(1, "D"))
+
+
+# Columnar timetable: one row per (date, location) with each timing as
+# fractional local hours. Pass timezones (one pytz name per location) for
+# exact offsets including daylight saving; otherwise the offset is
+# estimated from the longitude.
+def prayer_times_table(days, latitudes, longitudes, timezones=None, method=3, school=SHAFI,
+                       latitude_adjustment=ANGLE_BASED, elevation=0, locations=None):
+    import pandas as pd
+    days = np.asarray(days, dtype="datetime64[D]")
+    latitudes = np.asarray(latitudes, dtype=float)
+    longitudes = np.asarray(longitudes, dtype=float)
+    if timezones is not None:
+        utc_offsets = utc_offsets_grid(days, timezones)
+    else:
+        utc_offsets = np.round(longitudes / 15)
+    times = compute_times_grid(days, latitudes, longitudes, utc_offsets, method, school, latitude_adjustment, elevation)
+
+    n_days, n_locations = len(days), len(latitudes)
+    columns = {
+        "date": np.repeat(days, n_locations),
+        "location": np.tile(np.arange(n_locations) if locations is None else np.asarray(locations), n_days),
+        "latitude": np.tile(latitudes, n_days),
+        "longitude": np.tile(longitudes, n_days),
+    }
+    for name in TIMING_NAMES:
+        columns[name] = times[name].ravel()
+    return pd.DataFrame(columns)
+
+
+# "HH:MM" strings for an array of fractional hours, "-----" for NaN
+def format_times(hours):
+    hours = np.asarray(hours, dtype=float)
+    total = np.round(np.mod(np.nan_to_num(hours), 24) * 60).astype(np.int64) % (24 * 60)
+    text = np.char.add(
+        np.char.zfill((total // 60).astype(str), 2),
+        np.char.add(":", np.char.zfill((total % 60).astype(str), 2))
+    )
+    return np.where(np.isnan(hours), "-----", text)
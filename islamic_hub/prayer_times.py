@@ -0,0 +1,261 @@
+import math
+
+from islamic_hub import clock
+
+# Local prayer time calculation.
+#
+# This follows the PrayTimes.org algorithm that api.aladhan.com is built
+# on: the sun's declination and the equation of time are computed for the
+# date, then each prayer is the moment the sun reaches the angle that the
+# calculation method prescribes. Method ids match aladhan's, so a page can
+# switch between the API and the local engine without changing its
+# settings.
+
+# Asr juristic schools (aladhan "school")
+SHAFI = 0
+HANAFI = 1
+
+# High latitude adjustments (aladhan "latitudeAdjustmentMethod")
+NO_ADJUSTMENT = 0
+MIDDLE_OF_THE_NIGHT = 1
+ONE_SEVENTH = 2
+ANGLE_BASED = 3
+
+HIGH_LATITUDE_RULES = {
+    NO_ADJUSTMENT: "None",
+    MIDDLE_OF_THE_NIGHT: "Middle of the Night",
+    ONE_SEVENTH: "One Seventh of the Night",
+    ANGLE_BASED: "Angle Based",
+}
+
+# Fajr and Isha are sun angles below the horizon, unless Isha is given in
+# minutes after Maghrib. Maghrib is sunset unless an angle is given.
+METHODS = {
+    0: {"name": "Shia Ithna-Ashari", "fajr": 16, "isha": 14, "maghrib": 4, "midnight": "Jafari"},
+    1: {"name": "University of Islamic Sciences, Karachi", "fajr": 18, "isha": 18},
+    2: {"name": "Islamic Society of North America", "fajr": 15, "isha": 15},
+    3: {"name": "Muslim World League", "fajr": 18, "isha": 17},
+    4: {"name": "Umm Al-Qura University, Makkah", "fajr": 18.5, "isha_minutes": 90},
+    5: {"name": "Egyptian General Authority of Survey", "fajr": 19.5, "isha": 17.5},
+    7: {"name": "Institute of Geophysics, University of Tehran", "fajr": 17.7, "isha": 14, "maghrib": 4.5, "midnight": "Jafari"},
+    8: {"name": "Gulf Region", "fajr": 19.5, "isha_minutes": 90},
+    9: {"name": "Kuwait", "fajr": 18, "isha": 17.5},
+}
+
+IMSAK_MINUTES = 10
+
+DAILY_PRAYERS = ["Fajr", "Dhuhr", "Asr", "Maghrib", "Isha"]
+TIMING_NAMES = ["Fajr", "Sunrise", "Dhuhr", "Asr", "Sunset", "Maghrib", "Isha", "Imsak", "Midnight", "Firstthird", "Lastthird"]
+
+
+# Degree based trigonometry
+def _sin(d):
+    return math.sin(math.radians(d))
+
+
+def _cos(d):
+    return math.cos(math.radians(d))
+
+
+def _tan(d):
+    return math.tan(math.radians(d))
+
+
+def _arcsin(x):
+    return math.degrees(math.asin(x))
+
+
+def _arccos(x):
+    return math.degrees(math.acos(x))
+
+
+def _arctan2(y, x):
+    return math.degrees(math.atan2(y, x))
+
+
+def _arccot(x):
+    return math.degrees(math.atan(1 / x))
+
+
+def _fix(a, b):
+    if math.isnan(a):
+        return a
+    a = a - b * math.floor(a / b)
+    return a + b if a < 0 else a
+
+
+def _fix_hour(h):
+    return _fix(h, 24)
+
+
+def _time_diff(t1, t2):
+    return _fix_hour(t2 - t1)
+
+
+def julian_day(year, month, day):
+    if month <= 2:
+        year -= 1
+        month += 12
+    a = year // 100
+    b = 2 - a + a // 4
+    return math.floor(365.25 * (year + 4716)) + math.floor(30.6001 * (month + 1)) + day + b - 1524.5
+
+
+# Declination and equation of time for a julian day
+def sun_position(jd):
+    d = jd - 2451545.0
+    g = _fix(357.529 + 0.98560028 * d, 360)
+    q = _fix(280.459 + 0.98564736 * d, 360)
+    l = _fix(q + 1.915 * _sin(g) + 0.020 * _sin(2 * g), 360)
+    e = 23.439 - 0.00000036 * d
+    ra = _fix_hour(_arctan2(_cos(e) * _sin(l), _cos(l)) / 15)
+    equation = q / 15 - ra
+    declination = _arcsin(_sin(e) * _sin(l))
+    return declination, equation
+
+
+class _Day:
+    def __init__(self, jd, latitude):
+        self.jd = jd
+        self.latitude = latitude
+
+    def mid_day(self, time):
+        _, equation = sun_position(self.jd + time)
+        return _fix_hour(12 - equation)
+
+    # Time at which the sun is `angle` degrees below the horizon. Returns
+    # NaN when the sun never gets that low (summer at high latitudes).
+    def sun_angle_time(self, angle, time, ccw=False):
+        declination, _ = sun_position(self.jd + time)
+        noon = self.mid_day(time)
+        cos_t = (-_sin(angle) - _sin(declination) * _sin(self.latitude)) / (_cos(declination) * _cos(self.latitude))
+        if cos_t < -1 or cos_t > 1:
+            return float("nan")
+        t = _arccos(cos_t) / 15
+        return noon - t if ccw else noon + t
+
+    def asr_time(self, factor, time):
+        declination, _ = sun_position(self.jd + time)
+        angle = -_arccot(factor + _tan(abs(self.latitude - declination)))
+        return self.sun_angle_time(angle, time)
+
+
+def _night_portion(rule, angle, night):
+    if rule == MIDDLE_OF_THE_NIGHT:
+        return night / 2
+    if rule == ONE_SEVENTH:
+        return night / 7
+    return angle / 60 * night
+
+
+def _adjust_high_latitude(time, base, angle, night, rule, ccw=False):
+    portion = _night_portion(rule, angle, night)
+    diff = _time_diff(time, base) if ccw else _time_diff(base, time)
+    if math.isnan(time) or diff > portion:
+        return base - portion if ccw else base + portion
+    return time
+
+
+# Prayer times for one day as fractional local hours
+def compute_times(day, latitude, longitude, utc_offset, method=3, school=SHAFI,
+                  latitude_adjustment=ANGLE_BASED, elevation=0):
+    params = METHODS[method]
+    jd = julian_day(day.year, day.month, day.day) - longitude / (15 * 24)
+    sun = _Day(jd, latitude)
+    rise_set_angle = 0.833 + 0.0347 * math.sqrt(max(elevation, 0))
+
+    # First approximation of each time, as a portion of the day
+    fajr = sun.sun_angle_time(params["fajr"], 5 / 24, ccw=True)
+    sunrise = sun.sun_angle_time(rise_set_angle, 6 / 24, ccw=True)
+    dhuhr = sun.mid_day(12 / 24)
+    asr = sun.asr_time(1 + school, 13 / 24)
+    sunset = sun.sun_angle_time(rise_set_angle, 18 / 24)
+    maghrib = sun.sun_angle_time(params["maghrib"], 18 / 24) if "maghrib" in params else sunset
+    isha = sun.sun_angle_time(params["isha"], 18 / 24) if "isha" in params else float("nan")
+
+    shift = utc_offset - longitude / 15
+    fajr, sunrise, dhuhr, asr, sunset, maghrib, isha = (
+        t + shift for t in (fajr, sunrise, dhuhr, asr, sunset, maghrib, isha)
+    )
+
+    if latitude_adjustment != NO_ADJUSTMENT:
+        night = _time_diff(sunset, sunrise)
+        fajr = _adjust_high_latitude(fajr, sunrise, params["fajr"], night, latitude_adjustment, ccw=True)
+        if "isha" in params:
+            isha = _adjust_high_latitude(isha, sunset, params["isha"], night, latitude_adjustment)
+        if "maghrib" in params:
+            maghrib = _adjust_high_latitude(maghrib, sunset, params["maghrib"], night, latitude_adjustment)
+
+    if "isha_minutes" in params:
+        isha = maghrib + params["isha_minutes"] / 60
+    imsak = fajr - IMSAK_MINUTES / 60
+
+    if params.get("midnight") == "Jafari":
+        midnight = sunset + _time_diff(sunset, fajr) / 2
+    else:
+        midnight = sunset + _time_diff(sunset, sunrise) / 2
+    # Night thirds run from sunset to Fajr
+    night = _time_diff(sunset, fajr)
+
+    return {
+        "Fajr": fajr,
+        "Sunrise": sunrise,
+        "Dhuhr": dhuhr,
+        "Asr": asr,
+        "Sunset": sunset,
+        "Maghrib": maghrib,
+        "Isha": isha,
+        "Imsak": imsak,
+        "Midnight": midnight,
+        "Firstthird": sunset + night / 3,
+        "Lastthird": sunset + 2 * night / 3,
+    }
+
+
+# "HH:MM" rounded to the nearest minute, the format aladhan returns
+def format_time(hours):
+    if math.isnan(hours):
+        return "-----"
+    hours = _fix_hour(hours + 0.5 / 60)
+    h = int(hours)
+    m = int((hours - h) * 60)
+    return f"{h:02d}:{m:02d}"
+
+
+# UTC offset in hours for a pytz time zone name on a given day
+def utc_offset_for(timezone, day):
+    return clock.utc_offset(clock.zone_for(timezone), day)
+
+
+# Aladhan-style "timings" and "meta" blocks for one day. timezone is an
+# IANA zone name; without one the offset is estimated from the longitude.
+def prayer_times(latitude, longitude, day=None, timezone=None, method=3, school=SHAFI,
+                 latitude_adjustment=ANGLE_BASED, elevation=0):
+    zone = clock.zone_for(timezone, longitude)
+    day = day or clock.today(zone)
+    utc_offset = clock.utc_offset(zone, day)
+    times = compute_times(day, latitude, longitude, utc_offset, method, school, latitude_adjustment, elevation)
+    params = METHODS[method]
+    return {
+        "timings": {name: format_time(times[name]) for name in TIMING_NAMES},
+        "meta": {
+            "latitude": latitude,
+            "longitude": longitude,
+            "timezone": timezone or f"UTC{utc_offset:+g}",
+            "method": {"id": method, "name": params["name"]},
+            "latitudeAdjustmentMethod": HIGH_LATITUDE_RULES[latitude_adjustment],
+            "midnightMode": params.get("midnight", "Standard"),
+            "school": "Hanafi" if school == HANAFI else "Standard",
+        }
+    }
+
+
+# [(name, aware datetime)] for one day in chronological order, in the
+# location's own time zone. Defaults to the location's current day.
+def prayer_schedule(latitude, longitude, day=None, timezone=None, method=3, school=SHAFI,
+                    latitude_adjustment=ANGLE_BASED, elevation=0, names=DAILY_PRAYERS):
+    zone = clock.zone_for(timezone, longitude)
+    day = day or clock.today(zone)
+    times = compute_times(day, latitude, longitude, clock.utc_offset(zone, day), method, school,
+                          latitude_adjustment, elevation)
+    return clock.schedule(zone, day, times, names)
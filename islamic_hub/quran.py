@@ -0,0 +1,318 @@
+from islamic_hub import fanout, http_client, settings
+from islamic_hub.corpus import get_corpus
+
+# Quran text, surah list, editions and reciters. Installed editions are
+# read from the offline corpus, anything else from the alquran.cloud API,
+# with sample data when neither is available.
+
+# One edition read from the offline corpus, or None when it is not
+# installed or the corpus cannot be read (locked, corrupt), so the caller
+# fetches that edition instead
+def read_corpus(read, number, edition):
+    try:
+        return read(number, edition)
+    except Exception as e:
+        return None
+
+# Define API endpoints and functions
+def get_quran_editions():
+    try:
+        response = http_client.get(f"{settings.QURAN_API_URL}/edition", timeout=5)
+        if response.status_code == 200:
+            return response.json()["data"]
+        else:
+            # If API fails, return sample data
+            return [
+                {"identifier": "quran-uthmani", "language": "ar", "name": "Quran Uthmani", "englishName": "Quran Uthmani", "format": "text"},
+                {"identifier": "en.asad", "language": "en", "name": "Muhammad Asad", "englishName": "Muhammad Asad", "format": "text"},
+                {"identifier": "ur.jalandhry", "language": "ur", "name": "Jalandhry", "englishName": "Jalandhry (Urdu)", "format": "text"},
+                {"identifier": "ur.ahmedali", "language": "ur", "name": "Ahmed Ali", "englishName": "Ahmed Ali (Urdu)", "format": "text"},
+                {"identifier": "ar.alafasy", "language": "ar", "name": "Alafasy", "englishName": "Alafasy", "format": "audio"}
+            ]
+    except Exception as e:
+        # Return sample data if API call fails
+        return [
+            {"identifier": "quran-uthmani", "language": "ar", "name": "Quran Uthmani", "englishName": "Quran Uthmani", "format": "text"},
+            {"identifier": "en.asad", "language": "en", "name": "Muhammad Asad", "englishName": "Muhammad Asad", "format": "text"},
+            {"identifier": "ur.jalandhry", "language": "ur", "name": "Jalandhry", "englishName": "Jalandhry (Urdu)", "format": "text"},
+            {"identifier": "ur.ahmedali", "language": "ur", "name": "Ahmed Ali", "englishName": "Ahmed Ali (Urdu)", "format": "text"},
+            {"identifier": "ar.alafasy", "language": "ar", "name": "Alafasy", "englishName": "Alafasy", "format": "audio"}
+        ]
+
+def get_quran_surahs():
+    try:
+        # Surah metadata ships with the offline corpus
+        surahs = get_corpus().surahs()
+        if surahs:
+            return surahs
+        response = http_client.get(f"{settings.QURAN_API_URL}/surah", timeout=5)
+        if response.status_code == 200:
+            return response.json()["data"]
+        else:
+            # Return sample data for first few surahs
+            return [
+                {"number": 1, "name": "الفاتحة", "englishName": "Al-Fatiha", "englishNameTranslation": "The Opening", "numberOfAyahs": 7, "revelationType": "Meccan"},
+                {"number": 2, "name": "البقرة", "englishName": "Al-Baqara", "englishNameTranslation": "The Cow", "numberOfAyahs": 286, "revelationType": "Medinan"},
+                {"number": 3, "name": "آل عمران", "englishName": "Aal-Imran", "englishNameTranslation": "The Family of Imran", "numberOfAyahs": 200, "revelationType": "Medinan"},
+                {"number": 4, "name": "النساء", "englishName": "An-Nisa", "englishNameTranslation": "The Women", "numberOfAyahs": 176, "revelationType": "Medinan"},
+                {"number": 5, "name": "المائدة", "englishName": "Al-Maida", "englishNameTranslation": "The Table Spread", "numberOfAyahs": 120, "revelationType": "Medinan"}
+            ]
+    except Exception as e:
+        # Return sample data for first few surahs
+        return [
+            {"number": 1, "name": "الفاتحة", "englishName": "Al-Fatiha", "englishNameTranslation": "The Opening", "numberOfAyahs": 7, "revelationType": "Meccan"},
+            {"number": 2, "name": "البقرة", "englishName": "Al-Baqara", "englishNameTranslation": "The Cow", "numberOfAyahs": 286, "revelationType": "Medinan"},
+            {"number": 3, "name": "آل عمران", "englishName": "Aal-Imran", "englishNameTranslation": "The Family of Imran", "numberOfAyahs": 200, "revelationType": "Medinan"},
+            {"number": 4, "name": "النساء", "englishName": "An-Nisa", "englishNameTranslation": "The Women", "numberOfAyahs": 176, "revelationType": "Medinan"},
+            {"number": 5, "name": "المائدة", "englishName": "Al-Maida", "englishNameTranslation": "The Table Spread", "numberOfAyahs": 120, "revelationType": "Medinan"}
+        ]
+
+def get_juz(juz_number, edition="quran-uthmani"):
+    try:
+        # Installed editions are served from the offline corpus
+        juz = read_corpus(get_corpus().juz, juz_number, edition)
+        if juz:
+            return juz
+        url = f"{settings.QURAN_API_URL}/juz/{juz_number}/{edition}"
+        response = http_client.get(url, timeout=10)
+        if response.status_code == 200:
+            return response.json()["data"]
+        else:
+            # Return sample juz data 
+            return {
+                "number": juz_number,
+                "ayahs": [
+                    {
+                        "number": 1,
+                        "text": "بِسْمِ اللَّهِ الرَّحْمَٰنِ الرَّحِيمِ",
+                        "numberInSurah": 1,
+                        "juz": juz_number,
+                        "surah": {
+                            "number": 1,
+                            "name": "الفاتحة",
+                            "englishName": "Al-Fatiha",
+                            "englishNameTranslation": "The Opening"
+                        }
+                    },
+                    {
+                        "number": 2,
+                        "text": "الْحَمْدُ لِلَّهِ رَبِّ الْعَالَمِينَ",
+                        "numberInSurah": 2,
+                        "juz": juz_number,
+                        "surah": {
+                            "number": 1,
+                            "name": "الفاتحة",
+                            "englishName": "Al-Fatiha",
+                            "englishNameTranslation": "The Opening"
+                        }
+                    }
+                ]
+            }
+    except Exception as e:
+        # Return sample juz data
+        return {
+            "number": juz_number,
+            "ayahs": [
+                {
+                    "number": 1,
+                    "text": "بِسْمِ اللَّهِ الرَّحْمَٰنِ الرَّحِيمِ",
+                    "numberInSurah": 1,
+                    "juz": juz_number,
+                    "surah": {
+                        "number": 1,
+                        "name": "الفاتحة",
+                        "englishName": "Al-Fatiha",
+                        "englishNameTranslation": "The Opening"
+                    }
+                },
+                {
+                    "number": 2,
+                    "text": "الْحَمْدُ لِلَّهِ رَبِّ الْعَالَمِينَ",
+                    "numberInSurah": 2,
+                    "juz": juz_number,
+                    "surah": {
+                        "number": 1,
+                        "name": "الفاتحة",
+                        "englishName": "Al-Fatiha",
+                        "englishNameTranslation": "The Opening"
+                    }
+                }
+            ]
+        }
+
+def get_surah(surah_number, edition="en.asad"):
+    try:
+        # Installed editions are served from the offline corpus
+        surah = read_corpus(get_corpus().surah, surah_number, edition)
+        if surah:
+            return surah
+        url = f"{settings.QURAN_API_URL}/surah/{surah_number}/{edition}"
+        response = http_client.get(url, timeout=10)
+        if response.status_code == 200:
+            return response.json()["data"]
+        else:
+            # Return sample data for Al-Fatiha
+            if surah_number == 1:
+                return {
+                    "number": 1,
+                    "name": "الفاتحة",
+                    "englishName": "Al-Fatiha",
+                    "englishNameTranslation": "The Opening",
+                    "revelationType": "Meccan",
+                    "numberOfAyahs": 7,
+                    "ayahs": [
+                        {"number": 1, "text": "In the name of Allah, the Entirely Merciful, the Especially Merciful.", "numberInSurah": 1, "juz": 1, "page": 1},
+                        {"number": 2, "text": "[All] praise is [due] to Allah, Lord of the worlds -", "numberInSurah": 2, "juz": 1, "page": 1},
+                        {"number": 3, "text": "The Entirely Merciful, the Especially Merciful,", "numberInSurah": 3, "juz": 1, "page": 1},
+                        {"number": 4, "text": "Sovereign of the Day of Recompense.", "numberInSurah": 4, "juz": 1, "page": 1},
+                        {"number": 5, "text": "It is You we worship and You we ask for help.", "numberInSurah": 5, "juz": 1, "page": 1},
+                        {"number": 6, "text": "Guide us to the straight path -", "numberInSurah": 6, "juz": 1, "page": 1},
+                        {"number": 7, "text": "The path of those upon whom You have bestowed favor, not of those who have evoked [Your] anger or of those who are astray.", "numberInSurah": 7, "juz": 1, "page": 1}
+                    ]
+                }
+            return None
+    except Exception as e:
+        # Return sample data for Al-Fatiha
+        if surah_number == 1:
+            return {
+                "number": 1,
+                "name": "الفاتحة",
+                "englishName": "Al-Fatiha",
+                "englishNameTranslation": "The Opening",
+                "revelationType": "Meccan",
+                "numberOfAyahs": 7,
+                "ayahs": [
+                    {"number": 1, "text": "In the name of Allah, the Entirely Merciful, the Especially Merciful.", "numberInSurah": 1, "juz": 1, "page": 1},
+                    {"number": 2, "text": "[All] praise is [due] to Allah, Lord of the worlds -", "numberInSurah": 2, "juz": 1, "page": 1},
+                    {"number": 3, "text": "The Entirely Merciful, the Especially Merciful,", "numberInSurah": 3, "juz": 1, "page": 1},
+                    {"number": 4, "text": "Sovereign of the Day of Recompense.", "numberInSurah": 4, "juz": 1, "page": 1},
+                    {"number": 5, "text": "It is You we worship and You we ask for help.", "numberInSurah": 5, "juz": 1, "page": 1},
+                    {"number": 6, "text": "Guide us to the straight path -", "numberInSurah": 6, "juz": 1, "page": 1},
+                    {"number": 7, "text": "The path of those upon whom You have bestowed favor, not of those who have evoked [Your] anger or of those who are astray.", "numberInSurah": 7, "juz": 1, "page": 1}
+                ]
+            }
+        return None
+
+def get_ayah(ayah_number, edition="en.asad"):
+    try:
+        # Installed editions are served from the offline corpus
+        ayah = read_corpus(get_corpus().ayah, ayah_number, edition)
+        if ayah:
+            return ayah
+        url = f"{settings.QURAN_API_URL}/ayah/{ayah_number}/{edition}"
+        response = http_client.get(url, timeout=10)
+        if response.status_code == 200:
+            return response.json()["data"]
+        else:
+            # Fallback to sample data
+            if edition == "quran-uthmani":
+                return {
+                    "number": ayah_number,
+                    "text": "بِسْمِ اللَّهِ الرَّحْمَٰنِ الرَّحِيمِ",
+                    "numberInSurah": 1,
+                    "juz": 1,
+                    "surah": {
+                        "number": 1,
+                        "name": "الفاتحة",
+                        "englishName": "Al-Fatiha",
+                        "englishNameTranslation": "The Opening"
+                    }
+                }
+            elif edition == "en.asad":
+                return {
+                    "number": ayah_number,
+                    "text": "In the name of Allah, the Most Gracious, the Most Merciful",
+                    "numberInSurah": 1,
+                    "juz": 1,
+                    "surah": {
+                        "number": 1,
+                        "name": "الفاتحة",
+                        "englishName": "Al-Fatiha",
+                        "englishNameTranslation": "The Opening"
+                    }
+                }
+            elif edition == "ur.jalandhry":
+                return {
+                    "number": ayah_number,
+                    "text": "اللہ کے نام سے جو بڑا مہربان نہایت رحم والا ہے",
+                    "numberInSurah": 1,
+                    "juz": 1,
+                    "surah": {
+                        "number": 1,
+                        "name": "الفاتحة",
+                        "englishName": "Al-Fatiha",
+                        "englishNameTranslation": "The Opening"
+                    }
+                }
+            return None
+    except Exception as e:
+        # Return sample data as fallback
+        return {
+            "number": ayah_number,
+            "text": "In the name of Allah, the Most Gracious, the Most Merciful",
+            "numberInSurah": 1,
+            "juz": 1,
+            "surah": {
+                "number": 1,
+                "name": "الفاتحة",
+                "englishName": "Al-Fatiha",
+                "englishNameTranslation": "The Opening"
+            }
+        }
+
+# Fetch one resource in several editions with a single request, using the
+# alquran.cloud multi-edition endpoints (/surah/{n}/editions/a,b and
+# /ayah/{n}/editions/a,b). Returns {} when the request fails.
+def get_multi_edition(kind, number, editions):
+    try:
+        url = f"{settings.QURAN_API_URL}/{kind}/{number}/editions/{','.join(editions)}"
+        response = http_client.get(url, timeout=10)
+        if response.status_code == 200:
+            return {item["edition"]["identifier"]: item for item in response.json()["data"]}
+        return {}
+    except Exception as e:
+        return {}
+
+# Batched fetchers: the editions of one juz, surah or ayah are fetched
+# concurrently, so a page waits for the slowest call rather than the sum.
+# Each returns a dict keyed by edition identifier.
+def get_juz_editions(juz_number, editions):
+    editions = list(dict.fromkeys(editions))
+    return dict(zip(editions, fanout.map_concurrently(lambda edition: get_juz(juz_number, edition), editions)))
+
+def get_surah_editions(surah_number, editions):
+    editions = list(dict.fromkeys(editions))
+    corpus = get_corpus()
+    results = {edition: read_corpus(corpus.surah, surah_number, edition) for edition in editions}
+    missing = [edition for edition in editions if not results[edition]]
+    if len(missing) > 1:
+        results.update(get_multi_edition("surah", surah_number, missing))
+        missing = [edition for edition in editions if not results.get(edition)]
+    results.update(zip(missing, fanout.map_concurrently(lambda edition: get_surah(surah_number, edition), missing)))
+    return results
+
+def get_ayah_editions(ayah_number, editions):
+    editions = list(dict.fromkeys(editions))
+    corpus = get_corpus()
+    results = {edition: read_corpus(corpus.ayah, ayah_number, edition) for edition in editions}
+    missing = [edition for edition in editions if not results[edition]]
+    if len(missing) > 1:
+        results.update(get_multi_edition("ayah", ayah_number, missing))
+        missing = [edition for edition in editions if not results.get(edition)]
+    results.update(zip(missing, fanout.map_concurrently(lambda edition: get_ayah(ayah_number, edition), missing)))
+    return results
+
+def get_quran_audio_list():
+    # List of reciters and their editions in the Quran API with Pakistani translations
+    return [
+        {"id": "ar.alafasy", "name": "Mishary Rashid Alafasy", "language": "Arabic"},
+        {"id": "ar.abdulbasitmurattal", "name": "Abdul Basit Murattal", "language": "Arabic"},
+        {"id": "ar.abdurrahmaansudais", "name": "Abdurrahmaan As-Sudais", "language": "Arabic"},
+        {"id": "ar.mahermuaiqly", "name": "Maher Al Muaiqly", "language": "Arabic"},
+        {"id": "ur.khanabubakar", "name": "Moulana Abu Bakr Chisti (Urdu)", "language": "Urdu"},
+        {"id": "ur.muhammajunagarhvi", "name": "Muhammad Junagarhvi (Urdu)", "language": "Urdu"},
+        {"id": "ur.muhammajunagarhvi", "name": "Muhammad Junagarhvi (Urdu)", "language": "Urdu"},
+        {"id": "ur.khanzakariyya", "name": "Khan Zakariyya (Urdu)", "language": "Urdu"},
+        {"id": "ur.maulanamahmudhasan", "name": "Maulana Mahmud Hasan (Urdu)", "language": "Urdu"},
+        {"id": "ur.rashidmehmoodridai", "name": "Rashid Mehmood Ridai (Urdu)", "language": "Urdu"}
+    ]
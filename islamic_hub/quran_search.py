@@ -0,0 +1,415 @@
+import json
+import math
+import mmap
+import os
+import re
+import sqlite3
+import struct
+import sys
+import threading
+from array import array
+from bisect import bisect_left
+from functools import lru_cache
+
+from islamic_hub import settings, textnorm
+from islamic_hub.corpus import TOTAL_AYAHS
+from islamic_hub.textnorm import tokenize, word_variants
+
+# Full-text search over every edition in the offline corpus.
+#
+# The index is an inverted index from each normalised word (see
+# textnorm.py) to the ayahs it appears in and its positions there, with
+# one document per ayah per edition. It is built from the corpus by the
+# sync command and written to a single file, which the app memory-maps:
+# opening it reads only the header, and a search touches just the pages
+# holding the words it looks up. Worker processes share those pages
+# through the OS page cache.
+#
+# Queries match ayahs containing every word, ranked with BM25:
+#
+#   mercy forgiveness     both words, anywhere in the ayah
+#   "straight path"       the words next to each other, in this order
+#   merc*                 any word starting with "merc"
+#   الرحمن الرحيم          Arabic, with or without harakat
+#
+# An index built by another version of this module or of textnorm.py, or
+# on a machine with another byte order, is refused and rebuilt by the
+# next sync.
+#
+# File layout: MAGIC, the length of the JSON header, the header (editions,
+# average ayah lengths, section offsets), then uint32 arrays in the
+# machine's byte order and the UTF-8 words, sorted bytewise:
+#
+#   term_offsets    where each word starts in the words blob (+1 for the end)
+#   term_postings   where each word's postings start
+#   term_df         the number of documents each word appears in
+#   postings        per word: documents, cumulative position counts, positions
+#   lengths         words per document
+#   surahs          surah number of each ayah
+#   numbers         number in surah of each ayah
+#
+# A document is edition index * 6236 + ayah number - 1.
+
+MAGIC = b"QSEARCH\x00"
+VERSION = 1
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+# A prefix query matches at most this many words
+MAX_EXPANSIONS = 64
+
+# Each index memoises the scores of this many words, and the ranked
+# matches of this many queries
+SCORE_CACHE_SIZE = 1024
+RANKED_CACHE_SIZE = 16
+
+_QUERY = re.compile(r'"([^"]*)"|(\S+)')
+
+
+# Build the index for every installed edition. Returns the number of
+# distinct words indexed.
+def build_index(corpus_path=None, index_path=None):
+    corpus_path = corpus_path or settings.CORPUS_PATH
+    index_path = index_path or settings.SEARCH_INDEX_PATH
+    if not os.path.exists(corpus_path):
+        raise ValueError(f"No offline corpus at {corpus_path}, run the sync first")
+
+    conn = sqlite3.connect(corpus_path)
+    try:
+        editions = [row[0] for row in conn.execute("SELECT identifier FROM editions ORDER BY identifier")]
+        ayahs = conn.execute("SELECT surah, number_in_surah FROM ayahs ORDER BY number").fetchall()
+        if not editions or len(ayahs) != TOTAL_AYAHS:
+            raise ValueError("The corpus has no complete editions to index")
+
+        lengths = array("I", bytes(4 * TOTAL_AYAHS * len(editions)))
+        # word -> {document: [positions]}, documents in increasing order
+        index = {}
+        average_lengths = []
+        for edition_index, edition in enumerate(editions):
+            total = 0
+            rows = conn.execute("SELECT number, text FROM texts WHERE edition = ? ORDER BY number", (edition,))
+            for number, text in rows:
+                doc = edition_index * TOTAL_AYAHS + number - 1
+                words = word_variants(text)
+                lengths[doc] = len(words)
+                total += len(words)
+                for position, spellings in enumerate(words):
+                    for word in spellings:
+                        documents = index.get(word)
+                        if documents is None:
+                            documents = index[word] = {}
+                        positions = documents.get(doc)
+                        if positions is None:
+                            documents[doc] = [position]
+                        else:
+                            positions.append(position)
+            average_lengths.append(total / TOTAL_AYAHS)
+    finally:
+        conn.close()
+
+    words = sorted(word.encode("utf-8") for word in index)
+    term_offsets = array("I", [0])
+    term_postings = array("I")
+    term_df = array("I")
+    postings = array("I")
+    blob = bytearray()
+    for encoded in words:
+        documents = index[encoded.decode("utf-8")]
+        blob += encoded
+        term_offsets.append(len(blob))
+        term_postings.append(len(postings))
+        term_df.append(len(documents))
+        postings.extend(documents)
+        end = 0
+        for positions in documents.values():
+            end += len(positions)
+            postings.append(end)
+        for positions in documents.values():
+            postings.extend(positions)
+
+    sections = [
+        ("term_offsets", term_offsets.tobytes()),
+        ("term_postings", term_postings.tobytes()),
+        ("term_df", term_df.tobytes()),
+        ("postings", postings.tobytes()),
+        ("lengths", lengths.tobytes()),
+        ("surahs", array("I", [surah for surah, _ in ayahs]).tobytes()),
+        ("numbers", array("I", [number for _, number in ayahs]).tobytes()),
+        ("words", bytes(blob)),
+    ]
+    offsets = {}
+    position = 0
+    for name, data in sections:
+        offsets[name] = [position, len(data)]
+        position += len(data)
+    header = json.dumps({
+        "version": VERSION,
+        "normalization": textnorm.VERSION,
+        "byteorder": sys.byteorder,
+        "editions": editions,
+        "average_lengths": average_lengths,
+        "sections": offsets,
+    }).encode("utf-8")
+    # Keep the uint32 arrays aligned
+    header += b" " * (-(len(MAGIC) + 4 + len(header)) % 4)
+
+    # Write next to the old index and swap it in, so running apps keep
+    # reading the file they have mapped until they notice the new one
+    os.makedirs(os.path.dirname(os.path.abspath(index_path)), exist_ok=True)
+    temporary_path = index_path + ".tmp"
+    with open(temporary_path, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<I", len(header)))
+        f.write(header)
+        for _, data in sections:
+            f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temporary_path, index_path)
+    return len(words)
+
+
+# The sorted words, read from the mapped file as bisect asks for them
+class _Words:
+    def __init__(self, data, offsets, start):
+        self.data = data
+        self.offsets = offsets
+        self.start = start
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        return self.data[self.start + self.offsets[i]:self.start + self.offsets[i + 1]]
+
+
+# An index is closed by close() or a with block. The app's shared index
+# is left open for searches still using it when a sync replaces it, and
+# unmapped by the garbage collector once they are done.
+class QuranIndex:
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            header, start = self._header()
+        except Exception:
+            self._data.close()
+            raise
+
+        view = memoryview(self._data)
+        sections = {
+            name: view[start + offset:start + offset + size].cast("I")
+            for name, (offset, size) in header["sections"].items() if name != "words"
+        }
+        # The mapping cannot be closed while these views of it exist
+        self._views = list(sections.values()) + [view]
+        self.editions = header["editions"]
+        self._average_lengths = header["average_lengths"]
+        self._documents = len(self.editions) * TOTAL_AYAHS
+        self._term_postings = sections["term_postings"]
+        self._term_df = sections["term_df"]
+        self._postings = sections["postings"]
+        self._lengths = sections["lengths"]
+        self._surahs = sections["surahs"]
+        self._numbers = sections["numbers"]
+        self._words = _Words(self._data, sections["term_offsets"], start + header["sections"]["words"][0])
+
+        # Per index rather than on the class, so a replaced index and its
+        # mapping are not kept alive by the caches
+        self._scores = lru_cache(maxsize=SCORE_CACHE_SIZE)(self._term_scores)
+        self._ranked = lru_cache(maxsize=RANKED_CACHE_SIZE)(self._rank)
+
+    # The JSON header and where the sections start, after checking the
+    # file is an index this version can read
+    def _header(self):
+        if self._data[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{self.path} is not a Quran search index")
+        header_length = struct.unpack_from("<I", self._data, len(MAGIC))[0]
+        start = len(MAGIC) + 4
+        header = json.loads(self._data[start:start + header_length])
+        if (header["version"], header.get("normalization"), header["byteorder"]) != (VERSION, textnorm.VERSION, sys.byteorder):
+            raise ValueError(f"{self.path} was built by another version or machine, run the sync again")
+        return header, start + header_length
+
+    def close(self):
+        self._scores.cache_clear()
+        self._ranked.cache_clear()
+        for view in self._views:
+            view.release()
+        self._data.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return len(self._words)
+
+    def _term(self, word):
+        encoded = word.encode("utf-8")
+        i = bisect_left(self._words, encoded)
+        if i < len(self._words) and self._words[i] == encoded:
+            return i
+        return None
+
+    def _prefix_terms(self, prefix):
+        encoded = prefix.encode("utf-8")
+        i = bisect_left(self._words, encoded)
+        terms = []
+        while i < len(self._words) and len(terms) < MAX_EXPANSIONS and self._words[i].startswith(encoded):
+            terms.append(i)
+            i += 1
+        return terms
+
+    # The term's documents and cumulative position counts, and where its
+    # positions start
+    def _posting_list(self, term):
+        start = self._term_postings[term]
+        df = self._term_df[term]
+        return (self._postings[start:start + df], self._postings[start + df:start + 2 * df],
+                start + 2 * df)
+
+    # BM25 score of every document containing the term. Common words are
+    # looked up on most searches, so scores are memoised, as _scores().
+    def _term_scores(self, term):
+        documents, ends, _ = self._posting_list(term)
+        df = len(documents)
+        idf = math.log(1 + (self._documents - df + 0.5) / (df + 0.5))
+        lengths = self._lengths
+        average_lengths = self._average_lengths
+        scores = {}
+        previous = 0
+        for doc, end in zip(documents, ends):
+            tf = end - previous
+            previous = end
+            norm = K1 * (1 - B + B * lengths[doc] / average_lengths[doc // TOTAL_AYAHS])
+            scores[doc] = idf * tf * (K1 + 1) / (tf + norm)
+        return scores
+
+    def _positions(self, posting_list, doc):
+        documents, ends, start = posting_list
+        i = bisect_left(documents, doc)
+        first = ends[i - 1] if i else 0
+        return self._postings[start + first:start + ends[i]]
+
+    # Documents where the terms appear next to each other, in order
+    def _phrase(self, terms):
+        scores = [self._scores(term) for term in terms]
+        posting_lists = [self._posting_list(term) for term in terms]
+        rarest = min(scores, key=len)
+        matches = {}
+        for doc in rarest:
+            if not all(doc in term_scores for term_scores in scores):
+                continue
+            following = [set(self._positions(posting_list, doc)) for posting_list in posting_lists[1:]]
+            for position in self._positions(posting_lists[0], doc):
+                if all(position + offset in positions for offset, positions in enumerate(following, 1)):
+                    matches[doc] = sum(term_scores[doc] for term_scores in scores)
+                    break
+        return matches
+
+    # Scores of the documents matching one part of a query: a word, a
+    # prefix or a phrase
+    def _clause(self, words, prefix=False):
+        if prefix:
+            matches = {}
+            for term in self._prefix_terms(words[-1]):
+                for doc, score in self._scores(term).items():
+                    matches[doc] = matches.get(doc, 0) + score
+            if len(words) == 1:
+                return matches
+            return self._intersect([self._clause(words[:-1]), matches])
+        terms = [self._term(word) for word in words]
+        if None in terms:
+            return {}
+        if len(terms) == 1:
+            return self._scores(terms[0])
+        return self._phrase(terms)
+
+    @staticmethod
+    def _intersect(clauses):
+        clauses = sorted(clauses, key=len)
+        matches = dict(clauses[0])
+        for clause in clauses[1:]:
+            matches = {doc: score + clause[doc] for doc, score in matches.items() if doc in clause}
+        return matches
+
+    # The documents matching a query and their scores, best first, as two
+    # arrays. Counting the matches and each page of them reuse one
+    # ranking, as _ranked().
+    def _rank(self, query, editions):
+        clauses = []
+        for phrase, word in _QUERY.findall(query):
+            words = tokenize(phrase or word)
+            if words:
+                clauses.append(self._clause(words, prefix=not phrase and word.endswith("*")))
+        if not clauses:
+            return array("I"), array("d")
+        matches = self._intersect(clauses)
+
+        if editions is not None:
+            wanted = {i for i, edition in enumerate(self.editions) if edition in editions}
+            matches = {doc: score for doc, score in matches.items() if doc // TOTAL_AYAHS in wanted}
+
+        ranked = sorted(matches.items(), key=lambda item: (-item[1], item[0]))
+        return array("I", [doc for doc, _ in ranked]), array("d", [score for _, score in ranked])
+
+    # Search the index. Returns the number of matches and the hits
+    # from offset to offset + limit, best first. Each hit has the global
+    # ayah number, surah and number in surah, the edition it matched in and
+    # its score. editions limits the search to those edition identifiers.
+    def search(self, query, editions=None, limit=20, offset=0):
+        documents, scores = self._ranked(query, None if editions is None else tuple(sorted(editions)))
+        hits = []
+        for doc, score in zip(documents[offset:offset + limit], scores[offset:offset + limit]):
+            edition_index, ayah = divmod(doc, TOTAL_AYAHS)
+            hits.append({
+                "number": ayah + 1,
+                "surah": self._surahs[ayah],
+                "numberInSurah": self._numbers[ayah],
+                "edition": self.editions[edition_index],
+                "score": score,
+            })
+        return len(documents), hits
+
+
+_index = None
+_index_mtime = None
+_index_lock = threading.Lock()
+
+
+# The app's index, mapped on first use and mapped again after a sync
+# replaces the file. None when no index has been built.
+def get_index():
+    global _index, _index_mtime
+    try:
+        mtime = os.stat(settings.SEARCH_INDEX_PATH).st_mtime_ns
+    except OSError:
+        return None
+    if mtime != _index_mtime:
+        with _index_lock:
+            if mtime != _index_mtime:
+                try:
+                    _index = QuranIndex(settings.SEARCH_INDEX_PATH)
+                except (OSError, ValueError):
+                    # Unreadable or built by an older version: search stays
+                    # off until the next sync rebuilds it
+                    _index = None
+                _index_mtime = mtime
+    return _index
+
+
+
+# Whether the index at index_path can be read and covers exactly these
+# editions
+def index_is_current(index_path, editions):
+    try:
+        with QuranIndex(index_path) as index:
+            return sorted(index.editions) == sorted(editions)
+    except (OSError, ValueError):
+        return False
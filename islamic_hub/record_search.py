@@ -0,0 +1,185 @@
+import heapq
+import math
+from bisect import bisect_left
+
+from islamic_hub.textnorm import SEARCH_FIELD, add_search_text, tokenize
+
+# In-memory search over a small catalogue of records (duas, naats).
+#
+# Built once from the records, the index keeps:
+#
+#   - each record by its key (e.g. "id") and by every other unique field
+#     given (e.g. "title"), for constant-time lookups
+#   - the records for each value of each facet (e.g. "category"), in the
+#     catalogue's order
+#   - an inverted index from every normalised word (see textnorm.py) in
+#     the searched fields to the records containing it, with a BM25 score
+#     weighted by field, so a word in the title counts for more than the
+#     same word in a translation
+#
+# A query matches records containing every query word, each word also
+# matching longer words it starts (so "morn" finds "morning" as the user
+# types). Exact words score higher than these prefix matches. Results
+# are ranked best first and returned a page at a time.
+#
+# Given a word_key function (e.g. textnorm.phonetic_key), a query word
+# also matches every word with the same key, and the records containing
+# it as typed rank first. A query word whose key is empty ("e" for
+# phonetic_key) is only searched for as typed, and only when the query
+# has no other words. Keys shorter than min_key_length are shared by too
+# many words to go by ("l" for both "ali" and "allah"), so a word with one
+# is also only searched for as typed, though with the rest of the query.
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+# A prefix match scores this fraction of an exact one
+PREFIX_WEIGHT = 0.5
+
+# A query word matches at most this many longer words
+MAX_EXPANSIONS = 50
+
+# Marks a word indexed as written, next to its key
+EXACT = "="
+
+
+class RecordIndex:
+    # fields maps each searched field (a key or a dotted path such as
+    # "en.meaning") to its weight. prefix_length is the shortest query
+    # word that also matches the longer words it starts, min_key_length
+    # the shortest word_key that matches other spellings.
+    def __init__(self, records, fields, key="id", unique=(), facets=(), word_key=None, prefix_length=1,
+                 min_key_length=1):
+        self.records = list(records)
+        self.key = key
+        self.word_key = word_key
+        self.prefix_length = prefix_length
+        self.min_key_length = min_key_length
+        add_search_text(self.records, list(fields))
+
+        self._unique = {name: {} for name in (key,) + tuple(unique)}
+        self._facets = {name: {} for name in facets}
+        self._facet_positions = {name: {} for name in facets}
+        lengths = []
+        # word -> {record position: weighted count}
+        counts = {}
+        for position, record in enumerate(self.records):
+            for name, values in self._unique.items():
+                values[record[name]] = record
+            for name, values in self._facets.items():
+                values.setdefault(record.get(name), []).append(record)
+                self._facet_positions[name].setdefault(record.get(name), set()).add(position)
+
+            length = 0
+            for field, weight in fields.items():
+                words = record[SEARCH_FIELD][field].split()
+                # Counted in words, not keys, so a word's key does not
+                # make its record any longer
+                length += weight * len(words)
+                for word in self._keys(words):
+                    record_counts = counts.setdefault(word, {})
+                    record_counts[position] = record_counts.get(position, 0) + weight
+            lengths.append(length)
+
+        average_length = sum(lengths) / len(lengths) if lengths else 1
+        documents = len(self.records)
+        self._scores = {}
+        for word, record_counts in counts.items():
+            idf = math.log(1 + (documents - len(record_counts) + 0.5) / (len(record_counts) + 0.5))
+            self._scores[word] = {
+                position: idf * count * (K1 + 1) / (count + K1 * (1 - B + B * lengths[position] / average_length))
+                for position, count in record_counts.items()
+            }
+        self._words = sorted(self._scores)
+
+    def __len__(self):
+        return len(self.records)
+
+    # The record whose key, or other unique field, has this value
+    def get(self, value, field=None):
+        return self._unique[field or self.key].get(value)
+
+    # The records with this value of the facet, in catalogue order
+    def facet(self, name, value):
+        return self._facets[name].get(value, [])
+
+    # Every value of the facet with its number of records
+    def facet_counts(self, name):
+        return {value: len(records) for value, records in self._facets[name].items()}
+
+    # A word's key, or "" when it is too short to go by
+    def _key(self, word):
+        key = self.word_key(word)
+        return key if len(key) >= self.min_key_length else ""
+
+    # The words as indexed: with a word_key, each word as written and
+    # its key
+    def _keys(self, words):
+        if self.word_key is None:
+            return words
+        keys = []
+        for word in words:
+            keys.append(EXACT + word)
+            key = self._key(word)
+            if key:
+                keys.append(key)
+        return keys
+
+    # Scores of the records matching one query word, exactly or as a prefix
+    def _word_scores(self, word):
+        scores = dict(self._scores.get(word, {}))
+        if len(word) < self.prefix_length:
+            return scores
+        i = bisect_left(self._words, word)
+        for candidate in self._words[i:i + MAX_EXPANSIONS + 1]:
+            if not candidate.startswith(word):
+                break
+            if candidate == word:
+                continue
+            for position, score in self._scores[candidate].items():
+                scores[position] = max(scores.get(position, 0), score * PREFIX_WEIGHT)
+        return scores
+
+    # Scores of the records matching one query word, by its key too if
+    # the index has a word_key
+    def _query_scores(self, word):
+        if self.word_key is None:
+            return self._word_scores(word)
+        scores = self._word_scores(EXACT + word)
+        key = self._key(word)
+        if key:
+            for position, score in self._word_scores(key).items():
+                scores[position] = scores.get(position, 0) + score
+        return scores
+
+    # Records matching every word of the query, best first. Returns the
+    # number of matches and the records from offset to offset + limit,
+    # or every record from offset on when limit is None.
+    # filters maps facet names to the value the records must have.
+    def search(self, query, limit=10, offset=0, filters=None):
+        matches = None
+        words = list(dict.fromkeys(tokenize(query)))
+        if self.word_key is not None and any(self.word_key(word) for word in words):
+            words = [word for word in words if self.word_key(word)]
+        for word in words:
+            scores = self._query_scores(word)
+            if matches is None:
+                matches = scores
+            else:
+                matches = {position: score + scores[position] for position, score in matches.items() if position in scores}
+            if not matches:
+                return 0, []
+        if matches is None:
+            return 0, []
+
+        for name, value in (filters or {}).items():
+            allowed = self._facet_positions[name].get(value, set())
+            matches = {position: score for position, score in matches.items() if position in allowed}
+
+        rank = lambda item: (item[1], -item[0])
+        if limit is None:
+            best = sorted(matches.items(), key=rank, reverse=True)
+        else:
+            best = heapq.nlargest(offset + limit, matches.items(), key=rank)
+        return len(matches), [self.records[position] for position, _ in best[offset:]]
@@ -0,0 +1,190 @@
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from islamic_hub.singleflight import SingleFlight
+
+# In-process cache for upstream GET responses, keyed by URL.
+#
+# Every endpoint gets its own time to live from TTL_RULES. Once an entry
+# expires it can still be served for a "stale" window while a background
+# thread refreshes it (stale-while-revalidate), so readers never wait on
+# the network for data we already have. The cache is bounded by the total
+# size of the stored bodies and evicts least recently used entries first.
+# Concurrent misses for the same URL share a single upstream request.
+
+HOUR = 60 * 60
+DAY = 24 * HOUR
+
+
+# (URL pattern, ttl, stale window), both in seconds. The first matching
+# pattern wins.
+TTL_RULES = [
+    (r"/v1/edition", DAY, DAY),
+    (r"/v1/surah$", DAY, DAY),
+    (r"/v1/(quran|juz|surah|ayah|page|hizbQuarter)/", 7 * DAY, 7 * DAY),
+    # The date is part of the URL (/timingsByCity/DD-MM-YYYY), so an entry
+    # is only ever served for its own day, whatever the city's time zone
+    (r"/v1/timingsByCity/\d{2}-\d{2}-\d{4}", DAY, 0),
+    (r"ipinfo\.io", HOUR, HOUR),
+    (r"99-names-of-allah", DAY, DAY),
+]
+DEFAULT_TTL = (5 * 60, 5 * 60)
+
+
+def compile_rules(rules=None):
+    return [(re.compile(pattern), ttl, stale) for pattern, ttl, stale in (rules or TTL_RULES)]
+
+
+# Returns (ttl, stale window) in seconds for a URL
+def ttl_for(url, rules, default_ttl=DEFAULT_TTL):
+    for pattern, ttl, stale in rules:
+        if pattern.search(url):
+            return ttl, stale
+    return default_ttl
+
+
+# Response stand-in handed back to callers. It keeps the fields the
+# fetchers use and decodes the JSON body only once. fetched_at is when
+# the body last came from (or was confirmed by) the upstream, if it was
+# read from a cache.
+class CachedResponse:
+    def __init__(self, url, status_code, content, headers, fetched_at=None):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers
+        self.fetched_at = fetched_at
+        self._json = None
+        self._json_lock = threading.Lock()
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+    @property
+    def text(self):
+        return self.content.decode("utf-8")
+
+    def json(self):
+        if self._json is None:
+            with self._json_lock:
+                if self._json is None:
+                    self._json = json.loads(self.content)
+        return self._json
+
+
+class _Entry:
+    __slots__ = ("response", "size", "expires_at", "stale_until")
+
+    def __init__(self, response, expires_at, stale_until):
+        self.response = response
+        self.size = len(response.content) + len(response.url)
+        self.expires_at = expires_at
+        self.stale_until = stale_until
+
+
+class ResponseCache:
+    def __init__(self, fetch, max_bytes=64 * 1024 * 1024, rules=None, default_ttl=DEFAULT_TTL, refresh_workers=2):
+        self.fetch = fetch
+        self.max_bytes = max_bytes
+        self.rules = compile_rules(rules)
+        self.default_ttl = default_ttl
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._refreshing = set()
+        self._flight = SingleFlight()
+        self._refresh_pool = ThreadPoolExecutor(max_workers=refresh_workers, thread_name_prefix="cache-refresh")
+        self._stats = {"hits": 0, "stale_hits": 0, "misses": 0, "refreshes": 0, "refresh_errors": 0, "evictions": 0}
+
+    # The entry's lifetime runs from when the body was fetched, so a copy
+    # that was already some hours old on disk expires on time
+    def _store(self, url, response):
+        ttl, stale = ttl_for(url, self.rules, self.default_ttl)
+        if not isinstance(response, CachedResponse):
+            response = CachedResponse(url, response.status_code, response.content, dict(response.headers))
+        fetched_at = response.fetched_at or time.time()
+        entry = _Entry(
+            response,
+            fetched_at + ttl,
+            fetched_at + ttl + stale
+        )
+        if entry.size > self.max_bytes:
+            return entry.response
+        with self._lock:
+            old = self._entries.pop(url, None)
+            if old is not None:
+                self._bytes -= old.size
+            self._entries[url] = entry
+            self._bytes += entry.size
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.size
+                self._stats["evictions"] += 1
+        return entry.response
+
+    def _fetch_and_store(self, url, timeout):
+        response = self.fetch(url, timeout=timeout)
+        if response.status_code != 200:
+            return response
+        return self._store(url, response)
+
+    def _load(self, url, timeout):
+        return self._flight.do(url, self._fetch_and_store, url, timeout)
+
+    def _refresh(self, url, timeout):
+        try:
+            self._load(url, timeout)
+            self._count("refreshes")
+        except Exception:
+            self._count("refresh_errors")
+        finally:
+            with self._lock:
+                self._refreshing.discard(url)
+
+    def _count(self, name):
+        with self._lock:
+            self._stats[name] += 1
+
+    def get(self, url, timeout=10):
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None and now < entry.stale_until:
+                self._entries.move_to_end(url)
+                if now < entry.expires_at:
+                    self._stats["hits"] += 1
+                    return entry.response
+                # Serve the stale copy and refresh it in the background
+                self._stats["stale_hits"] += 1
+                if url not in self._refreshing:
+                    self._refreshing.add(url)
+                    self._refresh_pool.submit(self._refresh, url, timeout)
+                return entry.response
+            self._stats["misses"] += 1
+        return self._load(url, timeout)
+
+    def invalidate(self, url=None):
+        with self._lock:
+            if url is None:
+                self._entries.clear()
+                self._bytes = 0
+            else:
+                entry = self._entries.pop(url, None)
+                if entry is not None:
+                    self._bytes -= entry.size
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = len(self._entries)
+            stats["bytes"] = self._bytes
+            stats["max_bytes"] = self.max_bytes
+            stats["coalesced"] = self._flight.shared
+        lookups = stats["hits"] + stats["stale_hits"] + stats["misses"]
+        stats["hit_ratio"] = round((stats["hits"] + stats["stale_hits"]) / lookups, 3) if lookups else 0.0
+        return stats
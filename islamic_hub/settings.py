@@ -0,0 +1,56 @@
+import os
+
+# Runtime settings. Every value can be overridden with an environment
+# variable so the same code runs locally, in a container and on Streamlit Cloud.
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.environ.get("ISLAMIC_HUB_DATA_DIR", os.path.join(BASE_DIR, "data"))
+
+
+def _list_setting(name, default):
+    value = os.environ.get(name, default)
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+# Upstream Quran API
+QURAN_API_URL = os.environ.get("ISLAMIC_HUB_QURAN_API", "http://api.alquran.cloud/v1").rstrip("/")
+
+# Offline Quran corpus (see islamic_hub/corpus.py)
+CORPUS_PATH = os.environ.get("ISLAMIC_HUB_CORPUS", os.path.join(DATA_DIR, "quran_corpus.sqlite3"))
+CORPUS_EDITIONS = _list_setting("ISLAMIC_HUB_EDITIONS", "quran-uthmani,en.asad,ur.jalandhry")
+
+# Full-text search index over the corpus, built by the sync command (see
+# islamic_hub/quran_search.py)
+SEARCH_INDEX_PATH = os.environ.get("ISLAMIC_HUB_SEARCH_INDEX", os.path.join(DATA_DIR, "quran_search.idx"))
+
+# Shared HTTP client (see islamic_hub/http_client.py)
+HTTP_POOL_SIZE = int(os.environ.get("ISLAMIC_HUB_HTTP_POOL_SIZE", "20"))
+HTTP_PER_HOST_LIMIT = int(os.environ.get("ISLAMIC_HUB_HTTP_PER_HOST_LIMIT", "8"))
+HTTP_RETRIES = int(os.environ.get("ISLAMIC_HUB_HTTP_RETRIES", "2"))
+
+# In-memory response cache (see islamic_hub/response_cache.py)
+CACHE_MAX_BYTES = int(os.environ.get("ISLAMIC_HUB_CACHE_MAX_MB", "64")) * 1024 * 1024
+SHOW_CACHE_STATS = os.environ.get("ISLAMIC_HUB_SHOW_CACHE_STATS", "") not in ("", "0", "false")
+
+# Persistent HTTP cache shared by worker processes (see islamic_hub/disk_cache.py)
+DISK_CACHE_ENABLED = os.environ.get("ISLAMIC_HUB_DISK_CACHE", "1") not in ("", "0", "false")
+DISK_CACHE_PATH = os.environ.get("ISLAMIC_HUB_DISK_CACHE_PATH", os.path.join(DATA_DIR, "http_cache.sqlite3"))
+DISK_CACHE_MAX_BYTES = int(os.environ.get("ISLAMIC_HUB_DISK_CACHE_MAX_MB", "256")) * 1024 * 1024
+
+# Threads used to fetch several editions concurrently (see islamic_hub/fanout.py)
+FANOUT_WORKERS = int(os.environ.get("ISLAMIC_HUB_FANOUT_WORKERS", "16"))
+
+# Seconds the loading spinner is shown before a page's content
+LOADING_DELAY = float(os.environ.get("ISLAMIC_HUB_LOADING_DELAY", "0.5"))
+
+# How long a session keeps its detected location, and how soon it retries
+# after falling back to an offline guess
+LOCATION_TTL = int(os.environ.get("ISLAMIC_HUB_LOCATION_TTL", str(60 * 60)))
+LOCATION_RETRY_TTL = int(os.environ.get("ISLAMIC_HUB_LOCATION_RETRY_TTL", str(5 * 60)))
+
+# Durood and dhikr counters (see islamic_hub/counters.py). The backend is
+# "sqlite", "redis" or "memory".
+COUNTER_BACKEND = os.environ.get("ISLAMIC_HUB_COUNTER_BACKEND", "sqlite")
+COUNTER_PATH = os.environ.get("ISLAMIC_HUB_COUNTER_PATH", os.path.join(DATA_DIR, "counters.sqlite3"))
+COUNTER_REDIS_URL = os.environ.get("ISLAMIC_HUB_COUNTER_REDIS_URL", "redis://localhost:6379/0")
+COUNTER_FLUSH_INTERVAL = float(os.environ.get("ISLAMIC_HUB_COUNTER_FLUSH_INTERVAL", "2"))
@@ -0,0 +1,225 @@
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import requests
+
+from islamic_hub import http_client, settings
+from islamic_hub.corpus import QuranCorpus
+from islamic_hub.quran_search import build_index, index_is_current
+
+# Download complete editions into the offline corpus.
+#
+# Each edition is fetched in one request from /quran/{edition} and streamed
+# to <data dir>/downloads/{edition}.json.part. Interrupted downloads are
+# resumed with a Range request when the server supports it. A finished
+# download is renamed to {edition}.json next to a .sha256 file, so a rerun
+# installs it without touching the network. The checksum is recorded in
+# the corpus once the edition is installed.
+#
+# The checksum is of the bytes as they were received: it catches a
+# finished download that was changed or cut short on disk, but the API
+# publishes no digest to check it against. What the server sent is
+# checked against the length it announced (Content-Length, or the total
+# in Content-Range when resuming), unless the body was compressed in
+# transit, and must then parse as a complete edition of 114 surahs before
+# it is installed. A download shorter than announced keeps its .part file
+# for the next run to resume.
+#
+# When the corpus has changed, or the search index is missing or
+# outdated, the index is rebuilt from the corpus at the end of the sync.
+
+CHUNK_SIZE = 64 * 1024
+
+
+class Progress:
+    def __init__(self, total, stream=None):
+        self.total = total
+        self.done = 0
+        self.stream = stream or sys.stdout
+        self.lock = threading.Lock()
+        self.started = time.perf_counter()
+
+    def report(self, edition, status, size=None, elapsed=None):
+        with self.lock:
+            self.done += 1
+            details = [status]
+            if size is not None:
+                details.append(f"{size / 1024 / 1024:.1f} MB")
+            if elapsed is not None:
+                details.append(f"{elapsed:.1f}s")
+            self.stream.write(f"[{self.done}/{self.total}] {edition}: {', '.join(details)}\n")
+            self.stream.flush()
+
+    def indexed(self, words, elapsed):
+        with self.lock:
+            self.stream.write(f"Indexed {words} words for search in {elapsed:.1f}s\n")
+            self.stream.flush()
+
+    def summary(self, failed):
+        elapsed = time.perf_counter() - self.started
+        ok = self.total - len(failed)
+        self.stream.write(f"Synced {ok}/{self.total} editions in {elapsed:.1f}s\n")
+        for edition, error in failed.items():
+            self.stream.write(f"  {edition} failed: {error}\n")
+        self.stream.flush()
+
+
+def _sha256_file(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+# The size the finished file should have, from the response headers, or
+# None when they do not say. offset is the size of the partial file the
+# response continues.
+def _expected_size(response, offset):
+    if response.headers.get("Content-Encoding", "identity") != "identity":
+        return None
+    content_range = response.headers.get("Content-Range", "")
+    if response.status_code == 206 and "/" in content_range:
+        total = content_range.rsplit("/", 1)[1]
+        if total.isdigit():
+            return int(total)
+    length = response.headers.get("Content-Length")
+    if length and length.isdigit():
+        return offset + int(length)
+    return None
+
+
+def _read_checksum(path):
+    try:
+        with open(path) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+# Stream one edition to disk. Returns the path of the verified download and
+# its SHA-256 checksum.
+def download_edition(edition, download_dir, api_url, session=None, timeout=60):
+    session = session or http_client.get_client()
+    final_path = os.path.join(download_dir, f"{edition}.json")
+    checksum_path = final_path + ".sha256"
+    part_path = final_path + ".part"
+
+    # A previous run already finished this download
+    checksum = _read_checksum(checksum_path)
+    if checksum and os.path.exists(final_path) and _sha256_file(final_path) == checksum:
+        return final_path, checksum
+
+    digest = hashlib.sha256()
+    headers = {}
+    offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+    if offset:
+        # Offsets refer to the decoded body we wrote, so ask for it unencoded
+        headers["Range"] = f"bytes={offset}-"
+        headers["Accept-Encoding"] = "identity"
+
+    with session.get(f"{api_url}/quran/{edition}", headers=headers, stream=True, timeout=timeout) as response:
+        if response.status_code == 416 and offset:
+            # The partial file is unusable, start again from scratch
+            os.remove(part_path)
+            return download_edition(edition, download_dir, api_url, session=session, timeout=timeout)
+        if response.status_code == 206 and offset:
+            # Resume: the hash has to cover the bytes we already have
+            with open(part_path, "rb") as f:
+                for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                    digest.update(chunk)
+            mode = "ab"
+            expected = _expected_size(response, offset)
+        elif response.status_code == 200:
+            mode = "wb"
+            expected = _expected_size(response, 0)
+        else:
+            response.raise_for_status()
+            raise requests.HTTPError(f"Unexpected status {response.status_code}", response=response)
+
+        with open(part_path, mode) as f:
+            for chunk in response.iter_content(CHUNK_SIZE):
+                f.write(chunk)
+                digest.update(chunk)
+            f.flush()
+            os.fsync(f.fileno())
+
+    size = os.path.getsize(part_path)
+    if expected is not None and size != expected:
+        if size > expected:
+            # Longer than the file on the server, it cannot be resumed
+            os.remove(part_path)
+        raise IOError(f"Download of {edition} is incomplete: {size} of {expected} bytes")
+
+    checksum = digest.hexdigest()
+    os.replace(part_path, final_path)
+    with open(checksum_path, "w") as f:
+        f.write(checksum + "\n")
+    return final_path, checksum
+
+
+def _load_payload(path):
+    with open(path, encoding="utf-8") as f:
+        payload = json.load(f)
+    if payload.get("code") not in (None, 200) or "data" not in payload:
+        raise ValueError(f"Unexpected API response: {payload.get('status', payload.get('code'))}")
+    return payload["data"]
+
+
+def sync_edition(edition, corpus, download_dir, api_url, force=False, session=None):
+    started = time.perf_counter()
+    if not force and corpus.has_edition(edition):
+        return "already installed", None, None
+
+    path, checksum = download_edition(edition, download_dir, api_url, session=session)
+    size = os.path.getsize(path)
+    try:
+        corpus.install_edition(_load_payload(path), checksum=checksum)
+    except ValueError:
+        # A corrupt or truncated download must not be reused on the next run
+        os.remove(path)
+        os.remove(path + ".sha256")
+        raise
+    os.remove(path)
+    os.remove(path + ".sha256")
+    return "installed", size, time.perf_counter() - started
+
+
+def sync(editions, corpus_path=None, api_url=None, workers=4, force=False, stream=None, index_path=None):
+    corpus = QuranCorpus(corpus_path or settings.CORPUS_PATH)
+    api_url = (api_url or settings.QURAN_API_URL).rstrip("/")
+    download_dir = os.path.join(os.path.dirname(os.path.abspath(corpus.path)), "downloads")
+    os.makedirs(download_dir, exist_ok=True)
+
+    progress = Progress(len(editions), stream)
+    failed = {}
+    installed = False
+    session = http_client.get_client()
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = {
+            pool.submit(sync_edition, edition, corpus, download_dir, api_url, force, session): edition
+            for edition in editions
+        }
+        for future in as_completed(futures):
+            edition = futures[future]
+            try:
+                status, size, elapsed = future.result()
+                progress.report(edition, status, size, elapsed)
+                installed = installed or status == "installed"
+            except Exception as e:
+                failed[edition] = e
+                progress.report(edition, "failed")
+    progress.summary(failed)
+
+    index_path = index_path or settings.SEARCH_INDEX_PATH
+    editions_installed = corpus.installed_editions()
+    if editions_installed and (installed or not index_is_current(index_path, editions_installed)):
+        started = time.perf_counter()
+        words = build_index(corpus.path, index_path)
+        progress.indexed(words, time.perf_counter() - started)
+    return failed
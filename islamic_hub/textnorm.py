@@ -0,0 +1,210 @@
+import re
+import unicodedata
+
+# Text normalisation for search.
+#
+# Queries and searched text go through the same steps, so a search matches
+# however the words were written:
+#
+#   - Arabic harakat and tanween, Quranic annotation marks, superscript
+#     alef, tatweel and zero-width joiners are removed
+#   - the alef forms (أ إ آ ٱ) become ا, hamza carriers (ؤ ئ) become the
+#     bare letter and a hamza on the line (ء) is dropped, so the Uthmani
+#     ءَامَنُوا matches امنوا
+#   - alef maksura ى becomes ي and ta marbuta ة becomes ه
+#   - Urdu and Persian letter forms become their Arabic counterparts:
+#     ی -> ي, ک -> ك, ہ and ھ -> ه, so Urdu and Arabic spellings match
+#   - Arabic-Indic digits become 0-9
+#   - Latin text is case folded and accents are dropped (é -> e)
+#
+# The Uthmani script writes many long vowels as a superscript alef (ـٰ), so
+# ٱلْكِتَٰبُ normalises to الكتب where most people would type الكتاب.
+# word_variants() gives both spellings, for indexing. sound_key() goes
+# further for fuzzy matching, folding the many Latin spellings of one name,
+# and phonetic_key() reduces Roman Urdu and Urdu-script words alike to
+# their consonants, so a query in either script finds the other.
+#
+# The tables are built once at import as lists indexed by code point,
+# which str.translate looks up about four times faster than a dict.
+# Characters past the end of a table are kept as they are. NFKD is only
+# applied to text containing accented Latin letters or Arabic
+# presentation forms. benchmarks/bench_normalize.py times this over the
+# whole Quran.
+
+# Changes whenever the output of normalize() does, so indexes built with
+# an older version are rebuilt
+VERSION = 2
+
+# Characters that carry no meaning for search, on top of every combining
+# mark in the Arabic and Latin blocks
+_REMOVE = [
+    0x0621,                    # hamza
+    0x0640,                    # tatweel
+    0x06DD, 0x06DE, 0x06E9,    # end of ayah, rub el hizb, sajda mark
+    0x200C, 0x200D,            # zero-width non-joiner and joiner
+    0x200E, 0x200F,            # left-to-right and right-to-left marks
+]
+
+_REPLACE = {
+    "أ": "ا", "إ": "ا", "آ": "ا", "ٱ": "ا", "ٲ": "ا", "ٳ": "ا",
+    "ؤ": "و",
+    "ئ": "ي", "ى": "ي", "ی": "ي", "ې": "ي",
+    "ة": "ه", "ۃ": "ه", "ہ": "ه", "ۂ": "ه", "ھ": "ه", "ە": "ه", "ۀ": "ه",
+    "ک": "ك", "ڪ": "ك",
+    "ۓ": "ے",
+}
+
+SUPERSCRIPT_ALEF = "\u0670"
+
+# Up to and including the General Punctuation block
+TABLE_SIZE = 0x2070
+
+# Accented Latin letters and Arabic presentation forms, which need NFKD
+_COMPATIBILITY = re.compile("[\u00c0-\u024f\u1e00-\u1eff\ufb50-\ufdff\ufe70-\ufeff]")
+
+_TOKEN = re.compile(r"\w+")
+
+
+def _build_table(replace):
+    table = [chr(code) for code in range(TABLE_SIZE)]
+    for code in _REMOVE:
+        table[code] = None
+    # Latin combining accents, and the Arabic, Arabic Supplement and Arabic
+    # Extended-A marks: harakat, Quranic annotations, small high letters,
+    # superscript alef
+    for code in list(range(0x0300, 0x0370)) + list(range(0x0610, 0x0700)) + list(range(0x08D3, 0x0900)):
+        if unicodedata.category(chr(code)) in ("Mn", "Me", "Cf"):
+            table[code] = None
+    for digit in range(10):
+        table[0x0660 + digit] = str(digit)
+        table[0x06F0 + digit] = str(digit)
+    for source, target in replace.items():
+        table[ord(source)] = target
+    return table
+
+
+TABLE = _build_table(_REPLACE)
+# As TABLE, but the superscript alef is written out
+ALEF_TABLE = _build_table(dict(_REPLACE, **{SUPERSCRIPT_ALEF: "ا"}))
+
+
+def normalize(text, table=TABLE):
+    if not text:
+        return ""
+    if not text.isascii():
+        if _COMPATIBILITY.search(text):
+            text = unicodedata.normalize("NFKD", text)
+        text = text.translate(table)
+    return text.casefold()
+
+
+def tokenize(text):
+    return _TOKEN.findall(normalize(text))
+
+
+# Tokens of text, each as a tuple of its spellings: the normalised word,
+# followed by its spelling with the superscript alef written out if that
+# differs
+def word_variants(text):
+    tokens = tokenize(text)
+    if SUPERSCRIPT_ALEF not in text:
+        return [(token,) for token in tokens]
+    spelled = _TOKEN.findall(normalize(text, ALEF_TABLE))
+    if len(spelled) != len(tokens):
+        return [(token,) for token in tokens]
+    return [(token,) if token == other else (token, other) for token, other in zip(tokens, spelled)]
+
+
+# Latin spellings of one Arabic or Urdu sound, in the order they are folded
+_SOUNDS = [("ee", "i"), ("oo", "u"), ("ou", "u"), ("e", "a"), ("o", "u"), ("q", "k"), ("ph", "f"), ("dh", "z"), ("v", "w")]
+
+_DOUBLED = re.compile(r"(.)\1+")
+
+ARABIC_ARTICLE = "ال"
+
+
+# A normalised word reduced to how it sounds, so the usual ways of writing
+# a name in Latin letters agree: Rahman, Rehman and Rahmaan all become
+# rahman, Muhammad and Mohammed muhamad, Raheem rahim. Arabic-script words
+# lose the article, so الرحمن and رحمن agree.
+def sound_key(word):
+    if not word.isascii():
+        return word[len(ARABIC_ARTICLE):] if word.startswith(ARABIC_ARTICLE) and len(word) > 3 else word
+    for spelling, sound in _SOUNDS:
+        word = word.replace(spelling, sound)
+    return _DOUBLED.sub(r"\1", word)
+
+
+# The sound of each normalised Urdu or Arabic letter, and of each Roman
+# letter, for phonetic_key(). Vowels and the letters that often stand for
+# one (ا و ي ے ع, a e i o u w y v) count for nothing; S is sh and c is ch.
+_PHONETIC = {
+    "ب": "b", "پ": "p", "ت": "t", "ٹ": "t", "ط": "t", "ث": "s", "س": "s", "ص": "s",
+    "ج": "j", "چ": "c", "ح": "h", "ه": "h", "خ": "k", "د": "d", "ڈ": "d",
+    "ذ": "z", "ز": "z", "ض": "z", "ظ": "z", "ژ": "z", "ر": "r", "ڑ": "r", "ش": "S",
+    "غ": "g", "گ": "g", "ف": "f", "ق": "k", "ك": "k", "ل": "l", "م": "m", "ن": "n", "ں": "n",
+    "ا": "", "و": "", "ي": "", "ے": "", "ع": "",
+    "a": "", "e": "", "i": "", "o": "", "u": "", "w": "", "y": "", "v": "", "q": "k", "x": "k",
+}
+
+# Sounds an h after which only marks aspiration: bh, kh, ڈھ, چھ ...
+_ASPIRATED = set("bptdjckgr")
+
+# Roman spellings of one letter
+_DIGRAPHS = [("sh", "S"), ("ch", "c")]
+
+
+# A normalised Roman Urdu or Urdu-script word reduced to its consonants,
+# so both spellings of a word agree: "banda" and بندہ both become bnd,
+# "tujhey" and تجھے tj, "sohne" and سوہنے shn. An h that only marks
+# aspiration (bh, ھ after a consonant) and a final h (اللہ, allah) are
+# dropped, and doubled sounds are written once. Words that are all
+# vowels ("e", "ae", واہ) have an empty key.
+def phonetic_key(word):
+    for spelling, sound in _DIGRAPHS:
+        word = word.replace(spelling, sound)
+    sounds = []
+    last = len(word) - 1
+    for i, letter in enumerate(word):
+        sound = _PHONETIC.get(letter, letter)
+        if sound == "h" and letter != "ح" and (i == last or (i and _PHONETIC.get(word[i - 1], word[i - 1]) in _ASPIRATED)):
+            continue
+        sounds.append(sound)
+    return _DOUBLED.sub(r"\1", "".join(sounds))
+
+
+# Records (duas, durood, naats, names) carry their normalised text under
+# this key: one string per searched field, with the words separated by
+# single spaces. It is filled in the first time a record is searched and
+# reused after that, so a search only normalises the query.
+SEARCH_FIELD = "_search"
+
+
+def _field(record, path):
+    value = record
+    for key in path.split("."):
+        value = value.get(key) if isinstance(value, dict) else None
+    return value if isinstance(value, str) else ("" if value is None else str(value))
+
+
+# Adds the normalised text of fields to each record that lacks it and
+# returns the records. A field is a key, or a dotted path into nested
+# dicts such as "en.meaning".
+def add_search_text(records, fields):
+    for record in records:
+        shadow = record.get(SEARCH_FIELD)
+        if shadow is None:
+            shadow = record[SEARCH_FIELD] = {}
+        for field in fields:
+            if field not in shadow:
+                shadow[field] = " ".join(tokenize(_field(record, field)))
+    return records
+
+
+# The records where any of the fields contains the query, both normalised
+def search_records(records, query, fields):
+    query = " ".join(tokenize(query))
+    if not query:
+        return []
+    add_search_text(records, fields)
+    return [record for record in records if any(query in record[SEARCH_FIELD][field] for field in fields)]
@@ -0,0 +1,100 @@
+from functools import lru_cache
+from html import escape
+
+# Daily prayer timeline drawn as a small inline SVG.
+#
+# The chart for a day only changes when the timings do, so everything but
+# the current time marker is rendered once per (timings, axis range) and
+# cached. A render is then a dictionary lookup plus one <line>, and the
+# browser receives a couple of kilobytes of markup instead of a Plotly
+# figure and its JavaScript.
+
+TITLE = "Daily Prayer Timeline"
+COLORS = {
+    "Fajr": "#1f77b4",
+    "Sunrise": "#ff7f0e",
+    "Dhuhr": "#2ca02c",
+    "Asr": "#d62728",
+    "Maghrib": "#9467bd",
+    "Isha": "#8c564b",
+}
+DEFAULT_COLOR = "#7f7f7f"
+
+# The axis shows daylight hours, widened to fit every timing
+DAY_START = 4
+DAY_END = 22
+TICK_HOURS = 2
+
+WIDTH = 720
+ROW_HEIGHT = 30
+BAR_HEIGHT = 20
+LEFT = 80
+RIGHT = 16
+TOP = 40
+BOTTOM = 30
+
+
+def _axis_range(hours, current_hour=None):
+    start = min([DAY_START] + [int(hour) for hour in hours])
+    end = max([DAY_END] + [int(hour) + 2 for hour in hours])
+    # Show the whole day when the marker would otherwise fall off the chart
+    if current_hour is not None and not start <= current_hour <= end:
+        start, end = min(start, 0), max(end, 24)
+    return start, end
+
+
+def _x(hour, start, end):
+    return LEFT + (hour - start) * (WIDTH - LEFT - RIGHT) / (end - start)
+
+
+# Everything except the current time marker and the closing tag, for rows
+# of (prayer, "HH:MM", hours since local midnight)
+@lru_cache(maxsize=512)
+def _chart(rows, start, end):
+    height = TOP + len(rows) * ROW_HEIGHT + BOTTOM
+    bottom = TOP + len(rows) * ROW_HEIGHT
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {WIDTH} {height}" width="100%" '
+        f'role="img" aria-label="{TITLE}" font-family="sans-serif" font-size="12">',
+        f'<text x="{LEFT}" y="18" font-size="15" font-weight="bold" fill="#333">{TITLE}</text>',
+    ]
+
+    tick = start + (-start) % TICK_HOURS
+    while tick <= end:
+        x = _x(tick, start, end)
+        parts.append(f'<line x1="{x:.1f}" y1="{TOP}" x2="{x:.1f}" y2="{bottom}" stroke="#e5e5e5"/>')
+        parts.append(f'<text x="{x:.1f}" y="{bottom + 18}" text-anchor="middle" fill="#666">{tick % 24:02d}:00</text>')
+        tick += TICK_HOURS
+
+    for index, (name, label, hour) in enumerate(rows):
+        y = TOP + index * ROW_HEIGHT + (ROW_HEIGHT - BAR_HEIGHT) / 2
+        x = _x(hour, start, end)
+        width = _x(hour + 1, start, end) - x
+        color = COLORS.get(name, DEFAULT_COLOR)
+        parts.append(f'<text x="{LEFT - 8}" y="{y + BAR_HEIGHT - 6}" text-anchor="end" fill="#333">{escape(name)}</text>')
+        parts.append(
+            f'<rect x="{x:.1f}" y="{y}" width="{width:.1f}" height="{BAR_HEIGHT}" rx="4" fill="{color}">'
+            f'<title>{escape(name)} {escape(label)}</title></rect>'
+        )
+        parts.append(f'<text x="{x + 4:.1f}" y="{y + BAR_HEIGHT - 6}" fill="#fff" font-size="11">{escape(label)}</text>')
+    return "".join(parts), bottom
+
+
+# SVG markup for a day's timings with a marker at current_hour (hours
+# since local midnight), or no marker if current_hour is None. Rows are
+# drawn in time order, and rows without a time (None or NaN, e.g. Isha
+# at high latitudes) are left out.
+def render(rows, current_hour=None):
+    rows = tuple(sorted(
+        ((name, label, round(hour, 4)) for name, label, hour in rows if hour is not None and hour == hour),
+        key=lambda row: row[2]
+    ))
+    start, end = _axis_range([hour for _, _, hour in rows], current_hour)
+    chart, bottom = _chart(rows, start, end)
+    if current_hour is None:
+        return chart + "</svg>"
+    x = _x(current_hour, start, end)
+    return (
+        f'{chart}<line x1="{x:.1f}" y1="{TOP - 6}" x2="{x:.1f}" y2="{bottom}" stroke="red" stroke-width="2" '
+        f'stroke-dasharray="6 4"/><text x="{x:.1f}" y="{TOP - 10}" text-anchor="middle" fill="red">Current Time</text></svg>'
+    )
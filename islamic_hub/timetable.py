@@ -0,0 +1,203 @@
+import calendar
+import time
+from datetime import date
+from functools import lru_cache
+
+import numpy as np
+
+from islamic_hub import hijri
+from islamic_hub.prayer_table import compute_times_grid, format_times, utc_offsets_grid
+from islamic_hub.prayer_times import ANGLE_BASED, SHAFI
+
+# Month timetables, the Ramadan table and the yearly calendar export.
+#
+# All of them are assembled from whole months, each computed in a single
+# vectorized call and cached per (location, settings, month). Everyone
+# looking at the same city shares the work, the Ramadan table reuses the
+# one or two months it spans, and a year's calendar is streamed month by
+# month from the same cache.
+
+TABLE_TIMINGS = ["Fajr", "Sunrise", "Dhuhr", "Asr", "Maghrib", "Isha"]
+CALENDAR_PRAYERS = ["Fajr", "Dhuhr", "Asr", "Maghrib", "Isha"]
+EVENT_MINUTES = 15
+
+# Coordinates are rounded before they become part of a cache key. Three
+# decimals is about 100 m, which moves prayer times by well under a second.
+COORDINATE_DECIMALS = 3
+
+PRODUCT_ID = "-//Islamic Resources Hub//Prayer Times//EN"
+
+
+def _location(latitude, longitude):
+    return round(latitude, COORDINATE_DECIMALS), round(longitude, COORDINATE_DECIMALS)
+
+
+# (days, timings, utc offsets) for one month at one location. timings maps
+# each name to an array of fractional local hours.
+@lru_cache(maxsize=2048)
+def _month_times(latitude, longitude, timezone, year, month, method, school, latitude_adjustment):
+    first = np.datetime64(date(year, month, 1), "D")
+    days = first + np.arange(calendar.monthrange(year, month)[1])
+    if timezone:
+        offsets = utc_offsets_grid(days, [timezone])
+    else:
+        offsets = np.full((len(days), 1), round(longitude / 15))
+    grid = compute_times_grid(days, [latitude], [longitude], offsets, method, school, latitude_adjustment)
+    timings = {name: values[:, 0] for name, values in grid.items()}
+    return days, timings, offsets[:, 0]
+
+
+def month_times(latitude, longitude, timezone, year, month, method=3, school=SHAFI,
+                latitude_adjustment=ANGLE_BASED):
+    latitude, longitude = _location(latitude, longitude)
+    return _month_times(latitude, longitude, timezone, year, month, method, school, latitude_adjustment)
+
+
+@lru_cache(maxsize=1024)
+def _month_rows(latitude, longitude, timezone, year, month, method, school, latitude_adjustment):
+    days, timings, _ = _month_times(latitude, longitude, timezone, year, month, method, school, latitude_adjustment)
+    formatted = {name: format_times(timings[name]) for name in TABLE_TIMINGS + ["Imsak"]}
+    hijri_years, hijri_months, hijri_days = hijri.from_gregorian_array(days)
+    rows = []
+    for index, day in enumerate(days.astype(object)):
+        row = {
+            "Date": day.strftime("%d %b %Y"),
+            "Day": day.strftime("%a"),
+            "Hijri": f"{hijri_days[index]} {hijri.MONTHS[hijri_months[index] - 1]} {hijri_years[index]}",
+        }
+        for name in formatted:
+            row[name] = str(formatted[name][index])
+        rows.append(row)
+    return tuple(rows)
+
+
+# One row per day of a Gregorian month
+def month_table(latitude, longitude, timezone, year, month, method=3, school=SHAFI,
+                latitude_adjustment=ANGLE_BASED):
+    import pandas as pd
+    latitude, longitude = _location(latitude, longitude)
+    rows = _month_rows(latitude, longitude, timezone, year, month, method, school, latitude_adjustment)
+    return pd.DataFrame(list(rows), columns=["Date", "Day", "Hijri"] + TABLE_TIMINGS)
+
+
+# Sehri (ends at Imsak) and Iftar (Maghrib) for every day of Ramadan in
+# the given Hijri year
+def ramadan_table(latitude, longitude, timezone, hijri_year, method=3, school=SHAFI,
+                  latitude_adjustment=ANGLE_BASED):
+    import pandas as pd
+    latitude, longitude = _location(latitude, longitude)
+    first, last = hijri.month_range(hijri_year, hijri.RAMADAN)
+
+    rows = []
+    year, month = first.year, first.month
+    while (year, month) <= (last.year, last.month):
+        for row in _month_rows(latitude, longitude, timezone, year, month, method, school, latitude_adjustment):
+            rows.append(row)
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+    start = (first - date(first.year, first.month, 1)).days
+    table = []
+    for number, row in enumerate(rows[start:start + (last - first).days + 1], 1):
+        table.append({
+            "Ramadan": number,
+            "Date": row["Date"],
+            "Day": row["Day"],
+            "Sehri Ends": row["Imsak"],
+            "Fajr": row["Fajr"],
+            "Iftar": row["Maghrib"],
+            "Isha": row["Isha"],
+        })
+    return pd.DataFrame(table)
+
+
+# RFC 5545 TEXT value: backslashes, semicolons, commas and line breaks
+# are escaped
+def _escape_text(value):
+    value = value.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,")
+    return value.replace("\r\n", "\\n").replace("\n", "\\n").replace("\r", "\\n")
+
+
+# An iCalendar content line, folded so no line is longer than 75 octets
+def _content_line(line):
+    if len(line.encode("utf-8")) <= 75:
+        return line
+    parts = []
+    current = ""
+    for character in line:
+        # Continuation lines start with a space, which counts towards 75
+        limit = 75 if not parts else 74
+        if len((current + character).encode("utf-8")) > limit:
+            parts.append(current)
+            current = ""
+        current += character
+    parts.append(current)
+    return "\r\n ".join(parts)
+
+
+# (UID, DTSTART, prayer) for every event of one month. Times are in UTC
+# so the calendar needs no VTIMEZONE definitions.
+@lru_cache(maxsize=1024)
+def _month_events(latitude, longitude, timezone, year, month, method, school, latitude_adjustment):
+    days, timings, offsets = _month_times(latitude, longitude, timezone, year, month, method, school, latitude_adjustment)
+    midday = timings["Dhuhr"]
+    events = []
+    for name in CALENDAR_PRAYERS:
+        hours = timings[name]
+        # Maghrib and Isha can fall after local midnight at high latitudes
+        if name in ("Asr", "Maghrib", "Isha"):
+            hours = np.where(hours < midday, hours + 24, hours)
+        minutes = np.round((hours - offsets) * 60)
+        valid = ~np.isnan(minutes)
+        starts = days[valid].astype("datetime64[m]") + minutes[valid].astype(np.int64).astype("timedelta64[m]")
+        for day, start in zip(days[valid].astype(str), starts):
+            events.append((
+                f"{day}-{name.lower()}-{latitude}-{longitude}-{method}-{school}@islamic-resources-hub",
+                str(start).replace("-", "").replace(":", "") + "00Z",
+                name,
+            ))
+    return tuple(events)
+
+
+# VEVENT blocks for one month. Only the event times are cached; DTSTAMP
+# is when this calendar was generated.
+def _format_events(events, stamp):
+    lines = []
+    for uid, start, name in events:
+        lines += [
+            "BEGIN:VEVENT",
+            f"UID:{uid}",
+            f"DTSTAMP:{stamp}",
+            f"DTSTART:{start}",
+            f"DURATION:PT{EVENT_MINUTES}M",
+            _content_line(f"SUMMARY:{_escape_text(name)}"),
+            "TRANSP:TRANSPARENT",
+            "END:VEVENT",
+        ]
+    return "\r\n".join(lines) + "\r\n" if lines else ""
+
+
+# Yields an iCalendar file for a whole Gregorian year in month-sized
+# chunks, so a server can stream it as it is generated
+def iter_calendar(latitude, longitude, timezone, year, method=3, school=SHAFI,
+                  latitude_adjustment=ANGLE_BASED, name="Prayer Times"):
+    latitude, longitude = _location(latitude, longitude)
+    stamp = time.strftime("%Y%m%dT%H%M%SZ", time.gmtime())
+    yield "\r\n".join([
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        f"PRODID:{PRODUCT_ID}",
+        "CALSCALE:GREGORIAN",
+        "METHOD:PUBLISH",
+        _content_line(f"X-WR-CALNAME:{_escape_text(name)}"),
+    ]) + "\r\n"
+    for month in range(1, 13):
+        events = _month_events(latitude, longitude, timezone, year, month, method, school, latitude_adjustment)
+        yield _format_events(events, stamp)
+    yield "END:VCALENDAR\r\n"
+
+
+def calendar_bytes(latitude, longitude, timezone, year, method=3, school=SHAFI,
+                   latitude_adjustment=ANGLE_BASED, name="Prayer Times"):
+    return "".join(iter_calendar(
+        latitude, longitude, timezone, year, method, school, latitude_adjustment, name
+    )).encode("utf-8")
@@ -0,0 +1,117 @@
+from islamic_hub.textnorm import SEARCH_FIELD, add_search_text, sound_key, tokenize
+
+# Typo-tolerant search over a short list of names (Asma Al-Husna, the
+# names of the Prophet ﷺ).
+#
+# Built once from the records, the index keeps every normalised word (see
+# textnorm.py) of the searched fields, reduced to its sound key, and the
+# trigrams of that key: "rahman" is padded to "  rahman " and split into
+# "  r", " ra", "rah", ... A query word is compared with the words sharing
+# a trigram with it, and matches those whose trigrams are similar enough
+# (Dice coefficient of at least MIN_SIMILARITY), or which it starts. So
+# Rehman, Rahmaan and Ar-Rahmaan all find Ar-Rahman, mercyful finds
+# Merciful and رحمن finds الرحمن.
+#
+# The article (al-, ar-, as- ...) is not indexed on its own, so "al
+# rahman" finds Ar-Rahman, but each pair of neighbouring words is also
+# indexed joined, so "arrahman" and "mumin" (Al-Mu'min) are found too.
+#
+# A query matches records where every query word matches, ranked by the
+# similarity of the best matching word, weighted by field.
+
+# Latin spellings of the Arabic article
+ARTICLES = {"al", "ar", "as", "at", "ad", "adh", "an", "az", "ash", "ath", "ul", "ur", "un"}
+
+# Words less similar than this to a query word do not match it
+MIN_SIMILARITY = 0.5
+
+# A query word of at least PREFIX_LENGTH letters that starts a word
+# matches it with this similarity, so results appear as the user types
+PREFIX_LENGTH = 3
+PREFIX_SIMILARITY = 0.8
+
+
+def trigrams(word):
+    padded = f"  {word} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class TrigramIndex:
+    # fields maps each searched field (a key or a dotted path such as
+    # "en.meaning") to its weight
+    def __init__(self, records, fields, key="number"):
+        self.records = list(records)
+        self.key = key
+        add_search_text(self.records, list(fields))
+        self._by_key = {record[key]: record for record in self.records}
+
+        # sound key -> {record position: weight of the best field}
+        postings = {}
+        for position, record in enumerate(self.records):
+            for field, weight in fields.items():
+                words = record[SEARCH_FIELD][field].split()
+                keys = [word for word in words if word not in ARTICLES]
+                keys += [first + second for first, second in zip(words, words[1:])]
+                for word in keys:
+                    record_weights = postings.setdefault(sound_key(word), {})
+                    record_weights[position] = max(record_weights.get(position, 0), weight)
+
+        self._keys = list(postings)
+        self._postings = [postings[word] for word in self._keys]
+        self._sizes = []
+        # trigram -> positions in self._keys
+        self._trigrams = {}
+        for i, word in enumerate(self._keys):
+            grams = trigrams(word)
+            self._sizes.append(len(grams))
+            for gram in grams:
+                self._trigrams.setdefault(gram, []).append(i)
+
+    def __len__(self):
+        return len(self.records)
+
+    # The record with this key (e.g. number)
+    def get(self, value):
+        return self._by_key.get(value)
+
+    # Indexed words similar to a query word, as {position in self._keys:
+    # similarity}
+    def _similar(self, word):
+        word = sound_key(word)
+        grams = trigrams(word)
+        shared = {}
+        for gram in grams:
+            for i in self._trigrams.get(gram, ()):
+                shared[i] = shared.get(i, 0) + 1
+        similar = {}
+        for i, count in shared.items():
+            if self._keys[i] == word:
+                similarity = 1.0
+            else:
+                similarity = 2 * count / (len(grams) + self._sizes[i])
+                if len(word) >= PREFIX_LENGTH and self._keys[i].startswith(word):
+                    similarity = max(similarity, PREFIX_SIMILARITY)
+            if similarity >= MIN_SIMILARITY:
+                similar[i] = similarity
+        return similar
+
+    # Records matching every word of the query, best first
+    def search(self, query, limit=None):
+        matches = None
+        words = [word for word in dict.fromkeys(tokenize(query)) if word not in ARTICLES]
+        for word in words:
+            scores = {}
+            for i, similarity in self._similar(word).items():
+                for position, weight in self._postings[i].items():
+                    scores[position] = max(scores.get(position, 0), similarity * weight)
+            if matches is None:
+                matches = scores
+            else:
+                matches = {position: score + scores[position] for position, score in matches.items() if position in scores}
+            if not matches:
+                return []
+        if matches is None:
+            return []
+
+        ranked = sorted(matches, key=lambda position: (-matches[position], position))
+        return [self.records[position] for position in ranked[:limit]]
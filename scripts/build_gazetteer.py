@@ -0,0 +1,73 @@
+import argparse
+import gzip
+import json
+import os
+import re
+import unicodedata
+
+# Builds islamic_hub/data/cities.tsv.gz from GeoNames' cities15000 list.
+#
+#   pip download geonamescache --no-deps && unzip geonamescache-*.whl
+#   python scripts/build_gazetteer.py geonamescache/data/cities15000.json
+#
+# One line per city: name, country code, latitude, longitude, IANA time
+# zone, population and "|"-separated alternate names. Alternate names are
+# kept only for cities of ALIAS_POPULATION or more, and only proper
+# Latin-script ones ("Mecca" and "Makkah", "Bombay" for Mumbai).
+#
+# GeoNames data is licensed under CC BY 4.0 (https://www.geonames.org).
+
+OUTPUT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "islamic_hub", "data", "cities.tsv.gz")
+ALIAS_POPULATION = 500000
+ALIAS_PATTERN = re.compile(r"[A-Z][A-Za-z .'-]*[a-z][A-Za-z .'-]*")
+
+
+def fold(text):
+    text = unicodedata.normalize("NFKD", text.casefold())
+    return "".join(ch for ch in text if not unicodedata.combining(ch))
+
+
+def aliases(city):
+    if city["population"] < ALIAS_POPULATION:
+        return []
+    seen = {fold(city["name"])}
+    names = []
+    for name in city["alternatenames"]:
+        if name.isascii() and ALIAS_PATTERN.fullmatch(name) and fold(name) not in seen:
+            seen.add(fold(name))
+            names.append(name)
+    return names
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the bundled city gazetteer")
+    parser.add_argument("source", help="geonamescache cities15000.json")
+    parser.add_argument("--output", default=OUTPUT)
+    args = parser.parse_args()
+
+    with open(args.source, encoding="utf-8") as f:
+        cities = sorted(json.load(f).values(), key=lambda city: (-city["population"], city["geonameid"]))
+
+    lines = []
+    for city in cities:
+        if not city["timezone"]:
+            continue
+        lines.append("\t".join([
+            city["name"],
+            city["countrycode"],
+            f"{city['latitude']:.4f}",
+            f"{city['longitude']:.4f}",
+            city["timezone"],
+            str(city["population"]),
+            "|".join(aliases(city)),
+        ]))
+
+    os.makedirs(os.path.dirname(args.output), exist_ok=True)
+    # mtime=0 keeps the output byte-for-byte reproducible
+    with open(args.output, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=9, mtime=0) as f:
+        f.write(("\n".join(lines) + "\n").encode("utf-8"))
+    print(f"Wrote {len(lines)} cities to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from islamic_hub.corpus import TOTAL_AYAHS
+
+# Shared fixtures: a synthetic Quran edition, and a stand-in for the
+# alquran.cloud API serving such editions over HTTP.
+
+
+# A complete edition as /v1/quran/{edition} returns it: 114 surahs and
+# 6236 ayahs, each ayah's text given by text(number)
+def quran_edition(identifier, language="en", text=None):
+    text = text or (lambda number: f"ayah {number}")
+    counts = [54] * 113
+    counts.append(TOTAL_AYAHS - sum(counts))
+    surahs = []
+    number = 0
+    for surah, count in enumerate(counts, 1):
+        ayahs = []
+        for number_in_surah in range(1, count + 1):
+            number += 1
+            ayahs.append({
+                "number": number, "text": text(number), "numberInSurah": number_in_surah,
+                "juz": 1 + (number - 1) * 30 // TOTAL_AYAHS, "manzil": 1, "page": 1 + (number - 1) * 604 // TOTAL_AYAHS,
+                "ruku": 1, "hizbQuarter": 1 + (number - 1) * 240 // TOTAL_AYAHS, "sajda": False
+            })
+        surahs.append({
+            "number": surah, "name": f"سورة {surah}", "englishName": f"Surah {surah}",
+            "englishNameTranslation": f"Surah {surah}", "revelationType": "Meccan", "ayahs": ayahs
+        })
+    edition = {"identifier": identifier, "language": language, "name": identifier, "englishName": identifier,
+               "format": "text", "type": "quran" if language == "ar" else "translation"}
+    return {"edition": edition, "surahs": surahs}
+
+
+def edition_body(identifier, language="en", text=None):
+    payload = {"code": 200, "status": "OK", "data": quran_edition(identifier, language, text)}
+    return json.dumps(payload).encode("utf-8")
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests.append((self.path, self.headers.get("Range")))
+        edition = self.path.rsplit("/", 1)[-1]
+        body = server.editions.get(edition) if self.path.startswith("/v1/quran/") else None
+        if body is None:
+            self._send(404, json.dumps({"code": 404, "status": "Not Found"}).encode())
+            return
+
+        requested = self.headers.get("Range")
+        if requested and server.ranges:
+            start = int(requested[len("bytes="):].split("-")[0])
+            if start >= len(body):
+                self._send(416, b"", {"Content-Range": f"bytes */{len(body)}"})
+                return
+            self._send(206, body[start:], {"Content-Range": f"bytes {start}-{len(body) - 1}/{len(body)}"})
+            return
+        self._send(200, body)
+
+    def _send(self, status, body, headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        # Cut the body short once, to simulate a dropped connection
+        if self.server.drop_after is not None and len(body) > self.server.drop_after:
+            body = body[:self.server.drop_after]
+            self.server.drop_after = None
+            self.close_connection = True
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+# A local stand-in for the alquran.cloud API. Serve editions by setting
+# server.editions[identifier] = edition_body(...). server.requests lists
+# the (path, Range header) of every request, server.ranges = False makes
+# it ignore Range headers, and server.drop_after = n cuts the next body
+# off after n bytes.
+@pytest.fixture
+def quran_api():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    server.editions = {}
+    server.requests = []
+    server.ranges = True
+    server.drop_after = None
+    server.lock = threading.Lock()
+    server.url = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,105 @@
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from islamic_hub import clock
+from islamic_hub.pages import prayer_times as page
+
+LONDON = {"city": "London", "latitude": 51.5074, "longitude": -0.1278, "timezone": "Europe/London"}
+OSLO = {"city": "Oslo", "latitude": 59.9139, "longitude": 10.7522, "timezone": "Europe/Oslo"}
+
+
+def utc(*args):
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+def at(location, moment, monkeypatch, latitude_adjustment=3):
+    monkeypatch.setattr(page.clock, "now", lambda zone: moment.astimezone(zone))
+    return page.get_prayer_schedule(location, latitude_adjustment=latitude_adjustment)
+
+
+def named(events):
+    return [(name, when.strftime("%Y-%m-%d %H:%M %z")) for name, when in events]
+
+
+def test_zone_falls_back_to_the_longitude():
+    assert clock.zone_for("Asia/Karachi").zone == "Asia/Karachi"
+    assert clock.zone_for("Not/AZone", 67.0).utcoffset(datetime(2025, 1, 1)) == timedelta(hours=4)
+    assert clock.zone_for(None, -74.0).utcoffset(datetime(2025, 1, 1)) == timedelta(hours=-5)
+
+
+def test_at_hours_rounds_to_the_minute():
+    zone = clock.zone_for("Asia/Karachi")
+    assert clock.at_hours(zone, date(2025, 1, 1), 5 + 29.6 / 60).strftime("%H:%M %z") == "05:30 +0500"
+    assert clock.at_hours(zone, date(2025, 1, 1), 24.5).strftime("%Y-%m-%d %H:%M") == "2025-01-02 00:30"
+
+
+def test_schedule_puts_evening_times_before_dhuhr_on_the_next_day():
+    zone = clock.zone_for("Asia/Karachi")
+    timings = {"Fajr": 4.0, "Dhuhr": 12.5, "Maghrib": 19.0, "Isha": 0.75, "Sunrise": float("nan")}
+    events = clock.schedule(zone, date(2025, 6, 1), timings, ["Isha", "Sunrise", "Maghrib", "Dhuhr", "Fajr"])
+    assert named(events) == [
+        ("Fajr", "2025-06-01 04:00 +0500"),
+        ("Dhuhr", "2025-06-01 12:30 +0500"),
+        ("Maghrib", "2025-06-01 19:00 +0500"),
+        ("Isha", "2025-06-02 00:45 +0500"),
+    ]
+
+
+def test_next_event():
+    zone = clock.zone_for("Asia/Karachi")
+    events = clock.schedule(zone, date(2025, 6, 1), {"Fajr": 4.0, "Dhuhr": 12.5}, ["Fajr", "Dhuhr"])
+    assert clock.next_event(events, events[0][1] - timedelta(seconds=1))[0] == "Fajr"
+    assert clock.next_event(events, events[0][1])[0] == "Dhuhr"
+    assert clock.next_event(events, events[1][1]) is None
+
+
+def test_after_isha_the_next_prayer_is_tomorrows_fajr(monkeypatch):
+    schedule = at(LONDON, utc(2025, 1, 15, 23, 30), monkeypatch)
+    name, when = schedule["next"]
+    assert (name, when.date()) == ("Fajr", date(2025, 1, 16))
+    assert [event[1].date() for event in schedule["events"]] == [date(2025, 1, 15)] * 6
+
+
+def test_an_isha_after_midnight_is_still_next(monkeypatch):
+    # At Oslo's midsummer Isha falls after midnight, so just after
+    # midnight the previous day's Isha is still to come
+    name, when = at(OSLO, utc(2025, 6, 21, 22, 5), monkeypatch)["next"]
+    assert (name, when.strftime("%Y-%m-%d %H:%M")) == ("Isha", "2025-06-22 00:12")
+    assert at(OSLO, utc(2025, 6, 21, 22, 30), monkeypatch)["next"][0] == "Fajr"
+
+
+def test_times_without_a_value_are_skipped(monkeypatch):
+    # With no high latitude rule there is no Fajr or Isha at Oslo in June
+    schedule = at(OSLO, utc(2025, 6, 21, 12), monkeypatch, latitude_adjustment=0)
+    assert [name for name, _ in schedule["events"]] == ["Sunrise", "Dhuhr", "Asr", "Maghrib"]
+    assert schedule["next"][0] == "Asr"
+
+
+@pytest.mark.parametrize("day, offset", [(date(2025, 3, 30), "+0100"), (date(2025, 10, 26), "+0000")])
+def test_dst_days_use_the_days_own_offset(monkeypatch, day, offset):
+    moment = utc(day.year, day.month, day.day, 12)
+    schedule = at(LONDON, moment, monkeypatch)
+    assert {when.strftime("%z") for _, when in schedule["events"]} == {offset}
+    before = at(LONDON, moment - timedelta(days=1), monkeypatch)["events"]
+    # The times move by about the clock change, not by a whole hour
+    # more or less than it
+    for (name, when), (_, previous) in zip(schedule["events"], before):
+        assert abs((when - previous) - timedelta(days=1)) < timedelta(minutes=10), name
+    wall = [when.hour * 60 + when.minute for _, when in schedule["events"]]
+    wall_before = [when.hour * 60 + when.minute for _, when in before]
+    shift = 60 if offset == "+0100" else -60
+    assert all(abs(now - then - shift) < 10 for now, then in zip(wall, wall_before))
+
+
+def test_the_night_of_a_clock_change_finds_the_next_fajr(monkeypatch):
+    # 23:30 on the Saturday before the clocks go forward; Fajr is after
+    # the change, in summer time
+    name, when = at(LONDON, utc(2025, 3, 29, 23, 30), monkeypatch)["next"]
+    assert (name, when.strftime("%Y-%m-%d %z")) == ("Fajr", "2025-03-30 +0100")
+
+
+def test_format_duration():
+    assert clock.format_duration(timedelta(minutes=125)) == "2 h 05 min"
+    assert clock.format_duration(timedelta(minutes=11, seconds=1)) == "12 min"
+    assert clock.format_duration(timedelta(seconds=-5)) == "0 min"
@@ -0,0 +1,87 @@
+import gc
+import weakref
+
+import pytest
+
+from islamic_hub.corpus import QuranCorpus
+from tests.conftest import quran_edition
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    corpus = QuranCorpus(str(tmp_path / "corpus.sqlite3"))
+    corpus.install_edition(quran_edition("en.asad"))
+    return corpus
+
+
+def test_missing_database_reads_nothing(tmp_path):
+    corpus = QuranCorpus(str(tmp_path / "missing.sqlite3"))
+    assert corpus.installed_editions() == {}
+    assert corpus.surahs() == []
+    assert corpus.surah(1, "en.asad") is None
+    assert corpus.ayah(1, "en.asad") is None
+    assert corpus.ayah("1:1", "en.asad") is None
+    assert not (tmp_path / "missing.sqlite3").exists()
+
+
+def test_missing_edition_reads_nothing(corpus):
+    assert corpus.has_edition("en.asad")
+    assert not corpus.has_edition("ur.jalandhry")
+    assert corpus.surah(1, "ur.jalandhry") is None
+    assert corpus.ayah(1, "ur.jalandhry") is None
+    assert corpus.juz(1, "ur.jalandhry") is None
+
+
+def test_incomplete_edition_is_refused(corpus):
+    data = quran_edition("ur.jalandhry")
+    data["surahs"][0]["ayahs"].pop()
+    with pytest.raises(ValueError):
+        corpus.install_edition(data)
+    assert not corpus.has_edition("ur.jalandhry")
+
+
+def test_surah(corpus):
+    surah = corpus.surah("2", "en.asad")
+    assert (surah["number"], surah["englishName"], surah["numberOfAyahs"]) == (2, "Surah 2", 54)
+    assert surah["edition"]["identifier"] == "en.asad"
+    assert [ayah["numberInSurah"] for ayah in surah["ayahs"]] == list(range(1, 55))
+    assert surah["ayahs"][0]["text"] == "ayah 55"
+    assert "surah" not in surah["ayahs"][0]
+    assert corpus.surah(115, "en.asad") is None
+
+
+def test_ayah_by_number_and_reference(corpus):
+    ayah = corpus.ayah(56, "en.asad")
+    assert (ayah["text"], ayah["numberInSurah"], ayah["surah"]["number"]) == ("ayah 56", 2, 2)
+    assert ayah["edition"]["identifier"] == "en.asad"
+    assert corpus.ayah("2:2", "en.asad") == ayah
+    assert corpus.ayah("2:99", "en.asad") is None
+    assert corpus.ayah(6237, "en.asad") is None
+
+
+def test_juz_lists_its_surahs(corpus):
+    juz = corpus.juz(1, "en.asad")
+    assert juz["ayahs"][0]["number"] == 1
+    assert all(ayah["juz"] == 1 for ayah in juz["ayahs"])
+    assert list(juz["surahs"])[:2] == ["1", "2"]
+
+
+def test_reads_are_cached_per_corpus(tmp_path, corpus):
+    other = QuranCorpus(str(tmp_path / "other.sqlite3"))
+    other.install_edition(quran_edition("en.asad", text=lambda number: f"other {number}"))
+    assert corpus.ayah(1, "en.asad")["text"] == "ayah 1"
+    assert other.ayah(1, "en.asad")["text"] == "other 1"
+    assert corpus.ayah(1, "en.asad") is corpus.ayah(1, "en.asad")
+    assert corpus._read.cache_info().currsize == 1
+
+    reference = weakref.ref(other)
+    del other
+    gc.collect()
+    assert reference() is None
+
+
+def test_reads_see_an_edition_installed_by_another_process(tmp_path, corpus):
+    assert corpus.surah(1, "ur.jalandhry") is None
+    writer = QuranCorpus(corpus.path)
+    writer.install_edition(quran_edition("ur.jalandhry", "ur", lambda number: f"urdu {number}"))
+    assert corpus.ayah(1, "ur.jalandhry")["text"] == "urdu 1"
@@ -0,0 +1,166 @@
+import os
+import threading
+
+import pytest
+
+from islamic_hub import counters
+from islamic_hub.counters import CounterStore, MemoryBackend, SQLiteBackend
+
+DAY = "2025-03-01"
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def backend(request, tmp_path):
+    if request.param == "memory":
+        return MemoryBackend()
+    return SQLiteBackend(os.path.join(str(tmp_path), "counters.sqlite3"))
+
+
+def test_reports_are_totals_not_changes(backend):
+    store = CounterStore(backend)
+    store.record("durood", "a", DAY, 10)
+    store.record("durood", "a", DAY, 10)
+    assert store.user_total("durood", "a", DAY) == 10
+    store.flush()
+    store.record("durood", "a", DAY, 10)
+    store.flush()
+    assert backend.user_total("durood", "a", DAY) == 10
+    assert backend.day_total("durood", DAY) == 10
+
+
+def test_a_device_that_is_behind_cannot_lower_the_total(backend):
+    store = CounterStore(backend)
+    store.record("durood", "a", DAY, 40)
+    store.flush()
+    store.record("durood", "a", DAY, 25)
+    assert store.user_total("durood", "a", DAY) == 40
+    store.flush()
+    assert backend.user_total("durood", "a", DAY) == 40
+    assert store.day_total("durood", DAY) == 40
+
+
+def test_reset_lowers_the_user_total_but_not_the_community_total(backend):
+    store = CounterStore(backend)
+    store.record("durood", "a", DAY, 40)
+    store.record("durood", "b", DAY, 5)
+    store.flush()
+    store.record("durood", "a", DAY, 0, reset=True)
+    store.record("durood", "a", DAY, 3)
+    assert store.user_total("durood", "a", DAY) == 3
+    store.flush()
+    assert backend.user_total("durood", "a", DAY) == 3
+    # The 3 counted since the reset are new recitations
+    assert store.day_total("durood", DAY) == 48
+    store.record("durood", "a", DAY, 13)
+    store.flush()
+    assert store.day_total("durood", DAY) == 58
+
+
+def test_counters_and_days_are_separate(backend):
+    store = CounterStore(backend)
+    store.record("durood", "a", DAY, 7)
+    store.record("durood", "a", "2025-03-02", 2)
+    store.record("istighfar", "a", DAY, 4)
+    store.flush()
+    assert store.user_total("durood", "a", DAY) == 7
+    assert store.user_total("durood", "a", "2025-03-02") == 2
+    assert store.day_total("istighfar", DAY) == 4
+    assert store.user_total("durood", "b", DAY) == 0
+
+
+def test_the_same_report_reaching_two_workers_counts_once(tmp_path):
+    path = os.path.join(str(tmp_path), "counters.sqlite3")
+    first, second = CounterStore(SQLiteBackend(path)), CounterStore(SQLiteBackend(path))
+    first.record("durood", "a", DAY, 10)
+    first.flush()
+    # Both workers saw 10 stored when the report of 40 arrived
+    first.record("durood", "a", DAY, 40)
+    second.record("durood", "a", DAY, 40)
+    first.flush()
+    second.flush()
+    assert first.user_total("durood", "a", DAY) == second.user_total("durood", "a", DAY) == 40
+    assert first.day_total("durood", DAY) == 40
+
+
+def test_concurrent_reports_from_many_threads(tmp_path):
+    store = CounterStore(SQLiteBackend(os.path.join(str(tmp_path), "counters.sqlite3")), flush_interval=0.01)
+
+    def tap(worker):
+        for count in range(1, 201):
+            store.record("durood", f"user-{worker % 4}", DAY, count)
+
+    threads = [threading.Thread(target=tap, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    store.flush()
+    assert [store.user_total("durood", f"user-{i}", DAY) for i in range(4)] == [200] * 4
+    assert store.day_total("durood", DAY) == 800
+
+
+class FailingBackend(MemoryBackend):
+    def __init__(self):
+        MemoryBackend.__init__(self)
+        self.fail = True
+
+    def apply(self, reports):
+        if self.fail:
+            raise IOError("database is locked")
+        return MemoryBackend.apply(self, reports)
+
+
+def test_failed_flush_keeps_the_reports():
+    backend = FailingBackend()
+    store = CounterStore(backend)
+    store.record("durood", "a", DAY, 0, reset=True)
+    assert store.flush() == 0
+    store.record("durood", "a", DAY, 12)
+    assert store.user_total("durood", "a", DAY) == 12
+    backend.fail = False
+    assert store.flush() == 1
+    assert store.stats()["errors"] == 1
+    assert backend.user_total("durood", "a", DAY) == 12
+    assert backend.day_total("durood", DAY) == 12
+
+
+def test_counts_before_a_reset_in_the_same_batch_are_kept(backend):
+    store = CounterStore(backend)
+    store.record("durood", "a", DAY, 5)
+    store.flush()
+    store.record("durood", "a", DAY, 12)
+    store.record("durood", "a", DAY, 0, reset=True)
+    store.record("durood", "a", DAY, 4)
+    store.record("durood", "a", DAY, 0, reset=True)
+    store.record("durood", "a", DAY, 2)
+    store.record("durood", "b", DAY, 1)
+    assert store.user_total("durood", "a", DAY) == 2
+    store.flush()
+    assert backend.user_total("durood", "a", DAY) == 2
+    assert store.day_total("durood", DAY) == 12 + 4 + 2 + 1
+
+
+def test_counts_over_the_maximum_are_dropped(backend):
+    store = CounterStore(backend)
+    store.record("durood", "a", DAY, 10 ** 20)
+    store.record("durood", "b", DAY, counters.MAX_COUNT)
+    assert store.user_total("durood", "a", DAY) == 0
+    assert store.flush() == 1
+    assert store.day_total("durood", DAY) == counters.MAX_COUNT
+    assert store.stats()["dropped"] == 1
+
+
+def test_a_row_the_database_refuses_does_not_hold_up_the_batch(tmp_path, monkeypatch):
+    # Past the maximum, SQLite cannot bind the count at all
+    monkeypatch.setattr(counters, "MAX_COUNT", 10 ** 30)
+    backend = SQLiteBackend(str(tmp_path / "counters.sqlite3"))
+    store = CounterStore(backend)
+    store.record("durood", "a", DAY, 5)
+    store.record("durood", "b", DAY, 10 ** 20)
+    store.record("durood", "c", DAY, 7)
+    assert store.flush() == 2
+    assert [backend.user_total("durood", user, DAY) for user in "abc"] == [5, 0, 7]
+    assert backend.day_total("durood", DAY) == 12
+    store.record("durood", "a", DAY, 6)
+    assert store.flush() == 1
+    assert store.stats() == {"reports": 4, "flushes": 2, "rows_written": 3, "errors": 0, "dropped": 1, "pending": 0}
@@ -0,0 +1,183 @@
+import os
+import sqlite3
+import threading
+
+import pytest
+
+from islamic_hub import disk_cache
+from islamic_hub.disk_cache import DiskCache
+from islamic_hub.response_cache import DAY
+
+SURAH = "http://api.alquran.cloud/v1/surah/1/en.asad"
+EDITIONS = "http://api.alquran.cloud/v1/edition"
+
+
+class StubResponse:
+    def __init__(self, status_code, content=b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+
+# Stands in for the pooled client: answers each GET with the next queued
+# response (or raises it) and records the conditional headers it was sent
+class StubSession:
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def get(self, url, timeout=10, headers=None):
+        self.requests.append((url, headers or {}))
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+class Clock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(disk_cache.time, "time", clock.time)
+    return clock
+
+
+def cache_with(tmp_path, *responses, **kwargs):
+    session = StubSession(*responses)
+    return DiskCache(str(tmp_path / "http_cache.sqlite3"), session.get, **kwargs), session
+
+
+def test_fresh_rows_are_served_from_disk(tmp_path, clock):
+    cache, session = cache_with(tmp_path, StubResponse(200, b'{"surah": 1}', {"Content-Type": "application/json"}))
+    assert cache.get(SURAH).content == b'{"surah": 1}'
+    clock.now += 60
+    response = cache.get(SURAH)
+    assert (response.status_code, response.json()) == (200, {"surah": 1})
+    assert response.headers == {"Content-Type": "application/json"}
+    assert response.fetched_at == clock.now - 60
+    assert len(session.requests) == 1
+    assert cache.stats()["hits"] == 1
+
+
+def test_expired_rows_are_revalidated_and_a_304_keeps_the_body(tmp_path, clock):
+    cache, session = cache_with(
+        tmp_path,
+        StubResponse(200, b"v1", {"ETag": '"abc"', "Last-Modified": "Sat, 17 Oct 2026 10:00:00 GMT"}),
+        StubResponse(304),
+    )
+    cache.get(EDITIONS)
+    clock.now += DAY + 1
+    response = cache.get(EDITIONS)
+    assert response.content == b"v1"
+    assert response.fetched_at == clock.now
+    assert session.requests[1] == (EDITIONS, {
+        "If-None-Match": '"abc"', "If-Modified-Since": "Sat, 17 Oct 2026 10:00:00 GMT"
+    })
+    # The 304 restarted the row's TTL
+    clock.now += DAY - 1
+    assert cache.get(EDITIONS).content == b"v1"
+    assert len(session.requests) == 2
+    assert cache.stats()["revalidated"] == 1
+
+
+def test_a_changed_resource_replaces_the_row(tmp_path, clock):
+    cache, session = cache_with(tmp_path, StubResponse(200, b"v1", {"ETag": '"1"'}), StubResponse(200, b"v2", {"ETag": '"2"'}))
+    cache.get(EDITIONS)
+    clock.now += DAY + 1
+    assert cache.get(EDITIONS).content == b"v2"
+    clock.now += 1
+    assert cache.get(EDITIONS).content == b"v2"
+    assert len(session.requests) == 2
+
+
+def test_rows_without_validators_are_fetched_unconditionally(tmp_path, clock):
+    cache, session = cache_with(tmp_path, StubResponse(200, b"v1"), StubResponse(200, b"v2"))
+    cache.get(EDITIONS)
+    clock.now += DAY + 1
+    cache.get(EDITIONS)
+    assert session.requests[1] == (EDITIONS, {})
+
+
+@pytest.mark.parametrize("failure", [ConnectionError("offline"), StubResponse(503)])
+def test_the_last_copy_is_served_when_the_upstream_fails(tmp_path, clock, failure):
+    cache, session = cache_with(tmp_path, StubResponse(200, b"v1", {"ETag": '"1"'}), failure)
+    cache.get(EDITIONS)
+    clock.now += DAY + 1
+    response = cache.get(EDITIONS)
+    assert (response.status_code, response.content) == (200, b"v1")
+    assert cache.stats()["stale_on_error"] == 1
+
+
+def test_failures_without_a_copy_reach_the_caller(tmp_path, clock):
+    cache, session = cache_with(tmp_path, ConnectionError("offline"), StubResponse(404, b"missing"))
+    with pytest.raises(ConnectionError):
+        cache.get(EDITIONS)
+    assert cache.get(EDITIONS).status_code == 404
+    assert cache.stats()["entries"] == 0
+
+
+def test_least_recently_read_rows_are_evicted_over_budget(tmp_path, clock):
+    # Random bodies, so they stay about 4 KB each once compressed
+    responses = [StubResponse(200, os.urandom(4000)) for i in range(3)]
+    cache, session = cache_with(tmp_path, *responses, max_bytes=10_000)
+    urls = [f"{EDITIONS}/{i}" for i in range(3)]
+    cache.get(urls[0])
+    clock.now += disk_cache.ACCESS_GRANULARITY + 1
+    cache.get(urls[1])
+    clock.now += disk_cache.ACCESS_GRANULARITY + 1
+    # Reading the first row again makes the second the least recent
+    cache.get(urls[0])
+    cache.get(urls[2])
+    rows = sqlite3.connect(cache.path).execute("SELECT url FROM responses ORDER BY url").fetchall()
+    assert [url for url, in rows] == [urls[0], urls[2]]
+    assert cache.stats()["evictions"] == 1
+
+
+def test_idle_rows_are_dropped(tmp_path, clock):
+    cache, session = cache_with(tmp_path, StubResponse(200, b"old"), StubResponse(200, b"new"), max_idle=DAY)
+    cache.get(f"{EDITIONS}/old")
+    clock.now += DAY + 1
+    cache.get(f"{EDITIONS}/new")
+    assert cache.stats()["entries"] == 1
+
+
+def test_processes_share_the_database_in_wal_mode(tmp_path):
+    path = str(tmp_path / "http_cache.sqlite3")
+    fetches = []
+    lock = threading.Lock()
+
+    def fetch(url, timeout=10, headers=None):
+        with lock:
+            fetches.append(url)
+        return StubResponse(200, url.encode())
+
+    # One cache per "process", each with its own connections
+    caches = [DiskCache(path, fetch) for _ in range(4)]
+    urls = [f"{EDITIONS}/{i}" for i in range(20)]
+    errors = []
+
+    def worker(cache):
+        try:
+            for _ in range(3):
+                for url in urls:
+                    assert cache.get(url).content == url.encode()
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(cache,)) for cache in caches for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    assert sqlite3.connect(path).execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert caches[0].stats()["entries"] == len(urls)
+    # Rows written by one cache are read by the others instead of fetched again
+    assert len(fetches) < len(urls) * len(threads)
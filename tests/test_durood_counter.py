@@ -0,0 +1,69 @@
+import pytest
+
+from islamic_hub import counters
+from islamic_hub.counters import CounterStore, MemoryBackend
+from islamic_hub.pages import durood_shareef
+
+DAY = "2025-03-01"
+
+
+class SessionState(dict):
+    __getattr__ = dict.__getitem__
+    __setattr__ = dict.__setitem__
+
+
+@pytest.fixture
+def store(monkeypatch):
+    store = CounterStore(MemoryBackend())
+    monkeypatch.setattr(counters, "_store", store)
+    return store
+
+
+def send(monkeypatch, **batch):
+    state = SessionState(durood_counter=dict({"day": DAY, "user": "device"}, **batch))
+    monkeypatch.setattr(durood_shareef.st, "session_state", state)
+    durood_shareef.save_durood_batch()
+    return state
+
+
+def test_batches_set_the_days_total(store, monkeypatch):
+    state = send(monkeypatch, count=33, batch=1)
+    assert state.durood_count == 33 and state.durood_day == DAY
+    assert send(monkeypatch, count=50, batch=2).durood_count == 50
+    store.flush()
+    assert store.user_total(durood_shareef.DUROOD_COUNTER, "browser:device", DAY) == 50
+    assert store.day_total(durood_shareef.DUROOD_COUNTER, DAY) == 50
+
+
+def test_a_device_that_is_behind_gets_the_server_total(store, monkeypatch):
+    send(monkeypatch, count=50)
+    assert send(monkeypatch, count=10).durood_count == 50
+
+
+def test_reset(store, monkeypatch):
+    send(monkeypatch, count=50)
+    assert send(monkeypatch, count=0, reset=True).durood_count == 0
+    assert send(monkeypatch, count=3).durood_count == 3
+    store.flush()
+    assert store.day_total(durood_shareef.DUROOD_COUNTER, DAY) == 53
+
+
+def test_bad_batches(store, monkeypatch):
+    state = send(monkeypatch, count=-5, day="yesterday", user="x" * 500)
+    assert state.durood_count == 0
+    assert state.durood_day != "yesterday"
+
+    send(monkeypatch, count=40)
+    for count in ("abc", None, "", [], {}, True, "12.5", float("nan"), float("inf"),
+                  10 ** 20, "1" * 40, durood_shareef.MAX_DAILY_COUNT + 1):
+        assert send(monkeypatch, count=count).durood_count == 40, count
+        assert send(monkeypatch, count=count, reset=True).durood_count == 40, count
+    store.flush()
+    assert store.stats()["errors"] == 0
+    assert store.day_total(durood_shareef.DUROOD_COUNTER, DAY) == 40
+
+    # Numbers sent as text and the largest real count are accepted
+    assert send(monkeypatch, count="41").durood_count == 41
+    assert send(monkeypatch, count=durood_shareef.MAX_DAILY_COUNT).durood_count == durood_shareef.MAX_DAILY_COUNT
+    assert durood_shareef.get_counter_user({"user": "x" * 500}) == "browser:" + "x" * 64
+    assert durood_shareef.get_counter_user({}) == "browser:anonymous"
@@ -0,0 +1,106 @@
+import gzip
+
+import pytest
+
+from islamic_hub import gazetteer
+from islamic_hub.gazetteer import Gazetteer, fold, label
+
+# name, country, latitude, longitude, time zone, population, aliases
+CITIES = [
+    ("Hyderabad", "IN", 17.38405, 78.45636, "Asia/Kolkata", 6809970, "Haidarabad"),
+    ("Hyderabad", "PK", 25.39242, 68.37366, "Asia/Karachi", 1386330, ""),
+    ("Hyde", "GB", 53.45131, -2.07943, "Europe/London", 34003, ""),
+    ("Mecca", "SA", 21.42664, 39.82563, "Asia/Riyadh", 1323624, "Makkah|Mekka|Makkah al Mukarramah"),
+    ("Makkah Town", "XX", 10.0, 10.0, "UTC", 20000, ""),
+    ("São Paulo", "BR", -23.5475, -46.63611, "America/Sao_Paulo", 10021295, "Sao Paulo"),
+    ("Ar-Riyad", "SA", 24.68773, 46.72185, "Asia/Riyadh", 4205961, "Riyadh|Riyad"),
+    ("Lahore", "PK", 31.558, 74.35071, "Asia/Karachi", 6310888, ""),
+]
+
+
+@pytest.fixture(scope="module")
+def cities(tmp_path_factory):
+    path = tmp_path_factory.mktemp("gazetteer") / "cities.tsv.gz"
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        for city in CITIES:
+            f.write("\t".join(str(field) for field in city) + "\n")
+    return Gazetteer(str(path))
+
+
+def names(results):
+    return [(city["city"], city["country"]) for city in results]
+
+
+@pytest.mark.parametrize("text, folded", [
+    ("São Paulo", "sao paulo"),
+    ("Ar-Riyad", "ar riyad"),
+    ("  MAKKAH  al-Mukarramah ", "makkah al mukarramah"),
+    ("Zürich", "zurich"),
+    ("--", ""),
+])
+def test_fold(text, folded):
+    assert fold(text) == folded
+
+
+def test_city_record(cities):
+    assert len(cities) == len(CITIES)
+    results = cities.search("lahore")
+    assert results == [{
+        "city": "Lahore", "country": "PK", "country_name": "Pakistan", "latitude": 31.558,
+        "longitude": 74.35071, "timezone": "Asia/Karachi", "population": 6310888,
+    }]
+    assert label(results[0]) == "Lahore, Pakistan"
+
+
+def test_ambiguous_names_list_the_most_populous_first(cities):
+    assert names(cities.search("Hyderabad")) == [("Hyderabad", "IN"), ("Hyderabad", "PK")]
+
+
+@pytest.mark.parametrize("query", ["Hyderabad, PK", "hyderabad,pakistan", "Hyderabad, Pak"])
+def test_a_country_narrows_the_results(cities, query):
+    assert names(cities.search(query)) == [("Hyderabad", "PK")]
+
+
+def test_an_unknown_country_matches_nothing(cities):
+    assert cities.search("Hyderabad, Atlantis") == []
+
+
+def test_exact_names_come_before_longer_ones(cities):
+    assert names(cities.search("hyde")) == [("Hyde", "GB"), ("Hyderabad", "IN"), ("Hyderabad", "PK")]
+
+
+def test_alternate_names_find_the_city(cities):
+    assert names(cities.search("Makkah")) == [("Mecca", "SA"), ("Makkah Town", "XX")]
+    assert names(cities.search("mekka")) == [("Mecca", "SA")]
+    assert names(cities.search("Riyadh")) == [("Ar-Riyad", "SA")]
+    # A city matching by several aliases is listed once
+    assert names(cities.search("riya")) == [("Ar-Riyad", "SA")]
+
+
+def test_accents_and_punctuation_are_ignored(cities):
+    assert names(cities.search("sao paulo")) == [("São Paulo", "BR")]
+    assert names(cities.search("ar riyad")) == [("Ar-Riyad", "SA")]
+
+
+def test_limit_and_empty_queries(cities):
+    assert len(cities.search("h", limit=2)) == 2
+    assert cities.search("") == []
+    assert cities.search(" , PK") == []
+    assert cities.search("Nowhere") == []
+
+
+def test_a_missing_data_file(tmp_path, monkeypatch):
+    missing = str(tmp_path / "cities.tsv.gz")
+    with pytest.raises(FileNotFoundError):
+        Gazetteer(missing)
+    monkeypatch.setattr(gazetteer, "_gazetteer", None)
+    monkeypatch.setattr(gazetteer, "Gazetteer", lambda: Gazetteer(missing))
+    assert gazetteer.get_gazetteer() is None
+
+
+def test_the_bundled_gazetteer():
+    cities = gazetteer.get_gazetteer()
+    assert len(cities) > 30000
+    assert cities.search("Makkah", limit=1) == cities.search("Mecca", limit=1)
+    assert cities.search("Mecca", limit=1)[0]["country"] == "SA"
+    assert cities.search("Karachi", limit=1)[0]["timezone"] == "Asia/Karachi"
@@ -0,0 +1,90 @@
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from islamic_hub import hijri
+from islamic_hub.ummalqura import FIRST_YEAR, LAST_YEAR, MONTH_STARTS
+
+# Dates announced from the Umm al-Qura calendar
+KNOWN_DATES = [
+    (date(1924, 8, 1), (1343, 1, 1)),
+    (date(2025, 3, 1), (1446, 9, 1)),
+    (date(2025, 3, 30), (1446, 10, 1)),
+    (date(2025, 6, 26), (1447, 1, 1)),
+    (date(2077, 11, 16), (1500, 12, 30)),
+]
+
+
+@pytest.mark.parametrize("day, expected", KNOWN_DATES)
+def test_known_umm_al_qura_dates(day, expected):
+    assert hijri.from_gregorian(day) == expected
+    assert hijri.to_gregorian(*expected) == day
+
+
+def test_month_table():
+    lengths = np.diff(MONTH_STARTS).tolist()
+    assert len(lengths) == (LAST_YEAR - FIRST_YEAR + 1) * 12
+    # The early official calendar has a few 28 and 31 day months; every
+    # month from 1365 on has 29 or 30 days
+    assert set(lengths[(1365 - FIRST_YEAR) * 12:]) == {29, 30}
+    assert set(lengths) == {28, 29, 30, 31}
+
+
+def test_tabular_epoch():
+    # 16 July 622 in the Julian calendar
+    assert hijri.from_gregorian(date(622, 7, 19), hijri.TABULAR) == (1, 1, 1)
+    assert hijri.to_gregorian(1, 1, 1, hijri.TABULAR) == date(622, 7, 19)
+
+
+@pytest.mark.parametrize("variant", hijri.VARIANTS)
+def test_every_day_round_trips(variant):
+    # The whole Umm al-Qura table, and a year past each end of it
+    first, last = date(1923, 8, 1), date(2078, 11, 16)
+    previous = None
+    for ordinal in range(first.toordinal(), last.toordinal() + 1):
+        day = date.fromordinal(ordinal)
+        converted = hijri.from_gregorian(day, variant)
+        assert hijri.to_gregorian(*converted, variant) == day
+        if previous is not None:
+            year, month, day_of_month = previous
+            following = (year, month, day_of_month + 1) if converted[2] != 1 else \
+                ((year + 1, 1, 1) if month == 12 else (year, month + 1, 1))
+            assert converted == following, day
+        previous = converted
+
+
+@pytest.mark.parametrize("variant", hijri.VARIANTS)
+def test_arrays_match_single_dates(variant):
+    days = np.arange(np.datetime64("1920-01-01"), np.datetime64("2080-01-01"), np.timedelta64(37, "D"))
+    years, months, days_of_month = hijri.from_gregorian_array(days, variant)
+    expected = [hijri.from_gregorian(day, variant) for day in days.astype(object)]
+    assert list(zip(years.tolist(), months.tolist(), days_of_month.tolist())) == expected
+    assert (hijri.to_gregorian_array(years, months, days_of_month, variant) == days).all()
+
+
+def test_month_range_and_observances():
+    assert hijri.month_range(1446, hijri.RAMADAN) == (date(2025, 3, 1), date(2025, 3, 29))
+    observances = {name: (first, last) for name, first, last in hijri.observances(1446)}
+    assert observances["Eid al-Fitr"] == (date(2025, 3, 30), date(2025, 4, 1))
+    assert observances["Ramadan"][1] + timedelta(days=1) == observances["Eid al-Fitr"][0]
+
+
+def test_next_ramadan_year():
+    assert hijri.next_ramadan_year(date(2025, 3, 15)) == 1446
+    assert hijri.next_ramadan_year(date(2025, 4, 1)) == 1447
+
+
+def test_date_block_matches_aladhan():
+    assert hijri.date_block(date(2025, 3, 1)) == {
+        "date": "01-09-1446",
+        "day": "01",
+        "weekday": {"en": "Al Sabt"},
+        "month": {"number": 9, "en": hijri.MONTHS[8]},
+        "year": "1446",
+    }
+
+
+def test_unknown_variant():
+    with pytest.raises(ValueError):
+        hijri.from_gregorian(date(2025, 1, 1), "astronomical")
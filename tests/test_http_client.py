@@ -0,0 +1,104 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from islamic_hub import http_client
+from islamic_hub.http_client import RETRY_STATUSES, USER_AGENT, HttpClient, JitteredRetry
+
+
+def test_one_pooled_adapter_with_retries_for_both_schemes():
+    client = HttpClient(pool_size=7, per_host_limit=3, retries=4, backoff_factor=0.25)
+    adapter = client.session.get_adapter("https://api.alquran.cloud/v1/juz/1")
+    assert client.session.get_adapter("http://api.alquran.cloud/v1/juz/1") is adapter
+    assert (adapter._pool_connections, adapter._pool_maxsize) == (7, 7)
+
+    retry = adapter.max_retries
+    assert isinstance(retry, JitteredRetry)
+    assert (retry.total, retry.connect, retry.read, retry.status) == (4, 4, 4, 4)
+    assert retry.backoff_factor == 0.25
+    assert set(retry.status_forcelist) == set(RETRY_STATUSES)
+    assert not retry.raise_on_status
+    assert client.session.headers["User-Agent"] == USER_AGENT
+    assert client.per_host_limit == 3
+    client.close()
+
+
+def test_backoff_is_jittered_up_to_the_exponential_delay(monkeypatch):
+    retry = JitteredRetry(total=5, backoff_factor=1).increment().increment().increment()
+    base = super(JitteredRetry, retry).get_backoff_time()
+    assert base > 0
+    monkeypatch.setattr(http_client.random, "uniform", lambda low, high: (low, high))
+    assert retry.get_backoff_time() == (0, base)
+    assert JitteredRetry(total=5, backoff_factor=1).get_backoff_time() == 0
+
+
+def test_semaphore_caps_requests_in_flight_per_host():
+    client = HttpClient(per_host_limit=2, retries=0)
+    lock = threading.Lock()
+    in_flight = {}
+    peak = {}
+
+    def fake_get(url, timeout=None, **kwargs):
+        host = url.split("/")[2]
+        with lock:
+            in_flight[host] = in_flight.get(host, 0) + 1
+            peak[host] = max(peak.get(host, 0), in_flight[host])
+        time.sleep(0.05)
+        with lock:
+            in_flight[host] -= 1
+        return host
+
+    client.session.get = fake_get
+    urls = [f"http://{host}/{i}" for i in range(8) for host in ("a.example", "b.example")]
+    threads = [threading.Thread(target=client.get, args=(url,)) for url in urls]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert peak == {"a.example": 2, "b.example": 2}
+    assert client._host_limit("http://a.example/x") is client._host_limit("http://a.example/y")
+
+
+class _FlakyHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.server.requests += 1
+        status = 503 if self.server.requests <= self.server.failures else 200
+        body = b'{"status": "OK"}'
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def flaky_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FlakyHandler)
+    server.requests = 0
+    server.failures = 0
+    server.url = f"http://127.0.0.1:{server.server_address[1]}/"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_failed_gets_are_retried(flaky_server):
+    flaky_server.failures = 2
+    client = HttpClient(retries=2, backoff_factor=0)
+    response = client.get(flaky_server.url)
+    assert (response.status_code, flaky_server.requests) == (200, 3)
+    client.close()
+
+
+def test_retries_are_bounded(flaky_server):
+    flaky_server.failures = 10
+    client = HttpClient(retries=1, backoff_factor=0)
+    response = client.get(flaky_server.url)
+    assert (response.status_code, flaky_server.requests) == (503, 2)
+    client.close()
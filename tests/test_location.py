@@ -0,0 +1,102 @@
+from types import SimpleNamespace
+
+import pytest
+
+from islamic_hub import settings
+from islamic_hub.pages import prayer_times
+
+IPINFO = {"city": "Karachi", "country": "PK", "loc": "24.8607,67.0011", "timezone": "Asia/Karachi"}
+
+
+class SessionState(dict):
+    __getattr__ = dict.__getitem__
+    __setattr__ = dict.__setitem__
+
+
+class FakeResponse:
+    def __init__(self, status_code, data=None):
+        self.status_code = status_code
+        self._data = data
+
+    def json(self):
+        return self._data
+
+
+# A session of the page: its own session state, the time zone its browser
+# reported, and a clock the test moves forward
+@pytest.fixture
+def session(monkeypatch):
+    session = SimpleNamespace(now=1_000_000.0)
+    fake_st = SimpleNamespace(session_state=SessionState(), context=SimpleNamespace(timezone=None))
+    monkeypatch.setattr(prayer_times, "st", fake_st)
+    monkeypatch.setattr(prayer_times.time, "time", lambda: session.now)
+    session.st = fake_st
+    return session
+
+
+@pytest.fixture
+def ipinfo(monkeypatch):
+    requests = []
+    answer = SimpleNamespace(response=FakeResponse(200, dict(IPINFO)))
+
+    def get(url, timeout=10):
+        requests.append(url)
+        if isinstance(answer.response, Exception):
+            raise answer.response
+        return answer.response
+
+    monkeypatch.setattr(prayer_times.http_client, "get", get)
+    answer.requests = requests
+    return answer
+
+
+def test_the_location_is_looked_up_once_per_session(session, ipinfo):
+    location = prayer_times.get_session_location()
+    assert (location["city"], location["latitude"], location["timezone"], location["source"]) == \
+        ("Karachi", 24.8607, "Asia/Karachi", "ip")
+    session.now += settings.LOCATION_TTL - 1
+    assert prayer_times.get_session_location() is location
+    assert len(ipinfo.requests) == 1
+
+    # Another session looks it up for itself
+    session.st.session_state = SessionState()
+    prayer_times.get_session_location()
+    assert len(ipinfo.requests) == 2
+
+
+def test_the_location_is_looked_up_again_once_it_expires(session, ipinfo):
+    prayer_times.get_session_location()
+    session.now += settings.LOCATION_TTL + 1
+    prayer_times.get_session_location()
+    assert len(ipinfo.requests) == 2
+
+
+@pytest.mark.parametrize("failure", [ConnectionError("offline"), FakeResponse(429)])
+def test_offline_the_browsers_time_zone_is_used(session, ipinfo, failure):
+    ipinfo.response = failure
+    session.st.context.timezone = "Europe/London"
+    location = prayer_times.get_session_location()
+    assert (location["city"], location["timezone"], location["source"]) == ("London", "Europe/London", "timezone")
+
+
+def test_without_a_time_zone_the_default_location_is_used(session, ipinfo):
+    ipinfo.response = ConnectionError("offline")
+    location = prayer_times.get_session_location()
+    assert (location["city"], location["timezone"], location["source"]) == ("Islamabad", "Asia/Karachi", "default")
+
+
+def test_an_offline_guess_is_retried_sooner(session, ipinfo):
+    ipinfo.response = ConnectionError("offline")
+    assert prayer_times.get_session_location()["source"] == "default"
+    session.now += settings.LOCATION_RETRY_TTL - 1
+    assert prayer_times.get_session_location()["source"] == "default"
+
+    ipinfo.response = FakeResponse(200, dict(IPINFO))
+    session.now += 2
+    assert prayer_times.get_session_location()["source"] == "ip"
+    assert len(ipinfo.requests) == 2
+
+
+def test_a_missing_time_zone_is_found_from_the_coordinates(session, ipinfo):
+    ipinfo.response = FakeResponse(200, {"city": "Karachi", "country": "PK", "loc": "24.8607,67.0011"})
+    assert prayer_times.get_session_location()["timezone"] == "Asia/Karachi"
@@ -0,0 +1,150 @@
+import importlib
+import os
+import subprocess
+import sys
+
+import pytest
+import streamlit
+from streamlit.testing.v1 import AppTest
+
+from islamic_hub import gazetteer, http_client, names, pages, settings
+from islamic_hub.pages import common
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+# Draws one page on its own, without the sidebar or the Home page the
+# full app opens on
+@pytest.fixture
+def open_page(monkeypatch):
+    monkeypatch.setattr(settings, "LOADING_DELAY", 0)
+
+    def open_page(page):
+        app = AppTest.from_string(f"from islamic_hub import pages\npages.render({page!r})", default_timeout=60)
+        app.run()
+        assert not app.exception
+        return app
+    return open_page
+
+
+def test_fragment_falls_back_to_a_plain_function(monkeypatch):
+    monkeypatch.delattr(streamlit, "fragment", raising=False)
+    monkeypatch.delattr(streamlit, "experimental_fragment", raising=False)
+    try:
+        def draw():
+            pass
+        assert importlib.reload(common).fragment(draw) is draw
+    finally:
+        monkeypatch.undo()
+        importlib.reload(common)
+
+
+def test_dua_search(open_page):
+    app = open_page("🤲 Duas Collection")
+    app.text_input[0].input("protection").run()
+    assert not app.exception
+    assert app.success[0].value.startswith("Found ")
+
+
+def test_names_of_muhammad_views(open_page):
+    app = open_page("📒 Names of Muhammad ﷺ")
+    app.radio[0].set_value("List View").run()
+    app.text_input[0].input("Light").run()
+    assert not app.exception
+    assert app.success[0].value.startswith("Found ")
+    app.radio[0].set_value("Detailed View").run()
+    assert not app.exception
+
+
+def test_asma_al_husna_search_uses_the_bundled_names(open_page, monkeypatch):
+    fetched = []
+    monkeypatch.setattr(http_client, "get", lambda url, **kwargs: fetched.append(url))
+    monkeypatch.setattr(names, "_name_indexes", {})
+    app = open_page("📋 Asma Al-Husna")
+    app.radio[0].set_value("List View").run()
+    app.text_input[0].input("Rehman").run()
+    assert not app.exception
+    assert app.success[0].value.startswith("Found ")
+    assert fetched == []
+
+
+def test_naat_search(open_page):
+    app = open_page("🎵 Naats Collection")
+    app.text_input[0].input("main banda e aasi").run()
+    assert not app.exception
+    assert app.success[0].value == "Found 2 naats matching 'main banda e aasi'"
+
+
+def test_prayer_times_without_the_city_list(open_page, monkeypatch):
+    monkeypatch.setattr(gazetteer, "get_gazetteer", lambda: None)
+    monkeypatch.setattr(http_client, "get", lambda url, **kwargs: None)
+    app = open_page("🕋 Prayer Times")
+    app.checkbox[0].uncheck().run()
+    assert not app.exception
+    assert any("city list is missing" in warning.value for warning in app.warning)
+
+
+def test_durood_search(open_page):
+    app = open_page("📿 Durood Shareef")
+    app.text_input[0].input("Ibrahim").run()
+    assert not app.exception
+    assert not app.warning
+
+
+@pytest.mark.parametrize("page", list(pages.PAGES))
+def test_every_page_has_a_module_with_render(page):
+    module = importlib.import_module(f"islamic_hub.pages.{pages.PAGES[page]}")
+    assert callable(module.render)
+
+
+def test_the_router_imports_no_page_until_it_is_opened():
+    code = (
+        "import sys\n"
+        "import islamic_hub.pages\n"
+        "print(sorted(name for name in sys.modules if name.startswith(('islamic_hub.pages.', 'islamic_hub.datasets'))))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "[]"
+
+
+# The page is not drawn, so only the main script's own imports count
+def test_the_main_script_does_not_load_the_http_client():
+    code = (
+        "import sys\n"
+        "from streamlit.testing.v1 import AppTest\n"
+        "from islamic_hub import pages\n"
+        "pages.render = lambda page: None\n"
+        "app = AppTest.from_file('islamic_resources.py', default_timeout=60)\n"
+        "app.run()\n"
+        "print(len(app.exception), [name for name in ('requests', 'islamic_hub.http_client') if name in sys.modules])\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    assert result.stdout.strip().splitlines()[-1] == "0 []"
+
+
+def test_a_page_loads_only_its_own_datasets():
+    code = (
+        "import sys\n"
+        "import islamic_hub.pages.naats\n"
+        "print(sorted(name for name in sys.modules if name.startswith('islamic_hub.datasets.')))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "['islamic_hub.datasets.naats']"
+
+
+@pytest.mark.parametrize("page, dataset", [
+    ("📋 Asma Al-Husna", "islamic_hub.datasets.asma_al_husna"),
+    ("📒 Names of Muhammad ﷺ", "islamic_hub.datasets.names_of_muhammad"),
+])
+def test_a_names_page_loads_only_its_own_names(page, dataset):
+    script = f"from islamic_hub import pages\npages.render({page!r})"
+    code = (
+        "import sys\n"
+        "from streamlit.testing.v1 import AppTest\n"
+        f"app = AppTest.from_string({script!r}, default_timeout=60)\n"
+        "app.run()\n"
+        "print(len(app.exception), sorted(name for name in sys.modules if name.startswith('islamic_hub.datasets.')))\n"
+    )
+    env = dict(os.environ, ISLAMIC_HUB_LOADING_DELAY="0")
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+    assert result.stdout.strip().splitlines()[-1] == f"0 [{dataset!r}]"
@@ -0,0 +1,57 @@
+from datetime import date
+
+import numpy as np
+import pytest
+
+from islamic_hub import clock
+from islamic_hub.prayer_table import compute_times_grid, date_range, format_times, prayer_times_table, utc_offsets_grid
+from islamic_hub.prayer_times import HANAFI, METHODS, SHAFI, TIMING_NAMES, compute_times, format_time
+
+# (latitude, longitude, time zone): daylight saving, both hemispheres, and
+# a city far enough north for the high-latitude rules to matter
+CITIES = [
+    (24.8607, 67.0011, "Asia/Karachi"),
+    (51.5074, -0.1278, "Europe/London"),
+    (-33.8688, 151.2093, "Australia/Sydney"),
+    (40.7128, -74.0060, "America/New_York"),
+    (59.9139, 10.7522, "Europe/Oslo"),
+]
+
+# Days around both daylight saving changes and midsummer
+DAYS = [date(2025, 1, 1), date(2025, 3, 30), date(2025, 3, 31), date(2025, 6, 21), date(2025, 10, 26), date(2025, 12, 31)]
+
+
+def test_utc_offsets_match_the_zone():
+    offsets = utc_offsets_grid(np.array(DAYS, dtype="datetime64[D]"), [zone for _, _, zone in CITIES])
+    for row, day in enumerate(DAYS):
+        for column, (_, _, zone) in enumerate(CITIES):
+            assert offsets[row, column] == clock.utc_offset(clock.zone_for(zone), day)
+
+
+@pytest.mark.parametrize("method", sorted(METHODS))
+@pytest.mark.parametrize("school", [SHAFI, HANAFI])
+@pytest.mark.parametrize("rule", [0, 1, 2, 3])
+def test_grid_matches_the_single_day_calculation(method, school, rule):
+    days = np.array(DAYS, dtype="datetime64[D]")
+    timezones = [zone for _, _, zone in CITIES]
+    grid = compute_times_grid(days, [city[0] for city in CITIES], [city[1] for city in CITIES],
+                              utc_offsets_grid(days, timezones), method, school, rule)
+    for row, day in enumerate(DAYS):
+        for column, (latitude, longitude, zone) in enumerate(CITIES):
+            offset = clock.utc_offset(clock.zone_for(zone), day)
+            expected = compute_times(day, latitude, longitude, offset, method, school, rule)
+            for name in TIMING_NAMES:
+                assert format_times(grid[name][row, column]) == format_time(expected[name]), (day, zone, name)
+
+
+def test_table_has_one_row_per_day_and_location():
+    days = date_range("2025-01-01", "2025-01-31")
+    table = prayer_times_table(days, [24.8607, 51.5074], [67.0011, -0.1278], ["Asia/Karachi", "Europe/London"],
+                               locations=["Karachi", "London"])
+    assert len(table) == 62
+    assert list(table.columns) == ["date", "location", "latitude", "longitude"] + TIMING_NAMES
+    assert list(table["location"][:4]) == ["Karachi", "London", "Karachi", "London"]
+
+
+def test_format_times():
+    assert list(format_times([0, 5.5, 23.999, np.nan])) == ["00:00", "05:30", "00:00", "-----"]
@@ -0,0 +1,58 @@
+import importlib.util
+import os
+from datetime import date
+
+import pytest
+
+from islamic_hub.prayer_times import ANGLE_BASED, HANAFI, METHODS, NO_ADJUSTMENT, SHAFI, prayer_times
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The comparison lives with the fixtures in benchmarks/
+_spec = importlib.util.spec_from_file_location("validate_prayer_times", os.path.join(ROOT, "benchmarks", "validate_prayer_times.py"))
+validate = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(validate)
+
+
+def describe(mismatch):
+    case, prayer, local, expected = mismatch
+    return (f"{case['city']} {case['date']} method={case['method']} school={case['school']} "
+            f"rule={case['latitude_adjustment']} {prayer}: local {local}, expected {expected}")
+
+
+@pytest.mark.parametrize("path", [validate.REFERENCE_FIXTURES, validate.FIXTURES], ids=os.path.basename)
+def test_engine_agrees_with_fixtures_within_a_minute(path):
+    if not os.path.exists(path):
+        pytest.skip(f"{os.path.basename(path)} has not been recorded, run "
+                    "`python benchmarks/validate_prayer_times.py --record` with network access")
+    fixtures = validate.load(path)
+    assert [describe(mismatch) for mismatch in validate.mismatches(fixtures)] == []
+
+
+def test_reference_fixtures_cover_every_setting():
+    fixtures = validate.load(validate.REFERENCE_FIXTURES)
+    assert {case["method"] for case in fixtures} == set(METHODS) == {0, 1, 2, 3, 4, 5, 7, 8, 9}
+    assert {case["school"] for case in fixtures} == {SHAFI, HANAFI}
+    assert {case["latitude_adjustment"] for case in fixtures} == {0, 1, 2, 3}
+
+
+def test_makkah_isha_is_ninety_minutes_after_maghrib():
+    timings = prayer_times(21.4225, 39.8262, date(2025, 3, 30), "Asia/Riyadh", method=4)["timings"]
+    assert validate.minutes(timings["Isha"]) - validate.minutes(timings["Maghrib"]) == 90
+
+
+def test_hanafi_asr_is_later():
+    shafi = prayer_times(33.6844, 73.0479, date(2025, 1, 15), "Asia/Karachi", school=SHAFI)["timings"]
+    hanafi = prayer_times(33.6844, 73.0479, date(2025, 1, 15), "Asia/Karachi", school=HANAFI)["timings"]
+    assert validate.minutes(hanafi["Asr"]) > validate.minutes(shafi["Asr"])
+    assert {name: time for name, time in hanafi.items() if name != "Asr"} == \
+        {name: time for name, time in shafi.items() if name != "Asr"}
+
+
+def test_high_latitude_rule_fills_in_a_missing_isha():
+    midsummer = date(2025, 6, 21)
+    unadjusted = prayer_times(59.9139, 10.7522, midsummer, "Europe/Oslo", method=3, latitude_adjustment=NO_ADJUSTMENT)
+    adjusted = prayer_times(59.9139, 10.7522, midsummer, "Europe/Oslo", method=3, latitude_adjustment=ANGLE_BASED)
+    assert unadjusted["timings"]["Isha"] == "-----"
+    assert adjusted["timings"]["Isha"] != "-----"
+    assert adjusted["meta"]["latitudeAdjustmentMethod"] == "Angle Based"
@@ -0,0 +1,141 @@
+import sqlite3
+import threading
+
+import pytest
+
+from islamic_hub import quran
+
+API = "http://quran.test/v1"
+
+
+# Installed editions answer from memory; "broken" editions raise like a
+# locked or corrupt database
+class FakeCorpus:
+    def __init__(self, installed=(), broken=()):
+        self.installed = set(installed)
+        self.broken = set(broken)
+
+    def _read(self, kind, number, edition):
+        if edition in self.broken:
+            raise sqlite3.DatabaseError("database disk image is malformed")
+        if edition in self.installed:
+            return {"kind": kind, "number": number, "edition": {"identifier": edition}, "source": "corpus"}
+        return None
+
+    def juz(self, number, edition):
+        return self._read("juz", number, edition)
+
+    def surah(self, number, edition):
+        return self._read("surah", number, edition)
+
+    def ayah(self, number, edition):
+        return self._read("ayah", number, edition)
+
+
+class FakeResponse:
+    def __init__(self, status_code, data=None):
+        self.status_code = status_code
+        self._data = data
+
+    def json(self):
+        return {"code": self.status_code, "data": self._data}
+
+
+# Stands in for the alquran.cloud API, recording the paths requested.
+# Editions in "unknown" are not served, singly or in a batch.
+class FakeApi:
+    def __init__(self, unknown=(), batches=True):
+        self.unknown = set(unknown)
+        self.batches = batches
+        self.paths = []
+        self.lock = threading.Lock()
+
+    def get(self, url, timeout=10):
+        path = url[len(API):]
+        with self.lock:
+            self.paths.append(path)
+        parts = path.strip("/").split("/")
+        kind, number = parts[0], int(parts[1])
+        if parts[2] == "editions":
+            if not self.batches:
+                return FakeResponse(500)
+            editions = [edition for edition in parts[3].split(",") if edition not in self.unknown]
+            return FakeResponse(200, [self.item(kind, number, edition, "batch") for edition in editions])
+        if parts[2] in self.unknown:
+            return FakeResponse(404)
+        return FakeResponse(200, self.item(kind, number, parts[2], "api"))
+
+    def item(self, kind, number, edition, source):
+        return {"kind": kind, "number": number, "edition": {"identifier": edition}, "source": source}
+
+
+@pytest.fixture
+def setup(monkeypatch):
+    def setup(corpus, api):
+        monkeypatch.setattr(quran.settings, "QURAN_API_URL", API)
+        monkeypatch.setattr(quran, "get_corpus", lambda: corpus)
+        monkeypatch.setattr(quran.http_client, "get", api.get)
+        return api
+    return setup
+
+
+def sources(results):
+    return {edition: result and result.get("source", "sample") for edition, result in results.items()}
+
+
+def test_installed_editions_make_no_requests(setup):
+    api = setup(FakeCorpus(installed=("quran-uthmani", "en.asad")), FakeApi())
+    results = quran.get_surah_editions(2, ["quran-uthmani", "en.asad", "quran-uthmani"])
+    assert list(results) == ["quran-uthmani", "en.asad"]
+    assert sources(results) == {"quran-uthmani": "corpus", "en.asad": "corpus"}
+    assert api.paths == []
+
+
+def test_missing_editions_share_one_batch_request(setup):
+    api = setup(FakeCorpus(installed=("quran-uthmani",)), FakeApi())
+    results = quran.get_ayah_editions(262, ["quran-uthmani", "en.asad", "ur.jalandhry"])
+    assert sources(results) == {"quran-uthmani": "corpus", "en.asad": "batch", "ur.jalandhry": "batch"}
+    assert api.paths == ["/ayah/262/editions/en.asad,ur.jalandhry"]
+
+
+def test_one_missing_edition_is_fetched_on_its_own(setup):
+    api = setup(FakeCorpus(installed=("quran-uthmani",)), FakeApi())
+    results = quran.get_surah_editions(1, ["quran-uthmani", "en.asad"])
+    assert sources(results) == {"quran-uthmani": "corpus", "en.asad": "api"}
+    assert api.paths == ["/surah/1/en.asad"]
+
+
+def test_editions_the_batch_lacks_are_fetched_one_by_one(setup):
+    api = setup(FakeCorpus(), FakeApi(unknown=("ur.custom",)))
+    results = quran.get_surah_editions(1, ["en.asad", "ur.custom"])
+    assert sources(results) == {"en.asad": "batch", "ur.custom": "sample"}
+    assert api.paths == ["/surah/1/editions/en.asad,ur.custom", "/surah/1/ur.custom"]
+
+
+def test_a_failed_batch_falls_back_to_one_request_per_edition(setup):
+    api = setup(FakeCorpus(), FakeApi(batches=False))
+    results = quran.get_ayah_editions(1, ["en.asad", "ur.jalandhry"])
+    assert sources(results) == {"en.asad": "api", "ur.jalandhry": "api"}
+    assert sorted(api.paths[1:]) == ["/ayah/1/en.asad", "/ayah/1/ur.jalandhry"]
+
+
+@pytest.mark.parametrize("fetch", [quran.get_surah_editions, quran.get_ayah_editions])
+def test_a_corpus_error_falls_back_for_that_edition(setup, fetch):
+    api = setup(FakeCorpus(installed=("quran-uthmani",), broken=("en.asad",)), FakeApi())
+    results = fetch(1, ["quran-uthmani", "en.asad"])
+    assert sources(results) == {"quran-uthmani": "corpus", "en.asad": "api"}
+    assert len(api.paths) == 1
+
+
+def test_every_broken_edition_is_still_fetched(setup):
+    setup(FakeCorpus(broken=("quran-uthmani", "en.asad")), FakeApi())
+    results = quran.get_surah_editions(1, ["quran-uthmani", "en.asad"])
+    assert sources(results) == {"quran-uthmani": "batch", "en.asad": "batch"}
+
+
+def test_juz_editions_keep_the_order_asked_for(setup):
+    api = setup(FakeCorpus(installed=("en.asad",), broken=("ur.jalandhry",)), FakeApi())
+    results = quran.get_juz_editions(30, ["ur.jalandhry", "quran-uthmani", "en.asad"])
+    assert list(results) == ["ur.jalandhry", "quran-uthmani", "en.asad"]
+    assert sources(results) == {"ur.jalandhry": "api", "quran-uthmani": "api", "en.asad": "corpus"}
+    assert sorted(api.paths) == ["/juz/30/quran-uthmani", "/juz/30/ur.jalandhry"]
@@ -0,0 +1,125 @@
+import os
+
+import pytest
+
+from islamic_hub.corpus import QuranCorpus
+from islamic_hub.quran_search import QuranIndex, build_index, index_is_current
+from islamic_hub.textnorm import word_variants
+from tests.conftest import quran_edition
+
+ARABIC = {
+    1: "بِسْمِ ٱللَّهِ ٱلرَّحْمَٰنِ ٱلرَّحِيمِ",
+    2: "ٱلْحَمْدُ لِلَّهِ رَبِّ ٱلْعَٰلَمِينَ",
+    3: "ٱلرَّحْمَٰنِ ٱلرَّحِيمِ",
+    8: "ذَٰلِكَ ٱلْكِتَٰبُ لَا رَيْبَ فِيهِ",
+    13: "ءَامَنُوا۟ وَعَمِلُوا۟ ٱلصَّٰلِحَٰتِ",
+}
+
+ENGLISH = {
+    1: "In the name of God, the Most Gracious, the Dispenser of Grace",
+    6: "Guide us the straight path",
+    7: "the path of those upon whom Thou hast bestowed Thy blessings",
+    100: "a path that is straight and narrow",
+    200: "path path",
+    300: "His mercy and He is the most merciful",
+}
+
+
+@pytest.fixture(scope="module")
+def index_path(tmp_path_factory):
+    directory = str(tmp_path_factory.mktemp("search"))
+    corpus = QuranCorpus(os.path.join(directory, "quran_corpus.sqlite3"))
+    corpus.install_edition(quran_edition("quran-uthmani", "ar", lambda number: ARABIC.get(number, f"نص {number}")))
+    corpus.install_edition(quran_edition("en.asad", "en", lambda number: ENGLISH.get(number, f"verse {number}")))
+    path = os.path.join(directory, "quran_search.idx")
+    build_index(corpus.path, path)
+    return path
+
+
+@pytest.fixture
+def index(index_path):
+    with QuranIndex(index_path) as index:
+        yield index
+
+
+def found(index, query, **options):
+    total, hits = index.search(query, limit=100, **options)
+    assert total == len(hits)
+    return [(hit["edition"], hit["number"]) for hit in hits]
+
+
+def test_arabic_is_matched_without_harakat(index):
+    assert sorted(found(index, "الرحمن")) == [("quran-uthmani", 1), ("quran-uthmani", 3)]
+    assert found(index, "امنوا") == [("quran-uthmani", 13)]
+
+
+def test_superscript_alef_is_matched_written_out(index):
+    assert found(index, "الكتاب") == found(index, "الكتب") == [("quran-uthmani", 8)]
+
+
+def test_every_word_must_match(index):
+    assert found(index, "الله الرحمن") == [("quran-uthmani", 1)]
+    assert found(index, "straight path narrow") == [("en.asad", 100)]
+
+
+def test_phrases_keep_the_word_order(index):
+    assert sorted(found(index, "straight path")) == [("en.asad", 6), ("en.asad", 100)]
+    assert found(index, '"straight path"') == [("en.asad", 6)]
+
+
+def test_prefixes(index):
+    assert found(index, "merc*") == [("en.asad", 300)]
+    assert found(index, "merc") == []
+
+
+def test_editions_filter(index):
+    assert found(index, "الرحمن", editions=["en.asad"]) == []
+    assert sorted(found(index, "الرحمن", editions=["quran-uthmani"])) == [("quran-uthmani", 1), ("quran-uthmani", 3)]
+
+
+def test_ranking_and_hits(index):
+    total, hits = index.search("path", limit=1)
+    assert total == 4
+    assert hits[0]["number"] == 200
+    assert (hits[0]["surah"], hits[0]["numberInSurah"]) == (4, 38)
+    scores = [hit["score"] for hit in index.search("path", limit=10)[1]]
+    assert scores == sorted(scores, reverse=True)
+
+
+def test_pages_cover_the_ranking_once(index):
+    everything = index.search("path", limit=10)[1]
+    pages = [index.search("path", limit=3, offset=offset)[1] for offset in (0, 3, 6)]
+    assert [hit for page in pages for hit in page] == everything
+    assert index.search("path", limit=3, offset=6) == (4, [])
+    assert index.search("", limit=3) == (0, [])
+
+
+def test_each_index_has_its_own_caches(index_path):
+    with QuranIndex(index_path) as first, QuranIndex(index_path) as second:
+        first.search("path")
+        assert first._scores.cache_info().currsize == 1
+        assert second._scores.cache_info().currsize == 0
+        assert "_scores" not in vars(QuranIndex)
+
+
+def test_close_unmaps_the_file(index_path):
+    index = QuranIndex(index_path)
+    index.search("path")
+    index.close()
+    assert index._data.closed
+
+
+def test_index_is_current(index_path, tmp_path):
+    assert index_is_current(index_path, ["en.asad", "quran-uthmani"])
+    assert not index_is_current(index_path, ["quran-uthmani"])
+    assert not index_is_current(str(tmp_path / "missing.idx"), ["quran-uthmani"])
+    other = tmp_path / "other.idx"
+    other.write_bytes(b"not an index at all")
+    assert not index_is_current(str(other), ["quran-uthmani"])
+    with pytest.raises(ValueError):
+        QuranIndex(str(other))
+
+
+def test_word_variants():
+    assert word_variants("ٱلْكِتَٰبُ هُدًى") == [("الكتب", "الكتاب"), ("هدي",)]
+    assert word_variants("The Book") == [("the",), ("book",)]
@@ -0,0 +1,145 @@
+import pytest
+
+from islamic_hub.pages.duas import get_dua_index
+from islamic_hub.pages.naats import get_naat_index
+from islamic_hub.record_search import RecordIndex
+from islamic_hub.textnorm import phonetic_key
+
+RECORDS = [
+    {"id": 1, "title": "Morning Dua", "category": "Morning", "text": "protection for the day"},
+    {"id": 2, "title": "Dua for Protection", "category": "Daily", "text": "seek refuge in the morning"},
+    {"id": 3, "title": "Evening Dua", "category": "Evening", "text": "protection for the night"},
+    {"id": 4, "title": "Dua before a Meal", "category": "Daily", "text": "in the name of Allah"},
+    {"id": 5, "title": "Dua after a Meal", "category": "Daily", "text": "praise be to Allah who fed us"},
+]
+
+
+@pytest.fixture
+def index():
+    return RecordIndex(RECORDS, {"title": 3, "text": 1}, unique=("title",), facets=("category",))
+
+
+def ids(records):
+    return [record["id"] for record in records]
+
+
+def test_get_by_key_and_unique_field(index):
+    assert len(index) == 5
+    assert index.get(3)["title"] == "Evening Dua"
+    assert index.get("Dua before a Meal", field="title")["id"] == 4
+    assert index.get(99) is None
+
+
+def test_facets_keep_catalogue_order(index):
+    assert ids(index.facet("category", "Daily")) == [2, 4, 5]
+    assert index.facet("category", "Night") == []
+    assert index.facet_counts("category") == {"Morning": 1, "Daily": 3, "Evening": 1}
+
+
+def test_a_word_in_the_title_ranks_first(index):
+    total, results = index.search("protection")
+    assert total == 3
+    assert ids(results)[0] == 2
+    total, results = index.search("morning")
+    assert ids(results) == [1, 2]
+
+
+def test_a_prefix_matches_the_longer_words_it_starts(index):
+    assert ids(index.search("morn")[1]) == [1, 2]
+    total, results = index.search("protect")
+    assert (total, ids(results)) == (3, ids(index.search("protection")[1]))
+
+
+def test_every_query_word_must_match(index):
+    assert sorted(ids(index.search("meal allah")[1])) == [4, 5]
+    assert index.search("meal morning") == (0, [])
+    assert index.search("") == (0, [])
+    assert index.search("   ") == (0, [])
+
+
+def test_filters_narrow_to_a_facet_value(index):
+    total, results = index.search("protection", filters={"category": "Evening"})
+    assert (total, ids(results)) == (1, [3])
+    assert index.search("protection", filters={"category": "Night"}) == (0, [])
+
+
+def test_pages_of_results_follow_the_full_ranking(index):
+    total, everything = index.search("dua", limit=None)
+    assert total == len(everything) == 5
+    assert index.search("dua", limit=0) == (5, [])
+    pages = [index.search("dua", limit=2, offset=offset)[1] for offset in (0, 2, 4)]
+    assert [len(page) for page in pages] == [2, 2, 1]
+    assert ids(pages[0] + pages[1] + pages[2]) == ids(everything)
+    assert index.search("dua", limit=None, offset=3)[1] == everything[3:]
+
+
+def test_word_key_matches_spellings_and_ranks_the_typed_one_first():
+    records = [
+        {"id": "urdu", "title": "میں بندہ عاصی ہوں"},
+        {"id": "roman", "title": "Main Banda e Aasi Hoon"},
+        {"id": "other", "title": "Tajdar e Haram"},
+    ]
+    index = RecordIndex(records, {"title": 1}, word_key=phonetic_key)
+    total, results = index.search("banda")
+    assert total == 2
+    assert ids(results) == ["roman", "urdu"]
+    assert ids(index.search("بندہ")[1]) == ["urdu", "roman"]
+    assert ids(index.search("main banda e aasi")[1])[0] == "roman"
+
+
+def test_a_short_key_is_not_matched_by_other_spellings():
+    records = [
+        {"id": "allah", "title": "Allah Hoo"},
+        {"id": "ali", "title": "Ali Maula"},
+        {"id": "urdu", "title": "اللہ ہو"},
+    ]
+    loose = RecordIndex(records, {"title": 1}, word_key=phonetic_key)
+    assert ids(loose.search("ali", limit=None)[1]) == ["ali", "allah", "urdu"]
+    index = RecordIndex(records, {"title": 1}, word_key=phonetic_key, min_key_length=3)
+    assert ids(index.search("ali", limit=None)[1]) == ["ali"]
+    assert ids(index.search("ali maula", limit=None)[1]) == ["ali"]
+    assert ids(index.search("allah", limit=None)[1]) == ["allah"]
+
+
+def test_dua_search_looks_in_categories_and_the_placeholder_examples():
+    index = get_dua_index()
+    for query in ("morning", "meal", "protection", "رب"):
+        assert index.search(query)[0], query
+    total, results = index.search("travel", limit=None)
+    assert total == len(results)
+    assert any(dua["category"] == "Family & Travel" for dua in results)
+
+
+def test_naat_search_finds_roman_urdu_and_urdu_script_alike():
+    index = get_naat_index()
+    roman = index.search("main banda e aasi", limit=None)
+    urdu = index.search("میں بندہ عاصی ہوں", limit=None)
+    assert roman[0] == urdu[0] == 2
+    assert {naat["title"] for naat in roman[1]} == {"Main Banda-e-Aasi Hun", "Main Banda E Aasi Hoon"}
+    assert all("میں بندہ عاصی ہوں" in naat["lyrics_excerpt"] for naat in urdu[1])
+
+
+def test_naat_search_by_a_short_word_finds_only_that_word():
+    index = get_naat_index()
+    # Keys of one letter ("s", "l") used to match most of the catalogue
+    total, results = index.search("owais", limit=None)
+    assert (total, results[0]["reciter"]) == (2, "Owais Raza Qadri")
+    assert [naat["title"] for naat in index.search("ali", limit=None)[1]] == ["Main Banda E Aasi Hoon"]
+    # "ya" has no key at all, and is matched as typed
+    assert {naat["title"] for naat in index.search("ya", limit=None)[1]} == \
+        {"Ya Shafi Al Wara Salam", "Meri Darkan Main Ya Nabi", "Haq Char Yar"}
+    # Longer keys still match the Urdu script: "maula" only as مولا
+    assert [naat["id"] for naat in index.search("sohne")[1]] == [2]
+    assert {naat["id"] for naat in index.search("mere maula", limit=None)[1]} >= {1, 29}
+
+
+def test_naat_search_narrowed_by_language_and_reciter():
+    index = get_naat_index()
+    counts = index.facet_counts("language")
+    assert sum(counts.values()) == len(index)
+    total, results = index.search("allah", limit=None)
+    for language in counts:
+        narrowed = index.search("allah", limit=None, filters={"language": language})[1]
+        assert narrowed == [naat for naat in results if naat["language"] == language]
+    total, results = index.search("main banda e aasi", filters={"reciter": "Muhammad Ali Imran"})
+    assert (total, [naat["title"] for naat in results]) == (1, ["Main Banda E Aasi Hoon"])
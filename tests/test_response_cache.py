@@ -0,0 +1,68 @@
+import time
+
+from islamic_hub.response_cache import DAY, DEFAULT_TTL, CachedResponse, ResponseCache, compile_rules, ttl_for
+
+TIMINGS = "https://api.aladhan.com/v1/timingsByCity/{}?city=Auckland&country=New%20Zealand&method=3"
+
+
+def test_dated_timings_keep_a_fixed_ttl():
+    # The same TTL at any time of day: the entry is keyed on its date
+    assert ttl_for(TIMINGS.format("18-10-2026"), compile_rules()) == (DAY, 0)
+
+
+class StubResponse:
+    def __init__(self, url):
+        self.status_code = 200
+        self.content = url.encode()
+        self.headers = {}
+
+
+def test_next_day_is_fetched_afresh():
+    fetched = []
+
+    def fetch(url, timeout):
+        fetched.append(url)
+        return StubResponse(url)
+
+    cache = ResponseCache(fetch)
+    today, tomorrow = TIMINGS.format("18-10-2026"), TIMINGS.format("19-10-2026")
+    cache.get(today)
+    cache.get(today)
+    assert cache.get(tomorrow).content == tomorrow.encode()
+    assert fetched == [today, tomorrow]
+
+
+def test_undated_timings_use_the_default_ttl():
+    assert ttl_for("https://api.aladhan.com/v1/timingsByCity?city=Auckland", compile_rules()) == DEFAULT_TTL
+
+
+def test_a_copy_from_disk_expires_when_it_would_have_upstream():
+    fetched = []
+    today = TIMINGS.format("18-10-2026")
+
+    def fetch(url, timeout):
+        fetched.append(url)
+        # Fetched a day and a minute ago by another process, and served
+        # from the disk cache
+        return CachedResponse(url, 200, b"{}", {}, fetched_at=time.time() - DAY - 60)
+
+    cache = ResponseCache(fetch)
+    cache.get(today)
+    cache.get(today)
+    assert fetched == [today, today]
+    assert cache.stats()["hits"] == 0
+
+
+def test_a_copy_from_disk_is_fresh_for_the_rest_of_its_ttl():
+    fetched = []
+    today = TIMINGS.format("18-10-2026")
+
+    def fetch(url, timeout):
+        fetched.append(url)
+        return CachedResponse(url, 200, b"{}", {}, fetched_at=time.time() - DAY + 60)
+
+    cache = ResponseCache(fetch)
+    cache.get(today)
+    assert cache._entries[today].expires_at < time.time() + 61
+    cache.get(today)
+    assert fetched == [today]
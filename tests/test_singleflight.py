@@ -0,0 +1,161 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from islamic_hub.http_client import HttpClient
+from islamic_hub.response_cache import ResponseCache
+from islamic_hub.singleflight import SingleFlight
+
+CALLERS = 50
+
+
+def wait_for(condition, timeout=10):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("timed out")
+        time.sleep(0.001)
+
+
+# Runs call() in CALLERS threads released together by a barrier. Returns
+# what each thread got back, or the exception it raised.
+def run_together(call):
+    barrier = threading.Barrier(CALLERS)
+    outcomes = [None] * CALLERS
+
+    def caller(i):
+        barrier.wait()
+        try:
+            outcomes[i] = call()
+        except Exception as e:
+            outcomes[i] = e
+
+    threads = [threading.Thread(target=caller, args=(i,)) for i in range(CALLERS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(10)
+    return outcomes
+
+
+def test_concurrent_callers_share_one_call():
+    flight = SingleFlight()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        # Hold the call open until every other caller has joined it
+        wait_for(lambda: flight.shared == CALLERS - 1)
+        return object()
+
+    outcomes = run_together(lambda: flight.do("juz/1", fetch))
+
+    assert len(calls) == 1
+    assert all(outcome is outcomes[0] for outcome in outcomes)
+    assert flight.in_flight() == 0
+
+
+def test_concurrent_callers_share_the_exception():
+    flight = SingleFlight()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        wait_for(lambda: flight.shared == CALLERS - 1)
+        raise ConnectionError("upstream down")
+
+    outcomes = run_together(lambda: flight.do("juz/1", fetch))
+
+    assert len(calls) == 1
+    assert isinstance(outcomes[0], ConnectionError)
+    assert all(outcome is outcomes[0] for outcome in outcomes)
+    assert flight.in_flight() == 0
+
+    # The key is free again, the next call goes upstream
+    assert flight.do("juz/1", lambda: "fresh") == "fresh"
+
+
+def test_keys_do_not_share():
+    flight = SingleFlight()
+    assert flight.do("a", lambda: 1) == 1
+    assert flight.do("b", lambda: 2) == 2
+    assert flight.shared == 0
+
+
+class _SlowHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        with self.server.lock:
+            self.server.hits += 1
+        self.server.release.wait(10)
+        body = b'{"code": 200, "data": {"number": 1}}'
+        self.send_response(self.server.status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def slow_api():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _SlowHandler)
+    server.daemon_threads = True
+    server.hits = 0
+    server.status = 200
+    server.lock = threading.Lock()
+    server.release = threading.Event()
+    server.url = f"http://127.0.0.1:{server.server_address[1]}/v1/juz/1/quran-uthmani"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.release.set()
+    server.shutdown()
+    server.server_close()
+
+
+def test_response_cache_misses_make_one_upstream_request(slow_api):
+    client = HttpClient(pool_size=4, per_host_limit=CALLERS, retries=0)
+    cache = ResponseCache(client.get)
+    threading.Thread(
+        target=lambda: (wait_for(lambda: cache.stats()["coalesced"] == CALLERS - 1), slow_api.release.set()),
+        daemon=True
+    ).start()
+
+    outcomes = run_together(lambda: cache.get(slow_api.url))
+
+    assert slow_api.hits == 1
+    assert all(outcome is outcomes[0] for outcome in outcomes)
+    assert outcomes[0].json()["data"]["number"] == 1
+    assert cache._flight.in_flight() == 0
+    # And the next lookup is a plain cache hit
+    assert cache.get(slow_api.url) is outcomes[0]
+    assert slow_api.hits == 1
+    client.close()
+
+
+def test_response_cache_waiters_see_the_same_error(slow_api):
+    def fetch(url, timeout):
+        response = client.get(url, timeout=timeout)
+        response.raise_for_status()
+        return response
+
+    slow_api.status = 503
+    client = HttpClient(pool_size=4, per_host_limit=CALLERS, retries=0)
+    cache = ResponseCache(fetch)
+    threading.Thread(
+        target=lambda: (wait_for(lambda: cache.stats()["coalesced"] == CALLERS - 1), slow_api.release.set()),
+        daemon=True
+    ).start()
+
+    outcomes = run_together(lambda: cache.get(slow_api.url))
+
+    assert slow_api.hits == 1
+    assert isinstance(outcomes[0], Exception)
+    assert all(outcome is outcomes[0] for outcome in outcomes)
+    assert cache._flight.in_flight() == 0
+    assert cache.stats()["entries"] == 0
+    client.close()
@@ -0,0 +1,124 @@
+import hashlib
+import io
+import os
+
+from islamic_hub import cli
+from islamic_hub.corpus import QuranCorpus
+from islamic_hub.sync import download_edition, sync
+from tests.conftest import edition_body
+
+
+def run_sync(quran_api, tmp_path, editions):
+    return sync(editions, corpus_path=str(tmp_path / "corpus.sqlite3"), api_url=quran_api.url, workers=2,
+                stream=io.StringIO(), index_path=str(tmp_path / "search.idx"))
+
+
+def downloads(tmp_path):
+    return tmp_path / "downloads"
+
+
+def edition_requests(quran_api, edition):
+    return [request for request in quran_api.requests if request[0] == f"/v1/quran/{edition}"]
+
+
+def test_fresh_install(quran_api, tmp_path):
+    body = edition_body("en.test")
+    quran_api.editions["en.test"] = body
+
+    assert run_sync(quran_api, tmp_path, ["en.test"]) == {}
+
+    corpus = QuranCorpus(str(tmp_path / "corpus.sqlite3"))
+    assert corpus.has_edition("en.test")
+    assert corpus.edition_checksum("en.test") == hashlib.sha256(body).hexdigest()
+    assert corpus.ayah(1, "en.test")["text"] == "ayah 1"
+    assert os.listdir(downloads(tmp_path)) == []
+    assert (tmp_path / "search.idx").exists()
+
+    # Installed editions are not downloaded again
+    assert run_sync(quran_api, tmp_path, ["en.test"]) == {}
+    assert len(edition_requests(quran_api, "en.test")) == 1
+
+
+def test_resumes_an_interrupted_download(quran_api, tmp_path):
+    body = edition_body("en.test")
+    quran_api.editions["en.test"] = body
+    quran_api.drop_after = len(body) // 3
+
+    failed = run_sync(quran_api, tmp_path, ["en.test"])
+    assert list(failed) == ["en.test"]
+    part = downloads(tmp_path) / "en.test.json.part"
+    assert 0 < part.stat().st_size < len(body)
+    offset = part.stat().st_size
+
+    assert run_sync(quran_api, tmp_path, ["en.test"]) == {}
+    assert edition_requests(quran_api, "en.test")[-1] == ("/v1/quran/en.test", f"bytes={offset}-")
+    corpus = QuranCorpus(str(tmp_path / "corpus.sqlite3"))
+    assert corpus.edition_checksum("en.test") == hashlib.sha256(body).hexdigest()
+
+
+def test_restarts_when_the_partial_file_is_too_long(quran_api, tmp_path):
+    body = edition_body("en.test")
+    quran_api.editions["en.test"] = body
+    os.makedirs(downloads(tmp_path))
+    (downloads(tmp_path) / "en.test.json.part").write_bytes(body + b"garbage")
+
+    assert run_sync(quran_api, tmp_path, ["en.test"]) == {}
+    ranges = [request[1] for request in edition_requests(quran_api, "en.test")]
+    assert ranges == [f"bytes={len(body) + 7}-", None]
+    corpus = QuranCorpus(str(tmp_path / "corpus.sqlite3"))
+    assert corpus.edition_checksum("en.test") == hashlib.sha256(body).hexdigest()
+
+
+def test_restarts_when_the_server_ignores_range(quran_api, tmp_path):
+    body = edition_body("en.test")
+    quran_api.editions["en.test"] = body
+    quran_api.ranges = False
+    os.makedirs(downloads(tmp_path))
+    (downloads(tmp_path) / "en.test.json.part").write_bytes(b"stale bytes from another file")
+
+    assert run_sync(quran_api, tmp_path, ["en.test"]) == {}
+    assert len(edition_requests(quran_api, "en.test")) == 1
+    corpus = QuranCorpus(str(tmp_path / "corpus.sqlite3"))
+    assert corpus.edition_checksum("en.test") == hashlib.sha256(body).hexdigest()
+
+
+def test_reuses_a_finished_download(quran_api, tmp_path):
+    body = edition_body("en.test")
+    os.makedirs(downloads(tmp_path))
+    (downloads(tmp_path) / "en.test.json").write_bytes(body)
+    (downloads(tmp_path) / "en.test.json.sha256").write_text(hashlib.sha256(body).hexdigest() + "\n")
+
+    # The server does not even have the edition, the download is installed as is
+    assert run_sync(quran_api, tmp_path, ["en.test"]) == {}
+    assert quran_api.requests == []
+    assert QuranCorpus(str(tmp_path / "corpus.sqlite3")).has_edition("en.test")
+
+
+def test_downloads_again_when_the_checksum_does_not_match(quran_api, tmp_path):
+    body = edition_body("en.test")
+    quran_api.editions["en.test"] = body
+    os.makedirs(downloads(tmp_path))
+    (downloads(tmp_path) / "en.test.json").write_bytes(body[:100])
+    (downloads(tmp_path) / "en.test.json.sha256").write_text(hashlib.sha256(body).hexdigest() + "\n")
+
+    path, checksum = download_edition("en.test", str(downloads(tmp_path)), quran_api.url)
+    assert checksum == hashlib.sha256(body).hexdigest()
+    with open(path, "rb") as f:
+        assert f.read() == body
+    assert len(edition_requests(quran_api, "en.test")) == 1
+
+
+def test_missing_edition_fails_without_touching_the_others(quran_api, tmp_path):
+    quran_api.editions["en.one"] = edition_body("en.one")
+    quran_api.editions["en.two"] = edition_body("en.two")
+    corpus_path = str(tmp_path / "corpus.sqlite3")
+    argv = ["sync", "--api-url", quran_api.url, "--corpus", corpus_path, "--index", str(tmp_path / "search.idx")]
+
+    assert cli.main(argv + ["--editions", "en.one"]) == 0
+    checksum = QuranCorpus(corpus_path).edition_checksum("en.one")
+
+    assert cli.main(argv + ["--editions", "en.one,en.missing,en.two"]) == 1
+    corpus = QuranCorpus(corpus_path)
+    assert set(corpus.installed_editions()) == {"en.one", "en.two"}
+    assert corpus.edition_checksum("en.one") == checksum
+    assert not [name for name in os.listdir(downloads(tmp_path)) if name.startswith("en.missing")]
@@ -0,0 +1,104 @@
+import pytest
+
+from islamic_hub.textnorm import SEARCH_FIELD, add_search_text, normalize, phonetic_key, search_records, sound_key, tokenize
+
+
+@pytest.mark.parametrize("text, expected", [
+    # Harakat, shadda, sukun and tanween
+    ("بِسْمِ اللَّهِ", "بسم الله"),
+    ("هُدًى", "هدي"),
+    # Alef forms, hamza carriers and a hamza on the line
+    ("ٱلرَّحْمَٰنِ", "الرحمن"),
+    ("أَحَدٌ إِنَّ آمَنَ", "احد ان امن"),
+    ("ءَامَنُوا۟", "امنوا"),
+    ("مُؤْمِن", "مومن"),
+    ("سُئِلَ", "سيل"),
+    # Alef maksura and ta marbuta
+    ("مُوسَىٰ", "موسي"),
+    ("رَحْمَةٌ", "رحمه"),
+    # Urdu letter forms become the Arabic ones
+    ("کتاب", "كتاب"),
+    ("اللہ", "الله"),
+    ("ہدایت", "هدايت"),
+    ("بھی", "بهي"),
+    # Tatweel, Quranic marks and invisible characters
+    ("الـــلـه", "الله"),
+    ("ذَٰلِكَ ٱلْكِتَٰبُ ۛ", "ذلك الكتب "),
+    ("رب‌‏العالمين", "ربالعالمين"),
+    # Digits
+    ("٢٥٥ ۱۲", "255 12"),
+    # Latin
+    ("Crème Brûlée", "creme brulee"),
+    ("STRASSE", "strasse"),
+    # Arabic presentation forms
+    ("ﻻ", "لا"),
+    ("", ""),
+])
+def test_normalize(text, expected):
+    assert normalize(text) == expected
+
+
+def test_urdu_and_arabic_spellings_agree():
+    assert normalize("یا اللہ رحم کر") == normalize("يا الله رحم كر")
+
+
+def test_tokenize_splits_on_punctuation():
+    assert tokenize("Guide us, O Lord! (ٱهْدِنَا)") == ["guide", "us", "o", "lord", "اهدنا"]
+
+
+def test_search_records_matches_any_field_and_nested_fields():
+    records = [
+        {"title": "Dua for Rain", "en": {"meaning": "Mercy"}, "arabic": "اللَّهُمَّ صَيِّبًا نَافِعًا"},
+        {"title": "Dua for Parents", "en": {"meaning": "Gratitude"}, "arabic": "رَّبِّ ٱرْحَمْهُمَا"},
+    ]
+    fields = ("title", "en.meaning", "arabic")
+    assert search_records(records, "RAIN", fields) == records[:1]
+    assert search_records(records, "mercy", fields) == records[:1]
+    assert search_records(records, "رب ارحمهما", fields) == records[1:]
+    assert search_records(records, "  ", fields) == []
+    assert records[0][SEARCH_FIELD]["en.meaning"] == "mercy"
+
+
+def test_add_search_text_keeps_existing_fields():
+    record = {"title": "First", SEARCH_FIELD: {"title": "cached"}}
+    add_search_text([record], ["title", "missing"])
+    assert record[SEARCH_FIELD] == {"title": "cached", "missing": ""}
+
+
+@pytest.mark.parametrize("words, key", [
+    (["rahman", "rehman", "rahmaan"], "rahman"),
+    (["muhammad", "mohammed"], "muhamad"),
+    (["raheem", "rahim"], "rahim"),
+    (["quddus", "qudoos"], "kudus"),
+    (["dhul", "zul"], "zul"),
+    (["الرحمن", "رحمن"], "رحمن"),
+])
+def test_sound_key_gives_spellings_of_a_name_one_key(words, key):
+    assert [sound_key(word) for word in words] == [key] * len(words)
+
+
+def test_sound_key_keeps_a_short_arabic_word_whole():
+    assert sound_key("ال") == "ال"
+    assert sound_key("الم") == "الم"
+
+
+@pytest.mark.parametrize("roman, urdu, key", [
+    ("banda", "بندہ", "bnd"),
+    ("tujhey", "تجھے", "tj"),
+    ("sohne", "سوہنے", "shn"),
+    ("allah", "اللہ", "l"),
+    ("bhi", "بھی", "b"),
+])
+def test_phonetic_key_agrees_for_roman_and_urdu_spellings(roman, urdu, key):
+    assert phonetic_key(roman) == phonetic_key(normalize(urdu)) == key
+
+
+@pytest.mark.parametrize("word", ["e", "ae", "واہ"])
+def test_phonetic_key_of_a_vowel_only_word_is_empty(word):
+    assert phonetic_key(normalize(word)) == ""
+
+
+def test_phonetic_key_of_a_phrase():
+    roman = [phonetic_key(word) for word in tokenize("main banda e aasi")]
+    urdu = [phonetic_key(word) for word in tokenize("میں بندہ عاصی ہوں")]
+    assert roman[:2] + roman[3:] == urdu[:3]
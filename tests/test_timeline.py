@@ -0,0 +1,85 @@
+import xml.etree.ElementTree as ET
+
+from islamic_hub import timeline
+
+SVG = "{http://www.w3.org/2000/svg}"
+
+ROWS = [
+    ("Fajr", "05:12", 5.2),
+    ("Sunrise", "06:35", 6 + 35 / 60),
+    ("Dhuhr", "12:20", 12 + 20 / 60),
+    ("Asr", "15:45", 15.75),
+    ("Maghrib", "18:05", 18 + 5 / 60),
+    ("Isha", "19:30", 19.5),
+]
+
+
+def parse(markup):
+    return ET.fromstring(markup)
+
+
+def bars(svg):
+    return [(rect.find(f"{SVG}title").text, float(rect.get("x")), float(rect.get("y")))
+            for rect in svg.iter(f"{SVG}rect")]
+
+
+def marker(svg):
+    return [line for line in svg.iter(f"{SVG}line") if line.get("stroke") == "red"]
+
+
+def test_one_bar_per_timing_in_time_order():
+    svg = parse(timeline.render(list(reversed(ROWS))))
+    drawn = bars(svg)
+    assert [title for title, _, _ in drawn] == [f"{name} {label}" for name, label, _ in ROWS]
+    assert [x for _, x, _ in drawn] == sorted(x for _, x, _ in drawn)
+    assert [y for _, _, y in drawn] == sorted(y for _, _, y in drawn)
+    assert [rect.get("fill") for rect in svg.iter(f"{SVG}rect")] == [timeline.COLORS[name] for name, _, _ in ROWS]
+    assert marker(svg) == []
+
+
+def test_the_current_time_marker():
+    markup = timeline.render(ROWS, current_hour=13.5)
+    (line,) = marker(parse(markup))
+    start, end = timeline._axis_range([hour for _, _, hour in ROWS])
+    assert float(line.get("x1")) == round(timeline._x(13.5, start, end), 1)
+    assert "Current Time" in markup
+
+
+def test_a_marker_outside_the_day_widens_the_axis():
+    svg = parse(timeline.render(ROWS, current_hour=1.0))
+    (line,) = marker(svg)
+    assert float(line.get("x1")) == round(timeline._x(1.0, 0, 24), 1)
+    ticks = [text.text for text in svg.iter(f"{SVG}text") if text.text and text.text.endswith(":00")]
+    assert ticks[0] == "00:00" and ticks[-1] == "00:00"
+
+
+def test_a_timing_after_midnight_extends_the_axis():
+    svg = parse(timeline.render(ROWS[:-1] + [("Isha", "00:40", 24 + 40 / 60)]))
+    assert bars(svg)[-1][0] == "Isha 00:40"
+    ticks = [text.text for text in svg.iter(f"{SVG}text") if text.text and text.text.endswith(":00")]
+    assert ticks[-1] == "02:00"
+
+
+def test_timings_without_a_time_are_left_out():
+    svg = parse(timeline.render(ROWS[:-1] + [("Isha", "-", float("nan")), ("Imsak", "-", None)], current_hour=12))
+    assert [title.split()[0] for title, _, _ in bars(svg)] == ["Fajr", "Sunrise", "Dhuhr", "Asr", "Maghrib"]
+
+
+def test_no_timings():
+    svg = parse(timeline.render([], current_hour=12))
+    assert bars(svg) == [] and len(marker(svg)) == 1
+
+
+def test_names_and_labels_are_escaped():
+    svg = parse(timeline.render([("<Fajr>", "05:00 & on", 5.0)]))
+    assert bars(svg)[0][0] == "<Fajr> 05:00 & on"
+    assert svg.find(f"{SVG}rect").get("fill") == timeline.DEFAULT_COLOR
+
+
+def test_the_chart_is_cached_and_only_the_marker_changes():
+    timeline._chart.cache_clear()
+    first = timeline.render(ROWS, current_hour=10)
+    second = timeline.render(ROWS, current_hour=11)
+    assert timeline._chart.cache_info().hits == 1
+    chart = first[:first.rindex("<line x1")]
+    assert second.startswith(chart)
@@ -0,0 +1,66 @@
+from datetime import date
+
+from islamic_hub import hijri, timetable
+
+KARACHI = (24.8607, 67.0011, "Asia/Karachi")
+
+
+def calendar_lines(year=2025, name="Prayer Times"):
+    text = timetable.calendar_bytes(*KARACHI, year, name=name).decode("utf-8")
+    assert text.endswith("\r\n")
+    return text[:-2].split("\r\n")
+
+
+def unfold(lines):
+    unfolded = []
+    for line in lines:
+        if line.startswith(" "):
+            unfolded[-1] += line[1:]
+        else:
+            unfolded.append(line)
+    return unfolded
+
+
+def test_calendar_has_an_event_for_every_prayer_of_the_year():
+    lines = calendar_lines()
+    assert lines[0] == "BEGIN:VCALENDAR" and lines[-1] == "END:VCALENDAR"
+    assert lines.count("BEGIN:VEVENT") == lines.count("END:VEVENT") == 365 * len(timetable.CALENDAR_PRAYERS)
+    assert "SUMMARY:Fajr" in lines
+
+
+def test_calendar_name_is_escaped_and_folded():
+    name = "Prayer Times - Karachi, Sindh; Pakistan \\ " + "ہ" * 40
+    lines = calendar_lines(name=name)
+    assert all(len(line.encode("utf-8")) <= 75 for line in lines)
+    calname = next(line for line in unfold(lines) if line.startswith("X-WR-CALNAME:"))
+    assert calname == "X-WR-CALNAME:Prayer Times - Karachi\\, Sindh\\; Pakistan \\\\ " + "ہ" * 40
+
+
+def test_escape_text():
+    assert timetable._escape_text("a,b;c\\d\ne\r\nf") == "a\\,b\\;c\\\\d\\ne\\nf"
+
+
+def test_dtstamp_is_the_time_of_each_export(monkeypatch):
+    first = calendar_lines()
+    monkeypatch.setattr(timetable.time, "gmtime", lambda: (2030, 1, 2, 3, 4, 5, 2, 2, 0))
+    second = calendar_lines()
+    stamps = {line for line in second if line.startswith("DTSTAMP:")}
+    assert stamps == {"DTSTAMP:20300102T030405Z"}
+    assert [line for line in first if not line.startswith("DTSTAMP:")] == \
+        [line for line in second if not line.startswith("DTSTAMP:")]
+
+
+def test_month_table_rows():
+    table = timetable.month_table(*KARACHI, 2025, 2)
+    assert len(table) == 28
+    assert list(table.columns) == ["Date", "Day", "Hijri"] + timetable.TABLE_TIMINGS
+    assert table["Date"][0] == "01 Feb 2025"
+
+
+def test_ramadan_table_covers_the_month():
+    first, last = hijri.month_range(1446, hijri.RAMADAN)
+    table = timetable.ramadan_table(*KARACHI, 1446)
+    assert first == date(2025, 3, 1)
+    assert len(table) == (last - first).days + 1
+    assert list(table["Ramadan"]) == list(range(1, len(table) + 1))
+    assert table["Date"][0] == "01 Mar 2025"
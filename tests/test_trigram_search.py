@@ -0,0 +1,66 @@
+import pytest
+
+from islamic_hub.names import ASMA_AL_HUSNA, NAMES_OF_MUHAMMAD, get_name_index
+from islamic_hub.trigram_search import TrigramIndex, trigrams
+
+
+def names(index, query, limit=None):
+    return [record["transliteration"] for record in index.search(query, limit=limit)]
+
+
+@pytest.fixture(scope="module")
+def asma():
+    return get_name_index(ASMA_AL_HUSNA)
+
+
+def test_the_index_is_built_from_the_bundled_names(asma):
+    assert len(asma) == 99
+    assert asma.get(1)["transliteration"] == "Ar-Rahman"
+    assert asma.get(100) is None
+
+
+def test_trigrams_are_padded():
+    assert trigrams("rah") == {"  r", " ra", "rah", "ah "}
+
+
+@pytest.mark.parametrize("query", ["Rehman", "Rahmaan", "Ar-Rahmaan", "ar rahman", "al rahman", "رحمن", "الرحمن"])
+def test_spellings_of_ar_rahman(asma, query):
+    assert names(asma, query)[0] == "Ar-Rahman"
+
+
+def test_joined_article_and_missing_hamza(asma):
+    assert names(asma, "arrahman")[0] == "Ar-Rahman"
+    assert names(asma, "mumin")[0] == "Al-Mu'min"
+
+
+def test_typos_in_the_meaning(asma):
+    assert "Ar-Raheem" in names(asma, "mercyful")
+    assert names(asma, "mercyful") == names(asma, "Merciful")
+
+
+def test_a_prefix_finds_names_as_the_user_types(asma):
+    assert names(asma, "rah", limit=2) == ["Ar-Rahman", "Ar-Raheem"]
+
+
+def test_no_match(asma):
+    assert asma.search("xyzq") == []
+    assert asma.search("al") == []
+    assert asma.search("") == []
+
+
+def test_names_of_muhammad():
+    index = get_name_index(NAMES_OF_MUHAMMAD)
+    assert names(index, "Mohammed")[0] == "Muhammad"
+    assert names(index, "Ahmed") == ["Ahmad"]
+
+
+def test_every_query_word_must_match_and_fields_are_weighted():
+    records = [
+        {"number": 1, "transliteration": "Al-Ghafur", "meaning": "The Forgiving"},
+        {"number": 2, "transliteration": "Al-Ghaffar", "meaning": "The Forgiver"},
+        {"number": 3, "transliteration": "Al-Afuw", "meaning": "The Pardoner, Forgiving"},
+    ]
+    index = TrigramIndex(records, {"transliteration": 3, "meaning": 1})
+    assert [record["number"] for record in index.search("ghafur")][0] == 1
+    assert [record["number"] for record in index.search("afuw forgiving")] == [3]
+    assert index.search("ghafur pardoner") == []